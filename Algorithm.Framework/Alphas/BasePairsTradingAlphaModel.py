@@ -35,6 +35,11 @@ class BasePairsTradingAlphaModel(AlphaModel):
         self.pairs = dict()
         self.securities = set()
 
+        # One price feed per symbol, shared by all its pairs, and the ratio state of every pair in numpy arrays
+        self.price_feeds = self.PriceFeeds()
+        self.pair_ratios = self.PairRatios(500)
+        self.pair_keys = []
+
         resolution_string = Extensions.get_enum_string(resolution, Resolution)
         self.name = f'{self.__class__.__name__}({self.lookback},{resolution_string},{Extensions.normalize_to_str(threshold)})'
 
@@ -49,7 +54,12 @@ class BasePairsTradingAlphaModel(AlphaModel):
             The new insights generated'''
         insights = []
 
-        for key, pair in self.pairs.items():
+        # only the pairs whose legs have both updated can change their state
+        for row in self.pair_ratios.update(self.price_feeds):
+            pair = self.pairs[self.pair_keys[row]]
+            pair.ratio = self.pair_ratios.ratio[row]
+            pair.mean = self.pair_ratios.mean[row]
+            pair.is_ready = self.pair_ratios.samples[row] >= self.pair_ratios.period
             insights.extend(pair.get_insight_group())
 
         return insights
@@ -72,7 +82,7 @@ class BasePairsTradingAlphaModel(AlphaModel):
         for security in changes.removed_securities:
             keys = [k for k in self.pairs.keys() if security.symbol in k]
             for key in keys:
-                self.pairs.pop(key).dispose()
+                self.remove_pair(algorithm, key)
 
     def update_pairs(self, algorithm):
 
@@ -94,7 +104,30 @@ class BasePairsTradingAlphaModel(AlphaModel):
                     continue
 
                 pair = self.Pair(algorithm, asset_i, asset_j, self.prediction_interval, self.threshold)
-                self.pairs[pair_symbol] = pair
+                self.add_pair(algorithm, pair_symbol, pair)
+
+    def add_pair(self, algorithm, key, pair):
+        '''Starts tracking the ratio of the pair, from the price feeds of its assets
+        Args:
+            algorithm: The algorithm instance
+            key: The key of the pair in the pairs dictionary
+            pair: The pair'''
+        slot1 = self.price_feeds.add(algorithm, pair.asset1)
+        slot2 = self.price_feeds.add(algorithm, pair.asset2)
+        self.pair_ratios.add(slot1, slot2, self.price_feeds)
+        self.pair_keys.append(key)
+        self.pairs[key] = pair
+
+    def remove_pair(self, algorithm, key):
+        '''Stops tracking the pair and releases the price feeds no other pair uses
+        Args:
+            algorithm: The algorithm instance
+            key: The key of the pair in the pairs dictionary'''
+        pair = self.pairs.pop(key)
+        self.pair_ratios.remove(self.pair_keys.index(key))
+        self.pair_keys.remove(key)
+        self.price_feeds.release(algorithm, pair.asset1)
+        self.price_feeds.release(algorithm, pair.asset2)
 
     def has_passed_test(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
@@ -106,6 +139,135 @@ class BasePairsTradingAlphaModel(AlphaModel):
             True if the statistical test for the pair is successful'''
         return True
 
+    class PriceFeeds:
+        '''Latest price of every symbol used by a pair, each one fed by a single consolidator
+        no matter how many pairs the symbol is part of'''
+
+        def __init__(self, capacity = 16):
+            self.slot_by_symbol = dict()
+            self.consolidators = dict()
+            self.references = dict()
+            self.free_slots = list(reversed(range(capacity)))
+            self.values = np.zeros(capacity)
+            # number of updates of each price, used to know which pairs have new data on both legs
+            self.versions = np.zeros(capacity, dtype=np.int64)
+
+        def add(self, algorithm, symbol):
+            '''Adds a reference to the price feed of the symbol, creating it if needed
+            Args:
+                algorithm: The algorithm instance
+                symbol: The symbol of the price feed
+            Returns:
+                The slot of the price feed in the arrays'''
+            self.references[symbol] = self.references.get(symbol, 0) + 1
+            slot = self.slot_by_symbol.get(symbol)
+            if slot is not None:
+                return slot
+
+            if not self.free_slots:
+                self.grow()
+            slot = self.slot_by_symbol[symbol] = self.free_slots.pop()
+            self.values[slot] = 0
+            self.versions[slot] = 0
+
+            resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
+            consolidator = algorithm.resolve_consolidator(symbol, resolution)
+            consolidator.data_consolidated += lambda sender, consolidated: self.on_data_consolidated(slot, consolidated)
+            algorithm.subscription_manager.add_consolidator(symbol, consolidator)
+            self.consolidators[symbol] = consolidator
+            return slot
+
+        def release(self, algorithm, symbol):
+            '''Removes a reference to the price feed of the symbol. The consolidator is removed
+            from the subscription manager when there are no references left
+            Args:
+                algorithm: The algorithm instance
+                symbol: The symbol of the price feed'''
+            self.references[symbol] -= 1
+            if self.references[symbol] > 0:
+                return
+
+            self.references.pop(symbol)
+            self.free_slots.append(self.slot_by_symbol.pop(symbol))
+            algorithm.subscription_manager.remove_consolidator(symbol, self.consolidators.pop(symbol))
+
+        def on_data_consolidated(self, slot, consolidated):
+            self.values[slot] = consolidated.value
+            self.versions[slot] += 1
+
+        def grow(self):
+            '''Doubles the number of price feeds the arrays can hold'''
+            size = self.values.size
+            self.values = np.concatenate([self.values, np.zeros(size)])
+            self.versions = np.concatenate([self.versions, np.zeros(size, dtype=np.int64)])
+            self.free_slots.extend(reversed(range(size, 2 * size)))
+
+    class PairRatios:
+        '''Ratio of the prices of the legs of every pair and its exponential moving average.
+        Like a ratio indicator of two indicators, a pair is updated once both legs have new prices,
+        and like the ExponentialMovingAverage indicator, the mean starts with the simple average of the first period ratios'''
+
+        def __init__(self, period):
+            self.period = period
+            self.k = 2.0 / (1 + period)
+            self.leg1 = np.zeros(0, dtype=np.int64)
+            self.leg2 = np.zeros(0, dtype=np.int64)
+            self.seen1 = np.zeros(0, dtype=np.int64)
+            self.seen2 = np.zeros(0, dtype=np.int64)
+            self.ratio = np.zeros(0)
+            self.mean = np.zeros(0)
+            self.total = np.zeros(0)
+            self.samples = np.zeros(0, dtype=np.int64)
+
+        def add(self, slot1, slot2, price_feeds):
+            '''Adds a pair, only the prices received from now on are used
+            Args:
+                slot1: The slot of the price feed of the first asset
+                slot2: The slot of the price feed of the second asset
+                price_feeds: The price feeds'''
+            self.leg1 = np.append(self.leg1, slot1)
+            self.leg2 = np.append(self.leg2, slot2)
+            self.seen1 = np.append(self.seen1, price_feeds.versions[slot1])
+            self.seen2 = np.append(self.seen2, price_feeds.versions[slot2])
+            self.ratio = np.append(self.ratio, 0)
+            self.mean = np.append(self.mean, 0)
+            self.total = np.append(self.total, 0)
+            self.samples = np.append(self.samples, 0)
+
+        def remove(self, row):
+            '''Removes the pair of the given row'''
+            for name in ['leg1', 'leg2', 'seen1', 'seen2', 'ratio', 'mean', 'total', 'samples']:
+                setattr(self, name, np.delete(getattr(self, name), row))
+
+        def update(self, price_feeds):
+            '''Updates the pairs whose legs both have new prices
+            Args:
+                price_feeds: The price feeds
+            Returns:
+                The rows of the updated pairs'''
+            versions1 = price_feeds.versions[self.leg1]
+            versions2 = price_feeds.versions[self.leg2]
+            rows = np.flatnonzero((versions1 > self.seen1) & (versions2 > self.seen2))
+            if rows.size == 0:
+                return rows
+            self.seen1[rows] = versions1[rows]
+            self.seen2[rows] = versions2[rows]
+
+            # the ratio is not defined if the price of the second asset is zero, the pair keeps its state
+            price1 = price_feeds.values[self.leg1[rows]]
+            price2 = price_feeds.values[self.leg2[rows]]
+            valid = price2 != 0
+            rows = rows[valid]
+            ratio = price1[valid] / price2[valid]
+
+            samples = self.samples[rows] + 1
+            self.samples[rows] = samples
+            self.ratio[rows] = ratio
+            self.total[rows] += np.where(samples <= self.period, ratio, 0)
+            self.mean[rows] = np.where(samples < self.period, 0,
+                np.where(samples == self.period, self.total[rows] / self.period, ratio * self.k + self.mean[rows] * (1 - self.k)))
+            return rows
+
     class Pair:
 
         class State(Enum):
@@ -127,47 +289,28 @@ class BasePairsTradingAlphaModel(AlphaModel):
             self.asset1 = asset1
             self.asset2 = asset2
 
-            # Created the Identity indicator for a given Symbol and
-            # the consolidator it is registered to. The consolidator reference
-            # will be used to remove it from SubscriptionManager
-            def create_identity_indicator(symbol: Symbol):
-                resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
-
-                name = algorithm.create_indicator_name(symbol, "close", resolution)
-                identity = Identity(name)
-
-                consolidator = algorithm.resolve_consolidator(symbol, resolution)
-                algorithm.register_indicator(symbol, identity, consolidator)
-
-                return identity, consolidator
-
-            self.asset1_price, self.identity_consolidator1 = create_identity_indicator(asset1);
-            self.asset2_price, self.identity_consolidator2 = create_identity_indicator(asset2);
-
-            self.ratio = IndicatorExtensions.over(self.asset1_price, self.asset2_price)
-            self.mean = IndicatorExtensions.of(ExponentialMovingAverage(500), self.ratio)
-
-            upper = ConstantIndicator[IndicatorDataPoint]("ct", 1 + threshold / 100)
-            self.upper_threshold = IndicatorExtensions.times(self.mean, upper)
-
-            lower = ConstantIndicator[IndicatorDataPoint]("ct", 1 - threshold / 100)
-            self.lower_threshold = IndicatorExtensions.times(self.mean, lower)
+            # The ratio of the prices and its mean are set by the alpha model from the shared state of the pairs
+            self.ratio = 0
+            self.mean = 0
+            self.is_ready = False
+            self.threshold = threshold
 
             self.prediction_interval = prediction_interval
 
-        def dispose(self):
-            '''
-            On disposal, remove the consolidators from the subscription manager
-            '''
-            self.algorithm.subscription_manager.remove_consolidator(self.asset1, self.identity_consolidator1)
-            self.algorithm.subscription_manager.remove_consolidator(self.asset2, self.identity_consolidator2)
+        @property
+        def upper_threshold(self):
+            return self.mean * (1 + self.threshold / 100)
+
+        @property
+        def lower_threshold(self):
+            return self.mean * (1 - self.threshold / 100)
 
         def get_insight_group(self):
             '''Gets the insights group for the pair
             Returns:
                 Insights grouped by an unique group id'''
 
-            if not self.mean.is_ready:
+            if not self.is_ready:
                 return []
 
             # don't re-emit the same direction
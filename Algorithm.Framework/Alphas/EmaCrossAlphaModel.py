@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorUpdateTracker import IndicatorUpdateTracker
 
 class EmaCrossAlphaModel(AlphaModel):
     '''Alpha model that uses an EMA cross to create insights'''
@@ -29,6 +30,8 @@ class EmaCrossAlphaModel(AlphaModel):
         self.resolution = resolution
         self.prediction_interval = Time.multiply(Extensions.to_time_span(resolution), fast_period)
         self.symbol_data_by_symbol = {}
+        # symbols whose fast or slow EMA has been updated since the last update
+        self.indicator_updates = IndicatorUpdateTracker()
 
         resolution_string = Extensions.get_enum_string(resolution, Resolution)
         self.name = '{}({},{},{})'.format(self.__class__.__name__, fast_period, slow_period, resolution_string)
@@ -43,7 +46,11 @@ class EmaCrossAlphaModel(AlphaModel):
         Returns:
             The new insights generated'''
         insights = []
-        for symbol, symbol_data in self.symbol_data_by_symbol.items():
+        for symbol in self.indicator_updates.pop_updated():
+            symbol_data = self.symbol_data_by_symbol.get(symbol)
+            if symbol_data is None:
+                continue
+
             if symbol_data.fast.is_ready and symbol_data.slow.is_ready:
 
                 if symbol_data.fast_is_over_slow:
@@ -68,16 +75,19 @@ class EmaCrossAlphaModel(AlphaModel):
             if symbol_data is None:
                 symbol_data = SymbolData(added, self.fast_period, self.slow_period, algorithm, self.resolution)
                 self.symbol_data_by_symbol[added.symbol] = symbol_data
+                self.indicator_updates.track(added.symbol, symbol_data.fast, symbol_data.slow)
             else:
                 # a security that was already initialized was re-added, reset the indicators
                 symbol_data.fast.reset()
                 symbol_data.slow.reset()
+                self.indicator_updates.mark(added.symbol)
 
         for removed in changes.removed_securities:
             data = self.symbol_data_by_symbol.pop(removed.symbol, None)
             if data is not None:
                 # clean up our consolidators
                 data.remove_consolidators()
+            self.indicator_updates.untrack(removed.symbol)
 
 
 class SymbolData:
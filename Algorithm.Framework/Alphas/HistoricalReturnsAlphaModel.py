@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorUpdateTracker import IndicatorUpdateTracker
 
 class HistoricalReturnsAlphaModel(AlphaModel):
     '''Uses Historical returns to create insights.'''
@@ -26,6 +27,8 @@ class HistoricalReturnsAlphaModel(AlphaModel):
         self.prediction_interval = Time.multiply(Extensions.to_time_span(self.resolution), self.lookback)
         self._symbol_data_by_symbol = {}
         self.insight_collection = InsightCollection()
+        # symbols whose rate of change has been updated since the last update
+        self.indicator_updates = IndicatorUpdateTracker()
 
     def update(self, algorithm, data):
         '''Updates this alpha model with the latest data from the algorithm.
@@ -37,8 +40,9 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             The new insights generated'''
         insights = []
 
-        for symbol, symbol_data in self._symbol_data_by_symbol.items():
-            if symbol_data.can_emit:
+        for symbol in self.indicator_updates.pop_updated():
+            symbol_data = self._symbol_data_by_symbol.get(symbol)
+            if symbol_data is not None and symbol_data.can_emit:
 
                 direction = InsightDirection.FLAT
                 magnitude = symbol_data.return_
@@ -65,6 +69,7 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             symbol_data = self._symbol_data_by_symbol.pop(removed.symbol, None)
             if symbol_data is not None:
                 symbol_data.remove_consolidators(algorithm)
+            self.indicator_updates.untrack(removed.symbol)
             self.cancel_insights(algorithm, removed.symbol)
 
         # initialize data for added securities
@@ -80,6 +85,7 @@ class HistoricalReturnsAlphaModel(AlphaModel):
                 symbol_data = SymbolData(symbol, self.lookback)
                 self._symbol_data_by_symbol[symbol] = symbol_data
                 symbol_data.register_indicators(algorithm, self.resolution)
+                self.indicator_updates.track(symbol, symbol_data.roc)
                 symbol_data.warm_up_indicators(history.loc[ticker])
 
     def cancel_insights(self, algorithm, symbol):
@@ -0,0 +1,82 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Keeps the set of symbols whose indicators have been updated since the last time the set was read.
+### The updated event of every tracked indicator marks its symbol, so models only need to visit the symbols
+### that have new indicator values instead of reading the state of every indicator on every slice.
+### </summary>
+class IndicatorUpdateTracker:
+    '''Keeps the set of symbols whose indicators have been updated since the last time the set was read'''
+
+    def __init__(self):
+        self._updated = set()
+        self._handlers_by_symbol = {}
+        # the symbols are returned in the order they were first tracked, like the dictionaries of the models
+        self._order_by_symbol = {}
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._updated)
+
+    def __contains__(self, symbol):
+        return symbol in self._updated
+
+    def track(self, symbol, *indicators):
+        '''Marks the symbol as updated every time one of the indicators is updated.
+        A newly tracked symbol is marked, so it is visited at least once
+        Args:
+            symbol: The symbol the indicators belong to
+            indicators: The indicators whose updated event marks the symbol'''
+        handlers = self._handlers_by_symbol.setdefault(symbol, [])
+        for indicator in indicators:
+            handler = lambda sender, updated: self._updated.add(symbol)
+            indicator.updated += handler
+            handlers.append((indicator, handler))
+
+        if symbol not in self._order_by_symbol:
+            self._order_by_symbol[symbol] = self._next_order
+            self._next_order += 1
+        self._updated.add(symbol)
+
+    def untrack(self, symbol):
+        '''Stops tracking the indicators of the symbol and removes it from the updated symbols
+        Args:
+            symbol: The symbol to stop tracking'''
+        for indicator, handler in self._handlers_by_symbol.pop(symbol, []):
+            indicator.updated -= handler
+        self._order_by_symbol.pop(symbol, None)
+        self._updated.discard(symbol)
+
+    def mark(self, symbol):
+        '''Marks the symbol as updated, for changes that do not fire the updated event like an indicator reset
+        Args:
+            symbol: The symbol to mark'''
+        if symbol in self._order_by_symbol:
+            self._updated.add(symbol)
+
+    def mark_all(self):
+        '''Marks every tracked symbol as updated'''
+        self._updated.update(self._order_by_symbol.keys())
+
+    def pop_updated(self):
+        '''Gets the symbols updated since the last call and clears the set
+        Returns:
+            List of the updated symbols in the order they were first tracked'''
+        if not self._updated:
+            return []
+        updated = sorted(self._updated, key = lambda symbol: self._order_by_symbol.get(symbol, self._next_order))
+        self._updated.clear()
+        return updated
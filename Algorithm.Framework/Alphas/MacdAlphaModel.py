@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorUpdateTracker import IndicatorUpdateTracker
 
 class MacdAlphaModel(AlphaModel):
     '''Defines a custom alpha model that uses MACD crossovers. The MACD signal line
@@ -39,6 +40,8 @@ class MacdAlphaModel(AlphaModel):
         self.bounceThresholdPercent = 0.01
         self.insightCollection = InsightCollection()
         self.symbolData = {}
+        # symbols whose MACD has been updated since the last update
+        self.indicatorUpdates = IndicatorUpdateTracker()
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         movingAverageTypeString = Extensions.GetEnumString(movingAverageType, MovingAverageType)
@@ -54,12 +57,19 @@ class MacdAlphaModel(AlphaModel):
             The new insights generated'''
         insights = []
 
+        # the MACD is only read when it has a new value. The direction also depends on the price
+        # of the security, so every symbol is still compared with the threshold
+        for symbol in self.indicatorUpdates.pop_updated():
+            sd = self.symbolData.get(symbol)
+            if sd is not None:
+                sd.Signal = sd.MACD.Signal.Current.Value
+
         for key, sd in self.symbolData.items():
             if sd.Security.Price == 0:
                 continue
 
             direction = InsightDirection.Flat
-            normalized_signal = sd.MACD.Signal.Current.Value / sd.Security.Price
+            normalized_signal = sd.Signal / sd.Security.Price
 
             if normalized_signal > self.bounceThresholdPercent:
                 direction = InsightDirection.Up
@@ -90,7 +100,10 @@ class MacdAlphaModel(AlphaModel):
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
         for added in changes.AddedSecurities:
-            self.symbolData[added.Symbol] = SymbolData(algorithm, added, self.fastPeriod, self.slowPeriod, self.signalPeriod, self.movingAverageType, self.resolution)
+            self.indicatorUpdates.untrack(added.Symbol)
+            sd = SymbolData(algorithm, added, self.fastPeriod, self.slowPeriod, self.signalPeriod, self.movingAverageType, self.resolution)
+            self.symbolData[added.Symbol] = sd
+            self.indicatorUpdates.track(added.Symbol, sd.MACD)
 
         for removed in changes.RemovedSecurities:
             symbol = removed.Symbol
@@ -99,7 +112,8 @@ class MacdAlphaModel(AlphaModel):
             if data is not None:
                 # clean up our consolidator
                 algorithm.SubscriptionManager.RemoveConsolidator(symbol, data.Consolidator)
-                
+            self.indicatorUpdates.untrack(symbol)
+
             # remove from insight collection manager
             self.CancelInsights(algorithm, symbol)
 
@@ -121,3 +135,4 @@ class SymbolData:
         algorithm.WarmUpIndicator(security.Symbol, self.MACD, resolution)
 
         self.PreviousDirection = None
+        self.Signal = self.MACD.Signal.Current.Value
@@ -13,7 +13,6 @@
 
 from AlgorithmImports import *
 from Alphas.BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
-from scipy.stats import pearsonr
 
 class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     ''' This alpha model is designed to rank every pair combination by its pearson correlation
@@ -23,18 +22,27 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     def __init__(self, lookback = 15,
             resolution = Resolution.MINUTE,
             threshold = 1,
-            minimum_correlation = .5):
+            minimum_correlation = .5,
+            incremental = False):
         '''Initializes a new instance of the PearsonCorrelationPairsTradingAlphaModel class
         Args:
             lookback: lookback period of the analysis
             resolution: analysis resolution
             threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
-            minimum_correlation: The minimum correlation to consider a tradable pair'''
+            minimum_correlation: The minimum correlation to consider a tradable pair
+            incremental: True to keep the prices and correlation matrix between universe changes, the window is moved
+                         forward with the bars received since the last change and only the added securities request
+                         the whole lookback. False to request the whole lookback of every security on every change'''
         super().__init__(lookback, resolution, threshold)
         self.lookback = lookback
         self.resolution = resolution
         self.minimum_correlation = minimum_correlation
+        self.incremental = incremental
         self.best_pair = ()
+        self.prices = None
+        self.returns = None
+        self.correlation = None
+        self.window_end = None
 
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
@@ -51,24 +59,12 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
 
         symbols = sorted([ x.symbol for x in self.securities ])
 
-        history = algorithm.history(symbols, self.lookback, self.resolution)
+        self.update_correlation_matrix(algorithm, symbols)
 
-        if not history.empty:
-            history = history.close.unstack(level=0)
-
-            df = self.get_price_dataframe(history)
-            stop = len(df.columns)
-
-            corr = dict()
-
-            for i in range(0, stop):
-                for j in range(i+1, stop):
-                    if (j, i) not in corr:
-                        corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
-
-            corr = sorted(corr.items(), key = lambda kv: kv[1])
-            if corr[-1][1] >= self.minimum_correlation:
-                self.best_pair = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+        if self.correlation is not None:
+            top_pairs = self.get_top_pairs(self.correlation, 1)
+            if len(top_pairs) > 0 and top_pairs[0][1] >= self.minimum_correlation:
+                self.best_pair = self.get_pair_symbols(top_pairs[0][0], symbols)
 
         super().on_securities_changed(algorithm, changes)
 
@@ -82,6 +78,119 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
             True if the statistical test for the pair is successful'''
         return self.best_pair is not None and self.best_pair[0] == asset1 and self.best_pair[1] == asset2
 
+    def update_correlation_matrix(self, algorithm, symbols):
+        '''Updates the returns and the correlation matrix of the symbols over the latest lookback
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            symbols: The sorted symbols of the current universe'''
+        if not self.incremental or self.prices is None:
+            history = algorithm.history(symbols, self.lookback, self.resolution)
+            self.window_end = algorithm.time
+            self.prices = None if history.empty else history.close.unstack(level=0)
+            self.returns = None if self.prices is None else self.get_price_dataframe(self.prices)
+            self.correlation = None if self.returns is None else self.get_correlation_matrix(self.returns)
+            return
+
+        # the removed symbols are dropped
+        labels = { str(x.id) for x in symbols }
+        tracked = [ x for x in self.prices.columns if str(x) in labels ]
+        tracked_labels = { str(x) for x in tracked }
+        prices = self.prices[tracked]
+
+        # the window is moved forward with the bars received since the last update,
+        # the history start and end are algorithm times like the window end
+        tracked_symbols = [ x for x in symbols if str(x.id) in tracked_labels ]
+        if len(tracked_symbols) > 0 and algorithm.time > self.window_end:
+            history = algorithm.history(tracked_symbols, self.window_end, algorithm.time, self.resolution)
+            if not history.empty:
+                new_prices = history.close.unstack(level=0)
+                new_prices = new_prices[new_prices.index > prices.index.max()]
+                if not new_prices.empty:
+                    prices = pd.concat([prices, new_prices]).tail(self.lookback)
+        self.window_end = algorithm.time
+
+        # the added symbols request the whole lookback, which ends with the moved window
+        added = [ x for x in symbols if str(x.id) not in tracked_labels ]
+        if len(added) > 0:
+            history = algorithm.history(added, self.lookback, self.resolution)
+            if not history.empty:
+                prices = pd.concat([prices, history.close.unstack(level=0)], axis=1)
+
+        previous_returns = self.returns
+        self.prices = prices if prices.columns.size > 0 else None
+        self.returns = None if self.prices is None else self.get_price_dataframe(self.prices)
+        if self.returns is None:
+            self.correlation = None
+            return
+
+        if self.correlation is None or previous_returns is None or not self.returns.index.equals(previous_returns.index):
+            # the returns of the tracked symbols changed, every correlation is computed again
+            self.correlation = self.get_correlation_matrix(self.returns)
+            return
+
+        # only the rows and columns of the added symbols are computed, their correlations with every symbol
+        columns = self.returns.columns
+        added = [ x for x in columns if x not in self.correlation.index ]
+        self.correlation = self.correlation.reindex(index = columns, columns = columns)
+        if len(added) > 0:
+            block = pd.DataFrame(self.correlate(self.returns[added].values, self.returns.values),
+                index = added, columns = columns)
+            self.correlation.loc[added, :] = block
+            self.correlation.loc[:, added] = block.T
+
+    def get_correlation_matrix(self, returns):
+        '''Computes the pearson correlation of every pair of columns in one pass
+        Args:
+            returns: Data frame of the log returns where each column represents a symbol
+        Returns:
+            Data frame with the correlation matrix'''
+        values = returns.values
+        return pd.DataFrame(self.correlate(values, values), index = returns.columns, columns = returns.columns)
+
+    def correlate(self, x, y):
+        '''Computes the pearson correlation of every column of x with every column of y
+        Args:
+            x: Matrix of observations where each column represents a variable (size: T x N)
+            y: Matrix of observations where each column represents a variable (size: T x M)
+        Returns:
+            Matrix of the correlations (size: N x M). NaN if a variable is constant'''
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = x - x.mean(axis=0)
+            y = y - y.mean(axis=0)
+            x = x / np.sqrt((x * x).sum(axis=0))
+            y = y / np.sqrt((y * y).sum(axis=0))
+            return np.clip(x.T @ y, -1, 1)
+
+    def get_top_pairs(self, correlation, count):
+        '''Gets the pairs with the highest correlation
+        Args:
+            correlation: Data frame with the correlation matrix
+            count: The number of pairs
+        Returns:
+            List of the pairs and their correlation, sorted by descending correlation'''
+        labels = correlation.columns
+        rows, columns = np.triu_indices(labels.size, k=1)
+        values = correlation.values[rows, columns]
+        values = np.where(np.isnan(values), -np.inf, values)
+        count = min(count, values.size)
+        if count == 0:
+            return []
+
+        top = np.argpartition(-values, count - 1)[:count]
+        top = top[np.argsort(-values[top], kind='stable')]
+        return [ ((labels[rows[i]], labels[columns[i]]), values[i]) for i in top if np.isfinite(values[i]) ]
+
+    def get_pair_symbols(self, pair, symbols):
+        '''Gets the symbols of a pair of the correlation matrix, in the order of the symbols like the pairs of update_pairs
+        Args:
+            pair: The labels of the pair in the correlation matrix
+            symbols: The sorted symbols of the current universe
+        Returns:
+            The symbols of the pair'''
+        symbol_by_label = { str(x.id): x for x in symbols }
+        pair = [ symbol_by_label.get(str(label), label) for label in pair ]
+        return tuple(sorted(pair, key = lambda x: symbols.index(x) if x in symbols else len(symbols)))
+
     def get_price_dataframe(self, df):
         timezones = { x.symbol.value: x.exchange.time_zone for x in self.securities }
 
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Alphas.IndicatorUpdateTracker import IndicatorUpdateTracker
 from QuantConnect.Logging import *
 from enum import Enum
 
@@ -29,6 +30,8 @@ class RsiAlphaModel(AlphaModel):
         self.resolution = resolution
         self.insight_period = Time.multiply(Extensions.to_time_span(resolution), period)
         self.symbol_data_by_symbol ={}
+        # symbols whose RSI has been updated since the last update
+        self.indicator_updates = IndicatorUpdateTracker()
 
         resolution_string = Extensions.get_enum_string(resolution, Resolution)
         self.name = '{}({},{})'.format(self.__class__.__name__, period, resolution_string)
@@ -42,7 +45,11 @@ class RsiAlphaModel(AlphaModel):
         Returns:
             The new insights generated'''
         insights = []
-        for symbol, symbol_data in self.symbol_data_by_symbol.items():
+        for symbol in self.indicator_updates.pop_updated():
+            symbol_data = self.symbol_data_by_symbol.get(symbol)
+            if symbol_data is None:
+                continue
+
             rsi = symbol_data.rsi
             previous_state = symbol_data.state
             state = self.get_state(rsi, previous_state)
@@ -69,6 +76,7 @@ class RsiAlphaModel(AlphaModel):
             symbol_data = self.symbol_data_by_symbol.pop(security.symbol, None)
             if symbol_data:
                 symbol_data.dispose()
+            self.indicator_updates.untrack(security.symbol)
 
         # initialize data for added securities
         added_symbols = []
@@ -77,6 +85,7 @@ class RsiAlphaModel(AlphaModel):
             if symbol not in self.symbol_data_by_symbol:
                 symbol_data = SymbolData(algorithm, symbol, self.period, self.resolution)
                 self.symbol_data_by_symbol[symbol] = symbol_data
+                self.indicator_updates.track(symbol, symbol_data.rsi)
                 added_symbols.append(symbol)
 
         if added_symbols:
@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
+from Portfolio.ReturnsRingBuffer import ReturnsRingBuffer
 from itertools import groupby
 from numpy import dot, transpose
 from numpy.linalg import inv
@@ -36,7 +38,8 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
                  risk_free_rate = 0,
                  delta = 2.5,
                  tau = 0.05,
-                 optimizer = None):
+                 optimizer = None,
+                 use_rolling_moments = False):
         """Initialize the model
         Args:
             rebalance: Rebalancing parameter. If it is a timedelta, date rules or Resolution, it will be converted into a function.
@@ -50,7 +53,10 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             resolution: The resolution of the history price
             risk_free_rate(float): The risk free rate
             delta(float): The risk aversion coeffficient of the market portfolio
-            tau(float): The model parameter indicating the uncertainty of the CAPM prior"""
+            tau(float): The model parameter indicating the uncertainty of the CAPM prior
+            use_rolling_moments(bool): True to keep the mean and covariance of the returns up to date as they arrive
+                              instead of computing them from a data frame of the returns on each rebalance.
+                              The optimizer must support None historical returns when the covariance is provided"""
         super().__init__()
         self.lookback = lookback
         self.period = period
@@ -66,6 +72,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbol_data_by_symbol = {}
+        self._rolling_moments = RollingMoments(period) if use_rolling_moments else None
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -96,12 +103,20 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
                     self.algorithm.set_run_time_error(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
                     return targets
                 symbol_data.add(insight.generated_time_utc, insight.magnitude)
-                returns[symbol] = symbol_data.return_
-
-            returns = pd.DataFrame(returns)
+                returns[symbol] = symbol_data.window
+
+            # The mean and covariance are kept up to date by the symbol data of the symbols in the universe
+            if self._rolling_moments is not None and all(symbol in self.symbol_data_by_symbol and symbol in self._rolling_moments for symbol in returns):
+                symbols = list(returns)
+                mean = self._rolling_moments.mean(symbols)
+                covariance = self._rolling_moments.covariance(symbols)
+                returns = None
+            else:
+                returns = ReturnsRingBuffer.stack(returns)
+                mean, covariance = None, None
 
             # Calculate prior estimate of the mean and covariance
-            pi, sigma = self.get_equilibrium_return(returns)
+            pi, sigma = self.get_equilibrium_return(returns, mean, covariance)
 
             # Calculate posterior estimate of the mean and covariance
             pi, sigma = self.apply_blacklitterman_master_formula(pi, sigma, p, q)
@@ -162,7 +177,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             if str(symbol) not in symbols:
                 continue
 
-            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
+            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self._rolling_moments))
             for time, close in history[symbol].items():
                 utc_time = Extensions.convert_to_utc(time, timezone)
                 symbol_data.update(utc_time, close)
@@ -196,21 +211,27 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         return Pi, Sigma
 
-    def get_equilibrium_return(self, returns):
+    def get_equilibrium_return(self, returns, mean = None, covariance = None):
         '''Calculate equilibrium returns and covariance
         Args:
             returns: Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)
+            mean: Mean of the returns of each security. Computed from the returns if None
+            covariance: Covariance of the returns (size: K x K). Computed from the returns if None
         Returns:
             equilibrium_return: Array of double of equilibrium returns
             cov: Multi-dimensional array of double with the portfolio covariance of returns (size: K x K)'''
+        if mean is None:
+            mean = returns.mean()
+        if covariance is None:
+            covariance = returns.cov()
 
-        size = len(returns.columns)
+        size = len(covariance.columns)
         # equal weighting scheme
         W = np.array([1/size]*size)
         # the covariance matrix of excess returns (N x N matrix)
-        cov = returns.cov()*252
+        cov = covariance*252
         # annualized return
-        annual_return = np.sum(((1 + returns.mean())**252 -1) * W)
+        annual_return = np.sum(((1 + mean)**252 -1) * W)
         # annualized variance of return
         annual_variance = dot(W.T, dot(cov, W))
         # the risk aversion coefficient
@@ -271,40 +292,44 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
     class BlackLittermanSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, rolling_moments = None):
             self._symbol = symbol
+            self._rolling_moments = rolling_moments
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.window = ReturnsRingBuffer(period)
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._rolling_moments is not None:
+                self._rolling_moments.remove(self._symbol)
 
         def update(self, utc_time, close):
             self.roc.update(utc_time, close)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self.window.add(value.end_time, value.value)
+                if self._rolling_moments is not None:
+                    self._rolling_moments.add(self._symbol, value.end_time, value.value)
 
         def add(self, time, value):
-            if self.window.samples > 0 and self.window[0].end_time == time:
+            if self.window.samples > 0 and self.window.latest_time == np.datetime64(time, 'ns'):
                 return
 
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._rolling_moments is not None:
+                self._rolling_moments.add(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
             return self.window.is_ready
 
         def __str__(self, **kwargs):
-            return f'{self.roc.name}: {(1 + self.window[0])**252 - 1:.2%}'
+            return f'{self.roc.name}: {(1 + self.window.latest_value)**252 - 1:.2%}'
@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
+from Portfolio.ReturnsRingBuffer import ReturnsRingBuffer
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -26,7 +28,8 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
                  period = 63,
                  resolution = Resolution.DAILY,
                  target_return = 0.02,
-                 optimizer = None):
+                 optimizer = None,
+                 use_rolling_moments = False):
         """Initialize the model
         Args:
             rebalance: Rebalancing parameter. If it is a timedelta, date rules or Resolution, it will be converted into a function.
@@ -38,7 +41,10 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
             lookback(int): Historical return lookback period
             period(int): The time interval of history price to calculate the weight
             resolution: The resolution of the history price
-            optimizer(class): Method used to compute the portfolio weights"""
+            optimizer(class): Method used to compute the portfolio weights
+            use_rolling_moments(bool): True to keep the mean and covariance of the returns up to date as they arrive
+                              instead of computing them from a data frame of the returns on each rebalance.
+                              The optimizer must support None historical returns when the covariance is provided"""
         super().__init__()
         self.lookback = lookback
         self.period = period
@@ -51,6 +57,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, target_return) if optimizer is None else optimizer
 
         self.symbol_data_by_symbol = {}
+        self._rolling_moments = RollingMoments(period) if use_rolling_moments else None
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -88,15 +95,30 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         symbols = [insight.symbol for insight in active_insights]
 
+        if self._rolling_moments is not None:
+            # The mean and covariance are kept up to date by the symbol data, no need to build the returns data frame.
+            # The symbols without returns yet, before their indicator is ready, get no weight
+            weights = pd.Series(0.0, index = list(dict.fromkeys(str(symbol.id) for symbol in symbols)))
+            symbols = [symbol for symbol in self.symbol_data_by_symbol if symbol in symbols and symbol in self._rolling_moments]
+            if len(symbols) > 0:
+                labels = [str(symbol.id) for symbol in symbols]
+                expected_returns = self._rolling_moments.mean(symbols, labels)
+                covariance = self._rolling_moments.covariance(symbols, labels)
+                weights.update(pd.Series(self.optimizer.optimize(None, expected_returns, covariance), index = labels))
+            return self.get_target_percents(active_insights, weights)
+
         # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol.id) : data.return_ for symbol, data in self.symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        returns = ReturnsRingBuffer.stack({ str(symbol.id) : data.window for symbol, data in self.symbol_data_by_symbol.items() if symbol in symbols })
 
         # The portfolio optimizer finds the optional weights for the given data
         weights = self.optimizer.optimize(returns)
         weights = pd.Series(weights, index = returns.columns)
 
-        # Create portfolio targets from the specified insights
+        return self.get_target_percents(active_insights, weights)
+
+    def get_target_percents(self, active_insights, weights):
+        '''Create portfolio targets from the specified insights and the weights keyed by symbol id'''
+        targets = {}
         for insight in active_insights:
             weight = weights[str(insight.symbol.id)]
 
@@ -122,7 +144,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         # initialize data for added securities
         symbols = [x.symbol for x in changes.added_securities]
         for symbol in [x for x in symbols if x not in self.symbol_data_by_symbol]:
-            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
+            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period, self._rolling_moments)
 
         history = algorithm.history[TradeBar](symbols, self.lookback * self.period, self.resolution)
         for bars in history:
@@ -131,40 +153,42 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, rolling_moments = None):
             self._symbol = symbol
+            self._rolling_moments = rolling_moments
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.window = ReturnsRingBuffer(period)
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._rolling_moments is not None:
+                self._rolling_moments.remove(self._symbol)
 
         def update(self, time, value):
             return self.roc.update(time, value)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self.add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._rolling_moments is not None:
+                self._rolling_moments.add(self._symbol, time, value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010).
         # GARP Risk Professional, pp. 49-51, April 2010 , Available at SSRN: https://ssrn.com/abstract=1586656
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
             return self.window.is_ready
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.name, self.window.latest_value)
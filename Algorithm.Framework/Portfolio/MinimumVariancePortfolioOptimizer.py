@@ -13,33 +13,55 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from time import perf_counter
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that calculate the optimal weights
 ### with the weight range from -1 to 1 and minimize the portfolio variance with a target return of 2%
 ### </summary>
-### <remarks>The budged constrain is scaled down/up to ensure that the sum of the absolute value of the weights is 1.</remarks>
+### <remarks>The budged constrain is scaled down/up to ensure that the sum of the absolute value of the weights is 1.
+### SLSQP is used with analytic gradients. With warm_start, it starts from the previous solution, and with use_closed_form,
+### the problem is solved directly through its KKT linear system when the bounds are not binding. Both are opt-in:
+### at the scale of the variance SLSQP stops after a few iterations, so its weights depend on the starting point.</remarks>
 class MinimumVariancePortfolioOptimizer:
     '''Provides an implementation of a portfolio optimizer that calculate the optimal weights
     with the weight range from -1 to 1 and minimize the portfolio variance with a target return of 2%'''
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 use_closed_form = False,
+                 warm_start = False):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            use_closed_form(bool): True to solve the problem through its KKT linear system when the bounds are not binding,
+                                   opt-in since the weights can differ from the iterative solver ones
+            warm_start(bool): True to start the iterative solver from the previous solution,
+                              opt-in since the weights then depend on the previous optimizations'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.use_closed_form = use_closed_form
+        self.warm_start = warm_start
+        self._last_solution = None
+
+        # Solver cost of the last optimization and accumulated over all of them
+        self.last_method = None
+        self.last_iterations = 0
+        self.last_solve_time = 0
+        self.total_iterations = 0
+        self.total_solve_time = 0
+        self.optimization_count = 0
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
         Perform portfolio optimization for a provided matrix of historical returns and an array of expected returns
         args:
             historical_returns: Matrix of annualized historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+                                Can be None if the expected returns and the covariance are provided.
             expected_returns: Array of double with the portfolio annualized expected returns (size: K x 1).
             covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K).
         Returns:
@@ -50,25 +72,99 @@ class MinimumVariancePortfolioOptimizer:
         if expected_returns is None:
             expected_returns = historical_returns.mean()
 
-        size = historical_returns.columns.size   # K x 1
+        size = historical_returns.columns.size if historical_returns is not None else len(covariance)   # K x 1
+        labels = self.get_labels(historical_returns, expected_returns, covariance)
         x0 = np.array(size * [1. / size])
 
+        start = perf_counter()
+        covariance = np.asarray(covariance, dtype=float)
+        expected_returns = np.asarray(expected_returns, dtype=float).flatten()
+        weights, self.last_iterations = self.solve(x0, expected_returns, covariance, labels)
+        self.last_solve_time = perf_counter() - start
+        self.total_iterations += self.last_iterations
+        self.total_solve_time += self.last_solve_time
+        self.optimization_count += 1
+
+        if weights is None:
+            self._last_solution = None
+            return x0
+        self._last_solution = pd.Series(weights, index = labels) if labels is not None else None
+
+        # Scale the solution to ensure that the sum of the absolute weights is 1
+        sum_of_absolute_weights = np.sum(np.abs(weights))
+        return weights / sum_of_absolute_weights
+
+    def solve(self, x0, expected_returns, covariance, labels = None):
+        '''Finds the weights that minimize the portfolio variance subject to the budget and target return constraints
+        Args:
+            x0: Equal weights, used as initial guess if there is no previous solution
+            expected_returns: Array of the expected returns (size: K)
+            covariance: Covariance matrix (size: K x K)
+            labels: Labels of the assets, used to map the previous solution to the current assets
+        Returns:
+            The weights, None if no solution was found, and the number of iterations'''
+        if self.use_closed_form:
+            weights = self.solve_closed_form(expected_returns, covariance)
+            if weights is not None:
+                self.last_method = 'KKT'
+                return weights, 0
+
+        self.last_method = 'SLSQP'
         constraints = [
-            {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
-            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns)}]
+            {'type': 'eq', 'fun': self.get_budget_constraint, 'jac': lambda weights: np.ones_like(weights)},
+            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns), 'jac': lambda weights: expected_returns}]
 
         # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
         opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
-                       bounds = self.get_boundary_conditions(size),               # Bounds for variables
+                       self.get_initial_guess(x0, labels),                        # Initial guess
+                       jac = lambda weights: 2 * covariance @ weights,            # Gradient of the objective function
+                       bounds = self.get_boundary_conditions(x0.size),            # Bounds for variables
                        constraints = constraints,                                 # Constraints definition
                        method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
 
-        if not opt['success']: return x0
+        return (opt['x'] if opt['success'] else None), opt.get('nit', 0)
 
-        # Scale the solution to ensure that the sum of the absolute weights is 1
-        sum_of_absolute_weights = np.sum(np.abs(opt['x']))
-        return opt['x'] / sum_of_absolute_weights
+    def solve_closed_form(self, expected_returns, covariance):
+        '''Solves the equality constrained problem through its KKT linear system:
+        [2Σ A^T; A 0] [w; λ] = [0; b] where A = [1^T; µ^T] and b = [1; target return]
+        Returns:
+            The weights, None if the system is singular or the solution is out of bounds'''
+        size = expected_returns.size
+        kkt = np.zeros((size + 2, size + 2))
+        kkt[:size, :size] = 2 * covariance
+        kkt[size, :size] = kkt[:size, size] = 1
+        kkt[size + 1, :size] = kkt[:size, size + 1] = expected_returns
+        rhs = np.zeros(size + 2)
+        rhs[size] = 1
+        rhs[size + 1] = self.target_return
+
+        try:
+            solution = np.linalg.solve(kkt, rhs)
+        except np.linalg.LinAlgError:
+            return None
+        weights = solution[:size]
+
+        if not np.all(np.isfinite(weights)) or np.any(weights < self.minimum_weight) or np.any(weights > self.maximum_weight):
+            return None
+        # same check as the iterative solver objective function
+        self.portfolio_variance(weights, covariance)
+        return weights
+
+    def get_initial_guess(self, x0, labels):
+        '''Gets the previous solution mapped to the current assets, new assets get equal weights'''
+        if not self.warm_start or self._last_solution is None or labels is None:
+            return x0
+        guess = self._last_solution.reindex(labels).values
+        return np.where(np.isnan(guess), x0, guess)
+
+    def get_labels(self, historical_returns, expected_returns, covariance):
+        '''Gets the labels of the assets from the inputs, None if they are plain arrays'''
+        for data in [covariance, expected_returns]:
+            if isinstance(data, (pd.DataFrame, pd.Series)):
+                return list(data.index)
+        if historical_returns is not None:
+            return list(historical_returns.columns)
+        return None
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
@@ -91,4 +187,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expected_returns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expected_returns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expected_returns, weights) - self.target_return
@@ -0,0 +1,108 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Preallocated ring buffer of the last returns of a symbol and their end times, stored in numpy arrays.
+### Every item is written twice, at its position and at its position plus the size of the buffer,
+### so the items in chronological order are always a contiguous slice of the arrays.
+### </summary>
+class ReturnsRingBuffer:
+    '''Preallocated ring buffer of the last returns of a symbol and their end times'''
+    __slots__ = ['size', 'count', 'samples', '_head', '_values', '_times']
+
+    def __init__(self, size):
+        '''Initialize the ReturnsRingBuffer
+        Args:
+            size(int): The number of returns kept in the buffer'''
+        self.size = size
+        self.count = 0
+        self.samples = 0
+        self._head = 0
+        self._values = np.empty(2 * size)
+        self._times = np.empty(2 * size, dtype='datetime64[ns]')
+
+    def add(self, time, value):
+        '''Adds a return to the buffer, overwriting the oldest one if the buffer is full
+        Args:
+            time: The end time of the return
+            value(float): The return'''
+        head = self._head
+        time = np.datetime64(time, 'ns')
+        self._values[head] = self._values[head + self.size] = value
+        self._times[head] = self._times[head + self.size] = time
+        self._head = (head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.samples += 1
+
+    def reset(self):
+        '''Removes all the returns from the buffer'''
+        self.count = 0
+        self.samples = 0
+        self._head = 0
+
+    @property
+    def is_ready(self):
+        '''True if the buffer is full'''
+        return self.count == self.size
+
+    @property
+    def values(self):
+        '''Gets a view of the returns in chronological order, it is not copied so it changes with the buffer'''
+        end = self._head + self.size
+        return self._values[end - self.count:end]
+
+    @property
+    def times(self):
+        '''Gets a view of the end times in chronological order, it is not copied so it changes with the buffer'''
+        end = self._head + self.size
+        return self._times[end - self.count:end]
+
+    @property
+    def latest_value(self):
+        '''Gets the most recent return'''
+        return self._values[self._head + self.size - 1]
+
+    @property
+    def latest_time(self):
+        '''Gets the end time of the most recent return'''
+        return self._times[self._head + self.size - 1]
+
+    def to_series(self):
+        '''Gets the returns as a pandas.Series indexed by their end times'''
+        return pd.Series(self.values, index = self.times)
+
+    @staticmethod
+    def stack(buffers_by_label):
+        '''Stacks the returns of many buffers into a data frame where each column represents a buffer
+        and each row the returns for the given date/time (size: K x N).
+        When all the buffers hold the same end times the matrix is filled with one copy per buffer,
+        otherwise the returns are aligned on their end times like a data frame of series would.
+        Args:
+            buffers_by_label: Dictionary of the buffers keyed by the column label
+        Returns:
+            pandas.DataFrame of the returns'''
+        if len(buffers_by_label) == 0:
+            return pd.DataFrame()
+
+        labels = list(buffers_by_label.keys())
+        buffers = list(buffers_by_label.values())
+        times = buffers[0].times
+        if all(buffer.count == times.size and np.array_equal(buffer.times, times) for buffer in buffers[1:]):
+            matrix = np.empty((times.size, len(buffers)))
+            for i, buffer in enumerate(buffers):
+                matrix[:, i] = buffer.values
+            return pd.DataFrame(matrix, index = pd.DatetimeIndex(times), columns = labels)
+
+        return pd.DataFrame({ label: buffer.to_series() for label, buffer in buffers_by_label.items() })
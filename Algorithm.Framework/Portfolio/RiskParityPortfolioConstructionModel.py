@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+from Portfolio.RollingMoments import RollingMoments
+from Portfolio.ReturnsRingBuffer import ReturnsRingBuffer
 
 ### <summary>
 ### Risk Parity Portfolio Construction Model
@@ -26,7 +28,8 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
                  lookback = 1,
                  period = 252,
                  resolution = Resolution.DAILY,
-                 optimizer = None):
+                 optimizer = None,
+                 use_rolling_moments = False):
         """Initialize the model
         Args:
             rebalance: Rebalancing parameter. If it is a timedelta, date rules or Resolution, it will be converted into a function.
@@ -38,7 +41,10 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
             lookback(int): Historical return lookback period
             period(int): The time interval of history price to calculate the weight
             resolution: The resolution of the history price
-            optimizer(class): Method used to compute the portfolio weights"""
+            optimizer(class): Method used to compute the portfolio weights
+            use_rolling_moments(bool): True to keep the covariance of the returns up to date as they arrive
+                              instead of computing it from a data frame of the returns on each rebalance.
+                              The optimizer must support None historical returns when the covariance is provided"""
         super().__init__()
         if portfolio_bias == PortfolioBias.SHORT:
             raise ArgumentException("Long position must be allowed in RiskParityPortfolioConstructionModel.")
@@ -51,6 +57,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         self.optimizer = RiskParityPortfolioOptimizer() if optimizer is None else optimizer
 
         self._symbol_data_by_symbol = {}
+        self._rolling_moments = RollingMoments(period) if use_rolling_moments else None
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -77,13 +84,22 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         symbols = [insight.symbol for insight in active_insights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol) : data.return_ for symbol, data in self._symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
-
-        # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
-        weights = pd.Series(weights, index = returns.columns)
+        if self._rolling_moments is not None:
+            # The covariance is kept up to date by the symbol data, no need to build the returns data frame.
+            # The symbols without returns yet, before their indicator is ready, get no weight
+            weights = pd.Series(0.0, index = list(dict.fromkeys(str(symbol) for symbol in symbols)))
+            symbols = [symbol for symbol in self._symbol_data_by_symbol if symbol in symbols and symbol in self._rolling_moments]
+            if len(symbols) > 0:
+                # the labeled covariance lets the optimizer warm start and skip unchanged problems
+                covariance = self._rolling_moments.covariance(symbols, [str(symbol) for symbol in symbols])
+                weights.update(pd.Series(self.optimizer.optimize(None, covariance = covariance), index = covariance.columns))
+        else:
+            # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
+            returns = ReturnsRingBuffer.stack({ str(symbol) : data.window for symbol, data in self._symbol_data_by_symbol.items() if symbol in symbols })
+
+            # The portfolio optimizer finds the optional weights for the given data
+            weights = self.optimizer.optimize(returns)
+            weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
         for insight in active_insights:
@@ -114,23 +130,26 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
             symbol = SymbolCache.get_symbol(ticker)
 
             if symbol not in self._symbol_data_by_symbol:
-                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period)
+                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period, self._rolling_moments)
                 symbol_data.warm_up_indicators(history.loc[ticker])
                 self._symbol_data_by_symbol[symbol] = symbol_data
                 algorithm.register_indicator(symbol, symbol_data.roc, self.resolution)
 
     class RiskParitySymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, rolling_moments = None):
             self._symbol = symbol
+            self._rolling_moments = rolling_moments
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.window = ReturnsRingBuffer(period)
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._rolling_moments is not None:
+                self._rolling_moments.remove(self._symbol)
 
         def warm_up_indicators(self, history):
             for tuple in history.itertuples():
@@ -138,21 +157,20 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self.add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._rolling_moments is not None:
+                self._rolling_moments.add(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
             return self.window.is_ready
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.name, self.window.latest_value)
@@ -22,19 +22,36 @@ class RiskParityPortfolioOptimizer:
     
     def __init__(self, 
                  minimum_weight = 1e-05, 
-                 maximum_weight = sys.float_info.max):
+                 maximum_weight = sys.float_info.max,
+                 warm_start = True,
+                 covariance_tolerance = 0):
         '''Initialize the RiskParityPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
-            maximum_weight(float): The upper bounds on portfolio weights'''
+            maximum_weight(float): The upper bounds on portfolio weights
+            warm_start(bool): True to start the solver from the previous solution of the same assets
+            covariance_tolerance(float): The previous weights are returned without solving again if no element of the
+                                         covariance changed by more than this value. Negative to always solve'''
         self.minimum_weight = minimum_weight if minimum_weight >= 1e-05 else 1e-05
         self.maximum_weight = maximum_weight if maximum_weight >= minimum_weight else minimum_weight
+        self.warm_start = warm_start
+        self.covariance_tolerance = covariance_tolerance
+        self._last_labels = None
+        self._last_covariance = None
+        self._last_budget = None
+        self._last_solution = None
+        self._last_weights = None
+
+        # Solver cost of the last optimization
+        self.last_iterations = 0
+        self.last_solve_skipped = False
 
     def optimize(self, historical_returns, budget = None, covariance = None):
         '''
         Perform portfolio optimization for a provided matrix of historical returns and an array of expected returns
         args:
             historical_returns: Matrix of annualized historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
+                                Can be None if the covariance is provided.
             budget: Risk budget vector (size: K x 1).
             covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K).
         Returns:
@@ -43,8 +60,10 @@ class RiskParityPortfolioOptimizer:
         if covariance is None:
             covariance = np.cov(historical_returns.T)
 
-        size = historical_returns.columns.size   # K x 1
-        
+        size = historical_returns.columns.size if historical_returns is not None else len(covariance)   # K x 1
+        labels = self.get_labels(historical_returns, covariance)
+        covariance = np.asarray(covariance, dtype=float)
+
         # Optimization Problem
         # minimize_{x >= 0} f(x) = 1/2 * x^T.S.x - b^T.log(x)
         # b = 1 / num_of_assets (equal budget of risk)
@@ -52,12 +71,64 @@ class RiskParityPortfolioOptimizer:
         # H(x) = S + Diag(b / x^2)
         # lw <= x <= up
         x0 = np.array(size * [1. / size])
-        budget = budget if budget is not None else x0
+        budget = np.asarray(budget, dtype=float).flatten() if budget is not None else x0
+
+        if self.is_unchanged(labels, covariance, budget):
+            self.last_iterations = 0
+            self.last_solve_skipped = True
+            return self._last_weights.copy()
+        self.last_solve_skipped = False
+
         objective = lambda weights: 0.5 * weights.T @ covariance @ weights - budget.T @ np.log(weights)
         gradient = lambda weights: covariance @ weights - budget / weights
-        hessian = lambda weights: covariance + np.diag((budget / weights**2).flatten())
-        solver = minimize(objective, jac=gradient, hess=hessian, x0=x0, method="Newton-CG")
+        # Hessian-vector product H(x).p, the diagonal matrix is never materialized
+        hessian_product = lambda weights, p: covariance @ p + (budget / weights**2) * p
+        initial_guess = self.get_initial_guess(x0, labels)
+        solver = minimize(objective, jac=gradient, hessp=hessian_product, x0=initial_guess, method="Newton-CG")
+        self.last_iterations = solver.get("nit", 0)
+        if not solver["success"] and initial_guess is not x0:
+            # the previous solution can be too far from the new one and lead the solver out of the domain of the log
+            solver = minimize(objective, jac=gradient, hessp=hessian_product, x0=x0, method="Newton-CG")
+            self.last_iterations += solver.get("nit", 0)
 
-        if not solver["success"]: return x0
+        if not solver["success"]:
+            self._last_solution = None
+            return x0
         # Normalize weights: w = x / x^T.1
-        return np.clip(solver["x"]/np.sum(solver["x"]), self.minimum_weight, self.maximum_weight)
+        weights = np.clip(solver["x"]/np.sum(solver["x"]), self.minimum_weight, self.maximum_weight)
+
+        self._last_labels = labels
+        self._last_covariance = covariance
+        self._last_budget = budget
+        self._last_solution = solver["x"]
+        self._last_weights = weights
+        return weights
+
+    def is_unchanged(self, labels, covariance, budget):
+        '''True if the assets and the budget are the same as the previous optimization
+        and no element of the covariance changed beyond the tolerance'''
+        if self.covariance_tolerance < 0 or self._last_solution is None or labels is None or labels != self._last_labels:
+            return False
+        if covariance.shape != self._last_covariance.shape or not np.array_equal(budget, self._last_budget):
+            return False
+        return np.max(np.abs(covariance - self._last_covariance), initial=0) <= self.covariance_tolerance
+
+    def get_initial_guess(self, x0, labels):
+        '''Gets the previous solution mapped to the current assets. The solution scales with the square root of the
+        budget, so it is rescaled when the number of assets changes, and new assets start at the mean of the solution'''
+        if not self.warm_start or self._last_solution is None or labels is None:
+            return x0
+        previous = pd.Series(self._last_solution, index = self._last_labels)
+        previous = previous[~previous.index.duplicated()] * np.sqrt(len(self._last_labels) / len(labels))
+        guess = previous.reindex(labels).values
+        if np.all(np.isnan(guess)):
+            return x0
+        return np.where(np.isnan(guess), np.nanmean(guess), guess)
+
+    def get_labels(self, historical_returns, covariance):
+        '''Gets the labels of the assets from the inputs, None if they are plain arrays'''
+        if isinstance(covariance, pd.DataFrame):
+            return list(covariance.columns)
+        if historical_returns is not None and hasattr(historical_returns, 'columns'):
+            return list(historical_returns.columns)
+        return None
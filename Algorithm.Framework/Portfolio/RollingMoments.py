@@ -0,0 +1,172 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from collections import deque
+
+### <summary>
+### Keeps the running sums and cross-products of the returns of a set of symbols, each one over a rolling
+### window of its last observations, so the mean vector and the covariance matrix are available in O(N^2)
+### without building a data frame of the windows.
+### </summary>
+### <remarks>The statistics match pandas.DataFrame.mean() and pandas.DataFrame.cov() of the data frame whose
+### columns are the windows aligned on their times: each pair of symbols uses the times both have observed.</remarks>
+class RollingMoments:
+    '''Keeps the running sums and cross-products of the returns of a set of symbols over rolling windows'''
+    def __init__(self, period, capacity = 16):
+        '''Initialize the RollingMoments
+        Args:
+            period(int): The number of observations kept for each symbol
+            capacity(int): The initial number of symbols the arrays can hold'''
+        self.period = period
+        self._capacity = capacity
+        self._slot_by_symbol = {}
+        self._free_slots = []
+        self._times_by_slot = {}
+        self._rows = {}
+        self._pair_count = np.zeros((capacity, capacity))
+        self._pair_sum = np.zeros((capacity, capacity))
+        self._cross_product = np.zeros((capacity, capacity))
+
+    def __contains__(self, symbol):
+        return symbol in self._slot_by_symbol
+
+    def add(self, symbol, time, value):
+        '''Adds an observation of the given symbol, evicting its oldest one if its window is full
+        Args:
+            symbol: The symbol the observation belongs to
+            time: The end time of the observation, used to align the observations of different symbols
+            value(float): The observed return'''
+        slot = self._get_slot(symbol)
+        times = self._times_by_slot[slot]
+
+        row = self._rows.get(time)
+        if row is not None and not np.isnan(row[slot]):
+            # the time was already observed, the new value replaces the old one
+            self._remove(slot, time)
+            times.remove(time)
+        elif len(times) == self.period:
+            self._remove(slot, times.popleft())
+
+        row = self._rows.get(time)
+        if row is None:
+            row = self._rows[time] = np.full(self._capacity, np.nan)
+        row[slot] = value
+        self._apply(slot, row, 1)
+        times.append(time)
+
+    def remove(self, symbol):
+        '''Removes the symbol and all its observations
+        Args:
+            symbol: The symbol to remove'''
+        slot = self._slot_by_symbol.pop(symbol, None)
+        if slot is None:
+            return
+        for time in self._times_by_slot.pop(slot):
+            self._remove(slot, time)
+        self._free_slots.append(slot)
+
+    def reset(self):
+        '''Removes all the symbols and their observations'''
+        self.__init__(self.period, self._capacity)
+
+    def mean(self, symbols, labels = None):
+        '''Gets the mean of the returns of the given symbols
+        Args:
+            symbols: The symbols, in the order of the result
+            labels: The labels of the resulting series. The symbols are used if None
+        Returns:
+            pandas.Series with the mean returns'''
+        slots = self._get_slots(symbols)
+        known = slots >= 0
+        mean = np.full(slots.size, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean[known] = self._pair_sum[slots[known], slots[known]] / self._pair_count[slots[known], slots[known]]
+        return pd.Series(mean, index = symbols if labels is None else labels)
+
+    def covariance(self, symbols, labels = None):
+        '''Gets the sample covariance matrix of the returns of the given symbols
+        Args:
+            symbols: The symbols, in the order of the result
+            labels: The labels of the resulting data frame rows and columns. The symbols are used if None
+        Returns:
+            pandas.DataFrame with the covariance matrix (size: K x K)'''
+        slots = self._get_slots(symbols)
+        known = slots >= 0
+        index = np.ix_(slots[known], slots[known])
+        count = self._pair_count[index]
+        pair_sum = self._pair_sum[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            known_covariance = (self._cross_product[index] - pair_sum * pair_sum.T / count) / (count - 1)
+        known_covariance[count < 2] = np.nan
+        covariance = np.full((slots.size, slots.size), np.nan)
+        covariance[np.ix_(known, known)] = known_covariance
+        labels = symbols if labels is None else labels
+        return pd.DataFrame(covariance, index = labels, columns = labels)
+
+    def _get_slots(self, symbols):
+        '''Gets the slots of the symbols, -1 for the symbols without observations, their statistics are NaN'''
+        return np.array([self._slot_by_symbol.get(symbol, -1) for symbol in symbols], dtype=int)
+
+    def _get_slot(self, symbol):
+        slot = self._slot_by_symbol.get(symbol)
+        if slot is not None:
+            return slot
+
+        if not self._free_slots:
+            self._grow()
+        slot = self._slot_by_symbol[symbol] = self._free_slots.pop()
+        self._times_by_slot[slot] = deque()
+        return slot
+
+    def _grow(self):
+        '''Doubles the number of symbols the arrays can hold'''
+        size = self._capacity
+        self._capacity = capacity = max(1, 2 * size)
+        for name in ['_pair_count', '_pair_sum', '_cross_product']:
+            array = np.zeros((capacity, capacity))
+            array[:size, :size] = getattr(self, name)
+            setattr(self, name, array)
+        for time, row in self._rows.items():
+            self._rows[time] = np.concatenate([row, np.full(capacity - size, np.nan)])
+        self._free_slots.extend(reversed(range(size, capacity)))
+
+    def _remove(self, slot, time):
+        '''Removes the observation of the slot at the given time'''
+        row = self._rows[time]
+        self._apply(slot, row, -1)
+        row[slot] = np.nan
+        if np.isnan(row).all():
+            del self._rows[time]
+
+    def _apply(self, slot, row, sign):
+        '''Adds (sign = 1) or removes (sign = -1) the pairs formed by the observation of the slot
+        and the observations of every slot at the same time, including itself'''
+        observed = ~np.isnan(row)
+        mask = observed.astype(float) * sign
+        values = np.where(observed, row, 0) * sign
+        value = row[slot]
+
+        # the diagonal is updated by both the row and the column operations, we subtract it once
+        self._pair_count[slot, :] += mask
+        self._pair_count[:, slot] += mask
+        self._pair_count[slot, slot] -= sign
+
+        # pair_sum[i, j] is the sum of the observations of i at the times j was observed
+        self._pair_sum[slot, :] += value * mask
+        self._pair_sum[:, slot] += values
+        self._pair_sum[slot, slot] -= value * sign
+
+        self._cross_product[slot, :] += value * values
+        self._cross_product[:, slot] += value * values
+        self._cross_product[slot, slot] -= value * value * sign
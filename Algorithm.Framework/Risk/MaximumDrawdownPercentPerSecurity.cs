@@ -47,26 +47,16 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="targets">The current portfolio targets to be assessed for risk</param>
         public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            foreach (var kvp in algorithm.Securities)
+            // only the invested securities are checked, in a single call
+            foreach (var security in algorithm.Portfolio.GetInvestedSecuritiesWithUnrealizedProfitPercentBelow(_maximumDrawdownPercent))
             {
-                var security = kvp.Value;
+                var symbol = security.Symbol;
 
-                if (!security.Invested)
-                {
-                    continue;
-                }
+                // Cancel insights
+                algorithm.Insights.Cancel(new[] { symbol });
 
-                var pnl = security.Holdings.UnrealizedProfitPercent;
-                if (pnl < _maximumDrawdownPercent)
-                {
-                    var symbol = security.Symbol;
-
-                    // Cancel insights
-                    algorithm.Insights.Cancel(new[] { symbol });
-                    
-                    // liquidate
-                    yield return new PortfolioTarget(symbol, 0);
-                }
+                // liquidate
+                yield return new PortfolioTarget(symbol, 0);
             }
         }
     }
@@ -28,20 +28,14 @@ class MaximumDrawdownPercentPerSecurity(RiskManagementModel):
             algorithm: The algorithm instance
             targets: The current portfolio targets to be assessed for risk'''
         targets = []
-        for kvp in algorithm.securities:
-            security = kvp.value
+        # only the invested securities are checked, in a single call
+        for security in algorithm.portfolio.get_invested_securities_with_unrealized_profit_percent_below(self.maximum_drawdown_percent):
+            symbol = security.symbol
 
-            if not security.invested:
-                continue
+            # Cancel insights
+            algorithm.insights.cancel([symbol])
 
-            pnl = security.holdings.unrealized_profit_percent
-            if pnl < self.maximum_drawdown_percent:
-                symbol = security.symbol
-
-                # Cancel insights
-                algorithm.insights.cancel([symbol])
-
-                # liquidate
-                targets.append(PortfolioTarget(symbol, 0))
+            # liquidate
+            targets.append(PortfolioTarget(symbol, 0))
 
         return targets
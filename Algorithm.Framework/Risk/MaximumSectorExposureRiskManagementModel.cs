@@ -30,6 +30,8 @@ namespace QuantConnect.Algorithm.Framework.Risk
     {
         private readonly decimal _maximumSectorExposure;
         private readonly PortfolioTargetCollection _targetsCollection;
+        private readonly Dictionary<Symbol, string> _sectorBySymbol;
+        private readonly HashSet<Symbol> _targetedSymbols;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="MaximumSectorExposureRiskManagementModel"/> class
@@ -46,6 +48,8 @@ namespace QuantConnect.Algorithm.Framework.Risk
 
             _maximumSectorExposure = maximumSectorExposure;
             _targetsCollection = new PortfolioTargetCollection();
+            _sectorBySymbol = new Dictionary<Symbol, string>();
+            _targetedSymbols = new HashSet<Symbol>();
         }
 
         /// <summary>
@@ -58,54 +62,75 @@ namespace QuantConnect.Algorithm.Framework.Risk
             var maximumSectorExposureValue = algorithm.Portfolio.TotalPortfolioValue * _maximumSectorExposure;
 
             _targetsCollection.AddRange(targets);
+            foreach (var target in targets)
+            {
+                if (target.Quantity != 0)
+                {
+                    _targetedSymbols.Add(target.Symbol);
+                }
+                else
+                {
+                    _targetedSymbols.Remove(target.Symbol);
+                }
+            }
 
-            // Group the securities by their sector
-            var groupBySector = algorithm.UniverseManager.ActiveSecurities
-                .Where(x => x.Value.Fundamentals != null && x.Value.Fundamentals.HasFundamentalData)
-                .GroupBy(x => x.Value.Fundamentals.CompanyReference.IndustryTemplateCode);
+            // Only the securities with holdings or with a target have a sector exposure,
+            // the others of the sector would add nothing to it
+            var symbols = new HashSet<Symbol>(_targetedSymbols);
+            foreach (var security in algorithm.Portfolio.InvestedSecurities)
+            {
+                symbols.Add(security.Symbol);
+            }
 
-            foreach (var securities in groupBySector)
+            // Group the securities by their sector, the targets are emitted by sector and symbol so their order doesn't change between runs
+            var sectorAbsoluteHoldingsValues = new SortedDictionary<string, decimal>(StringComparer.Ordinal);
+            var sectorQuantities = new Dictionary<string, List<KeyValuePair<Symbol, decimal>>>();
+            foreach (var symbol in symbols.OrderBy(x => x.Value, StringComparer.Ordinal).ThenBy(x => x.ID.ToString(), StringComparer.Ordinal))
             {
+                if (!_sectorBySymbol.TryGetValue(symbol, out var sector))
+                {
+                    continue;
+                }
+
                 // Compute the sector absolute holdings value
                 // If the construction model has created a target, we consider that
                 // value to calculate the security absolute holding value
-                var sectorAbsoluteHoldingsValue = 0m;
+                var security = algorithm.Securities[symbol];
+                var quantity = security.Holdings.Quantity;
+                var absoluteHoldingsValue = security.Holdings.AbsoluteHoldingsValue;
 
-                foreach (var security in securities)
+                IPortfolioTarget target;
+                if (_targetsCollection.TryGetValue(symbol, out target))
                 {
-                    var absoluteHoldingsValue = security.Value.Holdings.AbsoluteHoldingsValue;
+                    quantity = target.Quantity;
+                    absoluteHoldingsValue = security.Price * Math.Abs(target.Quantity) *
+                        security.SymbolProperties.ContractMultiplier *
+                        security.QuoteCurrency.ConversionRate;
+                }
 
-                    IPortfolioTarget target;
-                    if (_targetsCollection.TryGetValue(security.Value.Symbol, out target))
-                    {
-                        absoluteHoldingsValue = security.Value.Price * Math.Abs(target.Quantity) *
-                            security.Value.SymbolProperties.ContractMultiplier *
-                            security.Value.QuoteCurrency.ConversionRate;
-                    }
+                sectorAbsoluteHoldingsValues.TryGetValue(sector, out var sectorAbsoluteHoldingsValue);
+                sectorAbsoluteHoldingsValues[sector] = sectorAbsoluteHoldingsValue + absoluteHoldingsValue;
 
-                    sectorAbsoluteHoldingsValue += absoluteHoldingsValue;
+                if (!sectorQuantities.TryGetValue(sector, out var quantities))
+                {
+                    sectorQuantities[sector] = quantities = new List<KeyValuePair<Symbol, decimal>>();
                 }
+                quantities.Add(new KeyValuePair<Symbol, decimal>(symbol, quantity));
+            }
 
+            foreach (var kvp in sectorAbsoluteHoldingsValues)
+            {
                 // If the ratio between the sector absolute holdings value and the maximum sector exposure value
                 // exceeds the unity, it means we need to reduce each security of that sector by that ratio
                 // Otherwise, it means that the sector exposure is below the maximum and there is nothing to do.
-                var ratio = sectorAbsoluteHoldingsValue / maximumSectorExposureValue;
+                var ratio = kvp.Value / maximumSectorExposureValue;
                 if (ratio > 1)
                 {
-                    foreach (var security in securities)
+                    foreach (var quantity in sectorQuantities[kvp.Key])
                     {
-                        var quantity = security.Value.Holdings.Quantity;
-                        var symbol = security.Value.Symbol;
-
-                        IPortfolioTarget target;
-                        if (_targetsCollection.TryGetValue(symbol, out target))
-                        {
-                            quantity = target.Quantity;
-                        }
-
-                        if (quantity != 0)
+                        if (quantity.Value != 0)
                         {
-                            yield return new PortfolioTarget(symbol, quantity / ratio);
+                            yield return new PortfolioTarget(quantity.Key, quantity.Value / ratio);
                         }
                     }
                 }
@@ -119,10 +144,23 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="changes">The security additions and removals from the algorithm</param>
         public override void OnSecuritiesChanged(QCAlgorithm algorithm, SecurityChanges changes)
         {
-            var anyFundamentalData = algorithm.ActiveSecurities
-                .Any(kvp => kvp.Value.Fundamentals != null && kvp.Value.Fundamentals.HasFundamentalData);
+            // The sector of the securities is only read when they are added to the universe
+            foreach (var security in changes.RemovedSecurities)
+            {
+                _sectorBySymbol.Remove(security.Symbol);
+                _targetedSymbols.Remove(security.Symbol);
+            }
+
+            foreach (var security in changes.AddedSecurities)
+            {
+                var fundamentals = security.Fundamentals;
+                if (fundamentals != null && fundamentals.HasFundamentalData)
+                {
+                    _sectorBySymbol[security.Symbol] = fundamentals.CompanyReference.IndustryTemplateCode ?? string.Empty;
+                }
+            }
 
-            if (!anyFundamentalData)
+            if (_sectorBySymbol.Count == 0)
             {
                 throw new Exception("MaximumSectorExposureRiskManagementModel.OnSecuritiesChanged: Please select a portfolio selection model that selects securities with fundamental data.");
             }
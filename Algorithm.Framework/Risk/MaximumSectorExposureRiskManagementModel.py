@@ -12,7 +12,6 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from itertools import groupby
 
 class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that that limits the sector exposure to the specified percentage'''
@@ -26,6 +25,8 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
 
         self.maximum_sector_exposure = maximum_sector_exposure
         self.targets_collection = PortfolioTargetCollection()
+        self.sector_by_symbol = {}
+        self.targeted_symbols = set()
 
     def manage_risk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
@@ -34,42 +35,53 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         maximum_sector_exposure_value = float(algorithm.portfolio.total_portfolio_value) * self.maximum_sector_exposure
 
         self.targets_collection.add_range(targets)
+        for target in targets:
+            if target.quantity != 0:
+                self.targeted_symbols.add(target.symbol)
+            else:
+                self.targeted_symbols.discard(target.symbol)
 
         risk_targets = list()
 
-        # Group the securities by their sector
-        filtered = list(filter(lambda x: x.value.fundamentals is not None and x.value.fundamentals.has_fundamental_data, algorithm.universe_manager.active_securities))
-        filtered.sort(key = lambda x: x.value.fundamentals.company_reference.industry_template_code)
-        group_by_sector = groupby(filtered, lambda x: x.value.fundamentals.company_reference.industry_template_code)
+        # Only the securities with holdings or with a target have a sector exposure,
+        # the others of the sector would add nothing to it
+        symbols = set(self.targeted_symbols)
+        symbols.update(security.symbol for security in algorithm.portfolio.invested_securities)
+
+        # Group the securities by their sector, the targets are emitted by sector and symbol so their order doesn't change between runs
+        sector_absolute_holdings_values = {}
+        sector_quantities = {}
+
+        for symbol in sorted(symbols, key=lambda x: (x.value, str(x.id))):
+            if symbol not in self.sector_by_symbol:
+                continue
+            sector = self.sector_by_symbol[symbol]
 
-        for code, securities in group_by_sector:
             # Compute the sector absolute holdings value
             # If the construction model has created a target, we consider that
             # value to calculate the security absolute holding value
-            quantities = {}
-            sector_absolute_holdings_value = 0
+            security = algorithm.securities[symbol]
+            quantity = security.holdings.quantity
+            absolute_holdings_value = security.holdings.absolute_holdings_value
 
-            for security in securities:
-                symbol = security.value.symbol
-                quantities[symbol] = security.value.holdings.quantity
-                absolute_holdings_value = security.value.holdings.absolute_holdings_value
+            if self.targets_collection.contains_key(symbol):
+                quantity = self.targets_collection[symbol].quantity
 
-                if self.targets_collection.contains_key(symbol):
-                    quantities[symbol] = self.targets_collection[symbol].quantity
+                absolute_holdings_value = (security.price * abs(quantity) *
+                    security.symbol_properties.contract_multiplier *
+                    security.quote_currency.conversion_rate)
 
-                    absolute_holdings_value = (security.value.price * abs(quantities[symbol]) *
-                        security.value.symbol_properties.contract_multiplier *
-                        security.value.quote_currency.conversion_rate)
-
-                sector_absolute_holdings_value += absolute_holdings_value
+            sector_absolute_holdings_values[sector] = sector_absolute_holdings_values.get(sector, 0) + absolute_holdings_value
+            sector_quantities.setdefault(sector, {})[symbol] = quantity
 
+        for sector, sector_absolute_holdings_value in sorted(sector_absolute_holdings_values.items()):
             # If the ratio between the sector absolute holdings value and the maximum sector exposure value
             # exceeds the unity, it means we need to reduce each security of that sector by that ratio
             # Otherwise, it means that the sector exposure is below the maximum and there is nothing to do.
             ratio = float(sector_absolute_holdings_value) / maximum_sector_exposure_value
 
             if ratio > 1:
-                for symbol, quantity in quantities.items():
+                for symbol, quantity in sector_quantities[sector].items():
                     if quantity != 0:
                         risk_targets.append(PortfolioTarget(symbol, float(quantity) / ratio))
 
@@ -80,10 +92,15 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
-        any_fundamental_data = any([
-            kvp.value.fundamentals is not None and
-            kvp.value.fundamentals.has_fundamental_data for kvp in algorithm.active_securities
-            ])
+        # The sector of the securities is only read when they are added to the universe
+        for security in changes.removed_securities:
+            self.sector_by_symbol.pop(security.symbol, None)
+            self.targeted_symbols.discard(security.symbol)
+
+        for security in changes.added_securities:
+            fundamentals = security.fundamentals
+            if fundamentals is not None and fundamentals.has_fundamental_data:
+                self.sector_by_symbol[security.symbol] = fundamentals.company_reference.industry_template_code or ''
 
-        if not any_fundamental_data:
+        if not self.sector_by_symbol:
             raise Exception("MaximumSectorExposureRiskManagementModel.on_securities_changed: Please select a portfolio selection model that selects securities with fundamental data.")
@@ -16,6 +16,7 @@
 
 using System;
 using System.Collections.Generic;
+using System.Linq;
 using QuantConnect.Algorithm.Framework.Portfolio;
 
 namespace QuantConnect.Algorithm.Framework.Risk
@@ -45,17 +46,18 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="targets">The current portfolio targets to be assessed for risk</param>
         public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            foreach (var kvp in algorithm.Securities)
+            // Remove if not invested
+            foreach (var symbol in _trailingAbsoluteHoldingsState.Keys.ToList())
             {
-                var symbol = kvp.Key;
-                var security = kvp.Value;
-
-                // Remove if not invested
-                if (!security.Invested)
+                if (!algorithm.Securities.TryGetValue(symbol, out var security) || !security.Invested)
                 {
                     _trailingAbsoluteHoldingsState.Remove(symbol);
-                    continue;
                 }
+            }
+
+            foreach (var security in algorithm.Portfolio.InvestedSecurities)
+            {
+                var symbol = security.Symbol;
 
                 var position = security.Holdings.IsLong ? PositionSide.Long : PositionSide.Short;
                 var absoluteHoldingsValue = security.Holdings.AbsoluteHoldingsValue;
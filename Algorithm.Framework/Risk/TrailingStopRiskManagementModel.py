@@ -30,14 +30,14 @@ class TrailingStopRiskManagementModel(RiskManagementModel):
             targets: The current portfolio targets to be assessed for risk'''
         risk_adjusted_targets = list()
 
-        for kvp in algorithm.securities:
-            symbol = kvp.key
-            security = kvp.value
-
-            # Remove if not invested
-            if not security.invested:
+        # Remove if not invested
+        for symbol in list(self.trailing_absolute_holdings_state):
+            security = algorithm.securities.get(symbol)
+            if security is None or not security.invested:
                 self.trailing_absolute_holdings_state.pop(symbol, None)
-                continue
+
+        for security in algorithm.portfolio.invested_securities:
+            symbol = security.symbol
 
             position = PositionSide.LONG if security.holdings.is_long else PositionSide.SHORT
             absolute_holdings_value = security.holdings.absolute_holdings_value
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
+from Selection.IndicatorBank import IndicatorBank, ExponentialMovingAverages
 
 class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
     '''Provides an implementation of FundamentalUniverseSelectionModel that subscribes to
@@ -22,13 +23,16 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
                  fastPeriod = 100,
                  slowPeriod = 300,
                  universeCount = 500,
-                 universeSettings = None):
+                 universeSettings = None,
+                 useIndicatorBank = False):
         '''Initializes a new instance of the EmaCrossUniverseSelectionModel class
         Args:
             fastPeriod: Fast EMA period
             slowPeriod: Slow EMA period
             universeCount: Maximum number of members of this universe selection
-            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings'''
+            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings
+            useIndicatorBank: True to keep the averages of all the symbols in numpy arrays updated in one call,
+                              False to use one pair of ExponentialMovingAverage indicators per symbol'''
         super().__init__(False, universeSettings)
         self.fast_period = fastPeriod
         self.slow_period = slowPeriod
@@ -36,6 +40,11 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.tolerance = 0.01
         # holds our coarse fundamental indicators by symbol
         self.averages = {}
+        self.indicator_bank = None
+        if useIndicatorBank:
+            self.indicator_bank = IndicatorBank()
+            self.fast_ema = self.indicator_bank.add('fast', ExponentialMovingAverages(fastPeriod))
+            self.slow_ema = self.indicator_bank.add('slow', ExponentialMovingAverages(slowPeriod))
 
     def select_coarse(self, algorithm: QCAlgorithm, fundamental: list[Fundamental]) -> list[Symbol]:
         '''Defines the coarse fundamental selection function.
@@ -44,6 +53,9 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
             fundamental: The coarse fundamental data used to perform filtering</param>
         Returns:
             An enumerable of symbols passing the filter'''
+        if self.indicator_bank is not None:
+            return self.select_with_indicator_bank(fundamental)
+
         filtered = []
 
         for cf in fundamental:
@@ -64,6 +76,31 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
         # we only need to return the symbol and return 'universeCount' symbols
         return [x.symbol for x in filtered[:self.universe_count]]
 
+    def select_with_indicator_bank(self, fundamental):
+        '''Updates the averages of all the symbols in one call and selects the symbols
+        with the larger delta by percentage between the two averages
+        Args:
+            fundamental: The coarse fundamental data used to perform filtering
+        Returns:
+            An enumerable of symbols passing the filter'''
+        symbols = []
+        prices = []
+        for cf in fundamental:
+            symbols.append(cf.symbol)
+            prices.append(cf.adjusted_price)
+
+        slots = self.indicator_bank.update(symbols, prices)
+        fast = self.fast_ema.current[slots]
+        slow = self.slow_ema.current[slots]
+
+        # only pick symbols whose averages are ready and have their fast ema over their slow ema
+        selected = self.fast_ema.is_ready[slots] & self.slow_ema.is_ready[slots] & (fast > slow * (1 + self.tolerance))
+        fast = fast[selected]
+        slow = slow[selected]
+
+        # prefer symbols with a larger delta by percentage between the two averages
+        return self.indicator_bank.top(slots[selected], (fast - slow) / ((fast + slow) / 2), self.universe_count)
+
     # class used to improve readability of the coarse selection function
     class SelectionData:
         def __init__(self, symbol, fast_period, slow_period):
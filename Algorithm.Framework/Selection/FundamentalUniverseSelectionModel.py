@@ -18,11 +18,14 @@ class FundamentalUniverseSelectionModel:
     
     def __init__(self,
                  filterFineData = None,
-                 universeSettings = None):
+                 universeSettings = None,
+                 fields = None):
         '''Initializes a new instance of the FundamentalUniverseSelectionModel class
         Args:
             filterFineData: [Obsolete] Fine and Coarse selection are merged
-            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings'''
+            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings
+            fields: The fundamental fields, like 'dollar_volume' or 'valuation_ratios.pe_ratio', of the data frame passed to 'select_frame'.
+                    Specify them to select from a columnar data frame instead of the fundamental objects passed to 'select'.'''
         self.filter_fine_data = filterFineData
         if self.filter_fine_data == None:
             self.fundamental_data = True
@@ -30,6 +33,7 @@ class FundamentalUniverseSelectionModel:
             self.fundamental_data = False
         self.market = Market.USA
         self.universe_settings = universeSettings
+        self.fields = fields
 
 
     def create_universes(self, algorithm: QCAlgorithm) -> list[Universe]:
@@ -40,6 +44,8 @@ class FundamentalUniverseSelectionModel:
             The universe defined by this model'''
         if self.fundamental_data:
             universe_settings = algorithm.universe_settings if self.universe_settings is None else self.universe_settings
+            if self.fields:
+                return [FundamentalFrameUniverse(self.market, universe_settings, self.fields, lambda frame: self.select_frame(algorithm, frame))]
             # handle both 'Select' and 'select' for backwards compatibility
             selection = lambda fundamental: self.select(algorithm, fundamental)
             if hasattr(self, "Select") and callable(self.Select):
@@ -95,6 +101,16 @@ class FundamentalUniverseSelectionModel:
         raise NotImplementedError("Please overrride the 'select' fundamental function")
 
 
+    def select_frame(self, algorithm: QCAlgorithm, frame: pd.DataFrame) -> pd.Series:
+        '''Defines the columnar fundamental selection function, used when the model has fields.
+        Args:
+            algorithm: The algorithm instance
+            frame: The data frame of the fields of the fundamental data, one row per symbol and indexed by symbol
+        Returns:
+            A boolean mask of the rows, the selected index values or symbols'''
+        raise NotImplementedError("Please overrride the 'select_frame' fundamental function")
+
+
     def select_coarse(self, algorithm: QCAlgorithm, fundamental: list[Fundamental]) -> list[Symbol]:
         '''Defines the coarse fundamental selection function.
         Args:
@@ -0,0 +1,306 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Holds the state of indicators of thousands of symbols in contiguous numpy arrays. Each symbol is assigned a slot
+### and every registered indicator is updated in one call from a vector of values, so universe selection functions
+### do not need one indicator object per symbol.
+### </summary>
+### <remarks>The indicators follow the Lean indicators of the same name, with double instead of decimal precision</remarks>
+class IndicatorBank:
+    '''Holds the state of indicators of thousands of symbols in contiguous numpy arrays'''
+
+    def __init__(self, capacity = 1024):
+        '''Initialize the IndicatorBank
+        Args:
+            capacity(int): The initial number of symbols the arrays can hold'''
+        self.capacity = capacity
+        self.slot_by_symbol = {}
+        self.symbols = np.empty(capacity, dtype=object)
+        self.indicators = {}
+        self._free_slots = list(reversed(range(capacity)))
+
+    def __len__(self):
+        return len(self.slot_by_symbol)
+
+    def __contains__(self, symbol):
+        return symbol in self.slot_by_symbol
+
+    def __getitem__(self, name):
+        return self.indicators[name]
+
+    def add(self, name, indicator):
+        '''Registers an indicator, it is updated by every call to update
+        Args:
+            name(str): The name of the indicator in the bank
+            indicator: The vectorized indicator, e.g. ExponentialMovingAverages
+        Returns:
+            The indicator'''
+        indicator.grow(self.capacity)
+        self.indicators[name] = indicator
+        return indicator
+
+    def get_slots(self, symbols):
+        '''Gets the slots of the symbols, assigning new slots to the symbols that are not in the bank
+        Args:
+            symbols: The symbols
+        Returns:
+            numpy array with the slot of each symbol'''
+        slots = np.empty(len(symbols), dtype=np.int64)
+        slot_by_symbol = self.slot_by_symbol
+        for i, symbol in enumerate(symbols):
+            slot = slot_by_symbol.get(symbol)
+            if slot is None:
+                slot = self._add_symbol(symbol)
+            slots[i] = slot
+        return slots
+
+    def update(self, symbols, values):
+        '''Updates every indicator of the bank with a new value of each symbol
+        Args:
+            symbols: The symbols, each one at most once
+            values: The new value of each symbol
+        Returns:
+            numpy array with the slot of each symbol'''
+        slots = self.get_slots(symbols)
+        values = np.asarray(values, dtype=float)
+        for indicator in self.indicators.values():
+            indicator.update(slots, values)
+        return slots
+
+    def remove(self, symbol):
+        '''Removes the symbol and resets its indicators
+        Args:
+            symbol: The symbol to remove'''
+        slot = self.slot_by_symbol.pop(symbol, None)
+        if slot is None:
+            return
+        slots = np.array([slot])
+        for indicator in self.indicators.values():
+            indicator.reset(slots)
+        self.symbols[slot] = None
+        self._free_slots.append(slot)
+
+    def top(self, slots, scores, count):
+        '''Gets the symbols with the largest scores, sorted by descending score.
+        Equal scores keep the order of the slots, like a stable sort would
+        Args:
+            slots: The slots of the candidates
+            scores: The score of each candidate
+            count(int): The maximum number of symbols
+        Returns:
+            List of the symbols'''
+        scores = np.asarray(scores, dtype=float)
+        if scores.size > count:
+            candidates = np.argpartition(-scores, count - 1)[:count]
+            # the partition does not keep the order of equal scores, the boundary ones are selected by position
+            boundary = scores[candidates].min()
+            candidates = np.concatenate([np.flatnonzero(scores > boundary), np.flatnonzero(scores == boundary)])[:count]
+        else:
+            candidates = np.arange(scores.size)
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return list(self.symbols[np.asarray(slots)[order]])
+
+    def _add_symbol(self, symbol):
+        if not self._free_slots:
+            self._grow()
+        slot = self._free_slots.pop()
+        self.slot_by_symbol[symbol] = slot
+        self.symbols[slot] = symbol
+        return slot
+
+    def _grow(self):
+        '''Doubles the number of symbols the arrays can hold'''
+        size = self.capacity
+        self.capacity = max(1, 2 * size)
+        self.symbols = np.concatenate([self.symbols, np.empty(self.capacity - size, dtype=object)])
+        for indicator in self.indicators.values():
+            indicator.grow(self.capacity)
+        self._free_slots.extend(reversed(range(size, self.capacity)))
+
+
+class VectorizedIndicator:
+    '''Base class of the indicators of an IndicatorBank: the state of every slot is kept in numpy arrays'''
+
+    def __init__(self, warm_up_period):
+        self.warm_up_period = warm_up_period
+        self.capacity = 0
+        self.current = np.zeros(0)
+        self.samples = np.zeros(0, dtype=np.int64)
+
+    @property
+    def is_ready(self):
+        '''Gets the readiness mask of every slot'''
+        return self.samples >= self.warm_up_period
+
+    def update(self, slots, values):
+        '''Updates the indicator of each slot with its new value
+        Args:
+            slots: numpy array of the slots, each one at most once
+            values: numpy array of the new value of each slot'''
+        raise NotImplementedError(f"{type(self).__name__} must override the 'update' method of VectorizedIndicator")
+
+    def reset(self, slots):
+        '''Resets the indicator of the slots to their initial state'''
+        for name, array in self._arrays().items():
+            array[slots] = 0
+
+    def grow(self, capacity):
+        '''Resizes the arrays to the given number of slots'''
+        size = self.capacity
+        self.capacity = capacity
+        for name, array in self._arrays().items():
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:size] = array[:size]
+            setattr(self, name, grown)
+
+    def _arrays(self):
+        '''Gets the state arrays by attribute name, their first dimension is the slot'''
+        return { name: value for name, value in vars(self).items() if isinstance(value, np.ndarray) }
+
+
+class SimpleMovingAverages(VectorizedIndicator):
+    '''Simple moving average of every slot over a window of the last period values'''
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.period = period
+        self.window = np.zeros((0, period))
+        self.sum = np.zeros(0)
+
+    def update(self, slots, values):
+        samples = self.samples[slots]
+        position = samples % self.period
+        self.sum[slots] += values - np.where(samples >= self.period, self.window[slots, position], 0)
+        self.window[slots, position] = values
+        self.samples[slots] = samples + 1
+        self.current[slots] = self.sum[slots] / np.minimum(samples + 1, self.period)
+
+
+class ExponentialMovingAverages(VectorizedIndicator):
+    '''Exponential moving average of every slot. Like the ExponentialMovingAverage indicator,
+    it is zero until it is ready and its first value is the simple average of the first period values'''
+
+    def __init__(self, period, smoothing_factor = None):
+        super().__init__(period)
+        self.period = period
+        self.k = smoothing_factor if smoothing_factor is not None else 2.0 / (1 + period)
+        self.sum = np.zeros(0)
+
+    def update(self, slots, values):
+        samples = self.samples[slots] + 1
+        self.samples[slots] = samples
+        self.sum[slots] += np.where(samples <= self.period, values, 0)
+        self.current[slots] = np.where(samples < self.period, 0,
+            np.where(samples == self.period, self.sum[slots] / self.period, values * self.k + self.current[slots] * (1 - self.k)))
+
+
+class WilderMovingAverages(VectorizedIndicator):
+    '''Wilder's moving average of every slot. Like the WilderMovingAverage indicator, it is the simple average of the
+    values until the period-th value, from which it is smoothed with a factor of 1 / period'''
+
+    def __init__(self, period):
+        super().__init__(period)
+        self.period = period
+        self.k = 1.0 / period
+        self.sum = np.zeros(0)
+
+    def update(self, slots, values):
+        samples = self.samples[slots] + 1
+        self.samples[slots] = samples
+        warming = samples < self.period
+        self.sum[slots] += np.where(warming, values, 0)
+        self.current[slots] = np.where(warming, self.sum[slots] / samples, values * self.k + self.current[slots] * (1 - self.k))
+
+
+class RelativeStrengthIndexes(VectorizedIndicator):
+    '''Relative strength index of every slot, using Wilder's moving averages of the gains and losses'''
+
+    def __init__(self, period):
+        super().__init__(period + 1)
+        self.average_gain = WilderMovingAverages(period)
+        self.average_loss = WilderMovingAverages(period)
+        self.previous = np.zeros(0)
+
+    @property
+    def is_ready(self):
+        return self.average_gain.is_ready & self.average_loss.is_ready
+
+    def update(self, slots, values):
+        # the first value of a slot has no previous value to compute its gain or loss
+        has_previous = self.samples[slots] > 0
+        changed = slots[has_previous]
+        change = values[has_previous] - self.previous[changed]
+        self.average_gain.update(changed, np.maximum(change, 0))
+        self.average_loss.update(changed, np.maximum(-change, 0))
+        self.previous[slots] = values
+        self.samples[slots] += 1
+
+        average_gain = np.maximum(self.average_gain.current[slots], 0)
+        average_loss = np.maximum(self.average_loss.current[slots], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + average_gain / average_loss)
+        self.current[slots] = np.where(np.round(average_loss, 10) == 0, 100, rsi)
+
+    def reset(self, slots):
+        super().reset(slots)
+        self.average_gain.reset(slots)
+        self.average_loss.reset(slots)
+
+    def grow(self, capacity):
+        super().grow(capacity)
+        self.average_gain.grow(capacity)
+        self.average_loss.grow(capacity)
+
+
+class MovingAverageConvergenceDivergences(VectorizedIndicator):
+    '''Moving average convergence divergence of every slot, with exponential moving averages.
+    The current value is the MACD line, the signal line starts once the fast and slow averages are ready'''
+
+    def __init__(self, fast_period, slow_period, signal_period):
+        if fast_period >= slow_period:
+            raise ValueError("MovingAverageConvergenceDivergences: fast_period must be less than slow_period")
+        super().__init__(slow_period + signal_period - 1)
+        self.fast = ExponentialMovingAverages(fast_period)
+        self.slow = ExponentialMovingAverages(slow_period)
+        self.signal = ExponentialMovingAverages(signal_period)
+        self.histogram = np.zeros(0)
+
+    @property
+    def is_ready(self):
+        return self.signal.is_ready
+
+    def update(self, slots, values):
+        self.fast.update(slots, values)
+        self.slow.update(slots, values)
+        self.samples[slots] += 1
+
+        macd = self.fast.current[slots] - self.slow.current[slots]
+        self.current[slots] = macd
+
+        ready = self.fast.is_ready[slots] & self.slow.is_ready[slots]
+        self.signal.update(slots[ready], macd[ready])
+        signal_ready = ready & self.signal.is_ready[slots]
+        self.histogram[slots[signal_ready]] = macd[signal_ready] - self.signal.current[slots[signal_ready]]
+
+    def reset(self, slots):
+        super().reset(slots)
+        for indicator in [self.fast, self.slow, self.signal]:
+            indicator.reset(slots)
+
+    def grow(self, capacity):
+        super().grow(capacity)
+        for indicator in [self.fast, self.slow, self.signal]:
+            indicator.grow(capacity)
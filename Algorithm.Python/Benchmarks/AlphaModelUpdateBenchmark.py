@@ -0,0 +1,84 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.EmaCrossAlphaModel import EmaCrossAlphaModel
+from Alphas.HistoricalReturnsAlphaModel import HistoricalReturnsAlphaModel
+from Alphas.MacdAlphaModel import MacdAlphaModel
+from Alphas.RsiAlphaModel import RsiAlphaModel
+import time
+
+### <summary>
+### Benchmark of the per slice cost of the update of the framework alpha models: minute data with daily indicators,
+### so most slices have no new indicator value. The 'universe-size' parameter sets the number of symbols,
+### the 'alpha-model' parameter the model and 'full-scan' visits every symbol on every slice, like before
+### the models tracked the updated indicators.
+### </summary>
+class AlphaModelUpdateBenchmark(QCAlgorithm):
+
+    def initialize(self):
+        self.set_start_date(2017, 1, 1)
+        self.set_end_date(2017, 3, 1)
+        self.set_cash(100000)
+
+        self.universe_settings.resolution = Resolution.MINUTE
+        self.number_of_symbols = int(self.get_parameter("universe-size", 100))
+        self.add_universe(self.coarse_selection_function)
+
+        models = {
+            'EmaCross': lambda: EmaCrossAlphaModel(resolution = Resolution.DAILY),
+            'HistoricalReturns': lambda: HistoricalReturnsAlphaModel(resolution = Resolution.DAILY),
+            'Macd': lambda: MacdAlphaModel(resolution = Resolution.DAILY),
+            'Rsi': lambda: RsiAlphaModel(resolution = Resolution.DAILY)
+        }
+        model = models[self.get_parameter("alpha-model", "EmaCross")]()
+        self.timed_model = TimedAlphaModel(model, self.get_parameter("full-scan", "false").lower() == "true")
+        self.set_alpha(self.timed_model)
+
+    def coarse_selection_function(self, coarse):
+        selected = sorted([x for x in coarse if x.has_fundamental_data], key=lambda x: x.dollar_volume, reverse=True)
+        return [ x.symbol for x in selected[:self.number_of_symbols] ]
+
+    def on_end_of_algorithm(self):
+        model = self.timed_model
+        cost = 1e6 * model.elapsed / max(1, model.slices)
+        self.log(f'{model.name}: {self.number_of_symbols} symbols, full scan {model.full_scan}: '
+            f'{cost:.1f} us per slice over {model.slices} slices')
+
+
+class TimedAlphaModel(AlphaModel):
+    '''Measures the time spent in the update of the wrapped alpha model'''
+
+    def __init__(self, model, full_scan):
+        self.model = model
+        self.full_scan = full_scan
+        self.name = model.name
+        self.elapsed = 0
+        self.slices = 0
+
+        # the MacdAlphaModel still uses the PascalCase API
+        self.indicator_updates = model.indicatorUpdates if hasattr(model, 'indicatorUpdates') else model.indicator_updates
+        self.model_update = model.Update if 'Update' in type(model).__dict__ else model.update
+        self.model_on_securities_changed = model.OnSecuritiesChanged if 'OnSecuritiesChanged' in type(model).__dict__ else model.on_securities_changed
+
+    def update(self, algorithm, data):
+        start = time.perf_counter()
+        if self.full_scan:
+            self.indicator_updates.mark_all()
+        insights = self.model_update(algorithm, data)
+        self.elapsed += time.perf_counter() - start
+        self.slices += 1
+        return insights
+
+    def on_securities_changed(self, algorithm, changes):
+        self.model_on_securities_changed(algorithm, changes)
@@ -13,6 +13,10 @@
 
 from AlgorithmImports import *
 
+### <summary>
+### Benchmark of a coarse and fine universe selection. By default the selection reads the fundamental objects,
+### the 'selection' parameter set to 'frame' selects from a data frame of the fundamental fields instead.
+### </summary>
 class CoarseFineUniverseSelectionBenchmark(QCAlgorithm):
 
     def initialize(self):
@@ -23,7 +27,11 @@ class CoarseFineUniverseSelectionBenchmark(QCAlgorithm):
 
         self.universe_settings.resolution = Resolution.MINUTE
 
-        self.add_universe(self.coarse_selection_function, self.fine_selection_function)
+        if self.get_parameter("selection", "objects") == "frame":
+            self.add_universe(FundamentalFrameUniverse(Market.USA, self.universe_settings,
+                ['has_fundamental_data', 'dollar_volume', 'valuation_ratios.pe_ratio'], self.frame_selection_function))
+        else:
+            self.add_universe(self.coarse_selection_function, self.fine_selection_function)
 
         self.number_of_symbols = 150
         self.number_of_symbols_fine = 40
@@ -46,6 +54,12 @@ class CoarseFineUniverseSelectionBenchmark(QCAlgorithm):
         # take the top entries from our sorted collection
         return [ x.symbol for x in sorted_by_pe_ratio[:self.number_of_symbols_fine] ]
 
+    # the coarse and fine selections in a single pass, vectorized over the columns
+    def frame_selection_function(self, frame):
+        selected = frame[frame['has_fundamental_data']]
+        selected = selected.nlargest(self.number_of_symbols, 'dollar_volume')
+        return selected['valuation_ratios.pe_ratio'].nlargest(self.number_of_symbols_fine).index
+
     def on_data(self, data):
         # if we have no changes, do nothing
         if self._changes is None: return
@@ -0,0 +1,90 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Benchmark of the parsing of python custom data: a csv file of the object store, one row per second, is read
+### line by line with the reader method or in chunks of lines with the read_chunk method.
+### The 'reader' parameter selects 'line' (default), 'chunk' or 'chunk-frame', which returns a data frame,
+### and the 'rows' parameter sets the number of rows of the file.
+### </summary>
+class CustomDataReaderBenchmark(QCAlgorithm):
+
+    def initialize(self):
+        rows = int(self.get_parameter("rows", 100000))
+        reader = self.get_parameter("reader", "line")
+        types = { 'line': LineCustomData, 'chunk': ChunkCustomData, 'chunk-frame': FrameCustomData }
+
+        # one row per second, the algorithm runs until the last one
+        start = datetime(2017, 1, 2)
+        self.set_start_date(start)
+        self.set_end_date(start + timedelta(seconds = rows))
+        self.set_cash(100000)
+        self.set_benchmark(lambda x: 0)
+
+        times = pd.date_range(start, periods = rows, freq = 's')
+        prices = 100 + np.cumsum(np.random.default_rng(7).normal(0, 0.01, rows))
+        self.object_store.save(CUSTOM_DATA_KEY, '\n'.join(f'{time:%Y-%m-%d %H:%M:%S},{price:.4f}' for time, price in zip(times, prices)))
+
+        self.add_data(types[reader], "CustomData", Resolution.SECOND)
+        self.reader = reader
+        self.data_points = 0
+
+    def on_data(self, slice):
+        self.data_points += 1
+
+    def on_end_of_algorithm(self):
+        self.log(f'{self.reader} reader: {self.data_points} data points')
+
+
+CUSTOM_DATA_KEY = "CustomData/CustomDataReaderBenchmark"
+
+class LineCustomData(PythonData):
+    '''Parses the custom data one line at a time'''
+
+    def get_source(self, config, date, is_live):
+        return SubscriptionDataSource(CUSTOM_DATA_KEY, SubscriptionTransportMedium.OBJECT_STORE, FileFormat.CSV)
+
+    def reader(self, config, line, date, is_live):
+        data = line.split(',')
+        result = type(self)()
+        result.symbol = config.symbol
+        result.time = datetime.strptime(data[0], '%Y-%m-%d %H:%M:%S')
+        result.value = float(data[1])
+        return result
+
+
+class ChunkCustomData(LineCustomData):
+    '''Parses the custom data in chunks of lines, returning a list of data points'''
+
+    def read_chunk(self, config, lines, date, is_live):
+        result = []
+        for line in lines:
+            data = line.split(',')
+            point = ChunkCustomData()
+            point.symbol = config.symbol
+            point.time = datetime.strptime(data[0], '%Y-%m-%d %H:%M:%S')
+            point.value = float(data[1])
+            result.append(point)
+        return result
+
+
+class FrameCustomData(LineCustomData):
+    '''Parses the custom data in chunks of lines, returning a data frame with one row per data point'''
+
+    def read_chunk(self, config, lines, date, is_live):
+        frame = pd.DataFrame([ line.split(',') for line in lines ], columns = ['time', 'value'])
+        frame['time'] = pd.to_datetime(frame['time'], format = '%Y-%m-%d %H:%M:%S')
+        frame['value'] = frame['value'].astype(float)
+        return frame
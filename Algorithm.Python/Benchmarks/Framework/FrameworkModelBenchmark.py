@@ -0,0 +1,69 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Alphas.EmaCrossAlphaModel import EmaCrossAlphaModel
+from Alphas.RsiAlphaModel import RsiAlphaModel
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+from Portfolio.BlackLittermanOptimizationPortfolioConstructionModel import BlackLittermanOptimizationPortfolioConstructionModel
+from Portfolio.MeanVarianceOptimizationPortfolioConstructionModel import MeanVarianceOptimizationPortfolioConstructionModel
+from Portfolio.RiskParityPortfolioConstructionModel import RiskParityPortfolioConstructionModel
+from Execution.VolumeWeightedAveragePriceExecutionModel import VolumeWeightedAveragePriceExecutionModel
+
+### <summary>
+### Benchmark of a single framework model over a universe of the symbols with the largest dollar volume.
+### The 'model' parameter selects the model and 'universe-size' the number of symbols.
+### It runs on the hourly data and coarse files of the random data generator, see framework_benchmarks.json,
+### the other models are the cheapest ones feeding the benchmarked model.
+### </summary>
+class FrameworkModelBenchmark(QCAlgorithm):
+
+    def initialize(self):
+        self.set_start_date(2020, 1, 6)
+        self.set_end_date(2020, 6, 30)
+        self.set_cash(10000000)
+        # the generated data has no benchmark security
+        self.set_benchmark(lambda x: 0)
+
+        self.universe_size = int(self.get_parameter("universe-size", 100))
+        self.model = self.get_parameter("model", "EmaCrossAlpha")
+        self.universe_settings.resolution = Resolution.HOUR
+        self.add_universe(self.coarse_selection_function)
+
+        # a daily insight for every symbol, for the portfolio construction, execution and risk models
+        constant_alpha = lambda: ConstantAlphaModel(InsightType.PRICE, InsightDirection.UP, timedelta(days = 1), 0.01, 0.5)
+        models = {
+            'EmaCrossAlpha': lambda: self.set_alpha(EmaCrossAlphaModel(resolution = Resolution.HOUR)),
+            'RsiAlpha': lambda: self.set_alpha(RsiAlphaModel(resolution = Resolution.HOUR)),
+            'PearsonCorrelationPairsTradingAlpha': lambda: self.set_alpha(PearsonCorrelationPairsTradingAlphaModel(resolution = Resolution.HOUR)),
+            'BlackLittermanOptimizationPortfolioConstruction': lambda: (self.set_alpha(constant_alpha()),
+                self.set_portfolio_construction(BlackLittermanOptimizationPortfolioConstructionModel(resolution = Resolution.HOUR))),
+            'MeanVarianceOptimizationPortfolioConstruction': lambda: (self.set_alpha(constant_alpha()),
+                self.set_portfolio_construction(MeanVarianceOptimizationPortfolioConstructionModel(resolution = Resolution.HOUR))),
+            'RiskParityPortfolioConstruction': lambda: (self.set_alpha(constant_alpha()),
+                self.set_portfolio_construction(RiskParityPortfolioConstructionModel(resolution = Resolution.HOUR))),
+            'VolumeWeightedAveragePriceExecution': lambda: (self.set_alpha(constant_alpha()),
+                self.set_portfolio_construction(EqualWeightingPortfolioConstructionModel()),
+                self.set_execution(VolumeWeightedAveragePriceExecutionModel()))
+        }
+        models[self.model]()
+
+    def coarse_selection_function(self, coarse):
+        # the universe is selected once, the benchmark measures the models and not the universe changes
+        if self.universe_size == len(self.active_securities):
+            return Universe.UNCHANGED
+        selected = sorted(coarse, key=lambda x: x.dollar_volume, reverse=True)
+        return [ x.symbol for x in selected[:self.universe_size] ]
+
+    def on_end_of_algorithm(self):
+        self.log(f'{self.model}: {len(self.active_securities)} securities, {self.transactions.orders_count} orders')
@@ -12,7 +12,13 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Selection.EmaCrossUniverseSelectionModel import EmaCrossUniverseSelectionModel
 
+### <summary>
+### Benchmark of a stateful coarse universe selection. By default the selection keeps a black list of symbols,
+### the 'selection' parameter set to 'ema-cross' selects with the EmaCrossUniverseSelectionModel and its indicator bank
+### instead, and 'ema-cross-indicators' with one pair of indicator objects per coarse symbol.
+### </summary>
 class StatefulCoarseUniverseSelectionBenchmark(QCAlgorithm):
 
     def initialize(self):
@@ -22,10 +28,16 @@ class StatefulCoarseUniverseSelectionBenchmark(QCAlgorithm):
         self.set_end_date(2019, 1, 1)
         self.set_cash(50000)
 
-        self.add_universe(self.coarse_selection_function)
         self.number_of_symbols = 250
         self._black_list = []
 
+        selection = self.get_parameter("selection", "black-list")
+        if selection == "black-list":
+            self.add_universe(self.coarse_selection_function)
+        else:
+            self.set_universe_selection(EmaCrossUniverseSelectionModel(universeCount = self.number_of_symbols,
+                useIndicatorBank = selection == "ema-cross"))
+
     # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
     def coarse_selection_function(self, coarse):
 
@@ -13,6 +13,10 @@
 
 from AlgorithmImports import *
 
+### <summary>
+### Benchmark of a stateless coarse universe selection. By default the selection reads the fundamental objects,
+### the 'selection' parameter set to 'frame' selects from a data frame of the fundamental fields instead.
+### </summary>
 class StatelessCoarseUniverseSelectionBenchmark(QCAlgorithm):
 
     def initialize(self):
@@ -22,8 +26,12 @@ class StatelessCoarseUniverseSelectionBenchmark(QCAlgorithm):
         self.set_end_date(2019, 1, 1)
         self.set_cash(50000)
 
-        self.add_universe(self.coarse_selection_function)
         self.number_of_symbols = 250
+        if self.get_parameter("selection", "objects") == "frame":
+            self.add_universe(FundamentalFrameUniverse(Market.USA, self.universe_settings,
+                ['has_fundamental_data', 'dollar_volume'], self.frame_selection_function))
+        else:
+            self.add_universe(self.coarse_selection_function)
 
     # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
     def coarse_selection_function(self, coarse):
@@ -35,6 +43,11 @@ class StatelessCoarseUniverseSelectionBenchmark(QCAlgorithm):
         # return the symbol objects of the top entries from our sorted collection
         return [ x.symbol for x in sorted_by_dollar_volume[:self.number_of_symbols] ]
 
+    # the same selection vectorized over the columns
+    def frame_selection_function(self, frame):
+        selected = frame[frame['has_fundamental_data']]
+        return selected['dollar_volume'].nlargest(self.number_of_symbols).index
+
     def on_securities_changed(self, changes):
         # if we have no changes, do nothing
         if changes is None: return
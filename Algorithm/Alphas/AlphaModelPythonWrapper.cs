@@ -28,6 +28,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
     public class AlphaModelPythonWrapper : AlphaModel
     {
         private readonly BasePythonWrapper<AlphaModel> _model;
+        private readonly string _pythonTypeName;
 
         /// <summary>
         /// Defines a name for a framework model
@@ -57,6 +58,10 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         public AlphaModelPythonWrapper(PyObject model)
         {
             _model = new BasePythonWrapper<AlphaModel>(model, false);
+            using (Py.GIL())
+            {
+                _pythonTypeName = model.GetPythonType().Name;
+            }
             foreach (var attributeName in new[] { "Update", "OnSecuritiesChanged" })
             {
                 if (!_model.HasAttr(attributeName))
@@ -77,7 +82,16 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         {
             using (Py.GIL())
             {
-                var insights = _model.InvokeMethod(nameof(Update), algorithm, new PythonSlice(data));
+                PyObject insights;
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    insights = _model.InvokeMethod(nameof(Update), algorithm, new PythonSlice(data));
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.AlphaUpdatePython, this, measurement);
+                }
                 var iterator = insights.GetIterator();
                 foreach (PyObject insight in iterator)
                 {
@@ -97,5 +111,13 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         {
             _model.InvokeMethod(nameof(OnSecuritiesChanged), algorithm, changes).Dispose();
         }
+
+        /// <summary>
+        /// Returns the name of the wrapped python class
+        /// </summary>
+        public override string ToString()
+        {
+            return _pythonTypeName;
+        }
     }
 }
@@ -15,6 +15,7 @@
 
 using System;
 using System.Collections.Generic;
+using System.Linq;
 using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Data.UniverseSelection;
@@ -84,7 +85,23 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             foreach (var model in _alphaModels)
             {
                 var name = model.GetModelName();
-                foreach (var insight in model.Update(algorithm, data))
+                IEnumerable<Insight> insights;
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    insights = model.Update(algorithm, data);
+                    if (algorithm.FrameworkProfiler.Enabled)
+                    {
+                        // the insights of lazy models are generated while enumerating them
+                        insights = insights.ToList();
+                    }
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.AlphaUpdate, model, measurement);
+                }
+
+                foreach (var insight in insights)
                 {
                     if (string.IsNullOrEmpty(insight.SourceModel))
                     {
@@ -107,7 +124,15 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         {
             foreach (var model in _alphaModels)
             {
-                model.OnSecuritiesChanged(algorithm, changes);
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    model.OnSecuritiesChanged(algorithm, changes);
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, model, measurement);
+                }
             }
         }
 
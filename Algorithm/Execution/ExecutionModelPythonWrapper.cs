@@ -27,6 +27,7 @@ namespace QuantConnect.Algorithm.Framework.Execution
     public class ExecutionModelPythonWrapper : ExecutionModel
     {
         private readonly BasePythonWrapper<ExecutionModel> _model;
+        private readonly string _pythonTypeName;
 
         /// <summary>
         /// Constructor for initialising the <see cref="IExecutionModel"/> class with wrapped <see cref="PyObject"/> object
@@ -35,6 +36,10 @@ namespace QuantConnect.Algorithm.Framework.Execution
         public ExecutionModelPythonWrapper(PyObject model)
         {
             _model = new BasePythonWrapper<ExecutionModel>(model, false);
+            using (Py.GIL())
+            {
+                _pythonTypeName = model.GetPythonType().Name;
+            }
             foreach (var attributeName in new[] { "Execute", "OnSecuritiesChanged" })
             {
                 if (!_model.HasAttr(attributeName))
@@ -52,7 +57,15 @@ namespace QuantConnect.Algorithm.Framework.Execution
         /// <param name="targets">The portfolio targets to be ordered</param>
         public override void Execute(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            _model.InvokeMethod(nameof(Execute), algorithm, targets).Dispose();
+            var measurement = algorithm.FrameworkProfiler.Start();
+            try
+            {
+                _model.InvokeMethod(nameof(Execute), algorithm, targets).Dispose();
+            }
+            finally
+            {
+                algorithm.FrameworkProfiler.Stop(FrameworkProfiler.ExecutePython, this, measurement);
+            }
         }
 
         /// <summary>
@@ -64,5 +77,13 @@ namespace QuantConnect.Algorithm.Framework.Execution
         {
             _model.InvokeMethod(nameof(OnSecuritiesChanged), algorithm, changes).Dispose();
         }
+
+        /// <summary>
+        /// Returns the name of the wrapped python class
+        /// </summary>
+        public override string ToString()
+        {
+            return _pythonTypeName;
+        }
     }
 }
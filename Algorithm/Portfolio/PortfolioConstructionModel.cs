@@ -108,8 +108,17 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
             var errorSymbols = new HashSet<Symbol>();
 
             // Determine target percent for the given insights
-            var percents = PythonWrapper?.DetermineTargetPercent(lastActiveInsights)
+            Dictionary<Insight, double> percents;
+            var measurement = algorithm.FrameworkProfiler.Start();
+            try
+            {
+                percents = PythonWrapper?.DetermineTargetPercent(lastActiveInsights)
                            ?? DetermineTargetPercent(lastActiveInsights);
+            }
+            finally
+            {
+                algorithm.FrameworkProfiler.Stop(FrameworkProfiler.DetermineTargetPercent, (object)PythonWrapper ?? this, measurement);
+            }
 
             foreach (var insight in lastActiveInsights)
             {
@@ -29,6 +29,7 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
     {
         private readonly BasePythonWrapper<PortfolioConstructionModel> _model;
         private readonly bool _implementsDetermineTargetPercent;
+        private readonly string _pythonTypeName;
 
         /// <summary>
         /// True if should rebalance portfolio on security changes. True by default
@@ -80,6 +81,7 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
                 _model.InvokeMethod(nameof(SetPythonWrapper), this).Dispose();
 
                 _implementsDetermineTargetPercent = model.GetPythonMethod("DetermineTargetPercent") != null;
+                _pythonTypeName = model.GetPythonType().Name;
             }
         }
 
@@ -91,7 +93,15 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
         /// <returns>An enumerable of portfolio targets to be sent to the execution model</returns>
         public override IEnumerable<IPortfolioTarget> CreateTargets(QCAlgorithm algorithm, Insight[] insights)
         {
-            return _model.InvokeMethod<IEnumerable<IPortfolioTarget>>(nameof(CreateTargets), algorithm, insights);
+            var measurement = algorithm.FrameworkProfiler.Start();
+            try
+            {
+                return _model.InvokeMethod<IEnumerable<IPortfolioTarget>>(nameof(CreateTargets), algorithm, insights);
+            }
+            finally
+            {
+                algorithm.FrameworkProfiler.Stop(FrameworkProfiler.CreateTargetsPython, this, measurement);
+            }
         }
 
         /// <summary>
@@ -171,5 +181,13 @@ namespace QuantConnect.Algorithm.Framework.Portfolio
                 return dic;
             }
         }
+
+        /// <summary>
+        /// Returns the name of the wrapped python class
+        /// </summary>
+        public override string ToString()
+        {
+            return _pythonTypeName;
+        }
     }
 }
@@ -13,12 +13,14 @@
  * limitations under the License.
 */
 
+using System;
 using System.Linq;
 using QuantConnect.Data;
 using QuantConnect.Util;
 using QuantConnect.Securities;
 using System.Collections.Generic;
 using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Algorithm.Framework;
 using QuantConnect.Algorithm.Framework.Risk;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Execution;
@@ -78,6 +80,13 @@ namespace QuantConnect.Algorithm
         [DocumentationAttribute(AlgorithmFramework)]
         public IRiskManagementModel RiskManagement { get; set; }
 
+        /// <summary>
+        /// Gets the framework profiler, recording the time of each framework stage and model
+        /// when <see cref="AlgorithmSettings.FrameworkProfilingEnabled"/> is set
+        /// </summary>
+        [DocumentationAttribute(AlgorithmFramework)]
+        public FrameworkProfiler FrameworkProfiler { get; } = new FrameworkProfiler(GetFrameworkModelName);
+
         /// <summary>
         /// Called by setup handlers after Initialize and allows the algorithm a chance to organize
         /// the data gather in the Initialize method
@@ -85,10 +94,20 @@ namespace QuantConnect.Algorithm
         [DocumentationAttribute(AlgorithmFramework)]
         public void FrameworkPostInitialize()
         {
-            foreach (var universe in UniverseSelection.CreateUniverses(this))
+            FrameworkProfiler.Enabled = Settings.FrameworkProfilingEnabled;
+
+            var measurement = FrameworkProfiler.Start();
+            try
+            {
+                foreach (var universe in UniverseSelection.CreateUniverses(this))
+                {
+                    AddUniverse(universe);
+                    _universeSelectionUniverses.Add(universe.Configuration.Symbol);
+                }
+            }
+            finally
             {
-                AddUniverse(universe);
-                _universeSelectionUniverses.Add(universe.Configuration.Symbol);
+                FrameworkProfiler.Stop(FrameworkProfiler.UniverseSelection, UniverseSelection, measurement);
             }
 
             if (DebugMode)
@@ -123,13 +142,21 @@ namespace QuantConnect.Algorithm
                 }
 
                 var toRemove = new HashSet<Symbol>(_universeSelectionUniverses);
-                foreach (var universe in UniverseSelection.CreateUniverses(this))
+                var universeMeasurement = FrameworkProfiler.Start();
+                try
                 {
-                    // add newly selected universes
-                    _universeSelectionUniverses.Add(universe.Configuration.Symbol);
-                    AddUniverse(universe);
+                    foreach (var universe in UniverseSelection.CreateUniverses(this))
+                    {
+                        // add newly selected universes
+                        _universeSelectionUniverses.Add(universe.Configuration.Symbol);
+                        AddUniverse(universe);
 
-                    toRemove.Remove(universe.Configuration.Symbol);
+                        toRemove.Remove(universe.Configuration.Symbol);
+                    }
+                }
+                finally
+                {
+                    FrameworkProfiler.Stop(FrameworkProfiler.UniverseSelection, UniverseSelection, universeMeasurement);
                 }
 
                 // remove deselected universes by symbol but prevent removal of qc algorithm created user defined universes
@@ -150,10 +177,19 @@ namespace QuantConnect.Algorithm
             }
 
             // insight timestamping handled via InsightsGenerated event handler
-            var insightsEnumerable = Alpha.Update(this, slice);
-            // for performance only call 'ToArray' if not empty enumerable (which is static)
-            var insights = insightsEnumerable == Enumerable.Empty<Insight>()
-                ? new Insight[] { } : insightsEnumerable.ToArray();
+            Insight[] insights;
+            var measurement = FrameworkProfiler.Start();
+            try
+            {
+                var insightsEnumerable = Alpha.Update(this, slice);
+                // for performance only call 'ToArray' if not empty enumerable (which is static)
+                insights = insightsEnumerable == Enumerable.Empty<Insight>()
+                    ? new Insight[] { } : insightsEnumerable.ToArray();
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.AlphaUpdate, Alpha, measurement);
+            }
 
             // only fire insights generated event if we actually have insights
             if (insights.Length != 0)
@@ -176,10 +212,19 @@ namespace QuantConnect.Algorithm
         private void ProcessInsights(Insight[] insights)
         {
             // construct portfolio targets from insights
-            var targetsEnumerable = PortfolioConstruction.CreateTargets(this, insights);
-            // for performance only call 'ToArray' if not empty enumerable (which is static)
-            var targets = targetsEnumerable == Enumerable.Empty<IPortfolioTarget>()
-                ? new IPortfolioTarget[] {} : targetsEnumerable.ToArray();
+            IPortfolioTarget[] targets;
+            var measurement = FrameworkProfiler.Start();
+            try
+            {
+                var targetsEnumerable = PortfolioConstruction.CreateTargets(this, insights);
+                // for performance only call 'ToArray' if not empty enumerable (which is static)
+                targets = targetsEnumerable == Enumerable.Empty<IPortfolioTarget>()
+                    ? new IPortfolioTarget[] {} : targetsEnumerable.ToArray();
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.CreateTargets, PortfolioConstruction, measurement);
+            }
 
             // set security targets w/ those generated via portfolio construction module
             foreach (var target in targets)
@@ -197,10 +242,19 @@ namespace QuantConnect.Algorithm
                 }
             }
 
-            var riskTargetOverridesEnumerable = RiskManagement.ManageRisk(this, targets);
-            // for performance only call 'ToArray' if not empty enumerable (which is static)
-            var riskTargetOverrides = riskTargetOverridesEnumerable == Enumerable.Empty<IPortfolioTarget>()
-                ? new IPortfolioTarget[] { } : riskTargetOverridesEnumerable.ToArray();
+            IPortfolioTarget[] riskTargetOverrides;
+            measurement = FrameworkProfiler.Start();
+            try
+            {
+                var riskTargetOverridesEnumerable = RiskManagement.ManageRisk(this, targets);
+                // for performance only call 'ToArray' if not empty enumerable (which is static)
+                riskTargetOverrides = riskTargetOverridesEnumerable == Enumerable.Empty<IPortfolioTarget>()
+                    ? new IPortfolioTarget[] { } : riskTargetOverridesEnumerable.ToArray();
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.ManageRisk, RiskManagement, measurement);
+            }
 
             // override security targets w/ those generated via risk management module
             foreach (var target in riskTargetOverrides)
@@ -240,7 +294,15 @@ namespace QuantConnect.Algorithm
                 }
             }
 
-            Execution.Execute(this, riskAdjustedTargets);
+            measurement = FrameworkProfiler.Start();
+            try
+            {
+                Execution.Execute(this, riskAdjustedTargets);
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.Execute, Execution, measurement);
+            }
         }
 
         /// <summary>
@@ -256,10 +318,61 @@ namespace QuantConnect.Algorithm
                 Debug($"{Time}: {changes}");
             }
 
-            Alpha.OnSecuritiesChanged(this, changes);
-            PortfolioConstruction.OnSecuritiesChanged(this, changes);
-            Execution.OnSecuritiesChanged(this, changes);
-            RiskManagement.OnSecuritiesChanged(this, changes);
+            var measurement = FrameworkProfiler.Start();
+            try
+            {
+                Alpha.OnSecuritiesChanged(this, changes);
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, Alpha, measurement);
+            }
+
+            measurement = FrameworkProfiler.Start();
+            try
+            {
+                PortfolioConstruction.OnSecuritiesChanged(this, changes);
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, PortfolioConstruction, measurement);
+            }
+
+            measurement = FrameworkProfiler.Start();
+            try
+            {
+                Execution.OnSecuritiesChanged(this, changes);
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, Execution, measurement);
+            }
+
+            measurement = FrameworkProfiler.Start();
+            try
+            {
+                RiskManagement.OnSecuritiesChanged(this, changes);
+            }
+            finally
+            {
+                FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, RiskManagement, measurement);
+            }
+        }
+
+        /// <summary>
+        /// The name of a framework model reported by the <see cref="FrameworkProfiler"/>
+        /// </summary>
+        private static string GetFrameworkModelName(object model)
+        {
+            // alpha models without a name use a guid
+            if (model is INamedModel namedModel && !string.IsNullOrEmpty(namedModel.Name) && !Guid.TryParse(namedModel.Name, out _))
+            {
+                return namedModel.Name;
+            }
+
+            // the python wrappers return the name of the python class
+            var name = model.ToString();
+            return name == model.GetType().ToString() ? model.GetType().Name : name;
         }
 
         /// <summary>
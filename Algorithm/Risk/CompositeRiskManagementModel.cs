@@ -98,13 +98,48 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <returns>The new portfolio targets</returns>
         public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            foreach (var model in _riskManagementModels)
+            // the distinct targets by symbol, carried from a model to the next one
+            var mergedTargets = new Dictionary<Symbol, IPortfolioTarget>(targets.Length);
+            foreach (var target in targets)
+            {
+                mergedTargets.TryAdd(target.Symbol, target);
+            }
+            if (mergedTargets.Count != targets.Length)
             {
-                // take into account the possibility of ManageRisk returning nothing
-                var riskAdjusted = model.ManageRisk(algorithm, targets);
+                targets = mergedTargets.Values.ToArray();
+            }
 
-                // produce a distinct set of new targets giving preference to newer targets
-                targets = riskAdjusted.Concat(targets).DistinctBy(t => t.Symbol).ToArray();
+            foreach (var model in _riskManagementModels)
+            {
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    // take into account the possibility of ManageRisk returning nothing
+                    var riskAdjusted = model.ManageRisk(algorithm, targets);
+
+                    // produce a distinct set of new targets giving preference to newer targets,
+                    // the first target of a symbol wins within the targets of a model.
+                    // The targets are only rebuilt if the model adjusted any
+                    var adjustedSymbols = new HashSet<Symbol>();
+                    if (riskAdjusted != null)
+                    {
+                        foreach (var target in riskAdjusted)
+                        {
+                            if (adjustedSymbols.Add(target.Symbol))
+                            {
+                                mergedTargets[target.Symbol] = target;
+                            }
+                        }
+                    }
+                    if (adjustedSymbols.Count > 0)
+                    {
+                        targets = mergedTargets.Values.ToArray();
+                    }
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.ManageRisk, model, measurement);
+                }
             }
 
             return targets;
@@ -120,7 +155,15 @@ namespace QuantConnect.Algorithm.Framework.Risk
         {
             foreach (var model in _riskManagementModels)
             {
-                model.OnSecuritiesChanged(algorithm, changes);
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    model.OnSecuritiesChanged(algorithm, changes);
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.OnSecuritiesChanged, model, measurement);
+                }
             }
         }
 
@@ -33,17 +33,32 @@ class CompositeRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance
             targets: The current portfolio targets to be assessed for risk'''
-        for model in self.risk_management_models:
-            # take into account the possibility of ManageRisk returning nothing
-            risk_adjusted = model.manage_risk(algorithm, targets)
+        # the distinct targets by symbol, carried from a model to the next one
+        merged_targets = {}
+        for target in targets:
+            merged_targets.setdefault(target.symbol, target)
+        targets = list(merged_targets.values())
 
-            # produce a distinct set of new targets giving preference to newer targets
-            symbols = [x.symbol for x in risk_adjusted]
-            for target in targets:
-                if target.symbol not in symbols:
-                    risk_adjusted.append(target)
+        profiler = algorithm.framework_profiler if algorithm.framework_profiler.enabled else None
+        for model in self.risk_management_models:
+            measurement = profiler.start() if profiler else None
+            try:
+                # take into account the possibility of ManageRisk returning nothing
+                risk_adjusted = model.manage_risk(algorithm, targets)
 
-            targets = risk_adjusted
+                # produce a distinct set of new targets giving preference to newer targets,
+                # the first target of a symbol wins within the targets of a model.
+                # The targets are only rebuilt if the model adjusted any
+                adjusted_symbols = set()
+                for target in risk_adjusted or []:
+                    if target.symbol not in adjusted_symbols:
+                        adjusted_symbols.add(target.symbol)
+                        merged_targets[target.symbol] = target
+                if adjusted_symbols:
+                    targets = list(merged_targets.values())
+            finally:
+                if profiler:
+                    profiler.stop('RiskManagement.ManageRisk', model.__class__.__name__, measurement)
 
         return targets
 
@@ -53,8 +68,14 @@ class CompositeRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
+        profiler = algorithm.framework_profiler if algorithm.framework_profiler.enabled else None
         for model in self.risk_management_models:
-            model.on_securities_changed(algorithm, changes)
+            measurement = profiler.start() if profiler else None
+            try:
+                model.on_securities_changed(algorithm, changes)
+            finally:
+                if profiler:
+                    profiler.stop('OnSecuritiesChanged', model.__class__.__name__, measurement)
 
     def add_risk_management(self, risk_management_model):
         '''Adds a new 'IRiskManagementModel' instance
@@ -27,6 +27,7 @@ namespace QuantConnect.Algorithm.Framework.Risk
     public class RiskManagementModelPythonWrapper : RiskManagementModel
     {
         private readonly BasePythonWrapper<IRiskManagementModel> _model;
+        private readonly string _pythonTypeName;
 
         /// <summary>
         /// Constructor for initialising the <see cref="IRiskManagementModel"/> class with wrapped <see cref="PyObject"/> object
@@ -35,6 +36,10 @@ namespace QuantConnect.Algorithm.Framework.Risk
         public RiskManagementModelPythonWrapper(PyObject model)
         {
             _model = new BasePythonWrapper<IRiskManagementModel>(model);
+            using (Py.GIL())
+            {
+                _pythonTypeName = model.GetPythonType().Name;
+            }
         }
 
         /// <summary>
@@ -46,7 +51,16 @@ namespace QuantConnect.Algorithm.Framework.Risk
         {
             using (Py.GIL())
             {
-                var riskTargetOverrides = _model.InvokeMethod("ManageRisk", algorithm, targets);
+                PyObject riskTargetOverrides;
+                var measurement = algorithm.FrameworkProfiler.Start();
+                try
+                {
+                    riskTargetOverrides = _model.InvokeMethod("ManageRisk", algorithm, targets);
+                }
+                finally
+                {
+                    algorithm.FrameworkProfiler.Stop(FrameworkProfiler.ManageRiskPython, this, measurement);
+                }
                 var iterator = riskTargetOverrides.GetIterator();
                 foreach (PyObject target in iterator)
                 {
@@ -66,5 +80,13 @@ namespace QuantConnect.Algorithm.Framework.Risk
         {
             _model.InvokeMethod(nameof(OnSecuritiesChanged), algorithm, changes).Dispose();
         }
+
+        /// <summary>
+        /// Returns the name of the wrapped python class
+        /// </summary>
+        public override string ToString()
+        {
+            return _pythonTypeName;
+        }
     }
 }
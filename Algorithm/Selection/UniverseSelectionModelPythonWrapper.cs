@@ -29,6 +29,7 @@ namespace QuantConnect.Algorithm.Framework.Selection
     {
         private readonly BasePythonWrapper<UniverseSelectionModel> _model;
         private readonly bool _modelHasGetNextRefreshTime;
+        private readonly string _pythonTypeName;
 
         /// <summary>
         /// Gets the next time the framework should invoke the `CreateUniverses` method to refresh the set of universes.
@@ -53,6 +54,7 @@ namespace QuantConnect.Algorithm.Framework.Selection
             using (Py.GIL())
             {
                 _modelHasGetNextRefreshTime = _model.HasAttr(nameof(IUniverseSelectionModel.GetNextRefreshTimeUtc));
+                _pythonTypeName = model.GetPythonType().Name;
 
                 foreach (var attributeName in new[] { "CreateUniverses" })
                 {
@@ -83,5 +85,13 @@ namespace QuantConnect.Algorithm.Framework.Selection
                 universes.Dispose();
             }
         }
+
+        /// <summary>
+        /// Returns the name of the wrapped python class
+        /// </summary>
+        public override string ToString()
+        {
+            return _pythonTypeName;
+        }
     }
 }
@@ -16,6 +16,7 @@
 using NodaTime;
 using Python.Runtime;
 using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Benchmarks;
 using QuantConnect.Brokerages;
@@ -550,6 +551,11 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         /// </summary>
         public InsightManager Insights => _baseAlgorithm.Insights;
 
+        /// <summary>
+        /// Gets the framework profiler, recording the time of each framework stage and model
+        /// </summary>
+        public FrameworkProfiler FrameworkProfiler => _baseAlgorithm.FrameworkProfiler;
+
         /// <summary>
         /// Sets the statistics service instance to be used by the algorithm
         /// </summary>
@@ -0,0 +1,289 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using System.Diagnostics;
+using System.Collections.Generic;
+
+namespace QuantConnect.Algorithm.Framework
+{
+    /// <summary>
+    /// Records the call count, time and managed allocations of each algorithm framework stage and model instance.
+    /// Disabled by default, see <see cref="Interfaces.IAlgorithmSettings.FrameworkProfilingEnabled"/>
+    /// </summary>
+    /// <remarks>The framework models are called from the algorithm thread, only the new stages and models are locked
+    /// so that the statistics can be read by the result handler thread</remarks>
+    public class FrameworkProfiler
+    {
+        /// <summary>
+        /// The universe selection model creating the universes
+        /// </summary>
+        public const string UniverseSelection = "UniverseSelection.CreateUniverses";
+
+        /// <summary>
+        /// The alpha model generating insights
+        /// </summary>
+        public const string AlphaUpdate = "Alpha.Update";
+
+        /// <summary>
+        /// The portfolio construction model creating targets
+        /// </summary>
+        public const string CreateTargets = "PortfolioConstruction.CreateTargets";
+
+        /// <summary>
+        /// The portfolio construction model determining the target percents, part of <see cref="CreateTargets"/>
+        /// </summary>
+        public const string DetermineTargetPercent = "PortfolioConstruction.DetermineTargetPercent";
+
+        /// <summary>
+        /// The risk management model adjusting the targets
+        /// </summary>
+        public const string ManageRisk = "RiskManagement.ManageRisk";
+
+        /// <summary>
+        /// The execution model placing orders
+        /// </summary>
+        public const string Execute = "Execution.Execute";
+
+        /// <summary>
+        /// Any framework model handling the security changes
+        /// </summary>
+        public const string OnSecuritiesChanged = "OnSecuritiesChanged";
+
+        /// <summary>
+        /// The python code of a python <see cref="AlphaUpdate"/>, the rest of the stage time is spent converting its arguments and results
+        /// </summary>
+        public const string AlphaUpdatePython = AlphaUpdate + ".Python";
+
+        /// <summary>
+        /// The python code of a python <see cref="CreateTargets"/>, the rest of the stage time is spent converting its arguments and results
+        /// </summary>
+        public const string CreateTargetsPython = CreateTargets + ".Python";
+
+        /// <summary>
+        /// The python code of a python <see cref="ManageRisk"/>, the rest of the stage time is spent converting its arguments and results
+        /// </summary>
+        public const string ManageRiskPython = ManageRisk + ".Python";
+
+        /// <summary>
+        /// The python code of a python <see cref="Execute"/>, the rest of the stage time is spent converting its arguments and results
+        /// </summary>
+        public const string ExecutePython = Execute + ".Python";
+
+        // the latencies are counted in buckets growing by a quarter of an octave from 100 nanoseconds, up to 7 minutes
+        private const double FirstBucketNanoseconds = 100;
+        private const int BucketsPerOctave = 4;
+        private const int BucketCount = 128;
+        private static readonly double NanosecondsPerTick = 1e9 / Stopwatch.Frequency;
+
+        private readonly Func<object, string> _modelNameProvider;
+        private readonly Dictionary<string, Dictionary<object, Recorder>> _recorders = new();
+
+        /// <summary>
+        /// True if the framework stages are being recorded
+        /// </summary>
+        public bool Enabled { get; set; }
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="modelNameProvider">Provides the name reported for a model instance, called once per stage and instance</param>
+        public FrameworkProfiler(Func<object, string> modelNameProvider = null)
+        {
+            _modelNameProvider = modelNameProvider ?? (model => model.GetType().Name);
+        }
+
+        /// <summary>
+        /// Starts measuring a framework stage call
+        /// </summary>
+        /// <returns>The measurement to pass to <see cref="Stop(string, object, Measurement)"/>, empty if disabled</returns>
+        public Measurement Start()
+        {
+            if (!Enabled)
+            {
+                return default;
+            }
+            return new Measurement(GC.GetAllocatedBytesForCurrentThread(), Stopwatch.GetTimestamp());
+        }
+
+        /// <summary>
+        /// Records a framework stage call of a model instance
+        /// </summary>
+        /// <param name="stage">The framework stage, like <see cref="AlphaUpdate"/></param>
+        /// <param name="model">The model instance called</param>
+        /// <param name="measurement">The measurement returned by <see cref="Start"/> before the call</param>
+        public void Stop(string stage, object model, Measurement measurement)
+        {
+            if (!Enabled || measurement.Timestamp == 0)
+            {
+                return;
+            }
+            var timestamp = Stopwatch.GetTimestamp();
+            var allocatedBytes = GC.GetAllocatedBytesForCurrentThread();
+
+            if (!_recorders.TryGetValue(stage, out var stageRecorders) || !stageRecorders.TryGetValue(model, out var recorder))
+            {
+                recorder = AddRecorder(stage, model);
+            }
+            recorder.Add(timestamp - measurement.Timestamp, allocatedBytes - measurement.AllocatedBytes);
+        }
+
+        private Recorder AddRecorder(string stage, object model)
+        {
+            var recorder = new Recorder(stage, model as string ?? _modelNameProvider(model));
+            lock (_recorders)
+            {
+                if (!_recorders.TryGetValue(stage, out var stageRecorders))
+                {
+                    _recorders[stage] = stageRecorders = new Dictionary<object, Recorder>(ReferenceEqualityComparer.Instance);
+                }
+                stageRecorders[model] = recorder;
+            }
+            return recorder;
+        }
+
+        /// <summary>
+        /// Records a framework stage call of a model known by its name, like a python model called by another python model
+        /// </summary>
+        /// <param name="stage">The framework stage, like <see cref="AlphaUpdate"/></param>
+        /// <param name="modelName">The name of the model called</param>
+        /// <param name="measurement">The measurement returned by <see cref="Start"/> before the call</param>
+        public void Stop(string stage, string modelName, Measurement measurement)
+        {
+            // the names are interned so that the same name is the same model
+            Stop(stage, (object)string.Intern(modelName), measurement);
+        }
+
+        /// <summary>
+        /// Gets the statistics of each recorded stage and model instance
+        /// </summary>
+        public List<FrameworkStageStatistics> GetStatistics()
+        {
+            lock (_recorders)
+            {
+                return _recorders.Values.SelectMany(stageRecorders => stageRecorders.Values)
+                    .Select(recorder => recorder.GetStatistics())
+                    .OrderBy(statistics => statistics.Stage, StringComparer.Ordinal)
+                    .ThenByDescending(statistics => statistics.TotalMilliseconds)
+                    .ToList();
+            }
+        }
+
+        /// <summary>
+        /// Gets the total time of each stage, of all its model instances, for the runtime statistics
+        /// </summary>
+        public Dictionary<string, string> GetRuntimeStatistics()
+        {
+            lock (_recorders)
+            {
+                return _recorders.ToDictionary(
+                    kvp => $"Framework {kvp.Key}",
+                    kvp => $"{(kvp.Value.Values.Sum(recorder => recorder.TotalTicks) * NanosecondsPerTick / 1e9).ToStringInvariant("0.000")}s");
+            }
+        }
+
+        /// <summary>
+        /// The start of a framework stage call measurement
+        /// </summary>
+        public readonly struct Measurement
+        {
+            /// <summary>
+            /// The bytes allocated by the thread at the start
+            /// </summary>
+            public long AllocatedBytes { get; }
+
+            /// <summary>
+            /// The <see cref="Stopwatch"/> timestamp at the start, zero if not measured
+            /// </summary>
+            public long Timestamp { get; }
+
+            /// <summary>
+            /// Creates a new instance
+            /// </summary>
+            public Measurement(long allocatedBytes, long timestamp)
+            {
+                AllocatedBytes = allocatedBytes;
+                Timestamp = timestamp;
+            }
+        }
+
+        private class Recorder
+        {
+            private readonly string _stage;
+            private readonly string _model;
+            private readonly long[] _buckets = new long[BucketCount];
+            private long _count;
+            private long _maximumTicks;
+            private long _allocatedBytes;
+
+            public long TotalTicks { get; private set; }
+
+            public Recorder(string stage, string model)
+            {
+                _stage = stage;
+                _model = model;
+            }
+
+            public void Add(long ticks, long allocatedBytes)
+            {
+                _count++;
+                TotalTicks += ticks;
+                _allocatedBytes += allocatedBytes;
+                _maximumTicks = Math.Max(_maximumTicks, ticks);
+
+                var nanoseconds = ticks * NanosecondsPerTick;
+                var bucket = nanoseconds <= FirstBucketNanoseconds
+                    ? 0
+                    : Math.Min(BucketCount - 1, (int)Math.Ceiling(Math.Log2(nanoseconds / FirstBucketNanoseconds) * BucketsPerOctave));
+                _buckets[bucket]++;
+            }
+
+            public FrameworkStageStatistics GetStatistics()
+            {
+                var maximum = _maximumTicks * NanosecondsPerTick / 1e6;
+                return new FrameworkStageStatistics
+                {
+                    Stage = _stage,
+                    Model = _model,
+                    Count = _count,
+                    TotalMilliseconds = TotalTicks * NanosecondsPerTick / 1e6,
+                    MedianMilliseconds = Math.Min(maximum, GetPercentile(0.5)),
+                    P99Milliseconds = Math.Min(maximum, GetPercentile(0.99)),
+                    MaximumMilliseconds = maximum,
+                    AllocatedBytes = _allocatedBytes
+                };
+            }
+
+            /// <summary>
+            /// The upper bound of the bucket of the percentile, at most a fifth above the exact value
+            /// </summary>
+            private double GetPercentile(double percentile)
+            {
+                var rank = (long)Math.Ceiling(percentile * _count);
+                var cumulative = 0L;
+                for (var i = 0; i < _buckets.Length; i++)
+                {
+                    cumulative += _buckets[i];
+                    if (cumulative >= rank)
+                    {
+                        return FirstBucketNanoseconds * Math.Pow(2, (double)i / BucketsPerOctave) / 1e6;
+                    }
+                }
+                return 0;
+            }
+        }
+    }
+}
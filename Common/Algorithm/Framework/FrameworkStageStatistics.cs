@@ -0,0 +1,63 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+namespace QuantConnect.Algorithm.Framework
+{
+    /// <summary>
+    /// The calls of a framework stage on a model instance recorded by the <see cref="FrameworkProfiler"/>
+    /// </summary>
+    public class FrameworkStageStatistics
+    {
+        /// <summary>
+        /// The framework stage, like <see cref="FrameworkProfiler.AlphaUpdate"/>
+        /// </summary>
+        public string Stage { get; set; }
+
+        /// <summary>
+        /// The name of the model instance
+        /// </summary>
+        public string Model { get; set; }
+
+        /// <summary>
+        /// The number of calls
+        /// </summary>
+        public long Count { get; set; }
+
+        /// <summary>
+        /// The total time of the calls
+        /// </summary>
+        public double TotalMilliseconds { get; set; }
+
+        /// <summary>
+        /// The median time of a call
+        /// </summary>
+        public double MedianMilliseconds { get; set; }
+
+        /// <summary>
+        /// The 99th percentile of the time of a call
+        /// </summary>
+        public double P99Milliseconds { get; set; }
+
+        /// <summary>
+        /// The longest call
+        /// </summary>
+        public double MaximumMilliseconds { get; set; }
+
+        /// <summary>
+        /// The managed bytes allocated by the calls, the python objects are not included
+        /// </summary>
+        public long AllocatedBytes { get; set; }
+    }
+}
@@ -28,6 +28,7 @@ namespace QuantConnect
     {
         private static TimeSpan _defaultDatabasesRefreshPeriod =
             TimeSpan.TryParse(Config.Get("databases-refresh-period", "1.00:00:00"), out var refreshPeriod) ? refreshPeriod : Time.OneDay;
+        private static bool _defaultFrameworkProfilingEnabled = Config.GetBool("framework-profiling");
 
         /// <summary>
         /// True if should rebalance portfolio on security changes. True by default
@@ -146,6 +147,12 @@ namespace QuantConnect
         /// </summary>
         public TimeSpan DatabasesRefreshPeriod { get; set; }
 
+        /// <summary>
+        /// True if the time of each algorithm framework stage and model is recorded, see <see cref="IAlgorithm.FrameworkProfiler"/>.
+        /// False by default, set by the 'framework-profiling' configuration
+        /// </summary>
+        public bool FrameworkProfilingEnabled { get; set; }
+
         /// <summary>
         /// Initializes a new instance of the <see cref="AlgorithmSettings"/> class
         /// </summary>
@@ -160,6 +167,7 @@ namespace QuantConnect
             MaxAbsolutePortfolioTargetPercentage = 1000000000;
             MinAbsolutePortfolioTargetPercentage = 0.0000000001m;
             DatabasesRefreshPeriod = _defaultDatabasesRefreshPeriod;
+            FrameworkProfilingEnabled = _defaultFrameworkProfilingEnabled;
         }
     }
 }
@@ -0,0 +1,76 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using Python.Runtime;
+using QuantConnect.Python;
+using System.Collections.Generic;
+
+namespace QuantConnect.Data.UniverseSelection
+{
+    /// <summary>
+    /// Defines a fundamental universe whose python selection function receives the day's fundamentals as a
+    /// pandas.DataFrame of the requested fields, see <see cref="FundamentalFrame"/>. The function returns a boolean
+    /// mask of the rows, the selected index values or Symbols, or <see cref="Universe.Unchanged"/>
+    /// </summary>
+    public class FundamentalFrameUniverse : FundamentalUniverseFactory
+    {
+        /// <summary>
+        /// Initializes a new instance of the <see cref="FundamentalFrameUniverse"/> class
+        /// </summary>
+        /// <param name="market">The target market</param>
+        /// <param name="universeSettings">The settings used for new subscriptions generated by this universe</param>
+        /// <param name="fields">The python names of the fundamental properties of the data frame columns, like 'valuation_ratios.pe_ratio'</param>
+        /// <param name="selector">Selects the symbols from the data frame</param>
+        public FundamentalFrameUniverse(string market, UniverseSettings universeSettings, PyObject fields, PyObject selector)
+            : base(market, universeSettings, CreateSelector(new FundamentalFrame(GetFields(fields)), selector))
+        {
+        }
+
+        private static Func<IEnumerable<Fundamental.Fundamental>, IEnumerable<Symbol>> CreateSelector(FundamentalFrame frame, PyObject selector)
+        {
+            return data =>
+            {
+                var fundamentals = data.ToList();
+                using (Py.GIL())
+                {
+                    using var dataFrame = frame.Create(fundamentals);
+                    using var selection = selector.Invoke(dataFrame);
+                    return frame.GetSymbols(selection, fundamentals);
+                }
+            };
+        }
+
+        private static IEnumerable<string> GetFields(PyObject fields)
+        {
+            using (Py.GIL())
+            {
+                if (PyString.IsStringType(fields))
+                {
+                    return new[] { fields.As<string>() };
+                }
+
+                var result = new List<string>();
+                foreach (PyObject field in fields)
+                {
+                    result.Add(field.As<string>());
+                    field.Dispose();
+                }
+                return result;
+            }
+        }
+    }
+}
@@ -30,6 +30,7 @@ using System.Collections.Concurrent;
 using QuantConnect.Securities.Future;
 using QuantConnect.Securities.Option;
 using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Algorithm.Framework;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Alphas.Analysis;
 
@@ -399,6 +400,14 @@ namespace QuantConnect.Interfaces
             get;
         }
 
+        /// <summary>
+        /// Gets the framework profiler, recording the time of each framework stage and model
+        /// </summary>
+        FrameworkProfiler FrameworkProfiler
+        {
+            get;
+        }
+
         /// <summary>
         /// Gets the object store, used for persistence
         /// </summary>
@@ -123,5 +123,10 @@ namespace QuantConnect.Interfaces
         /// Gets the time span used to refresh the market hours and symbol properties databases
         /// </summary>
         TimeSpan DatabasesRefreshPeriod { get; set; }
+
+        /// <summary>
+        /// True if the time of each algorithm framework stage and model is recorded, see <see cref="IAlgorithm.FrameworkProfiler"/>
+        /// </summary>
+        bool FrameworkProfilingEnabled { get; set; }
     }
 }
@@ -0,0 +1,65 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Newtonsoft.Json;
+using System.Collections.Generic;
+
+namespace QuantConnect.Optimizer
+{
+    /// <summary>
+    /// A backtest request sent by the optimizer to a long lived Lean worker process.
+    /// The optimizer writes one json job per line to the standard input of the worker and the worker
+    /// writes a line starting with <see cref="CompletedPrefix"/> to its completion pipe when the backtest ends.
+    /// The pipe is dedicated to these lines, the standard output is shared with the logs and the algorithm prints
+    /// </summary>
+    public class OptimizationWorkerJob
+    {
+        /// <summary>
+        /// The prefix of the completion pipe line the worker writes when a backtest ends,
+        /// followed by the backtest id and the duration of the backtest in seconds
+        /// </summary>
+        public const string CompletedPrefix = "OptimizationWorker.Completed:";
+
+        /// <summary>
+        /// The unique backtest id
+        /// </summary>
+        [JsonProperty(PropertyName = "backtest-id")]
+        public string BacktestId { get; set; }
+
+        /// <summary>
+        /// The backtest name
+        /// </summary>
+        [JsonProperty(PropertyName = "backtest-name")]
+        public string BacktestName { get; set; }
+
+        /// <summary>
+        /// The folder the backtest stores its log and results in
+        /// </summary>
+        [JsonProperty(PropertyName = "results-destination-folder")]
+        public string ResultsDestinationFolder { get; set; }
+
+        /// <summary>
+        /// The algorithm parameters of the backtest
+        /// </summary>
+        [JsonProperty(PropertyName = "parameters")]
+        public IReadOnlyDictionary<string, string> Parameters { get; set; }
+
+        /// <summary>
+        /// The fraction of the algorithm period to backtest, null for the full period
+        /// </summary>
+        [JsonProperty(PropertyName = "period-fraction", NullValueHandling = NullValueHandling.Ignore)]
+        public decimal? PeriodFraction { get; set; }
+    }
+}
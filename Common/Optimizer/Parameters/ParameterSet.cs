@@ -41,15 +41,23 @@ namespace QuantConnect.Optimizer.Parameters
         [JsonProperty(PropertyName = "value", NullValueHandling = NullValueHandling.Ignore)]
         public IReadOnlyDictionary<string, string> Value { get; }
 
+        /// <summary>
+        /// The fraction of the algorithm period to backtest this combination on, from its start date. Null for the full period
+        /// </summary>
+        [JsonProperty(PropertyName = "period-fraction", NullValueHandling = NullValueHandling.Ignore)]
+        public decimal? PeriodFraction { get; }
+
         /// <summary>
         /// Creates an instance of <see cref="ParameterSet"/> based on new combination of optimization parameters
         /// </summary>
         /// <param name="id">Unique identifier</param>
         /// <param name="value">Combination of optimization parameters</param>
-        public ParameterSet(int id, Dictionary<string, string> value)
+        /// <param name="periodFraction">The fraction of the algorithm period to backtest, null for the full period</param>
+        public ParameterSet(int id, Dictionary<string, string> value, decimal? periodFraction = null)
         {
             Id = id;
             Value = value?.ToReadOnlyDictionary();
+            PeriodFraction = periodFraction;
         }
 
         /// <summary>
@@ -66,6 +66,12 @@ namespace QuantConnect.Packets
         /// </summary>
         public int OutOfSampleDays;
 
+        /// <summary>
+        /// The fraction of the algorithm period to backtest, from its start date. Used by optimization strategies
+        /// that evaluate the parameter sets on a shorter period before running the full one
+        /// </summary>
+        public decimal? PeriodFraction;
+
         /// <summary>
         /// Estimated number of trading days in this backtest task based on the start-end dates.
         /// </summary>
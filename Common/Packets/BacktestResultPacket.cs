@@ -19,6 +19,7 @@ using Newtonsoft.Json;
 using QuantConnect.Orders;
 using QuantConnect.Logging;
 using QuantConnect.Statistics;
+using QuantConnect.Algorithm.Framework;
 using System.Collections.Generic;
 
 namespace QuantConnect.Packets
@@ -213,6 +214,12 @@ namespace QuantConnect.Packets
         /// </summary>
         public AlgorithmPerformance TotalPerformance = null;
 
+        /// <summary>
+        /// The time of each algorithm framework stage and model, only when framework profiling is enabled
+        /// </summary>
+        [JsonProperty(NullValueHandling = NullValueHandling.Ignore)]
+        public List<FrameworkStageStatistics> FrameworkProfile;
+
         /// <summary>
         /// Default Constructor
         /// </summary>
@@ -227,6 +234,7 @@ namespace QuantConnect.Packets
         {
             RollingWindow = parameters.RollingWindow;
             TotalPerformance = parameters.TotalPerformance;
+            FrameworkProfile = parameters.FrameworkProfile;
         }
     }
 } // End of Namespace:
@@ -17,6 +17,7 @@
 using System;
 using QuantConnect.Orders;
 using QuantConnect.Statistics;
+using QuantConnect.Algorithm.Framework;
 using System.Collections.Generic;
 using QuantConnect.Securities.Positions;
 
@@ -36,6 +37,12 @@ namespace QuantConnect.Packets
         /// Rolling window detailed statistics.
         /// </summary>
         public AlgorithmPerformance TotalPerformance { get; set; }
+
+        /// <summary>
+        /// The time of each algorithm framework stage and model, null if not profiled
+        /// </summary>
+        public List<FrameworkStageStatistics> FrameworkProfile { get; set; }
+
         /// <summary>
         /// Creates a new instance
         /// </summary>
@@ -48,11 +55,13 @@ namespace QuantConnect.Packets
             List<OrderEvent> orderEvents,
             AlgorithmPerformance totalPerformance = null,
             AlgorithmConfiguration algorithmConfiguration = null,
-            IDictionary<string, string> state = null)
+            IDictionary<string, string> state = null,
+            List<FrameworkStageStatistics> frameworkProfile = null)
             : base(charts, orders, profitLoss, statistics, runtimeStatistics, orderEvents, algorithmConfiguration, state)
         {
             RollingWindow = rollingWindow;
             TotalPerformance = totalPerformance;
+            FrameworkProfile = frameworkProfile;
         }
     }
 }
@@ -20,53 +20,152 @@ Allowing support for indexing of Lean created Indexes with tickers like "SPY", S
 
 import pandas as pd
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
+from contextlib import contextmanager
 
 from clr import AddReference
 AddReference("QuantConnect.Common")
+AddReference("QuantConnect.Configuration")
 from QuantConnect import *
-
-def mapper(key):
+from QuantConnect.Configuration import Config
+
+# Lean names the symbol level of every index it creates (see PandasData.cs), this level name is what
+# survives pandas operations like unstack, concat, join or transpose so we use it as the Lean index marker
+LEAN_INDEX_MARKER = 'symbol'
+
+# Bounded memo of ticker to Symbol SecurityIdentifier string resolutions, avoids calling SymbolCache on each lookup
+SYMBOL_ID_CACHE_SIZE = 10000
+_symbol_id_cache = {}
+
+# Remapping can be turned off globally for algorithms that never index Lean data frames by ticker or Symbol
+_remapping_enabled = Config.GetBool("pandas-symbol-remapping", True)
+
+def set_symbol_remapping(enabled):
+    '''Enables or disables the remapping of tickers and Symbol objects for every pandas object'''
+    global _remapping_enabled
+    _remapping_enabled = enabled
+
+@contextmanager
+def symbol_remapping_disabled():
+    '''Context manager that runs the enclosed pandas code without the ticker and Symbol remapping'''
+    global _remapping_enabled
+    previous = _remapping_enabled
+    _remapping_enabled = False
+    try:
+        yield
+    finally:
+        _remapping_enabled = previous
+
+def clear_symbol_cache():
+    '''Clears the memoized ticker to SecurityIdentifier resolutions'''
+    _symbol_id_cache.clear()
+
+def is_lean_index(index):
+    '''True if the given index was created by Lean, that is, one of its levels is the symbol level'''
+    return LEAN_INDEX_MARKER in index.names
+
+def is_lean_object(obj):
+    '''True if the given pandas object (indexer, data frame, series or index) has a Lean created index'''
+    if isinstance(obj, (pd.core.indexing._LocationIndexer, pd.core.indexing._ScalarAccessIndexer)):
+        obj = obj.obj
+    if isinstance(obj, pd.DataFrame):
+        return is_lean_index(obj.index) or is_lean_index(obj.columns)
+    if isinstance(obj, pd.Series):
+        return is_lean_index(obj.index)
+    if isinstance(obj, pd.Index):
+        return is_lean_index(obj)
+    return True
+
+def resolve_ticker(ticker, use_cache = True, sources = None):
+    '''Resolves a ticker to the string representation of its Symbol SecurityIdentifier.
+    Returns None if the ticker is not in the SymbolCache
+    '''
+    if use_cache:
+        sid = _symbol_id_cache.get(ticker)
+        if sid is not None:
+            if sources is not None:
+                sources.append('cache')
+            return sid
+
+    kvp = SymbolCache.TryGetSymbol(ticker, None)
+    if not kvp[0]:
+        return None
+
+    if sources is not None:
+        sources.append('lookup')
+
+    sid = str(kvp[1].ID)
+    if len(_symbol_id_cache) >= SYMBOL_ID_CACHE_SIZE:
+        # evict the oldest entry, dictionaries keep insertion order
+        del _symbol_id_cache[next(iter(_symbol_id_cache))]
+    _symbol_id_cache[ticker] = sid
+    return sid
+
+def mapper(key, use_cache = True, sources = None):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
-    Symbol SecurityIdentifier.If cannot map, returns the object
+    Symbol SecurityIdentifier.If cannot map, returns the object.
+    If a list is given as 'sources', how each mapped key was resolved is appended to it
     '''
     keyType = type(key)
     if keyType is Symbol:
+        if sources is not None:
+            sources.append('symbol')
         return str(key.ID)
     if keyType is str:
         reserved = ['high', 'low', 'open', 'close']
         if key in reserved:
             return key
-        kvp = SymbolCache.TryGetSymbol(key, None)
-        if kvp[0]:
-            return str(kvp[1].ID)
+        sid = resolve_ticker(key, use_cache, sources)
+        if sid is not None:
+            return sid
     if keyType is list:
-        return [mapper(x) for x in key]
+        return [mapper(x, use_cache, sources) for x in key]
     if keyType is tuple:
-        return tuple([mapper(x) for x in key])
+        return tuple([mapper(x, use_cache, sources) for x in key])
     if keyType is dict:
-        return { k: mapper(v) for k, v in key.items()}
+        return { k: mapper(v, use_cache, sources) for k, v in key.items()}
     return key
 
+def map_arguments(args, kwargs, use_cache = True):
+    '''Maps the arguments of a wrapped function, returns the new arguments and how each mapped key was resolved'''
+    sources = []
+    newargs = args
+    newkwargs = kwargs
+
+    if len(args) > 1:
+        newargs = mapper(args, use_cache, sources)
+    if len(kwargs) > 0:
+        newkwargs = mapper(kwargs, use_cache, sources)
+
+    return newargs, newkwargs, sources
+
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
     wrapped_function converts the args / kwargs to use alternative index keys and then calls the function. 
     If this fails we fall back to the original key and try it as well, if they both fail we throw our error.
+    Objects without a Lean created index and keys that could not be mapped go straight to the original function.
     '''
     def wrapped_function(*args, **kwargs):
-        # Map args & kwargs and execute function
-        try:
-            newargs = args
-            newkwargs = kwargs
+        if not _remapping_enabled or not is_lean_object(args[0]):
+            return f(*args, **kwargs)
 
-            if len(args) > 1:
-                newargs = mapper(args)
-            if len(kwargs) > 0:
-                newkwargs = mapper(kwargs)
+        # Map args & kwargs and execute function
+        newargs, newkwargs, sources = map_arguments(args, kwargs)
+        if not sources:
+            return f(*args, **kwargs)
 
+        try:
             return f(*newargs, **newkwargs)
         except KeyError as e:
             mKey = [arg for arg in newargs if isinstance(arg, str)]
 
+        # The memoized resolution might be outdated, retry resolving the keys through the SymbolCache
+        if 'cache' in sources:
+            freshargs, freshkwargs, _ = map_arguments(args, kwargs, use_cache=False)
+            try:
+                return f(*freshargs, **freshkwargs)
+            except KeyError as e:
+                pass
+
         # Execute original
         # Allows for df, Series, etc indexing for keys like 'SPY' if they exist
         try:
@@ -76,6 +175,7 @@ def wrap_keyerror_function(f):
             raise KeyError(f"No key found for either mapped or original key. Mapped Key: {mKey}; Original Key: {oKey}")
 
     wrapped_function.__name__ = f.__name__
+    wrapped_function.__wrapped__ = f
     return wrapped_function
 
 def wrap_bool_function(f):
@@ -87,21 +187,23 @@ def wrap_bool_function(f):
 
         # Try the original args; if true just return true
         originalResult = f(*args, **kwargs)
-        if originalResult:
+        if originalResult or not _remapping_enabled or not is_lean_object(args[0]):
             return originalResult
 
         # Try our mapped args; return this result regardless
-        newargs = args
-        newkwargs = kwargs
-
-        if len(args) > 1:
-            newargs = mapper(args)
-        if len(kwargs) > 0:
-            newkwargs = mapper(kwargs)
+        newargs, newkwargs, sources = map_arguments(args, kwargs)
+        if not sources:
+            return originalResult
 
-        return f(*newargs, **newkwargs)
+        result = f(*newargs, **newkwargs)
+        if not result and 'cache' in sources:
+            # The memoized resolution might be outdated, retry resolving the keys through the SymbolCache
+            freshargs, freshkwargs, _ = map_arguments(args, kwargs, use_cache=False)
+            result = f(*freshargs, **freshkwargs)
+        return result
 
     wrapped_function.__name__ = f.__name__
+    wrapped_function.__wrapped__ = f
     return wrapped_function
 
 
@@ -126,5 +228,6 @@ pd.core.indexes.base.Index.__contains__ = wrap_bool_function(pd.core.indexes.bas
 FrozenList = pdFrozenList
 Index = pd.Index
 MultiIndex = pd.MultiIndex
+DatetimeIndex = pd.DatetimeIndex
 Series = pd.Series
 DataFrame = pd.DataFrame
@@ -0,0 +1,372 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Reflection;
+using System.Runtime.InteropServices;
+using Python.Runtime;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.UniverseSelection;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Converts the fundamentals of a universe selection into a pandas.DataFrame holding only the requested fields,
+    /// one row per symbol. The values are read in C# and copied column by column into numpy arrays so that a python
+    /// selection can be vectorized instead of reading each property of each <see cref="Fundamental"/> through pythonnet
+    /// </summary>
+    /// <remarks>The fields are the python names of the properties, like 'dollar_volume' or 'valuation_ratios.pe_ratio'
+    /// for nested ones, they are the column names. The index is named 'symbol' and holds the security identifiers like
+    /// the other Lean data frames, so it can be indexed by ticker or Symbol</remarks>
+    public class FundamentalFrame
+    {
+        private static PyObject _dataFrameFactory;
+        private static PyObject _indexFactory;
+        private static PyObject _numpyEmpty;
+        private static PyObject _numpyFlatNonZero;
+        private static PyString _float64;
+        private static PyString _int64;
+        private static PyString _bool;
+        private static PyString _datetime64;
+        private static PyString _symbol;
+
+        private readonly static long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
+        private readonly static ConcurrentDictionary<string, Column> _columns = new();
+
+        private readonly Column[] _fieldColumns;
+
+        /// <summary>
+        /// The fields of the data frame
+        /// </summary>
+        public IReadOnlyList<string> Fields { get; }
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="fields">The python names of the <see cref="Fundamental"/> properties of the columns, like 'valuation_ratios.pe_ratio'</param>
+        /// <exception cref="ArgumentException">If a field is not a property of the fundamentals</exception>
+        public FundamentalFrame(IEnumerable<string> fields)
+        {
+            Fields = fields.ToList();
+            if (Fields.Count == 0)
+            {
+                throw new ArgumentException("FundamentalFrame: at least one field is required");
+            }
+            _fieldColumns = Fields.Select(field => _columns.GetOrAdd(field, CreateColumn)).ToArray();
+        }
+
+        /// <summary>
+        /// Creates the data frame of the given fundamentals, the caller must hold the python GIL
+        /// </summary>
+        /// <param name="fundamentals">The fundamentals, one row each in the same order</param>
+        /// <returns>The pandas.DataFrame of the fields indexed by symbol</returns>
+        public PyObject Create(IReadOnlyList<Fundamental> fundamentals)
+        {
+            Initialize();
+
+            using var columns = new PyDict();
+            for (var i = 0; i < Fields.Count; i++)
+            {
+                using var values = _fieldColumns[i].Create(fundamentals);
+                columns.SetItem(Fields[i], values);
+            }
+
+            using var identifiers = new PyList();
+            foreach (var fundamental in fundamentals)
+            {
+                using var identifier = new PyString(fundamental.Symbol.ID.ToString());
+                identifiers.Append(identifier);
+            }
+            using var indexArguments = Py.kw("name", _symbol);
+            using var index = _indexFactory.Invoke(new PyObject[] { identifiers }, indexArguments);
+
+            using var frameArguments = Py.kw("index", index);
+            return _dataFrameFactory.Invoke(new PyObject[] { columns }, frameArguments);
+        }
+
+        /// <summary>
+        /// Gets the symbols selected by a python selection of the data frame, the caller must hold the python GIL
+        /// </summary>
+        /// <param name="selection">A boolean mask of the rows, the selected index values or Symbols, or <see cref="Universe.Unchanged"/></param>
+        /// <param name="fundamentals">The fundamentals the data frame was created from</param>
+        /// <returns>The selected symbols</returns>
+        public IEnumerable<Symbol> GetSymbols(PyObject selection, IReadOnlyList<Fundamental> fundamentals)
+        {
+            Initialize();
+
+            if (selection.TryConvert(out Universe.UnchangedUniverse _))
+            {
+                return Universe.Unchanged;
+            }
+
+            var symbols = new List<Symbol>();
+            if (IsBooleanMask(selection))
+            {
+                if (selection.Length() != fundamentals.Count)
+                {
+                    throw new ArgumentException($"FundamentalFrame: the selection mask has {selection.Length()} values for {fundamentals.Count} rows");
+                }
+
+                if (selection.HasAttr("index"))
+                {
+                    // a pandas series is aligned on its index like pandas does, it could have been sorted
+                    return GetMaskedSymbols(selection, fundamentals);
+                }
+
+                using var positions = _numpyFlatNonZero.Invoke(selection);
+                using var positionList = positions.InvokeMethod("tolist");
+                foreach (PyObject position in positionList)
+                {
+                    symbols.Add(fundamentals[position.As<int>()].Symbol);
+                    position.Dispose();
+                }
+                return symbols;
+            }
+
+            Dictionary<string, Symbol> symbolByIdentifier = null;
+            foreach (PyObject item in selection)
+            {
+                using (item)
+                {
+                    if (item.TryConvert(out Symbol symbol))
+                    {
+                        symbols.Add(symbol);
+                        continue;
+                    }
+
+                    // an index value is a security identifier, it could also be a ticker
+                    var value = item.As<string>();
+                    symbolByIdentifier ??= GetSymbolByIdentifier(fundamentals);
+                    if (symbolByIdentifier.TryGetValue(value, out symbol) || SymbolCache.TryGetSymbol(value, out symbol))
+                    {
+                        symbols.Add(symbol);
+                    }
+                }
+            }
+            return symbols;
+        }
+
+        /// <summary>
+        /// Gets the symbols of the rows of a boolean pandas series that are true, in the order of the rows
+        /// </summary>
+        private static IEnumerable<Symbol> GetMaskedSymbols(PyObject mask, IReadOnlyList<Fundamental> fundamentals)
+        {
+            var symbolByIdentifier = GetSymbolByIdentifier(fundamentals);
+            var masked = new Dictionary<Symbol, bool>(fundamentals.Count);
+
+            using var index = mask.GetAttr("index");
+            using var labels = index.InvokeMethod("tolist");
+            using var values = mask.InvokeMethod("tolist");
+            for (var i = 0; i < fundamentals.Count; i++)
+            {
+                using var label = labels[i];
+                using var value = values[i];
+                if (!symbolByIdentifier.TryGetValue(label.ToString(), out var symbol) || !masked.TryAdd(symbol, value.IsTrue()))
+                {
+                    throw new ArgumentException($"FundamentalFrame: the index of the selection mask does not match the rows of the data frame, unexpected label '{label}'");
+                }
+            }
+            return fundamentals.Where(fundamental => masked[fundamental.Symbol]).Select(fundamental => fundamental.Symbol).ToList();
+        }
+
+        private static Dictionary<string, Symbol> GetSymbolByIdentifier(IReadOnlyList<Fundamental> fundamentals)
+        {
+            var symbolByIdentifier = new Dictionary<string, Symbol>(fundamentals.Count);
+            foreach (var fundamental in fundamentals)
+            {
+                symbolByIdentifier[fundamental.Symbol.ID.ToString()] = fundamental.Symbol;
+            }
+            return symbolByIdentifier;
+        }
+
+        private static bool IsBooleanMask(PyObject selection)
+        {
+            if (!selection.HasAttr("dtype"))
+            {
+                return false;
+            }
+            using var dtype = selection.GetAttr("dtype");
+            using var kind = dtype.GetAttr("kind");
+            return kind.As<string>() == "b";
+        }
+
+        private static void Initialize()
+        {
+            if (_dataFrameFactory != null)
+            {
+                return;
+            }
+
+            // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
+            using var pandas = Py.Import("PandasMapper");
+            using var numpy = Py.Import("numpy");
+            _indexFactory = pandas.GetAttr("Index");
+            _numpyEmpty = numpy.GetAttr("empty");
+            _numpyFlatNonZero = numpy.GetAttr("flatnonzero");
+            _float64 = new PyString("float64");
+            _int64 = new PyString("int64");
+            _bool = new PyString("bool");
+            _datetime64 = new PyString("datetime64[ns]");
+            _symbol = new PyString("symbol");
+            _dataFrameFactory = pandas.GetAttr("DataFrame");
+        }
+
+        /// <summary>
+        /// Resolves the property chain of a field, 'valuation_ratios.pe_ratio' is ValuationRatios.PERatio
+        /// </summary>
+        private static Column CreateColumn(string field)
+        {
+            var getters = new List<Func<object, object>>();
+            var type = typeof(Fundamental);
+            foreach (var name in field.Split('.'))
+            {
+                var normalizedName = Normalize(name);
+                var property = type.GetProperties(BindingFlags.Public | BindingFlags.Instance)
+                    .FirstOrDefault(x => x.GetIndexParameters().Length == 0 && Normalize(x.Name) == normalizedName);
+                if (property == null)
+                {
+                    throw new ArgumentException($"FundamentalFrame: '{field}' is not a fundamental property, '{name}' is not a property of {type.Name}");
+                }
+
+                var parameter = Expression.Parameter(typeof(object));
+                var value = Expression.Property(Expression.Convert(parameter, property.DeclaringType), property);
+                getters.Add(Expression.Lambda<Func<object, object>>(Expression.Convert(value, typeof(object)), parameter).Compile());
+                type = property.PropertyType;
+            }
+
+            var getter = getters.Count == 1 ? getters[0] : instance =>
+            {
+                foreach (var get in getters)
+                {
+                    if (instance == null)
+                    {
+                        return null;
+                    }
+                    instance = get(instance);
+                }
+                return instance;
+            };
+            return new Column(getter, Nullable.GetUnderlyingType(type) ?? type);
+        }
+
+        private static string Normalize(string name)
+        {
+            return name.Replace("_", string.Empty, StringComparison.InvariantCulture).ToLowerInvariant();
+        }
+
+        private static PyObject AllocateArray(int length, PyString dtype, out IntPtr address)
+        {
+            using var size = length.ToPython();
+            var array = _numpyEmpty.Invoke(size, dtype);
+            using var ctypes = array.GetAttr("ctypes");
+            using var data = ctypes.GetAttr("data");
+            address = new IntPtr(data.As<long>());
+            return array;
+        }
+
+        private class Column
+        {
+            private readonly Func<object, object> _getter;
+            private readonly Type _type;
+
+            public Column(Func<object, object> getter, Type type)
+            {
+                _getter = getter;
+                _type = type;
+            }
+
+            /// <summary>
+            /// Reads the values of the fundamentals into a numpy array, the missing values are NaN, False and NaT
+            /// </summary>
+            public PyObject Create(IReadOnlyList<Fundamental> fundamentals)
+            {
+                if (_type == typeof(bool))
+                {
+                    var buffer = new byte[fundamentals.Count];
+                    for (var i = 0; i < buffer.Length; i++)
+                    {
+                        buffer[i] = _getter(fundamentals[i]) is true ? (byte)1 : (byte)0;
+                    }
+                    var array = AllocateArray(buffer.Length, _bool, out var address);
+                    Copy(buffer, address);
+                    return array;
+                }
+
+                if (_type == typeof(DateTime))
+                {
+                    var buffer = new long[fundamentals.Count];
+                    for (var i = 0; i < buffer.Length; i++)
+                    {
+                        buffer[i] = _getter(fundamentals[i]) is DateTime time ? (time.Ticks - _unixEpochTicks) * 100 : long.MinValue;
+                    }
+                    using var array = AllocateArray(buffer.Length, _int64, out var address);
+                    Copy(buffer, address);
+                    return array.InvokeMethod("view", _datetime64);
+                }
+
+                if (_type.IsPrimitive && _type != typeof(char) || _type == typeof(decimal))
+                {
+                    var buffer = new double[fundamentals.Count];
+                    for (var i = 0; i < buffer.Length; i++)
+                    {
+                        var value = _getter(fundamentals[i]);
+                        buffer[i] = value == null ? double.NaN : Convert.ToDouble(value, CultureInfo.InvariantCulture);
+                    }
+                    var array = AllocateArray(buffer.Length, _float64, out var address);
+                    Copy(buffer, address);
+                    return array;
+                }
+
+                // strings and any other object are kept as python objects
+                var values = new PyList();
+                foreach (var fundamental in fundamentals)
+                {
+                    using var value = _getter(fundamental).ToPython();
+                    values.Append(value);
+                }
+                return values;
+            }
+
+            private static void Copy(byte[] buffer, IntPtr address)
+            {
+                if (buffer.Length > 0)
+                {
+                    Marshal.Copy(buffer, 0, address, buffer.Length);
+                }
+            }
+
+            private static void Copy(long[] buffer, IntPtr address)
+            {
+                if (buffer.Length > 0)
+                {
+                    Marshal.Copy(buffer, 0, address, buffer.Length);
+                }
+            }
+
+            private static void Copy(double[] buffer, IntPtr address)
+            {
+                if (buffer.Length > 0)
+                {
+                    Marshal.Copy(buffer, 0, address, buffer.Length);
+                }
+            }
+        }
+    }
+}
@@ -14,6 +14,7 @@
 */
 
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Data;
 using QuantConnect.Data.Fundamental;
 using QuantConnect.Data.Market;
@@ -25,6 +26,7 @@ using System.Collections.Generic;
 using System.Globalization;
 using System.Linq;
 using System.Reflection;
+using System.Runtime.InteropServices;
 
 namespace QuantConnect.Python
 {
@@ -65,11 +67,19 @@ namespace QuantConnect.Python
         private static PyObject _seriesFactory;
         private static PyObject _dataFrameFactory;
         private static PyObject _multiIndexFactory;
+        private static PyObject _multiIndexType;
+        private static PyObject _datetimeIndexFactory;
+        private static PyObject _numpyEmpty;
+        private static PyObject _numpyZeros;
+        private static PyString _float64;
+        private static PyString _int64;
+        private static PyString _datetime64;
 
         private static PyList _defaultNames;
         private static PyList _level2Names;
         private static PyList _level3Names;
 
+        private readonly static long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
         private readonly static HashSet<string> _baseDataProperties = typeof(BaseData).GetProperties().ToHashSet(x => x.Name.ToLowerInvariant());
         private readonly static ConcurrentDictionary<Type, IEnumerable<MemberInfo>> _membersByType = new ();
         private readonly static IReadOnlyList<string> _standardColumns = new string []
@@ -85,6 +95,12 @@ namespace QuantConnect.Python
 
         private readonly IEnumerable<MemberInfo> _members = Enumerable.Empty<MemberInfo>();
 
+        /// <summary>
+        /// True if numeric series and the multi index should be handed to pandas as contiguous numpy buffers
+        /// instead of being converted value by value. Enabled by default, see 'pandas-columnar-conversion'
+        /// </summary>
+        public static bool ColumnarConversion { get; set; } = Config.GetBool("pandas-columnar-conversion", true);
+
         /// <summary>
         /// Gets true if this is a custom data request, false for normal QC data
         /// </summary>
@@ -108,10 +124,18 @@ namespace QuantConnect.Python
                     _pandas = Py.Import("PandasMapper");
                     _seriesFactory = _pandas.GetAttr("Series");
                     _dataFrameFactory = _pandas.GetAttr("DataFrame");
-                    using var multiIndex = _pandas.GetAttr("MultiIndex");
-                    _multiIndexFactory = multiIndex.GetAttr("from_tuples");
+                    _multiIndexType = _pandas.GetAttr("MultiIndex");
+                    _multiIndexFactory = _multiIndexType.GetAttr("from_tuples");
+                    _datetimeIndexFactory = _pandas.GetAttr("DatetimeIndex");
                     _empty = new PyString(string.Empty);
 
+                    using var numpy = Py.Import("numpy");
+                    _numpyEmpty = numpy.GetAttr("empty");
+                    _numpyZeros = numpy.GetAttr("zeros");
+                    _float64 = new PyString("float64");
+                    _int64 = new PyString("int64");
+                    _datetime64 = new PyString("datetime64[ns]");
+
                     var time = new PyString("time");
                     var symbol = new PyString("symbol");
                     var expiry = new PyString("expiry");
@@ -386,26 +410,43 @@ namespace QuantConnect.Python
 
                 if (!indexCache.TryGetValue(kvp.Value.Times, out var index))
                 {
-                    using var tuples = kvp.Value.Times.Select(time => CreateTupleIndex(time, list)).ToPyListUnSafe();
-                    using var namesDic = Py.kw("names", names);
+                    if (ColumnarConversion)
+                    {
+                        index = CreateMultiIndexFromCodes(kvp.Value.Times, list, names);
+                    }
+                    else
+                    {
+                        using var tuples = kvp.Value.Times.Select(time => CreateTupleIndex(time, list)).ToPyListUnSafe();
+                        using var namesDic = Py.kw("names", names);
 
-                    indexCache[kvp.Value.Times] = index = _multiIndexFactory.Invoke(new[] { tuples }, namesDic);
+                        index = _multiIndexFactory.Invoke(new[] { tuples }, namesDic);
 
-                    foreach (var pyObject in tuples)
-                    {
-                        pyObject.Dispose();
+                        foreach (var pyObject in tuples)
+                        {
+                            pyObject.Dispose();
+                        }
                     }
+                    indexCache[kvp.Value.Times] = index;
                 }
 
                 // Adds pandas.Series value keyed by the column name
-                using var pyvalues = new PyList();
-                for (var i = 0; i < kvp.Value.Values.Count; i++)
+                if (ColumnarConversion && kvp.Value.IsNumeric)
                 {
-                    using var pyObject = kvp.Value.Values[i].ToPython();
-                    pyvalues.Append(pyObject);
+                    using var array = CreateFloat64Array(kvp.Value.Values);
+                    using var series = _seriesFactory.Invoke(array, index);
+                    pyDict.SetItem(kvp.Key, series);
+                }
+                else
+                {
+                    using var pyvalues = new PyList();
+                    for (var i = 0; i < kvp.Value.Values.Count; i++)
+                    {
+                        using var pyObject = kvp.Value.Values[i].ToPython();
+                        pyvalues.Append(pyObject);
+                    }
+                    using var series = _seriesFactory.Invoke(pyvalues, index);
+                    pyDict.SetItem(kvp.Key, series);
                 }
-                using var series = _seriesFactory.Invoke(pyvalues, index);
-                pyDict.SetItem(kvp.Key, series);
             }
             _series.Clear();
             foreach (var kvp in indexCache)
@@ -440,6 +481,98 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Creates the pandas.MultiIndex from level codes: every level but the last holds a single constant
+        /// label and the time level is built from an int64 nanoseconds buffer, so no per row tuple is created
+        /// </summary>
+        private static PyObject CreateMultiIndexFromCodes(List<DateTime> times, List<PyObject> list, PyList names)
+        {
+            // pandas sorts the levels when building from tuples, we do the same so the resulting index is identical
+            var uniqueTimes = times.Distinct().OrderBy(x => x).ToList();
+            var codeByTime = new Dictionary<DateTime, long>(uniqueTimes.Count);
+            var nanoseconds = new long[uniqueTimes.Count];
+            for (var i = 0; i < uniqueTimes.Count; i++)
+            {
+                codeByTime[uniqueTimes[i]] = i;
+                nanoseconds[i] = (uniqueTimes[i].Ticks - _unixEpochTicks) * 100;
+            }
+            var timeCodes = new long[times.Count];
+            for (var i = 0; i < times.Count; i++)
+            {
+                timeCodes[i] = codeByTime[times[i]];
+            }
+
+            using var levels = new PyList();
+            using var codes = new PyList();
+            using var count = times.Count.ToPython();
+            for (var i = 0; i < list.Count - 1; i++)
+            {
+                using var level = new PyList(new[] { list[i] });
+                using var levelCodes = _numpyZeros.Invoke(count, _int64);
+                levels.Append(level);
+                codes.Append(levelCodes);
+            }
+
+            using var timeArray = CreateArray(nanoseconds, _int64);
+            using var timeView = timeArray.InvokeMethod("view", _datetime64);
+            using var timeLevel = _datetimeIndexFactory.Invoke(timeView);
+            using var timeCodesArray = CreateArray(timeCodes, _int64);
+            levels.Append(timeLevel);
+            codes.Append(timeCodesArray);
+
+            using var kwargs = Py.kw("levels", levels, "codes", codes, "names", names, "verify_integrity", false);
+            return _multiIndexType.Invoke(Array.Empty<PyObject>(), kwargs);
+        }
+
+        /// <summary>
+        /// Copies the values of a numeric serie into a contiguous numpy float64 array, null values become NaN
+        /// </summary>
+        private static PyObject CreateFloat64Array(List<object> values)
+        {
+            var buffer = new double[values.Count];
+            for (var i = 0; i < buffer.Length; i++)
+            {
+                buffer[i] = values[i] is double value ? value : double.NaN;
+            }
+            return CreateArray(buffer, _float64);
+        }
+
+        /// <summary>
+        /// Allocates a numpy array and copies the given buffer straight into its memory
+        /// </summary>
+        private static PyObject CreateArray(double[] buffer, PyString dtype)
+        {
+            var array = AllocateArray(buffer.Length, dtype, out var address);
+            if (buffer.Length > 0)
+            {
+                Marshal.Copy(buffer, 0, address, buffer.Length);
+            }
+            return array;
+        }
+
+        /// <summary>
+        /// Allocates a numpy array and copies the given buffer straight into its memory
+        /// </summary>
+        private static PyObject CreateArray(long[] buffer, PyString dtype)
+        {
+            var array = AllocateArray(buffer.Length, dtype, out var address);
+            if (buffer.Length > 0)
+            {
+                Marshal.Copy(buffer, 0, address, buffer.Length);
+            }
+            return array;
+        }
+
+        private static PyObject AllocateArray(int length, PyString dtype, out IntPtr address)
+        {
+            using var size = length.ToPython();
+            var array = _numpyEmpty.Invoke(size, dtype);
+            using var ctypes = array.GetAttr("ctypes");
+            using var data = ctypes.GetAttr("data");
+            address = new IntPtr(data.As<long>());
+            return array;
+        }
+
         /// <summary>
         /// Create a new tuple index
         /// </summary>
@@ -488,6 +621,10 @@ namespace QuantConnect.Python
         {
             private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
             public bool ShouldFilter { get; set; } = true;
+            /// <summary>
+            /// True while every value added is a double or null, so the serie can be copied into a float64 buffer
+            /// </summary>
+            public bool IsNumeric { get; private set; } = true;
             public List<DateTime> Times { get; set; } = new();
             public List<object> Values { get; set; } = new();
 
@@ -524,6 +661,11 @@ namespace QuantConnect.Python
                     }
                 }
 
+                if (IsNumeric && value != null && value is not double)
+                {
+                    IsNumeric = false;
+                }
+
                 Values.Add(value);
                 Times.Add(time);
             }
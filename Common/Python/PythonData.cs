@@ -17,6 +17,7 @@ using Python.Runtime;
 using QuantConnect.Data;
 using System;
 using System.Collections.Generic;
+using System.Linq;
 
 namespace QuantConnect.Python
 {
@@ -28,6 +29,7 @@ namespace QuantConnect.Python
     {
         private readonly string _pythonTypeName;
         private readonly dynamic _pythonReader;
+        private readonly dynamic _pythonReadChunk;
         private readonly dynamic _pythonGetSource;
         private readonly dynamic _pythonData;
         private readonly dynamic _defaultResolution;
@@ -36,6 +38,9 @@ namespace QuantConnect.Python
         private readonly dynamic _requiresMapping;
         private DateTime _endTime;
 
+        private static readonly long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
+        private static PyObject _frameColumns;
+
         /// <summary>
         /// The end time of this data. Some data covers spans (trade bars)
         /// and as such we want to know the entire time span covered
@@ -84,6 +89,7 @@ namespace QuantConnect.Python
                 _defaultResolution = pythonData.GetMethod("DefaultResolution");
                 _supportedResolutions = pythonData.GetMethod("SupportedResolutions");
                 _pythonReader = pythonData.GetMethod("Reader");
+                _pythonReadChunk = pythonData.GetPythonMethodWithChecks("ReadChunk");
                 _pythonGetSource = pythonData.GetMethod("GetSource");
                 _pythonTypeName = pythonData.GetPythonType().GetAssemblyName().Name;
             }
@@ -126,6 +132,118 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// True if the python type defines a bulk reader, read_chunk(config, lines, date, is_live_mode),
+        /// that parses many lines of the source in one call
+        /// </summary>
+        public bool ImplementsChunkReader => _pythonReadChunk != null;
+
+        /// <summary>
+        /// Parses many lines of the source in one call of the python read_chunk method.
+        /// The method can return an iterable of data instances or a pandas data frame, in which case each row is a data point
+        /// with the columns as properties. The time of the points is the 'time' column or the index of the data frame
+        /// </summary>
+        /// <param name="config">Subscription data config setup object</param>
+        /// <param name="lines">Lines of the subscription data source</param>
+        /// <param name="date">Date of the requested data</param>
+        /// <param name="isLiveMode">true if we're in live mode, false for backtesting mode</param>
+        /// <returns>The data points parsed from the lines</returns>
+        public List<BaseData> ReadChunk(SubscriptionDataConfig config, IReadOnlyList<string> lines, DateTime date, bool isLiveMode)
+        {
+            using (Py.GIL())
+            {
+                using var pyLines = new PyList(lines.Select(line => (PyObject)new PyString(line)).ToArray());
+                using PyObject result = _pythonReadChunk(config, pyLines, date, isLiveMode);
+
+                if (result.IsNone())
+                {
+                    return new List<BaseData>();
+                }
+                if (result.HasAttr("columns") && result.HasAttr("index"))
+                {
+                    return ReadFrame(config, result);
+                }
+
+                var data = new List<BaseData>(lines.Count);
+                using var iterator = result.GetIterator();
+                foreach (PyObject item in iterator)
+                {
+                    var instance = item.GetAndDispose<BaseData>();
+                    (instance as PythonData)?.SetProperty("__typename", _pythonTypeName);
+                    data.Add(instance);
+                }
+                return data;
+            }
+        }
+
+        /// <summary>
+        /// Creates a data point per row of the data frame, the columns are converted once instead of per value
+        /// </summary>
+        private List<BaseData> ReadFrame(SubscriptionDataConfig config, PyObject frame)
+        {
+            if (_frameColumns == null)
+            {
+                _frameColumns = PyModule.FromString("PythonDataFrameColumns", @"
+import pandas as pd
+
+def get_ticks(times):
+    # ticks of 100 ns since the unix epoch, whatever the unit of the datetime values
+    return (pd.DatetimeIndex(times).tz_localize(None).values.astype('datetime64[ns]').astype('int64') // 100).tolist()
+
+def get_frame_columns(frame):
+    times = get_ticks(frame['time'] if 'time' in frame.columns else frame.index)
+    end_times = get_ticks(frame['end_time']) if 'end_time' in frame.columns else None
+    columns = []
+    for name in frame.columns:
+        if name in ('time', 'end_time'):
+            continue
+        column = frame[name]
+        numeric = pd.api.types.is_numeric_dtype(column)
+        columns.append((str(name), numeric, column.astype('float64').tolist() if numeric else column.astype(str).tolist()))
+    return times, end_times, columns
+").GetAttr("get_frame_columns");
+            }
+
+            using var converted = _frameColumns.Invoke(frame);
+            var times = converted[0].As<long[]>();
+            var endTimes = converted[1].IsNone() ? null : converted[1].As<long[]>();
+            var columns = new List<(string Name, double[] Numbers, string[] Strings)>();
+            using var pyColumns = converted[2];
+            foreach (PyObject column in pyColumns.GetIterator())
+            {
+                var isNumeric = column[1].As<bool>();
+                columns.Add((column[0].As<string>(),
+                    isNumeric ? column[2].As<double[]>() : null,
+                    isNumeric ? null : column[2].As<string[]>()));
+                column.Dispose();
+            }
+
+            var data = new List<BaseData>(times.Length);
+            for (var i = 0; i < times.Length; i++)
+            {
+                var point = new PythonData { Symbol = config.Symbol, Time = new DateTime(times[i] + _unixEpochTicks) };
+                if (endTimes != null)
+                {
+                    point.EndTime = new DateTime(endTimes[i] + _unixEpochTicks);
+                }
+                point.SetProperty("__typename", _pythonTypeName);
+
+                foreach (var (name, numbers, strings) in columns)
+                {
+                    if (numbers == null)
+                    {
+                        point.SetProperty(name, strings[i]);
+                    }
+                    else if (!numbers[i].IsNaNOrInfinity())
+                    {
+                        point.SetProperty(name, numbers[i].SafeDecimalCast());
+                    }
+                }
+                data.Add(point);
+            }
+            return data;
+        }
+
         /// <summary>
         /// Indicates if there is support for mapping
         /// </summary>
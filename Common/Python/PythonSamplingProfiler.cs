@@ -0,0 +1,91 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.IO;
+using Python.Runtime;
+using QuantConnect.Logging;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Samples the python stacks of the algorithm threads while the algorithm runs, see SamplingProfiler.py.
+    /// The collapsed stacks it writes can be rendered by flamegraph.pl or speedscope
+    /// </summary>
+    public class PythonSamplingProfiler
+    {
+        private PyObject _profiler;
+
+        private PythonSamplingProfiler(PyObject profiler)
+        {
+            _profiler = profiler;
+        }
+
+        /// <summary>
+        /// Starts sampling the python threads
+        /// </summary>
+        /// <param name="algorithmLocation">The algorithm file, the frames of the files of its folder are attributed to the user code</param>
+        /// <param name="intervalMilliseconds">The time between two samples</param>
+        /// <returns>The started profiler, null if it could not be started</returns>
+        public static PythonSamplingProfiler Start(string algorithmLocation, int intervalMilliseconds)
+        {
+            try
+            {
+                using (Py.GIL())
+                {
+                    using var module = Py.Import("SamplingProfiler");
+                    var userFolder = string.IsNullOrEmpty(algorithmLocation) ? null : Path.GetDirectoryName(Path.GetFullPath(algorithmLocation));
+                    var profiler = module.GetAttr("SamplingProfiler").Invoke(userFolder.ToPython(), (intervalMilliseconds / 1000d).ToPython());
+                    profiler.InvokeMethod("start").Dispose();
+
+                    Log.Trace($"PythonSamplingProfiler.Start(): sampling every {intervalMilliseconds}ms");
+                    return new PythonSamplingProfiler(profiler);
+                }
+            }
+            catch (Exception exception)
+            {
+                Log.Error(exception, "PythonSamplingProfiler.Start(): failed to start the profiler");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Stops sampling and writes the collapsed stacks, once
+        /// </summary>
+        /// <param name="path">The file to write</param>
+        public void Stop(string path)
+        {
+            if (_profiler == null)
+            {
+                return;
+            }
+
+            try
+            {
+                using (Py.GIL())
+                {
+                    var samples = _profiler.InvokeMethod("stop", path.ToPython()).GetAndDispose<int>();
+                    _profiler.Dispose();
+                    Log.Trace($"PythonSamplingProfiler.Stop(): {samples} samples written to {path}");
+                }
+            }
+            catch (Exception exception)
+            {
+                Log.Error(exception, "PythonSamplingProfiler.Stop(): failed to write the profile");
+            }
+            _profiler = null;
+        }
+    }
+}
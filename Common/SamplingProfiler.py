@@ -0,0 +1,128 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import dis
+import time
+import linecache
+import threading
+from collections import Counter
+
+FRAMEWORK_PACKAGES = ('Alphas.', 'Portfolio.', 'Execution.', 'Risk.', 'Selection.')
+CALL_OPCODES = frozenset(op for op, name in enumerate(dis.opname) if name.startswith(('CALL', 'PRECALL')))
+MAXIMUM_INTEROP_LABEL_LENGTH = 80
+
+class SamplingProfiler:
+    '''Samples the python stack of every thread at a fixed interval from a daemon thread, started by the engine
+    when 'python-profiling' is enabled. It writes collapsed stacks, one 'frame;frame;frame count' line per distinct stack,
+    the input of flamegraph.pl and speedscope. The stacks of the threads running algorithm code start with a thread label
+    and their frames are labeled:
+        [user]         the algorithm code, the files of the algorithm folder
+        [framework]    the Algorithm.Framework models
+        [interop]      a call from python to the engine or to a native library, with its source line
+        [engine]       the thread is running engine code only'''
+
+    def __init__(self, user_folder, interval = 0.01):
+        '''Initializes a new instance
+        Args:
+            user_folder: The folder of the algorithm files, their frames are labeled [user]
+            interval: The seconds between two samples'''
+        self.user_folder = os.path.normcase(os.path.abspath(user_folder)) + os.sep if user_folder else None
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.algorithm_threads = {}
+        self.labels = {}
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        '''Starts sampling'''
+        self.thread = threading.Thread(target=self.run, name='SamplingProfiler', daemon=True)
+        self.thread.start()
+
+    def stop(self, path):
+        '''Stops sampling and writes the collapsed stacks
+        Args:
+            path: The file to write
+        Returns:
+            The number of samples'''
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        with open(path, 'w') as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f'{stack} {count}\n')
+        return self.samples
+
+    def run(self):
+        own_thread = threading.get_ident()
+        while not self.stopped.wait(self.interval):
+            frames = sys._current_frames()
+            frames.pop(own_thread, None)
+            self.sample(frames)
+
+    def sample(self, frames):
+        '''Adds the current stack of each thread
+        Args:
+            frames: The current frame of each thread by thread id'''
+        self.samples += 1
+        for thread_id, frame in frames.items():
+            stack, is_algorithm = self.collapse(frame)
+            if is_algorithm and thread_id not in self.algorithm_threads:
+                self.algorithm_threads[thread_id] = f'thread-{len(self.algorithm_threads) + 1}'
+            root = self.algorithm_threads.get(thread_id)
+            if root is not None:
+                self.stacks[f'{root};{stack}'] += 1
+
+        # the threads that ran algorithm code and have no python frame are in the engine
+        for thread_id, root in self.algorithm_threads.items():
+            if thread_id not in frames:
+                self.stacks[f'{root};[engine]'] += 1
+
+    def collapse(self, frame):
+        '''The collapsed stack of a frame, from the outermost frame, and whether it has algorithm code'''
+        labels = []
+        is_algorithm = False
+        leaf = frame
+        while frame is not None:
+            label, category = self.get_label(frame.f_code, frame.f_globals)
+            labels.append(label)
+            is_algorithm = is_algorithm or category is not None
+            frame = frame.f_back
+        labels.reverse()
+
+        # a call without a python callee frame is running native or engine code
+        code = leaf.f_code.co_code
+        if 0 <= leaf.f_lasti < len(code) and code[leaf.f_lasti] in CALL_OPCODES:
+            line = linecache.getline(leaf.f_code.co_filename, leaf.f_lineno).strip()[:MAXIMUM_INTEROP_LABEL_LENGTH]
+            labels.append(f'[interop] {line or leaf.f_code.co_name}'.replace(';', ','))
+        return ';'.join(labels), is_algorithm
+
+    def get_label(self, code, module_globals):
+        '''The frame label and category of a code object, cached'''
+        label = self.labels.get(code)
+        if label is None:
+            module = module_globals.get('__name__', '') if module_globals else ''
+            name = f'{module}:{getattr(code, "co_qualname", code.co_name)}'.replace(';', ',').replace(' ', '_')
+            category = None
+            if module.startswith(FRAMEWORK_PACKAGES):
+                category = '[framework]'
+            elif self.user_folder and os.path.normcase(os.path.abspath(code.co_filename)).startswith(self.user_folder):
+                category = '[user]'
+            label = (f'{category} {name}' if category else name, category)
+            self.labels[code] = label
+        return label
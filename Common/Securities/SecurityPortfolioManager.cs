@@ -15,8 +15,11 @@
 
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Collections.Specialized;
 using System.Linq;
+using System.Threading;
 using Python.Runtime;
 using QuantConnect.Data.Market;
 using QuantConnect.Interfaces;
@@ -43,6 +46,10 @@ namespace QuantConnect.Securities
         private decimal _freePortfolioValue;
         private SecurityPositionGroupModel _positions;
         private IAlgorithmSettings _algorithmSettings;
+        private readonly ConcurrentDictionary<Symbol, Security> _investedSecurities = new();
+        // the order the securities were added in, the invested securities are returned in this order to be deterministic
+        private readonly ConcurrentDictionary<Symbol, long> _securityOrder = new();
+        private long _securityCount;
 
         /// <summary>
         /// Local access to the securities collection for the portfolio summation.
@@ -91,6 +98,13 @@ namespace QuantConnect.Securities
             Positions = new SecurityPositionGroupModel();
             MarginCallModel = new DefaultMarginCallModel(this, defaultOrderProperties);
 
+            // the invested securities are tracked from the holdings quantity changes, made by the fills
+            foreach (var security in Securities.Values)
+            {
+                AddInvestedSecurityTracking(security);
+            }
+            Securities.CollectionChanged += OnSecuritiesCollectionChanged;
+
             CashBook = new CashBook();
             UnsettledCashBook = new CashBook();
 
@@ -392,6 +406,54 @@ namespace QuantConnect.Securities
         /// <seealso cref="HoldStock"/>
         public bool Invested => HoldStock;
 
+        /// <summary>
+        /// Gets the securities with holdings, tracked as their holdings change so that iterating
+        /// them costs the number of positions instead of the number of securities. They are in the order they were added
+        /// to the <see cref="Securities"/>, like when iterating them
+        /// </summary>
+        public IEnumerable<Security> InvestedSecurities => GetInvestedSecurities(security => true);
+
+        /// <summary>
+        /// Gets the invested securities with an unrealized profit percent below the given one, in a single call
+        /// </summary>
+        /// <param name="unrealizedProfitPercent">The unrealized profit percent, like -0.05 for a 5% drawdown</param>
+        /// <returns>The invested securities with a lower unrealized profit percent</returns>
+        public List<Security> GetInvestedSecuritiesWithUnrealizedProfitPercentBelow(decimal unrealizedProfitPercent)
+        {
+            return GetInvestedSecurities(security => security.Holdings.UnrealizedProfitPercent < unrealizedProfitPercent);
+        }
+
+        /// <summary>
+        /// Gets the invested securities with an unrealized profit percent above the given one, in a single call
+        /// </summary>
+        /// <param name="unrealizedProfitPercent">The unrealized profit percent, like 0.05 for a 5% profit</param>
+        /// <returns>The invested securities with a higher unrealized profit percent</returns>
+        public List<Security> GetInvestedSecuritiesWithUnrealizedProfitPercentAbove(decimal unrealizedProfitPercent)
+        {
+            return GetInvestedSecurities(security => security.Holdings.UnrealizedProfitPercent > unrealizedProfitPercent);
+        }
+
+        private List<Security> GetInvestedSecurities(Func<Security, bool> predicate)
+        {
+            var securities = new List<Security>();
+            foreach (var kvp in _investedSecurities)
+            {
+                var security = kvp.Value;
+                if (security.Invested && predicate(security))
+                {
+                    securities.Add(security);
+                }
+            }
+            // the concurrent dictionary order depends on the symbol hash codes, which change between runs
+            securities.Sort((x, y) => GetSecurityOrder(x).CompareTo(GetSecurityOrder(y)));
+            return securities;
+        }
+
+        private long GetSecurityOrder(Security security)
+        {
+            return _securityOrder.TryGetValue(security.Symbol, out var order) ? order : long.MaxValue;
+        }
+
         /// <summary>
         /// Get the total unrealised profit in our portfolio from the individual security unrealized profits.
         /// </summary>
@@ -598,7 +660,13 @@ namespace QuantConnect.Securities
         public override SecurityHolding this[Symbol symbol]
         {
             get { return Securities[symbol].Holdings; }
-            set { Securities[symbol].Holdings = value; }
+            set
+            {
+                var security = Securities[symbol];
+                security.Holdings.QuantityChanged -= OnHoldingsQuantityChanged;
+                security.Holdings = value;
+                AddInvestedSecurityTracking(security);
+            }
         }
 
         /// <summary>
@@ -933,5 +1001,49 @@ namespace QuantConnect.Securities
         {
             Positions = positionGroupModel;
         }
+
+        private void OnSecuritiesCollectionChanged(object sender, NotifyCollectionChangedEventArgs args)
+        {
+            if (args.Action == NotifyCollectionChangedAction.Add)
+            {
+                foreach (Security security in args.NewItems)
+                {
+                    AddInvestedSecurityTracking(security);
+                }
+            }
+            else if (args.Action == NotifyCollectionChangedAction.Remove)
+            {
+                foreach (Security security in args.OldItems)
+                {
+                    security.Holdings.QuantityChanged -= OnHoldingsQuantityChanged;
+                    _investedSecurities.TryRemove(security.Symbol, out _);
+                    _securityOrder.TryRemove(security.Symbol, out _);
+                }
+            }
+        }
+
+        private void AddInvestedSecurityTracking(Security security)
+        {
+            security.Holdings.QuantityChanged += OnHoldingsQuantityChanged;
+            _securityOrder.GetOrAdd(security.Symbol, _ => Interlocked.Increment(ref _securityCount));
+            UpdateInvestedSecurity(security);
+        }
+
+        private void OnHoldingsQuantityChanged(object sender, SecurityHoldingQuantityChangedEventArgs args)
+        {
+            UpdateInvestedSecurity(args.Security);
+        }
+
+        private void UpdateInvestedSecurity(Security security)
+        {
+            if (security.Invested)
+            {
+                _investedSecurities[security.Symbol] = security;
+            }
+            else
+            {
+                _investedSecurities.TryRemove(security.Symbol, out _);
+            }
+        }
     }
 }
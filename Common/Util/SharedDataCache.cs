@@ -0,0 +1,298 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using System.Threading;
+using Newtonsoft.Json;
+using QuantConnect.Logging;
+
+namespace QuantConnect.Util
+{
+    /// <summary>
+    /// Node local, read only cache of decompressed data files shared by the processes of an optimization.
+    /// Each entry is a file of the cache folder, keyed by the source path, entry name, size and write time of the zip,
+    /// and read through a memory mapped view so the processes share the same pages of the operating system cache.
+    /// The least recently used entries are deleted once the folder exceeds its size limit
+    /// </summary>
+    /// <remarks>A RAM backed folder, like /dev/shm, avoids writing the decompressed data to disk</remarks>
+    public class SharedDataCache
+    {
+        private const string StatisticsFolderName = "statistics";
+        private const string EntryExtension = ".bin";
+
+        private readonly string _folder;
+        private readonly long _sizeLimit;
+        private readonly string _statisticsFile;
+        private long _storedSinceEviction;
+        private long _hits;
+        private long _misses;
+        private long _evictions;
+
+        /// <summary>
+        /// The number of entries read from the cache
+        /// </summary>
+        public long Hits => Interlocked.Read(ref _hits);
+
+        /// <summary>
+        /// The number of entries that were not in the cache
+        /// </summary>
+        public long Misses => Interlocked.Read(ref _misses);
+
+        /// <summary>
+        /// The number of entries this instance deleted to respect the size limit
+        /// </summary>
+        public long Evictions => Interlocked.Read(ref _evictions);
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="folder">The cache folder, shared by the processes</param>
+        /// <param name="sizeLimit">The maximum size of the cache entries, in bytes</param>
+        public SharedDataCache(string folder, long sizeLimit)
+        {
+            _folder = folder;
+            _sizeLimit = sizeLimit;
+            Directory.CreateDirectory(Path.Combine(folder, StatisticsFolderName));
+            _statisticsFile = Path.Combine(folder, StatisticsFolderName, $"{Environment.ProcessId}-{Guid.NewGuid():N}.json");
+        }
+
+        /// <summary>
+        /// Gets a stream of the cached entry of a zip file
+        /// </summary>
+        /// <param name="zipFile">The path of the zip file</param>
+        /// <param name="entryName">The entry name, null for the first entry</param>
+        /// <returns>A read only stream of the decompressed entry, null if it's not in the cache</returns>
+        public Stream Fetch(string zipFile, string entryName)
+        {
+            var path = GetEntryPath(zipFile, entryName);
+            if (path == null || !File.Exists(path))
+            {
+                Interlocked.Increment(ref _misses);
+                return null;
+            }
+
+            try
+            {
+                var stream = Open(path);
+                Interlocked.Increment(ref _hits);
+                File.SetLastAccessTimeUtc(path, DateTime.UtcNow);
+                return stream;
+            }
+            catch (Exception err)
+            {
+                // evicted by another process after we checked it existed
+                if (err is not IOException)
+                {
+                    Log.Error(err, "SharedDataCache.Fetch()");
+                }
+                Interlocked.Increment(ref _misses);
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Stores the decompressed entry of a zip file in the cache
+        /// </summary>
+        /// <param name="zipFile">The path of the zip file</param>
+        /// <param name="entryName">The entry name, null for the first entry</param>
+        /// <param name="data">The decompressed entry, its position is not changed</param>
+        public void Store(string zipFile, string entryName, MemoryStream data)
+        {
+            var path = GetEntryPath(zipFile, entryName);
+            if (path == null || data.Length > _sizeLimit)
+            {
+                return;
+            }
+
+            // the entry is written to a temporary file and then renamed, so other processes never read a partial entry
+            var temporaryPath = $"{path}.{Guid.NewGuid():N}.tmp";
+            try
+            {
+                var buffer = data.TryGetBuffer(out var segment) ? segment : new ArraySegment<byte>(data.ToArray());
+                using (var file = File.Create(temporaryPath))
+                {
+                    file.Write(buffer.Array, buffer.Offset, buffer.Count);
+                }
+                File.Move(temporaryPath, path);
+            }
+            catch (Exception err)
+            {
+                // another process stored it first, the cache never fails the read of the data
+                if (err is not IOException)
+                {
+                    Log.Error(err, "SharedDataCache.Store()");
+                }
+                try
+                {
+                    File.Delete(temporaryPath);
+                }
+                catch
+                {
+                    // pass
+                }
+                return;
+            }
+
+            if (Interlocked.Add(ref _storedSinceEviction, data.Length) > _sizeLimit / 10)
+            {
+                Interlocked.Exchange(ref _storedSinceEviction, 0);
+                Evict();
+            }
+        }
+
+        /// <summary>
+        /// Writes the counters of this instance to the statistics folder of the cache, see <see cref="ReadStatistics"/>
+        /// </summary>
+        public void WriteStatistics()
+        {
+            try
+            {
+                File.WriteAllText(_statisticsFile, JsonConvert.SerializeObject(new SharedDataCacheStatistics
+                {
+                    Hits = Hits,
+                    Misses = Misses,
+                    Evictions = Evictions
+                }));
+            }
+            catch (Exception err)
+            {
+                Log.Error(err, "SharedDataCache.WriteStatistics()");
+            }
+        }
+
+        /// <summary>
+        /// Gets the sum of the counters written by the instances of every process using the cache folder
+        /// </summary>
+        /// <param name="folder">The cache folder</param>
+        public static SharedDataCacheStatistics ReadStatistics(string folder)
+        {
+            var statistics = new SharedDataCacheStatistics();
+            var statisticsFolder = new DirectoryInfo(Path.Combine(folder, StatisticsFolderName));
+            if (!statisticsFolder.Exists)
+            {
+                return statistics;
+            }
+
+            foreach (var file in statisticsFolder.EnumerateFiles("*.json"))
+            {
+                try
+                {
+                    var instance = JsonConvert.DeserializeObject<SharedDataCacheStatistics>(File.ReadAllText(file.FullName));
+                    statistics.Hits += instance.Hits;
+                    statistics.Misses += instance.Misses;
+                    statistics.Evictions += instance.Evictions;
+                }
+                catch (Exception)
+                {
+                    // being written
+                }
+            }
+            statistics.Size = new DirectoryInfo(folder).EnumerateFiles($"*{EntryExtension}").Sum(file => file.Length);
+            return statistics;
+        }
+
+        /// <summary>
+        /// Deletes the least recently used entries until the cache is under its size limit.
+        /// Entries being read by other processes stay readable on posix systems, on windows they can't be deleted and are skipped
+        /// </summary>
+        private void Evict()
+        {
+            try
+            {
+                var files = new DirectoryInfo(_folder).GetFiles($"*{EntryExtension}");
+                var size = files.Sum(file => file.Length);
+                foreach (var file in files.OrderBy(file => file.LastAccessTimeUtc))
+                {
+                    if (size <= _sizeLimit)
+                    {
+                        break;
+                    }
+                    try
+                    {
+                        file.Delete();
+                        size -= file.Length;
+                        Interlocked.Increment(ref _evictions);
+                    }
+                    catch (IOException)
+                    {
+                        // in use
+                    }
+                }
+            }
+            catch (Exception err)
+            {
+                Log.Error(err, "SharedDataCache.Evict()");
+            }
+        }
+
+        /// <summary>
+        /// Gets the path of the cache entry, the key includes the size and write time of the zip file so a changed file is not read from the cache
+        /// </summary>
+        private string GetEntryPath(string zipFile, string entryName)
+        {
+            var info = new FileInfo(zipFile);
+            if (!info.Exists)
+            {
+                return null;
+            }
+            var key = $"{info.FullName}#{entryName}#{info.Length}#{info.LastWriteTimeUtc.Ticks}";
+            return Path.Combine(_folder, key.ToMD5() + EntryExtension);
+        }
+
+        private static Stream Open(string path)
+        {
+            var length = new FileInfo(path).Length;
+            if (length == 0)
+            {
+                // empty files can't be mapped
+                return new MemoryStream();
+            }
+
+            // the view stays valid after the memory mapped file handle is released
+            using var memoryMappedFile = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read);
+            // the explicit size, else the view is rounded up to the page size
+            return memoryMappedFile.CreateViewStream(0, length, MemoryMappedFileAccess.Read);
+        }
+    }
+
+    /// <summary>
+    /// The counters of a <see cref="SharedDataCache"/>
+    /// </summary>
+    public class SharedDataCacheStatistics
+    {
+        /// <summary>
+        /// The number of entries read from the cache
+        /// </summary>
+        public long Hits { get; set; }
+
+        /// <summary>
+        /// The number of entries that were not in the cache
+        /// </summary>
+        public long Misses { get; set; }
+
+        /// <summary>
+        /// The number of entries deleted to respect the size limit
+        /// </summary>
+        public long Evictions { get; set; }
+
+        /// <summary>
+        /// The size of the cache entries, in bytes
+        /// </summary>
+        public long Size { get; set; }
+    }
+}
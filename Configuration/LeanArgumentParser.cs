@@ -51,6 +51,25 @@ namespace QuantConnect.Configuration
                 // the unique optimization id
                 new CommandLineOption("optimization-id", CommandOptionType.SingleValue),
 
+                // true will run the backtests of an optimizer read from the standard input, one per line
+                new CommandLineOption("optimization-worker", CommandOptionType.SingleValue),
+
+                // the handle of the anonymous pipe the optimization worker writes the end of its backtests to
+                new CommandLineOption("optimization-worker-pipe", CommandOptionType.SingleValue),
+
+                // the folder of the decompressed data shared by the backtests of an optimization and its size limit
+                new CommandLineOption("shared-data-cache-folder", CommandOptionType.SingleValue),
+                new CommandLineOption("shared-data-cache-size-mb", CommandOptionType.SingleValue),
+
+                // the fraction of the algorithm period to backtest, from its start date, used by the optimization strategies
+                new CommandLineOption("backtest-period-fraction", CommandOptionType.SingleValue),
+
+                // record the time of each algorithm framework stage and model
+                new CommandLineOption("framework-profiling", CommandOptionType.NoValue),
+
+                // sample the python threads of the algorithm, writing their collapsed stacks next to the algorithm log
+                new CommandLineOption("python-profiling", CommandOptionType.NoValue),
+
                 // Options grabbed from json file
                 new CommandLineOption("environment", CommandOptionType.SingleValue),
 
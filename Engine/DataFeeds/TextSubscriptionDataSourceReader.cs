@@ -16,6 +16,7 @@
 using System;
 using System.Linq;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using QuantConnect.Logging;
 using QuantConnect.Interfaces;
 using System.Collections.Generic;
@@ -36,6 +37,11 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         private BaseData _factory;
         private bool _shouldCacheDataPoints;
 
+        /// <summary>
+        /// The number of lines passed to each call of a python custom data bulk reader
+        /// </summary>
+        private const int ChunkSize = 10000;
+
         private static int CacheSize = 100;
         private static volatile Dictionary<string, List<BaseData>> BaseDataSourceCache = new Dictionary<string, List<BaseData>>(100);
         private static Queue<string> CacheKeys = new Queue<string>(100);
@@ -107,6 +113,23 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                         // only create a factory if the stream isn't null
                         _factory = Config.GetBaseDataInstance();
                     }
+
+                    if (_factory is PythonData pythonFactory && pythonFactory.ImplementsChunkReader && !reader.ShouldBeRateLimited)
+                    {
+                        // the bulk reader consumes the whole stream, one python call per chunk of lines
+                        foreach (var instance in ReadChunks(pythonFactory, reader))
+                        {
+                            if (_shouldCacheDataPoints)
+                            {
+                                cache.Add(instance);
+                            }
+                            else
+                            {
+                                yield return instance;
+                            }
+                        }
+                    }
+
                     // while the reader has data
                     while (!reader.EndOfStream)
                     {
@@ -195,6 +218,66 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             }
         }
 
+        /// <summary>
+        /// Reads the stream in chunks of lines using the bulk reader of a python custom data type
+        /// </summary>
+        /// <param name="factory">The python data instance implementing the bulk reader</param>
+        /// <param name="reader">The stream reader of the source</param>
+        /// <returns>The valid data points of the source</returns>
+        private IEnumerable<BaseData> ReadChunks(PythonData factory, IStreamReader reader)
+        {
+            var lines = new List<string>(ChunkSize);
+            while (!reader.EndOfStream)
+            {
+                lines.Clear();
+                while (lines.Count < ChunkSize && !reader.EndOfStream)
+                {
+                    lines.Add(reader.ReadLine());
+                }
+
+                List<BaseData> chunk;
+                try
+                {
+                    chunk = factory.ReadChunk(Config, lines, _date, IsLiveMode);
+                }
+                catch
+                {
+                    // the lines of the chunk are read again one by one, so only the invalid lines are dropped and reported
+                    chunk = ReadLines(lines);
+                }
+
+                foreach (var instance in chunk)
+                {
+                    if (instance != null && instance.EndTime != default(DateTime))
+                    {
+                        yield return instance;
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Reads the lines one by one with the reader of the data type, like when the bulk reader is not implemented
+        /// </summary>
+        /// <param name="lines">The lines to read</param>
+        /// <returns>The data points of the lines, null for the invalid ones</returns>
+        private List<BaseData> ReadLines(List<string> lines)
+        {
+            var instances = new List<BaseData>(lines.Count);
+            foreach (var line in lines)
+            {
+                try
+                {
+                    instances.Add(_factory.Reader(Config, line, _date, IsLiveMode));
+                }
+                catch (Exception err)
+                {
+                    OnReaderError(line, err);
+                }
+            }
+            return instances;
+        }
+
         /// <summary>
         /// Event invocator for the <see cref="ReaderError"/> event
         /// </summary>
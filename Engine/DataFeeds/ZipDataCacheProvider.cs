@@ -39,6 +39,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         private readonly ConcurrentDictionary<string, CachedZipFile> _zipFileCache = new ConcurrentDictionary<string, CachedZipFile>();
         private readonly IDataProvider _dataProvider;
         private readonly Timer _cacheCleaner;
+        private readonly SharedDataCache _sharedCache;
 
         /// <summary>
         /// Property indicating the data is temporary in nature and should not be cached.
@@ -54,6 +55,13 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             _cacheSeconds = double.IsNaN(cacheTimer) ? Config.GetDouble("zip-data-cache-provider", 10) : cacheTimer;
             _dataProvider = dataProvider;
             _cacheCleaner = new Timer(state => CleanCache(), null, TimeSpan.FromSeconds(_cacheSeconds), Timeout.InfiniteTimeSpan);
+
+            // the decompressed entries can be shared with the other backtests of an optimization running on this node
+            var sharedCacheFolder = Config.Get("shared-data-cache-folder");
+            if (!isDataEphemeral && !string.IsNullOrEmpty(sharedCacheFolder))
+            {
+                _sharedCache = new SharedDataCache(sharedCacheFolder, Config.GetValue("shared-data-cache-size-mb", 4096L) * 1024 * 1024);
+            }
         }
 
         /// <summary>
@@ -66,7 +74,11 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             // handles zip files
             if (filename.EndsWith(".zip", StringComparison.InvariantCulture))
             {
-                Stream stream = null;
+                Stream stream = _sharedCache?.Fetch(filename, entryName);
+                if (stream != null)
+                {
+                    return stream;
+                }
 
                 try
                 {
@@ -105,6 +117,10 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                         }
                     }
 
+                    if (_sharedCache != null && stream is MemoryStream decompressed)
+                    {
+                        _sharedCache.Store(filename, entryName, decompressed);
+                    }
                     return stream;
                 }
                 catch (Exception err)
@@ -207,6 +223,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         {
             // stop the cache cleaner timer
             _cacheCleaner.DisposeSafely();
+            _sharedCache?.WriteStatistics();
             CachedZipFile zip;
             foreach (var zipFile in _zipFileCache)
             {
@@ -253,6 +270,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             }
             finally
             {
+                _sharedCache?.WriteStatistics();
                 try
                 {
                     var nextDueTime = Time.GetSecondUnevenWait((int)Math.Ceiling(_cacheSeconds * 1000));
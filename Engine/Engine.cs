@@ -32,6 +32,7 @@ using QuantConnect.Lean.Engine.Setup;
 using QuantConnect.Logging;
 using QuantConnect.Orders;
 using QuantConnect.Packets;
+using QuantConnect.Python;
 using QuantConnect.Securities;
 using QuantConnect.Util;
 using static QuantConnect.StringExtensions;
@@ -86,6 +87,7 @@ namespace QuantConnect.Lean.Engine
 
             var algorithm = default(IAlgorithm);
             var algorithmManager = manager;
+            PythonSamplingProfiler pythonProfiler = null;
 
             try
             {
@@ -115,6 +117,12 @@ namespace QuantConnect.Lean.Engine
                     // Save algorithm to cache, load algorithm instance:
                     algorithm = AlgorithmHandlers.Setup.CreateAlgorithmInstance(job, assemblyPath);
 
+                    if (job.Language == Language.Python && Config.GetBool("python-profiling"))
+                    {
+                        // the python interpreter is initialized by the algorithm creation
+                        pythonProfiler = PythonSamplingProfiler.Start(assemblyPath, Config.GetInt("python-profiling-interval-ms", 10));
+                    }
+
                     algorithm.ProjectId = job.ProjectId;
 
                     // Set algorithm in ILeanManager
@@ -449,6 +457,9 @@ namespace QuantConnect.Lean.Engine
                 AlgorithmHandlers.Transactions.Exit();
                 AlgorithmHandlers.RealTime.Exit();
                 AlgorithmHandlers.DataMonitor.Exit();
+
+                // written next to the algorithm log
+                pythonProfiler?.Stop(Path.Combine(Globals.ResultsDestinationFolder, $"{job.AlgorithmId}-profile.folded"));
             }
         }
 
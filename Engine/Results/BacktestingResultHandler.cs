@@ -357,7 +357,8 @@ namespace QuantConnect.Lean.Engine.Results
                     result = new BacktestResultPacket(_job,
                         new BacktestResult(new BacktestResultParameters(charts, orders, profitLoss, statisticsResults.Summary, runtime,
                             statisticsResults.RollingPerformances, orderEvents, statisticsResults.TotalPerformance,
-                            AlgorithmConfiguration.Create(Algorithm, _job), GetAlgorithmState(endTime))),
+                            AlgorithmConfiguration.Create(Algorithm, _job), GetAlgorithmState(endTime),
+                            Algorithm.FrameworkProfiler.Enabled ? Algorithm.FrameworkProfiler.GetStatistics() : null)),
                         Algorithm.EndDate, Algorithm.StartDate);
                 }
                 else
@@ -822,6 +822,14 @@ namespace QuantConnect.Lean.Engine.Results
             runtimeStatistics["Holdings"] = AlgorithmCurrencySymbol + Algorithm.Portfolio.TotalHoldingsValue.ToStringInvariant("N2");
             runtimeStatistics["Volume"] = AlgorithmCurrencySymbol + Algorithm.Portfolio.TotalSaleVolume.ToStringInvariant("N2");
 
+            if (Algorithm.FrameworkProfiler.Enabled)
+            {
+                foreach (var pair in Algorithm.FrameworkProfiler.GetRuntimeStatistics())
+                {
+                    runtimeStatistics[pair.Key] = pair.Value;
+                }
+            }
+
             return runtimeStatistics;
         }
 
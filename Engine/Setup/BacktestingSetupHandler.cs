@@ -205,6 +205,16 @@ namespace QuantConnect.Lean.Engine.Setup
                         }
                     }
 
+                    if (job.PeriodFraction.HasValue && job.PeriodFraction.Value < 1)
+                    {
+                        // keep the first days of the period, at least one
+                        var days = (algorithm.EndDate.Date - algorithm.StartDate.Date).Days + 1;
+                        var periodDays = Math.Max(1, (int)Math.Ceiling(days * job.PeriodFraction.Value));
+                        var endDate = algorithm.StartDate.Date.AddDays(periodDays - 1);
+                        Log.Trace($"BacktestingSetupHandler.Setup(): period fraction {job.PeriodFraction.Value.ToStringInvariant()}, setting end date to {endDate:yyyyMMdd}");
+                        algorithm.SetEndDate(endDate);
+                    }
+
                     // after we call initialize
                     BaseSetupHandler.LoadBacktestJobCashAmount(algorithm, job);
 
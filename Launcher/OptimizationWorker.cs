@@ -0,0 +1,169 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Diagnostics;
+using System.IO;
+using System.IO.Pipes;
+using Newtonsoft.Json;
+using Python.Runtime;
+using QuantConnect.Configuration;
+using QuantConnect.Interfaces;
+using QuantConnect.Lean.Engine;
+using QuantConnect.Logging;
+using QuantConnect.Optimizer;
+using QuantConnect.Util;
+
+namespace QuantConnect.Lean.Launcher
+{
+    /// <summary>
+    /// Runs the backtests of an optimization back to back in a single long lived process, so the runtime, python
+    /// and the read only caches like the map and factor files are only loaded once. The jobs are read from the standard input,
+    /// one <see cref="OptimizationWorkerJob"/> json per line, and the end of each backtest is written to the completion pipe
+    /// of the optimizer, or to the standard output if the worker was started without one
+    /// </summary>
+    public static class OptimizationWorker
+    {
+        /// <summary>
+        /// Runs the jobs of the standard input until it is closed
+        /// </summary>
+        public static void Run()
+        {
+            // the worker can't wait for a key press at the end of each backtest, the standard input is the job queue
+            Config.Set("close-automatically", "true");
+            PythonInitializer.ActivatePythonVirtualEnvironment(Config.Get("python-venv"));
+            OS.Initialize();
+
+            IMapFileProvider mapFileProvider = null;
+            IFactorFileProvider factorFileProvider = null;
+            var backtests = 0;
+            var stopwatch = new Stopwatch();
+            using var completions = GetCompletionsWriter();
+
+            string line;
+            while ((line = Console.In.ReadLine()) != null)
+            {
+                if (string.IsNullOrWhiteSpace(line))
+                {
+                    continue;
+                }
+
+                var job = JsonConvert.DeserializeObject<OptimizationWorkerJob>(line);
+                stopwatch.Restart();
+                try
+                {
+                    Reset(job, mapFileProvider, factorFileProvider);
+                    RunBacktest(out mapFileProvider, out factorFileProvider);
+                }
+                catch (Exception err)
+                {
+                    Log.Error(err, $"OptimizationWorker.Run(): backtest {job.BacktestId} failed");
+                }
+                backtests++;
+
+                // the optimizer reads the result json from the results folder once it gets this line
+                completions.WriteLine($"{OptimizationWorkerJob.CompletedPrefix}{job.BacktestId} {stopwatch.Elapsed.TotalSeconds.ToStringInvariant()}");
+                completions.Flush();
+            }
+
+            Log.Trace($"OptimizationWorker.Run(): standard input closed after {backtests} backtests, exiting");
+            OS.Dispose();
+            PythonInitializer.Shutdown();
+        }
+
+        /// <summary>
+        /// Gets the writer of the completion lines, the pipe the optimizer reads them from
+        /// so the logs and the algorithm prints can't interleave with them
+        /// </summary>
+        private static TextWriter GetCompletionsWriter()
+        {
+            var pipeHandle = Config.Get("optimization-worker-pipe");
+            if (string.IsNullOrEmpty(pipeHandle))
+            {
+                return new StreamWriter(Console.OpenStandardOutput());
+            }
+            return new StreamWriter(new AnonymousPipeClientStream(PipeDirection.Out, pipeHandle));
+        }
+
+        /// <summary>
+        /// Resets the engine state of the previous backtest and sets the configuration of the job
+        /// </summary>
+        private static void Reset(OptimizationWorkerJob job, IMapFileProvider mapFileProvider, IFactorFileProvider factorFileProvider)
+        {
+            Directory.CreateDirectory(job.ResultsDestinationFolder);
+            Config.Set("algorithm-id", job.BacktestId);
+            Config.Set("backtest-name", job.BacktestName);
+            Config.Set("results-destination-folder", job.ResultsDestinationFolder);
+            Config.Set("parameters", JsonConvert.SerializeObject(job.Parameters));
+            Config.Set("backtest-period-fraction", job.PeriodFraction?.ToStringInvariant() ?? string.Empty);
+            Globals.ResultsDestinationFolder = job.ResultsDestinationFolder;
+
+            // every backtest gets new handlers, except for the read only map and factor file providers and their caches
+            Composer.Instance.Reset();
+            if (mapFileProvider != null)
+            {
+                Composer.Instance.AddPart(mapFileProvider);
+            }
+            if (factorFileProvider != null)
+            {
+                Composer.Instance.AddPart(factorFileProvider);
+            }
+            SymbolCache.Clear();
+
+            // each backtest logs to its own folder, like when it runs in its own process
+            var previousLogHandler = Log.LogHandler;
+            Log.FilePath = Path.Combine(job.ResultsDestinationFolder, "log.txt");
+            Log.LogHandler = Composer.Instance.GetExportedValueByTypeName<ILogHandler>(Config.Get("log-handler", "CompositeLogHandler"));
+            previousLogHandler.DisposeSafely();
+
+            // a python algorithm module is imported again so its module level state does not leak between backtests
+            if (Config.Get("algorithm-language") == Language.Python.ToString() && PythonEngine.IsInitialized)
+            {
+                var moduleName = Path.GetFileNameWithoutExtension(Config.Get("algorithm-location"));
+                using (Py.GIL())
+                {
+                    PythonEngine.Exec($"import sys\nsys.modules.pop('{moduleName}', None)");
+                }
+            }
+        }
+
+        /// <summary>
+        /// Runs the backtest of the current configuration
+        /// </summary>
+        private static void RunBacktest(out IMapFileProvider mapFileProvider, out IFactorFileProvider factorFileProvider)
+        {
+            using var systemHandlers = Initializer.GetSystemHandlers();
+            using var algorithmHandlers = Initializer.GetAlgorithmHandlers();
+            mapFileProvider = algorithmHandlers.MapFileProvider;
+            factorFileProvider = algorithmHandlers.FactorFileProvider;
+
+            var job = systemHandlers.JobQueue.NextJob(out var assemblyPath);
+            var algorithmManager = new AlgorithmManager(false, job);
+            systemHandlers.LeanManager.Initialize(systemHandlers, algorithmHandlers, job, algorithmManager);
+
+            // the engine disposes of the worker thread at the end of the backtest
+            using var workerThread = new BacktestWorkerThread();
+            var engine = new Engine.Engine(systemHandlers, algorithmHandlers, false);
+            engine.Run(job, algorithmManager, assemblyPath, workerThread);
+
+            systemHandlers.JobQueue.AcknowledgeJob(job);
+        }
+
+        private class BacktestWorkerThread : WorkerThread
+        {
+        }
+    }
+}
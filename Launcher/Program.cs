@@ -61,6 +61,15 @@ namespace QuantConnect.Lean.Launcher
             Thread.CurrentThread.Name = "Algorithm Analysis Thread";
 
             Initializer.Start();
+
+            if (Config.GetBool("optimization-worker"))
+            {
+                // a long lived worker of the optimizer, runs the backtests of its standard input until it's closed
+                OptimizationWorker.Run();
+                Log.LogHandler.DisposeSafely();
+                Environment.Exit(0);
+            }
+
             leanEngineSystemHandlers = Initializer.GetSystemHandlers();
 
             //-> Pull job from QuantConnect job queue, or, pull local build:
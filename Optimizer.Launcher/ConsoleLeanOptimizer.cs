@@ -16,6 +16,7 @@
 using QuantConnect.Util;
 using System;
 using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
 using System.Linq;
@@ -32,7 +33,10 @@ namespace QuantConnect.Optimizer.Launcher
         private readonly string _leanLocation;
         private readonly string _rootResultDirectory;
         private readonly string _extraLeanArguments;
+        private readonly string _sharedDataCacheFolder;
         private readonly ConcurrentDictionary<string, Process> _processByBacktestId;
+        private readonly List<LeanWorker> _workers;
+        private readonly Queue<OptimizationWorkerJob> _pendingJobs;
 
         /// <summary>
         /// Creates a new instance
@@ -69,6 +73,25 @@ namespace QuantConnect.Optimizer.Launcher
             {
                 _extraLeanArguments += $" --algorithm-location \"{algorithmLocation}\"";
             }
+
+            if (Configuration.Config.GetBool("optimizer-shared-data-cache"))
+            {
+                // the backtests share the decompressed data files instead of each one decompressing its own copy
+                _sharedDataCacheFolder = Configuration.Config.Get("shared-data-cache-folder", Path.Combine(_rootResultDirectory, "shared-data-cache"));
+                var sizeLimit = Configuration.Config.GetInt("shared-data-cache-size-mb", 4096);
+                _extraLeanArguments += $" --shared-data-cache-folder \"{_sharedDataCacheFolder}\" --shared-data-cache-size-mb {sizeLimit}";
+            }
+
+            if (Configuration.Config.GetBool("optimizer-worker-pool"))
+            {
+                // a fixed pool of long lived Lean processes that run the backtests back to back, instead of a process per backtest
+                var workerCount = NodePacket.MaximumConcurrentBacktests > 0 ? NodePacket.MaximumConcurrentBacktests : Environment.ProcessorCount;
+                _pendingJobs = new Queue<OptimizationWorkerJob>();
+                _workers = Enumerable.Range(0, workerCount).Select(id => new LeanWorker(id, _leanLocation,
+                    $"--optimization-worker true --results-destination-folder \"{Path.Combine(_rootResultDirectory, $"worker-{id}")}\" " +
+                    $"--optimization-id \"{nodePacket.OptimizationId}\" {_extraLeanArguments}",
+                    OnWorkerBacktestEnded)).ToList();
+            }
         }
 
         /// <summary>
@@ -85,12 +108,33 @@ namespace QuantConnect.Optimizer.Launcher
             var resultDirectory = Path.Combine(_rootResultDirectory, backtestId);
             Directory.CreateDirectory(resultDirectory);
 
+            if (_workers != null)
+            {
+                lock (_workers)
+                {
+                    _pendingJobs.Enqueue(new OptimizationWorkerJob
+                    {
+                        BacktestId = backtestId,
+                        BacktestName = backtestName,
+                        ResultsDestinationFolder = resultDirectory,
+                        Parameters = parameterSet.Value,
+                        PeriodFraction = parameterSet.PeriodFraction
+                    });
+                }
+                DispatchJobs();
+                return backtestId;
+            }
+
+            var periodFraction = parameterSet.PeriodFraction.HasValue
+                ? $"--backtest-period-fraction {parameterSet.PeriodFraction.Value.ToStringInvariant()}"
+                : string.Empty;
+
             // Use ProcessStartInfo class
             var startInfo = new ProcessStartInfo
             {
                 FileName = _leanLocation,
                 WorkingDirectory = Directory.GetParent(_leanLocation).FullName,
-                Arguments = $"--results-destination-folder \"{resultDirectory}\" --algorithm-id \"{backtestId}\" --optimization-id \"{optimizationId}\" --parameters {parameterSet} --backtest-name \"{backtestName}\" {_extraLeanArguments}",
+                Arguments = $"--results-destination-folder \"{resultDirectory}\" --algorithm-id \"{backtestId}\" --optimization-id \"{optimizationId}\" --parameters {parameterSet} --backtest-name \"{backtestName}\" {periodFraction} {_extraLeanArguments}",
                 WindowStyle = ProcessWindowStyle.Minimized
             };
 
@@ -127,6 +171,20 @@ namespace QuantConnect.Optimizer.Launcher
         /// <param name="backtestId">Specified backtest id</param>
         protected override void AbortLean(string backtestId)
         {
+            if (_workers != null)
+            {
+                lock (_workers)
+                {
+                    if (!_workers.Any(worker => worker.Abort(backtestId)))
+                    {
+                        var pendingJobs = _pendingJobs.Where(job => job.BacktestId != backtestId).ToList();
+                        _pendingJobs.Clear();
+                        pendingJobs.ForEach(_pendingJobs.Enqueue);
+                    }
+                }
+                return;
+            }
+
             Process process;
             if (_processByBacktestId.TryRemove(backtestId, out process))
             {
@@ -151,8 +209,97 @@ namespace QuantConnect.Optimizer.Launcher
                 {
                     message += $". Best id:'{currentBestBacktest.BacktestId}'. {OptimizationTarget}. Parameters ({currentBestBacktest.ParameterSet})";
                 }
+                if (_workers != null)
+                {
+                    message += $". Workers: {GetWorkerStatistics()}";
+                }
                 Log.Trace(message);
             }
         }
+
+        /// <summary>
+        /// Get the current runtime statistics, including the counters of the shared data cache
+        /// </summary>
+        public override Dictionary<string, string> GetRuntimeStatistics()
+        {
+            var statistics = base.GetRuntimeStatistics();
+            if (_sharedDataCacheFolder != null)
+            {
+                var cache = SharedDataCache.ReadStatistics(_sharedDataCacheFolder);
+                statistics["Data Cache Hits"] = $"{cache.Hits}";
+                statistics["Data Cache Misses"] = $"{cache.Misses}";
+                statistics["Data Cache Evictions"] = $"{cache.Evictions}";
+                statistics["Data Cache Size"] = $"{cache.Size / (1024 * 1024)} MB";
+            }
+            return statistics;
+        }
+
+        /// <summary>
+        /// Disposes of any resources, stopping the worker processes
+        /// </summary>
+        public override void Dispose()
+        {
+            if (Disposed)
+            {
+                return;
+            }
+            base.Dispose();
+
+            if (_workers != null)
+            {
+                Log.Trace($"ConsoleLeanOptimizer.Dispose(): workers {GetWorkerStatistics()}");
+                lock (_workers)
+                {
+                    _pendingJobs.Clear();
+                }
+                _workers.ForEach(worker => worker.DisposeSafely());
+            }
+        }
+
+        /// <summary>
+        /// Sends the pending backtests to the idle workers
+        /// </summary>
+        private void DispatchJobs()
+        {
+            lock (_workers)
+            {
+                foreach (var worker in _workers.Where(worker => worker.IsIdle))
+                {
+                    if (Disposed || !_pendingJobs.TryDequeue(out var job))
+                    {
+                        return;
+                    }
+                    worker.Run(job);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Handles the end of a backtest of a worker, its result is read from the results folder like for a backtest process
+        /// </summary>
+        private void OnWorkerBacktestEnded(LeanWorker worker, string backtestId)
+        {
+            if (Disposed)
+            {
+                // handle abort
+                return;
+            }
+
+            var resultJson = Path.Combine(_rootResultDirectory, backtestId, $"{backtestId}.json");
+            NewResult(File.Exists(resultJson) ? File.ReadAllText(resultJson) : null, backtestId);
+            DispatchJobs();
+        }
+
+        /// <summary>
+        /// Gets the throughput of each worker
+        /// </summary>
+        private string GetWorkerStatistics()
+        {
+            return string.Join(", ", _workers.Select(worker =>
+            {
+                var average = worker.EndedBacktests > 0 ? worker.BacktestsDuration.TotalSeconds / worker.EndedBacktests : 0;
+                return $"{worker.Id}:{worker.EndedBacktests} backtests {average:F2}s avg {worker.ProcessStarts} starts";
+            }));
+        }
     }
 }
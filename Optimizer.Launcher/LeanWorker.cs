@@ -0,0 +1,300 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Diagnostics;
+using System.Globalization;
+using System.IO;
+using System.IO.Pipes;
+using System.Threading;
+using Newtonsoft.Json;
+using QuantConnect.Util;
+using Log = QuantConnect.Logging.Log;
+
+namespace QuantConnect.Optimizer.Launcher
+{
+    /// <summary>
+    /// A long lived Lean process that runs backtests back to back, see <see cref="OptimizationWorkerJob"/>.
+    /// The process is started on the first backtest and again after it's aborted or it dies. The process writes the end
+    /// of its backtests to a dedicated pipe, its standard output is the log of the backtests and is discarded
+    /// </summary>
+    public class LeanWorker : IDisposable
+    {
+        private readonly object _lock = new();
+        private readonly string _leanLocation;
+        private readonly string _arguments;
+        private readonly Action<LeanWorker, string> _backtestEnded;
+        private Process _process;
+        private bool _disposed;
+
+        /// <summary>
+        /// The worker id within the pool
+        /// </summary>
+        public int Id { get; }
+
+        /// <summary>
+        /// The id of the running backtest, null if the worker is idle
+        /// </summary>
+        public string BacktestId { get; private set; }
+
+        /// <summary>
+        /// True if the worker is not running a backtest
+        /// </summary>
+        public bool IsIdle => BacktestId == null;
+
+        /// <summary>
+        /// The number of backtests the worker has ended
+        /// </summary>
+        public int EndedBacktests { get; private set; }
+
+        /// <summary>
+        /// The time spent running backtests, as reported by the worker process
+        /// </summary>
+        public TimeSpan BacktestsDuration { get; private set; }
+
+        /// <summary>
+        /// The number of times the worker process has been started
+        /// </summary>
+        public int ProcessStarts { get; private set; }
+
+        /// <summary>
+        /// Creates a new instance
+        /// </summary>
+        /// <param name="id">The worker id within the pool</param>
+        /// <param name="leanLocation">The Lean launcher executable</param>
+        /// <param name="arguments">The Lean arguments shared by every backtest</param>
+        /// <param name="backtestEnded">Called with the backtest id when a backtest ends, or when the process dies while running it</param>
+        public LeanWorker(int id, string leanLocation, string arguments, Action<LeanWorker, string> backtestEnded)
+        {
+            Id = id;
+            _leanLocation = leanLocation;
+            _arguments = arguments;
+            _backtestEnded = backtestEnded;
+        }
+
+        /// <summary>
+        /// Sends the backtest to the worker process
+        /// </summary>
+        /// <param name="job">The backtest to run</param>
+        public void Run(OptimizationWorkerJob job)
+        {
+            lock (_lock)
+            {
+                if (_disposed)
+                {
+                    return;
+                }
+                if (!IsIdle)
+                {
+                    throw new InvalidOperationException($"LeanWorker.Run(): worker {Id} is already running backtest {BacktestId}");
+                }
+
+                if (_process == null)
+                {
+                    StartProcess();
+                }
+                BacktestId = job.BacktestId;
+                _process.StandardInput.WriteLine(JsonConvert.SerializeObject(job, Formatting.None));
+                _process.StandardInput.Flush();
+            }
+        }
+
+        /// <summary>
+        /// Kills the worker process if it's running the given backtest, a new process is started for the next backtest
+        /// </summary>
+        /// <param name="backtestId">The backtest to abort</param>
+        /// <returns>True if the worker was running the backtest</returns>
+        public bool Abort(string backtestId)
+        {
+            Process process;
+            lock (_lock)
+            {
+                if (backtestId != BacktestId)
+                {
+                    return false;
+                }
+                BacktestId = null;
+                process = _process;
+                _process = null;
+            }
+
+            KillSafely(process);
+            process.DisposeSafely();
+            return true;
+        }
+
+        /// <summary>
+        /// Closes the standard input of the worker process, so it exits, and kills it if it's running a backtest
+        /// </summary>
+        public void Dispose()
+        {
+            Process process;
+            bool isIdle;
+            lock (_lock)
+            {
+                if (_disposed)
+                {
+                    return;
+                }
+                _disposed = true;
+                isIdle = IsIdle;
+                process = _process;
+                _process = null;
+            }
+
+            if (process == null)
+            {
+                return;
+            }
+            try
+            {
+                process.StandardInput.Close();
+            }
+            catch
+            {
+                // the process might be gone already
+            }
+            if (!isIdle || !process.WaitForExit(10000))
+            {
+                KillSafely(process);
+            }
+            process.DisposeSafely();
+        }
+
+        private void StartProcess()
+        {
+            var completions = new AnonymousPipeServerStream(PipeDirection.In, HandleInheritability.Inheritable);
+            var process = new Process
+            {
+                StartInfo = new ProcessStartInfo
+                {
+                    FileName = _leanLocation,
+                    WorkingDirectory = Directory.GetParent(_leanLocation).FullName,
+                    Arguments = $"{_arguments} --optimization-worker-pipe {completions.GetClientHandleAsString()}",
+                    UseShellExecute = false,
+                    RedirectStandardInput = true,
+                    RedirectStandardOutput = true,
+                    WindowStyle = ProcessWindowStyle.Minimized
+                },
+                EnableRaisingEvents = true
+            };
+
+            // the output is the log of the backtests, already stored in their results folders
+            process.OutputDataReceived += (sender, args) => { };
+            process.Exited += (sender, args) => OnExited(process);
+
+            try
+            {
+                process.Start();
+            }
+            catch
+            {
+                completions.DisposeSafely();
+                throw;
+            }
+            // the process has its own copy of the pipe handle, ours would keep the pipe open after it exits
+            completions.DisposeLocalCopyOfClientHandle();
+            process.BeginOutputReadLine();
+            _process = process;
+            ProcessStarts++;
+
+            new Thread(() => ReadCompletions(completions)) { IsBackground = true, Name = $"LeanWorker {Id} completions" }.Start();
+        }
+
+        private void ReadCompletions(AnonymousPipeServerStream completions)
+        {
+            try
+            {
+                using var reader = new StreamReader(completions);
+                string line;
+                while ((line = reader.ReadLine()) != null)
+                {
+                    OnCompleted(line);
+                }
+            }
+            catch (Exception err)
+            {
+                // the pipe breaks when the process is killed
+                Log.Debug($"LeanWorker.ReadCompletions(): worker {Id} pipe closed: {err.Message}");
+            }
+            finally
+            {
+                completions.DisposeSafely();
+            }
+        }
+
+        private void OnCompleted(string line)
+        {
+            if (!line.StartsWith(OptimizationWorkerJob.CompletedPrefix, StringComparison.Ordinal))
+            {
+                Log.Error($"LeanWorker.OnCompleted(): worker {Id} unexpected completion line '{line}'");
+                return;
+            }
+
+            var fields = line.Substring(OptimizationWorkerJob.CompletedPrefix.Length).Split(' ');
+            var backtestId = fields[0];
+            lock (_lock)
+            {
+                if (backtestId != BacktestId)
+                {
+                    // aborted
+                    return;
+                }
+                BacktestId = null;
+                EndedBacktests++;
+                if (fields.Length > 1 && double.TryParse(fields[1], NumberStyles.Float, CultureInfo.InvariantCulture, out var seconds))
+                {
+                    BacktestsDuration += TimeSpan.FromSeconds(seconds);
+                }
+            }
+            _backtestEnded(this, backtestId);
+        }
+
+        private void OnExited(Process process)
+        {
+            string backtestId;
+            lock (_lock)
+            {
+                if (_process != process)
+                {
+                    // aborted or disposed
+                    return;
+                }
+                _process = null;
+                backtestId = BacktestId;
+                BacktestId = null;
+            }
+            process.DisposeSafely();
+
+            if (backtestId != null)
+            {
+                Log.Error($"LeanWorker.OnExited(): worker {Id} exited while running backtest {backtestId}");
+                _backtestEnded(this, backtestId);
+            }
+        }
+
+        private static void KillSafely(Process process)
+        {
+            try
+            {
+                process?.Kill();
+            }
+            catch
+            {
+                // pass
+            }
+        }
+    }
+}
@@ -285,7 +285,7 @@ namespace QuantConnect.Optimizer
         /// <summary>
         /// Get the current runtime statistics
         /// </summary>
-        public Dictionary<string, string> GetRuntimeStatistics()
+        public virtual Dictionary<string, string> GetRuntimeStatistics()
         {
             var completedCount = _completedBacktest;
             var totalEndedCount = completedCount + _failedBacktest;
@@ -300,6 +300,8 @@ namespace QuantConnect.Optimizer
                 { "Total Runtime", $"{runtime.ToString(@"hh\:mm\:ss", CultureInfo.InvariantCulture)}" }
             };
 
+            Strategy.AddRuntimeStatistics(result);
+
             return result;
         }
 
@@ -54,5 +54,13 @@ namespace QuantConnect.Optimizer.Strategies
         /// Estimates amount of parameter sets that can be run
         /// </summary>
         int GetTotalBacktestEstimate();
+
+        /// <summary>
+        /// Adds the strategy specific statistics to the optimization runtime statistics, none by default
+        /// </summary>
+        /// <param name="statistics">The runtime statistics of the optimization</param>
+        void AddRuntimeStatistics(Dictionary<string, string> statistics)
+        {
+        }
     }
 }
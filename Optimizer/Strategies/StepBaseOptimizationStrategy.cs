@@ -110,7 +110,7 @@ namespace QuantConnect.Optimizer.Strategies
         /// Calculate number of parameter sets within grid
         /// </summary>
         /// <returns>Number of parameter sets for given optimization parameters</returns>
-        public int GetTotalBacktestEstimate()
+        public virtual int GetTotalBacktestEstimate()
         {
             var total = 1;
             foreach (var arg in OptimizationParameters)
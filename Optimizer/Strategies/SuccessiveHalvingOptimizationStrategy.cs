@@ -0,0 +1,260 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json.Linq;
+using QuantConnect.Logging;
+using QuantConnect.Optimizer.Objectives;
+using QuantConnect.Optimizer.Parameters;
+
+namespace QuantConnect.Optimizer.Strategies
+{
+    /// <summary>
+    /// Budget aware brute-force strategy: every parameter set of the grid is backtested on the first part of the algorithm period,
+    /// then only the best of each round are backtested again on a longer period, until the full period.
+    /// With the default settings each round keeps a third of the parameter sets on a three times longer period
+    /// </summary>
+    /// <remarks>The solution is only picked from the full period backtests, the shorter ones are only used to rank the parameter sets</remarks>
+    public class SuccessiveHalvingOptimizationStrategy : StepBaseOptimizationStrategy, IOptimizationStrategy
+    {
+        private readonly object _locker = new object();
+        private readonly List<Candidate> _candidates = new List<Candidate>();
+        private List<decimal> _periodFractions;
+        private int _reductionFactor;
+        private int _round;
+        private int _roundSize;
+        private int _runningBacktests;
+        private int _lastId;
+        private int _parameterSetCount;
+        private int _fullPeriodDays;
+        private long _backtestDays;
+
+        /// <summary>
+        /// The number of days backtested by the ended backtests
+        /// </summary>
+        public long BacktestDays => _backtestDays;
+
+        /// <summary>
+        /// The number of days a grid search would backtest for the same parameter sets
+        /// </summary>
+        public long GridSearchBacktestDays => (long)_parameterSetCount * _fullPeriodDays;
+
+        /// <summary>
+        /// Initializes the strategy using generator, extremum settings and optimization parameters
+        /// </summary>
+        /// <param name="target">The optimization target</param>
+        /// <param name="constraints">The optimization constraints to apply on backtest results</param>
+        /// <param name="parameters">Optimization parameters</param>
+        /// <param name="settings">Optimization strategy settings</param>
+        public override void Initialize(Target target, IReadOnlyList<Constraint> constraints, HashSet<OptimizationParameter> parameters, OptimizationStrategySettings settings)
+        {
+            var halvingSettings = settings as SuccessiveHalvingOptimizationStrategySettings ?? new SuccessiveHalvingOptimizationStrategySettings();
+            if (halvingSettings.MinimumPeriodFraction <= 0 || halvingSettings.MinimumPeriodFraction > 1)
+            {
+                throw new ArgumentException($"SuccessiveHalvingOptimizationStrategy.Initialize: the minimum period fraction should be in (0, 1], but specified '{halvingSettings.MinimumPeriodFraction}'", nameof(settings));
+            }
+            if (halvingSettings.ReductionFactor < 2)
+            {
+                throw new ArgumentException($"SuccessiveHalvingOptimizationStrategy.Initialize: the reduction factor should be at least 2, but specified '{halvingSettings.ReductionFactor}'", nameof(settings));
+            }
+
+            _reductionFactor = halvingSettings.ReductionFactor;
+            _periodFractions = new List<decimal>();
+            // the last round is always the full period, a fraction close enough to it is not worth its own round
+            for (var fraction = halvingSettings.MinimumPeriodFraction; fraction < 0.999m; fraction *= _reductionFactor)
+            {
+                _periodFractions.Add(fraction);
+            }
+            _periodFractions.Add(1m);
+
+            base.Initialize(target, constraints, parameters, settings);
+        }
+
+        /// <summary>
+        /// Calculate number of backtests of all the rounds
+        /// </summary>
+        /// <returns>Number of backtests for given optimization parameters</returns>
+        public override int GetTotalBacktestEstimate()
+        {
+            var total = 0;
+            var parameterSets = base.GetTotalBacktestEstimate();
+            for (var round = parameterSets > 1 ? 0 : _periodFractions.Count - 1; round < _periodFractions.Count; round++)
+            {
+                total += parameterSets;
+                parameterSets = Math.Max(1, parameterSets / _reductionFactor);
+            }
+
+            return total;
+        }
+
+        /// <summary>
+        /// Adds the days backtested so far and the days a grid search would backtest to the runtime statistics
+        /// </summary>
+        /// <param name="statistics">The runtime statistics of the optimization</param>
+        public void AddRuntimeStatistics(Dictionary<string, string> statistics)
+        {
+            statistics["Backtest Days"] = $"{BacktestDays}";
+            statistics["Grid Search Backtest Days"] = $"{GridSearchBacktestDays}";
+        }
+
+        /// <summary>
+        /// Ranks the new result within its round and starts the next round once all its backtests have ended
+        /// </summary>
+        /// <param name="result">Lean compute job result and corresponding parameter set</param>
+        public override void PushNewResults(OptimizationResult result)
+        {
+            if (!Initialized)
+            {
+                throw new InvalidOperationException($"SuccessiveHalvingOptimizationStrategy.PushNewResults: strategy has not been initialized yet.");
+            }
+
+            lock (_locker)
+            {
+                if (ReferenceEquals(result, OptimizationResult.Initial))
+                {
+                    var parameterSets = Step(OptimizationParameters).Select(parameterSet => parameterSet.Value).ToList();
+                    _parameterSetCount = parameterSets.Count;
+                    // a single parameter set has nothing to be ranked against
+                    StartRound(_parameterSetCount > 1 ? 0 : _periodFractions.Count - 1, parameterSets);
+                    return;
+                }
+
+                if (!string.IsNullOrEmpty(result?.JsonBacktestResult))
+                {
+                    AddResult(result);
+                }
+                // else one of the requested backtests failed, it's not promoted
+
+                _runningBacktests--;
+                if (_runningBacktests == 0)
+                {
+                    EndRound();
+                }
+            }
+        }
+
+        private void AddResult(OptimizationResult result)
+        {
+            var json = JObject.Parse(result.JsonBacktestResult);
+            var fraction = result.ParameterSet.PeriodFraction ?? 1m;
+
+            var configuration = json["AlgorithmConfiguration"];
+            var startDate = configuration?["StartDate"];
+            var endDate = configuration?["EndDate"];
+            if (startDate != null && endDate != null)
+            {
+                var days = (endDate.Value<DateTime>().Date - startDate.Value<DateTime>().Date).Days + 1;
+                _backtestDays += days;
+                if (fraction == 1m)
+                {
+                    _fullPeriodDays = days;
+                }
+                else if (_fullPeriodDays == 0)
+                {
+                    // estimated until the first full period backtest ends
+                    _fullPeriodDays = (int)Math.Round(days / fraction);
+                }
+            }
+
+            if (_round == _periodFractions.Count - 1)
+            {
+                ProcessNewResult(result);
+                return;
+            }
+
+            var token = json.SelectToken(Target.Target);
+            _candidates.Add(new Candidate
+            {
+                ParameterSet = result.ParameterSet,
+                Value = token?.Value<string>().ToNormalizedDecimal(),
+                IsCompliant = Constraints?.All(constraint => constraint.IsMet(result.JsonBacktestResult)) != false
+            });
+        }
+
+        private void EndRound()
+        {
+            if (_round == _periodFractions.Count - 1)
+            {
+                Log.Trace($"SuccessiveHalvingOptimizationStrategy.EndRound(): backtested {_backtestDays} days, a grid search would backtest {GridSearchBacktestDays} days");
+                return;
+            }
+
+            _candidates.Sort(Compare);
+            var promoted = Math.Max(1, _roundSize / _reductionFactor);
+            var parameterSets = _candidates.Take(promoted).Select(candidate => candidate.ParameterSet.Value).ToList();
+
+            Log.Trace($"SuccessiveHalvingOptimizationStrategy.EndRound(): round {_round} ended, promoting {parameterSets.Count} of {_candidates.Count} parameter sets " +
+                $"to {_periodFractions[_round + 1]:P0} of the period");
+
+            _candidates.Clear();
+            if (parameterSets.Count > 0)
+            {
+                StartRound(_round + 1, parameterSets);
+            }
+        }
+
+        private void StartRound(int round, IReadOnlyList<IReadOnlyDictionary<string, string>> parameterSets)
+        {
+            _round = round;
+            _roundSize = parameterSets.Count;
+            var fraction = _periodFractions[round];
+
+            // failed launches push their result right away, the round can't end before all its backtests are launched
+            _runningBacktests = parameterSets.Count + 1;
+            foreach (var value in parameterSets)
+            {
+                OnNewParameterSet(new ParameterSet(
+                    ++_lastId,
+                    value.ToDictionary(kvp => kvp.Key, kvp => kvp.Value),
+                    fraction < 1m ? Math.Round(fraction, 6) : (decimal?)null));
+            }
+
+            _runningBacktests--;
+            if (_runningBacktests == 0)
+            {
+                EndRound();
+            }
+        }
+
+        /// <summary>
+        /// Orders the candidates from best to worst: compliant with the constraints first, then by target value
+        /// </summary>
+        private int Compare(Candidate left, Candidate right)
+        {
+            if (left.IsCompliant != right.IsCompliant)
+            {
+                return left.IsCompliant ? -1 : 1;
+            }
+            if (left.Value.HasValue != right.Value.HasValue)
+            {
+                return left.Value.HasValue ? -1 : 1;
+            }
+            if (left.Value.HasValue && left.Value.Value != right.Value.Value)
+            {
+                return Target.Extremum.Better(left.Value.Value, right.Value.Value) ? 1 : -1;
+            }
+            return left.ParameterSet.Id.CompareTo(right.ParameterSet.Id);
+        }
+
+        private class Candidate
+        {
+            public ParameterSet ParameterSet { get; init; }
+            public decimal? Value { get; init; }
+            public bool IsCompliant { get; init; }
+        }
+    }
+}
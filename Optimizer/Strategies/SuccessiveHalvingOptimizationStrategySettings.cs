@@ -0,0 +1,37 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Newtonsoft.Json;
+
+namespace QuantConnect.Optimizer.Strategies
+{
+    /// <summary>
+    /// Defines the settings of the <see cref="SuccessiveHalvingOptimizationStrategy"/>
+    /// </summary>
+    public class SuccessiveHalvingOptimizationStrategySettings : StepBaseOptimizationStrategySettings
+    {
+        /// <summary>
+        /// The fraction of the algorithm period every parameter set is backtested on first
+        /// </summary>
+        [JsonProperty("minimum-period-fraction")]
+        public decimal MinimumPeriodFraction { get; set; } = 1m / 9;
+
+        /// <summary>
+        /// The period is multiplied and the number of parameter sets divided by this factor on each round
+        /// </summary>
+        [JsonProperty("reduction-factor")]
+        public int ReductionFactor { get; set; } = 3;
+    }
+}
@@ -252,6 +252,12 @@ namespace QuantConnect.Queues
             }
             backtestJob.OutOfSampleDays = Config.GetInt("out-of-sample-days");
 
+            var periodFraction = Config.Get("backtest-period-fraction");
+            if (!string.IsNullOrEmpty(periodFraction))
+            {
+                backtestJob.PeriodFraction = Parse.Decimal(periodFraction);
+            }
+
             // Only set optimization id when backtest is for optimization
             if (!optimizationId.IsNullOrEmpty())
             {
@@ -181,3 +181,11 @@ result = charts.GetExposure(time, long_securities, short_securities, long, short
 result = charts.GetExposure(time, long_securities, short_securities, long, short,
                                 live_time, live_long_securities, live_short_securities,
                                 live_long, live_short)
+
+## Test RenderCharts (in this process, the worker processes need a python executable)
+rendered = charts.RenderCharts({'leverage': ('GetLeverage', {'data': backtest}),
+                                'exposure': ('GetExposure', {'time': time, 'long_securities': long_securities, 'short_securities': short_securities,
+                                                             'long_data': long, 'short_data': short}),
+                                'annual-returns': ('GetAnnualReturns', {})}, processes = 1)
+assert list(rendered.keys()) == ['leverage', 'exposure', 'annual-returns']
+assert all(chart.startswith('data:image/png;base64,') for chart in rendered.values())
@@ -15,12 +15,12 @@ import re
 import matplotlib
 import numpy as np
 import pandas as pd
+import multiprocessing
+from io import BytesIO
 from base64 import b64encode
 from datetime import date, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from pandas.plotting import register_matplotlib_converters
-from clr import AddReference
-AddReference("System")
-from System import *
 
 register_matplotlib_converters()
 
@@ -34,12 +34,17 @@ matplotlib.rc('axes', edgecolor='#d5d5d5')
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import matplotlib.colors as mcolors
+from matplotlib.figure import Figure
 from matplotlib.dates import DateFormatter
 from matplotlib.ticker import MaxNLocator, NullFormatter, ScalarFormatter, FormatStrFormatter
-la = matplotlib.font_manager.FontManager()
-lu = matplotlib.font_manager.FontProperties(family = "Open Sans Condensed")
+
+def render_chart(method, kwargs):
+    '''Renders a chart in a worker process of ReportCharts.RenderCharts'''
+    return getattr(ReportCharts(), method)(**kwargs)
 
 class ReportCharts:
+    '''Draws the report charts as base64 png images.
+    Each chart is drawn on its own Figure, not on the pyplot state, and rendered in memory'''
     color_map = {
             "Equity": "#ff9914",
             "Option": "#DAA520",
@@ -54,49 +59,77 @@ class ReportCharts:
         }
 
     def fig_to_base64(self, filename = '', fig = None, dpi = 200):
+        '''Renders a figure to a base64 png in memory and closes it
+        Args:
+            filename: The name of the chart, kept for compatibility, nothing is written to disk
+            fig: The figure to render
+            dpi: The resolution of the image'''
         base64 = 'data:image/png;base64,'
         if fig is not None:
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
-            with open(filename, "rb") as fp:
-                base64 += b64encode(fp.read()).decode('utf-8').replace('\n', '')
-            return base64
+            buffer = BytesIO()
+            fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+            # a no-op for the figures that pyplot does not track
+            plt.close(fig)
+            return base64 + b64encode(buffer.getvalue()).decode('utf-8')
+
+    def GetInsufficientData(self, name, width, height, fontsize = 20):
+        '''Renders the chart shown when there is no data to plot'''
+        fig = Figure()
+        fig.set_size_inches(width, height)
+
+        left, box_width = .25, .5
+        bottom, box_height = .25, .5
+        right = left + box_width
+        top = bottom + box_height
+
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
+                horizontalalignment='center',
+                verticalalignment='center',
+                fontsize=fontsize,
+                transform=ax.transAxes)
+
+        ax.axis('off')
+
+        for _, spine in ax.spines.items():
+            spine.set_visible(False)
+
+        return self.fig_to_base64(name, fig)
+
+    def RenderCharts(self, charts, processes = None):
+        '''Renders a set of charts in parallel, each in a process of a pool
+        Args:
+            charts: The charts to render by key, as the name of a chart method and its keyword arguments,
+                    e.g. {'daily-returns': ('GetDailyReturns', {'returns': [time, values]})}. The arguments are
+                    sent to the worker processes so they must be python objects that can be pickled
+            processes: The number of worker processes, the number of cores by default. With 1 process,
+                    the charts are rendered in this process
+        Returns:
+            The result of the chart method of each key'''
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = min(processes, len(charts))
+
+        if processes <= 1:
+            return {key: getattr(self, method)(**kwargs) for key, (method, kwargs) in charts.items()}
+
+        # spawned workers do not inherit the threads of the host process, like the .NET runtime ones
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {key: executor.submit(render_chart, method, kwargs) for key, (method, kwargs) in charts.items()}
+            return {key: future.result() for key, future in futures.items()}
 
     def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
                            name = "returns-per-trade.png", width = 7, height = 5,
                            live_color = "#ff9914", backtest_color = "#71c3fc"):
 
         if len(returns_per_trade) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height, 30)
 
         if len(live_returns_per_trade) > 0:
             width = 11.5
             height = 5
-            plt.figure()
-            fig, ax = plt.subplots(1, 2, tight_layout=True)
+            fig = Figure(tight_layout=True)
+            ax = fig.subplots(1, 2)
             ax[0].hist(returns_per_trade, bins=75, color=backtest_color)
             ax[1].hist(live_returns_per_trade, bins=25, color=live_color)
             for i in range(2):
@@ -113,27 +146,27 @@ class ReportCharts:
                     plt.setp(ax[i].spines.values(), color='#d5d5d5')
                     ax[i].spines['right'].set_visible(False)
                     ax[i].spines['top'].set_visible(False)
+            # the percentage ticks were only set on the last axes
+            ax = ax[1]
         else:
-            fig = plt.figure()
-            plt.hist(returns_per_trade, bins=75, color=backtest_color)
-            plt.xticks(fontsize=8)
-            plt.yticks(fontsize=8)
-            plt.gca().spines['right'].set_visible(False)
-            plt.gca().spines['top'].set_visible(False)
-            plt.gca().tick_params(axis='x', color='#d5d5d5')
-            plt.gca().tick_params(axis='y', color='#d5d5d5')
-            plt.gca().axvline(x=np.median(returns_per_trade), color="red", ls="dashed", label="median", linewidth=0.5)
-            plt.ylabel('')
+            fig = Figure()
+            ax = fig.add_subplot()
+            ax.hist(returns_per_trade, bins=75, color=backtest_color)
+            ax.tick_params(labelsize=8)
+            ax.spines['right'].set_visible(False)
+            ax.spines['top'].set_visible(False)
+            ax.tick_params(axis='x', color='#d5d5d5')
+            ax.tick_params(axis='y', color='#d5d5d5')
+            ax.axvline(x=np.median(returns_per_trade), color="red", ls="dashed", label="median", linewidth=0.5)
+            ax.set_ylabel('')
 
         # Set the x ticks as percentage to keep consistency
-        plt.xticks(ticks=plt.xticks()[0], labels=["{:.2f}%".format(tick * 100) for tick in plt.xticks()[0]])
+        ticks = ax.get_xticks()
+        ax.set_xticks(ticks)
+        ax.set_xticklabels(["{:.2f}%".format(tick * 100) for tick in ticks])
 
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetCumulativeReturns(self, data = None, live_data = None, benchmark_symbol = 'SPY',
                                  name = "cumulative-return.png", width = 11.5, height = 2.5, live_color = "#ff9914",
@@ -151,34 +184,10 @@ class ReportCharts:
             live_data = [[],[],[],[]]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
+            return self.GetInsufficientData(name, width, height)
 
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         labels = ['Backtest', 'Benchmark']
         labels_removed = []
 
@@ -200,31 +209,7 @@ class ReportCharts:
 
         # Return if we don't have any valid labels
         if not any(labels):
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         live_labels = []
         live_labels_removed = []
@@ -241,64 +226,35 @@ class ReportCharts:
 
         ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                   frameon=False, fontsize=8, ncol=len(labels))
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(fontsize=8)
+        ax.tick_params(axis='x', labelrotation=0, labelsize=8)
+        ax.tick_params(axis='y', labelsize=8)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
         ax.yaxis.set_major_formatter(ticker.PercentFormatter())
         ax.yaxis.set_major_locator(MaxNLocator(6))
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetDailyReturns(self, returns = [[],[]], live_returns = [[],[]],
                             name = "daily-returns.png", width = 11.5, height = 2.5,
                             live_color = "#ff9914", backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(returns[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         returns[0] = list(returns[0])
         returns[1] = list(returns[1])
         live_returns[0] = list(live_returns[0])
         live_returns[1] = list(live_returns[1])
 
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         backtest_series = pd.Series(returns[1], index=returns[0])
         live_series = pd.Series(live_returns[1], index=live_returns[0])
@@ -324,7 +280,6 @@ class ReportCharts:
             ax.legend(rectangles, [label for label in ['Backtest', "Live"]], handlelength=0.8, handleheight=0.8,
                       frameon=False, fontsize=8)
 
-        fig = ax.get_figure()
         ax.xaxis_date()
         #ax.set_xticks(fontsize = 8)
         #ax.set_yticks(fontsize = 8)
@@ -332,7 +287,7 @@ class ReportCharts:
         ax.set_xlabel("")
         ax.yaxis.set_major_formatter(ticker.PercentFormatter())
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
-        plt.axhline(y = 0, color = '#d5d5d5')
+        ax.axhline(y = 0, color = '#d5d5d5')
         plt.setp(ax.spines.values(), color='#d5d5d5')
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
@@ -340,10 +295,7 @@ class ReportCharts:
         ax.set_axisbelow(True)
         ax.yaxis.grid(True, color = "#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetMonthlyReturns(self, returns = {}, live_returns = {}, width=7, height=5, name='monthly-returns.png'):
         '''
@@ -359,31 +311,7 @@ class ReportCharts:
 
         if len(returns) == 0:
             print("No monthly returns found")
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height, 30)
 
         # Make data frame
         returns = pd.DataFrame(returns, index = months).transpose()
@@ -395,12 +323,13 @@ class ReportCharts:
                   c('#00FF00'), c('#00CC00')]
 
         abs_cmap = matplotlib.colors.LinearSegmentedColormap.from_list('monthly_returns', colors)
-        norm = plt.Normalize(-10, 10)
+        norm = mcolors.Normalize(-10, 10)
 
         if len(live_returns) > 0:
             live_returns = pd.DataFrame(live_returns, index=months).transpose()
 
-            fig, ax = plt.subplots(2, 1, gridspec_kw={'height_ratios': [6, 1]})
+            fig = Figure()
+            ax = fig.subplots(2, 1, gridspec_kw={'height_ratios': [6, 1]})
             #ax[0].matshow(returns, aspect='auto', cmap=c_map, interpolation='none', vmin=-10, vmax=10)
             #ax[1].matshow(live_returns, aspect='auto', cmap=live_c_map, interpolation='none')
             ax[0].matshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
@@ -436,26 +365,25 @@ class ReportCharts:
             ax[1].tick_params(axis='y', color='#d5d5d5')
 
         else:
-            ax = plt.imshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
-            fig = ax.get_figure()
-            plt.xlabel('')
-            plt.ylabel('')
-            plt.gca().tick_params(axis='x', color='#d5d5d5')
-            plt.gca().tick_params(axis='y', color='#d5d5d5')
-            plt.yticks(range(len(returns.index.values)), returns.index.values, fontsize=8)
-            plt.xticks(range(12), ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+            fig = Figure()
+            ax = fig.add_subplot()
+            ax.imshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
+            ax.set_xlabel('')
+            ax.set_ylabel('')
+            ax.tick_params(axis='x', color='#d5d5d5')
+            ax.tick_params(axis='y', color='#d5d5d5')
+            ax.set_yticks(range(len(returns.index.values)))
+            ax.set_yticklabels(returns.index.values, fontsize=8)
+            ax.set_xticks(range(12))
+            ax.set_xticklabels(months)
             for (j, i), label in np.ndenumerate(returns):
                 if np.isnan(label):
-                    plt.text(i, j, "", ha='center', va='center', fontsize=7)
+                    ax.text(i, j, "", ha='center', va='center', fontsize=7)
                 else:
-                    plt.text(i, j, str(round(label, 1)), ha='center', va='center', fontsize=7)
+                    ax.text(i, j, str(round(label, 1)), ha='center', va='center', fontsize=7)
 
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetAnnualReturns(self, data = None, live_data = None, name = "annual-returns.png",width = 3.5*2, height = 2.5*2):
 
@@ -468,103 +396,50 @@ class ReportCharts:
             live_data = [[], []]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height, 30)
 
         # Cast to list just in case
         time = list(data[0]) + list(live_data[0])
         returns = list(data[1]) + list(live_data[1])
 
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         # Prevent value speculation on the y-axis ticks by
         # converting to string before plotting.
         ax.barh([str(i) for i in time], returns, color = [backtest_color], zorder=1)
         # Add a percentage sign at the end of each x-axis tick
         ax.xaxis.set_major_formatter(ticker.PercentFormatter())
 
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(fontsize=8)
-        plt.axvline(x=0, color='#d5d5d5', linewidth=0.5)
-        vline = plt.axvline(x=np.mean(returns), color="red", ls="dashed", label="mean", linewidth=1)
-        plt.legend([vline], ["mean"], loc='upper right', frameon=False, fontsize=8)
+        ax.tick_params(axis='x', labelrotation=0, labelsize=8)
+        ax.tick_params(axis='y', labelsize=8)
+        ax.axvline(x=0, color='#d5d5d5', linewidth=0.5)
+        vline = ax.axvline(x=np.mean(returns), color="red", ls="dashed", label="mean", linewidth=1)
+        ax.legend([vline], ["mean"], loc='upper right', frameon=False, fontsize=8)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.grid(color='#d5d5d5', axis='x', linewidth=1, zorder=0)
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.xlabel("")
-        plt.ylabel("")
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.xaxis.grid(True)
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetDrawdown(self, data = [[],[]], live_data = [[],[]], worst = [{}], name = "drawdowns.png",
                         width = 11.5, height = 2.5, gray = "#b3bcc0"):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         time = list(data[0]) + list(live_data[0])
         drawdown = list(data[1]) + list(live_data[1])
 
         colors = ["#FFCCCCCC", "#FFE5CCCC", "#FFFFCCCC", "#E5FFCCCC", "#CCFFCCCC"]
         labels = ["1st Worst", "2nd Worst", "3rd Worst", "4th Worst", "5th Worst"]
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Backtest
@@ -581,8 +456,8 @@ class ReportCharts:
                 sub_data = drawdown[time.index(start):time.index(end)]
                 worst_point = time[drawdown.index(min(sub_data))]
 
-            plt.axvspan(start, end, 0, 0.95, color = colors[index], zorder = 1)
-            plt.axvline(worst_point, 0, 0.95, ls = 'dashed', color = 'black', zorder = 4, linewidth = 0.5)
+            ax.axvspan(start, end, 0, 0.95, color = colors[index], zorder = 1)
+            ax.axvline(worst_point, 0, 0.95, ls = 'dashed', color = 'black', zorder = 4, linewidth = 0.5)
             ax.text(worst_point, min(drawdown) * 0.75, labels[index], rotation = 90, zorder = 4, va='bottom')
 
         # Live
@@ -592,41 +467,33 @@ class ReportCharts:
         # No need to draw the live mode stuff since we've already taken care of it.
         # We're just after the Live trading dotted plot in case it exists
 
-        plt.axvline(live_time[0], 0, 0.95, ls='dotted', color='red', zorder=4) if len(live_time) > 0 else None
-        plt.text(live_time[0], min(min(drawdown), min(live_drawdown)) * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
+        ax.axvline(live_time[0], 0, 0.95, ls='dotted', color='red', zorder=4) if len(live_time) > 0 else None
+        ax.text(live_time[0], min(min(drawdown), min(live_drawdown)) * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
 
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(ticks=[i for i in plt.yticks()[0] if i <= 0], labels=['{:.1f}%'.format(i * 100) for i in plt.yticks()[0] if i <= 0], fontsize=8)
-        plt.ylabel("")
-        plt.xlabel("")
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
+        ax.tick_params(axis='x', labelrotation=0, labelsize=8)
+        ticks = [i for i in ax.get_yticks() if i <= 0]
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(['{:.1f}%'.format(i * 100) for i in ticks], fontsize=8)
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetCrisisEventsPlots(self, data = [[],[],[]], name = '', width = 7, height = 5,
                              backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(data[0]) == 0:
-            fig = plt.figure()
+            fig = Figure()
             fig.set_size_inches(width, height)
-            base64 = self.fig_to_base64(f'{name}.png', fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+            return self.fig_to_base64(f'{name}.png', fig)
+
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%Y-%m-%d"))
         colors = [backtest_color, gray]
         for j, values in enumerate(data[1:]):
@@ -636,53 +503,27 @@ class ReportCharts:
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=len(labels))
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color= gray, zorder=1)
+        ax.axhline(y=0, color= gray, zorder=1)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='x', labelsize=8, labelrotation=45)
-        plt.yticks(ticks=plt.yticks()[0], labels=['{0:g}%'.format(i * 100) for i in plt.yticks()[0]], fontsize=8)
+        ticks = ax.get_yticks()
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(['{0:g}%'.format(i * 100) for i in ticks], fontsize=8)
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.xlabel("")
-        plt.ylabel("")
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(f'{name}.png', fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(f'{name}.png', fig)
 
     def GetRollingBeta(self, data = [[],[],[],[]], live_data = [[],[],[],[]], name = "rolling-portfolio-beta-to-equity.png",
                         width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                         backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
 
         if len(data[0]) == 0 and len(live_data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         # Data will come in the following format:
         # [six month rolling beta time, six month rolling beta, twelve month rolling beta time, twelve month rolling beta]
@@ -708,9 +549,8 @@ class ReportCharts:
             labels += ['Live 12 mo.']
             rectangles += [plt.Rectangle((0, 0), 1, 1, fc=live_twelve_months_color)]
 
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Backtest
@@ -728,55 +568,27 @@ class ReportCharts:
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=2)
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.xlabel("")
-        plt.ylabel("")
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetRollingSharpeRatio(self, data = [[],[]], live_data = [[],[]], name = "rolling-sharpe-ratio.png",
                                 width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                                 backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
+            return self.GetInsufficientData(name, width, height)
 
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Data will come in the following format:
@@ -817,52 +629,23 @@ class ReportCharts:
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8)
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
         plt.setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
-        fig = ax.get_figure()
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetAssetAllocation(self, data = [[],[]], live_data = [[],[]],
                               name="asset-allocation.png", width = 7, height = 5):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return {"Backtest Asset Allocation": base64}
+            return {"Backtest Asset Allocation": self.GetInsufficientData(name, width, height, 30)}
 
         symbols = [data[0], live_data[0]]
 
@@ -886,18 +669,16 @@ class ReportCharts:
 
             labels = [f'{symbol}\n' + '{:.2f}%'.format(value * 100) for symbol, value in zip(symbols_to_use, to_label)]
 
-            fig = plt.figure()
-            plt.pie(to_label, colors = colors)
-            plt.legend(labels, frameon = False, fontsize = 8, loc = 'center left', bbox_to_anchor=(0, 0.5))
-            plt.axis('equal')
+            fig = Figure()
+            ax = fig.add_subplot()
+            ax.pie(to_label, colors = colors)
+            ax.legend(labels, frameon = False, fontsize = 8, loc = 'center left', bbox_to_anchor=(0, 0.5))
+            ax.axis('equal')
             fig.set_size_inches(width, height)
             if i == 0:
                 pies["Backtest Asset Allocation"] = self.fig_to_base64(f"asset-allocation-backtest.png", fig)
             else:
                 pies["Live Asset Allocation"] = self.fig_to_base64(f"asset-allocation-live.png", fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
 
         pies["filler"] = ''
 
@@ -907,37 +688,12 @@ class ReportCharts:
                         height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914",):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         labels = ['Backtest']
 
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         # Backtest
         ax.fill_between(data[0], 0, data[1], color = backtest_color, alpha = 0.75, step='post')
@@ -954,51 +710,23 @@ class ReportCharts:
         ax.set_xticklabels(ax.get_xticklabels(), rotation=0, ha='center')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
-        plt.axhline(y=0, color='#d5d5d5')
+        ax.axhline(y=0, color='#d5d5d5')
         plt.setp(ax.spines.values(), color='#d5d5d5')
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetExposure(self, time = [], long_securities = [], short_securities = [], long_data = [[]], short_data = [[]],
                         live_time = [], live_long_securities = [], live_short_securities = [], live_long_data = [[]],
                         live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5):
         if len(time) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         for k, v in list(self.color_map.items()):
             self.color_map[k + ' - Short'] = '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6)
@@ -1009,7 +737,8 @@ class ReportCharts:
         short_colors = [self.color_map[security + ' - Short'] for security in short_securities] if len(short_securities) > 0 else None
         short_live_colors = [self.color_map[security + ' - Short'] for security in live_short_securities] if len(live_short_securities) > 0 else None
 
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         # Create step plot for the stackplot by adding a value
         # right before the next data point with the same previous value
@@ -1126,23 +855,18 @@ class ReportCharts:
         live_rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in live_labels]
         ax.legend(rectangles + live_rectangles, labels + [f'{lab} - Live' for lab in live_labels], handlelength=0.8,
                   handleheight=0.8, frameon=False, fontsize=8, ncol=len(labels), loc='upper right')
-        fig = ax.get_figure()
-        plt.xticks(rotation = 0,ha = 'center', fontsize = 8)
-        plt.yticks(fontsize = 8)
-        plt.xlabel("")
+        ax.tick_params(axis='x', labelrotation=0, labelsize=8)
+        ax.tick_params(axis='y', labelsize=8)
+        ax.set_xlabel("")
         ax.axhline(y=0, color = 'black', linewidth = 0.5)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
         plt.setp(ax.spines.values(), color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.yaxis.grid(True, color = "#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
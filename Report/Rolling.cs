@@ -14,7 +14,6 @@
 */
 
 using Deedle;
-using MathNet.Numerics.Statistics;
 using System;
 using QuantConnect.Statistics;
 using System.Collections.Generic;
@@ -39,38 +38,41 @@ namespace QuantConnect.Report
         /// <returns>Rolling beta</returns>
         public static Series<DateTime, double> Beta(SortedList<DateTime, double> performancePoints, SortedList<DateTime, double> benchmarkPoints, int windowSize = 132)
         {
-            var dailyDictionary = StatisticsBuilder.PreprocessPerformanceValues(performancePoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value)));
-            var dailyReturnsSeries = new Series<DateTime, double>(dailyDictionary);
+            var returns = GetReturns(performancePoints, benchmarkPoints, out var dailyReturnsSeries, out var benchmarkReturns);
 
-            Series<DateTime, double> benchmarkReturns;
-            if (benchmarkPoints.Count != 0)
-            {
-                var benchmarkReturnsDictionary = StatisticsBuilder.CreateBenchmarkDifferences(benchmarkPoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value)), benchmarkPoints.Keys.First(), benchmarkPoints.Keys.Last());
-                benchmarkReturns = new Series<DateTime, double>(benchmarkReturnsDictionary);
-            }
-            else
-            {
-                benchmarkReturns = new Series<DateTime, double>(benchmarkPoints);
-            }
-
-            var returns = Frame.CreateEmpty<DateTime, string>();
-            returns["strategy"] = dailyReturnsSeries;
-            returns = returns.Join("benchmark", benchmarkReturns)
-                .FillMissing(Direction.Forward)
-                .DropSparseRows();
-
-            var correlation = returns
-                .Window(windowSize)
-                .SelectValues(x => Correlation.Pearson(x["strategy"].Values, x["benchmark"].Values));
-
-            var portfolioStandardDeviation = dailyReturnsSeries.Window(windowSize).SelectValues(s => s.StdDev());
-            var benchmarkStandardDeviation = benchmarkReturns.Window(windowSize).SelectValues(s => s.StdDev());
+            var correlation = Correlation(returns, windowSize);
+            var portfolioStandardDeviation = StandardDeviation(dailyReturnsSeries, windowSize);
+            var benchmarkStandardDeviation = StandardDeviation(benchmarkReturns, windowSize);
 
             return (correlation * (portfolioStandardDeviation / benchmarkStandardDeviation))
                 .FillMissing(Direction.Forward)
                 .DropMissing();
         }
 
+        /// <summary>
+        /// Calculate the rolling correlation of the daily returns of the performance and benchmark with the given window size (in days)
+        /// </summary>
+        /// <param name="performancePoints">The performance points you want to measure the correlation for</param>
+        /// <param name="benchmarkPoints">The benchmark/points you want to calculate the correlation with</param>
+        /// <param name="windowSize">Days/window to lookback</param>
+        /// <returns>Rolling Pearson correlation</returns>
+        public static Series<DateTime, double> Correlation(SortedList<DateTime, double> performancePoints, SortedList<DateTime, double> benchmarkPoints, int windowSize = 132)
+        {
+            return Correlation(GetReturns(performancePoints, benchmarkPoints, out _, out _), windowSize);
+        }
+
+        /// <summary>
+        /// Calculate the rolling annualized volatility of the given returns with the given window size
+        /// </summary>
+        /// <param name="returns">The daily returns</param>
+        /// <param name="windowSize">Days/window to lookback</param>
+        /// <param name="tradingDayPerYear">The number of trading days per year to annualize the standard deviation</param>
+        /// <returns>Rolling annualized standard deviation</returns>
+        public static Series<DateTime, double> Volatility(Series<DateTime, double> returns, int windowSize, int tradingDayPerYear)
+        {
+            return StandardDeviation(returns, windowSize) * Math.Sqrt(tradingDayPerYear);
+        }
+
         /// <summary>
         /// Get the rolling sharpe of the given series with a lookback of <paramref name="months"/>. The risk free rate is adjustable
         /// </summary>
@@ -87,11 +89,21 @@ namespace QuantConnect.Report
             }
 
             var dailyReturns = equityCurve.ResampleEquivalence(date => date.Date, s => s.LastValue())
-                .PercentChange();
+                .PercentChange()
+                .Observations
+                .ToList();
 
             var rollingSharpeData = new List<KeyValuePair<DateTime, double>>();
             var firstDate = equityCurve.FirstKey();
 
+            // the returns between the lookback start and the date are kept in the window as both move forward
+            var window = new RollingMoments();
+            var start = 0;
+            var end = 0;
+            var sharpe = 0d;
+            var previousStart = -1;
+            var previousEnd = -1;
+
             foreach (var date in equityCurve.Keys)
             {
                 var nMonthsAgo = date.AddMonths(-months);
@@ -100,16 +112,138 @@ namespace QuantConnect.Report
                     continue;
                 }
 
-                var algoPerformanceLookback = dailyReturns.Between(nMonthsAgo, date);
-                rollingSharpeData.Add(
-                    new KeyValuePair<DateTime, double>(
-                        date,
-                        Statistics.Statistics.SharpeRatio(algoPerformanceLookback.Values.ToList(), riskFreeRate, tradingDayPerYear)
-                    )
-                );
+                for (; end < dailyReturns.Count && dailyReturns[end].Key <= date; end++)
+                {
+                    window.Add(dailyReturns[end].Value);
+                }
+                for (; start < end && dailyReturns[start].Key < nMonthsAgo; start++)
+                {
+                    window.Remove(dailyReturns[start].Value);
+                }
+
+                // the equity curve has many points per day, the sharpe only changes with the window
+                if (start != previousStart || end != previousEnd)
+                {
+                    sharpe = GetSharpeRatio(window, dailyReturns, start, end, riskFreeRate, tradingDayPerYear);
+                    previousStart = start;
+                    previousEnd = end;
+                }
+                rollingSharpeData.Add(new KeyValuePair<DateTime, double>(date, sharpe));
             }
 
             return new Series<DateTime, double>(rollingSharpeData.Select(kvp => kvp.Key), rollingSharpeData.Select(kvp => kvp.Value));
         }
+
+        /// <summary>
+        /// The <see cref="Statistics.Statistics.SharpeRatio(List{double}, double, double)"/> of the returns of the window
+        /// </summary>
+        private static double GetSharpeRatio(RollingMoments window, List<KeyValuePair<DateTime, double>> dailyReturns, int start, int end,
+            double riskFreeRate, int tradingDayPerYear)
+        {
+            if (window.HasInfiniteValues || window.PresentCount == 0)
+            {
+                return Statistics.Statistics.SharpeRatio(dailyReturns.GetRange(start, end - start).Select(kvp => kvp.Value).ToList(),
+                    riskFreeRate, tradingDayPerYear);
+            }
+
+            var annualPerformance = Math.Pow(window.MeanX + 1, tradingDayPerYear) - 1;
+            var variance = window.VarianceX;
+            var annualStandardDeviation = Math.Sqrt(variance.IsNaNOrZero() ? 0 : variance * tradingDayPerYear);
+            return Statistics.Statistics.SharpeRatio(annualPerformance, annualStandardDeviation, riskFreeRate);
+        }
+
+        /// <summary>
+        /// The daily returns of the performance and benchmark points, and their rows where both are known
+        /// </summary>
+        private static Frame<DateTime, string> GetReturns(SortedList<DateTime, double> performancePoints, SortedList<DateTime, double> benchmarkPoints,
+            out Series<DateTime, double> dailyReturnsSeries, out Series<DateTime, double> benchmarkReturns)
+        {
+            var dailyDictionary = StatisticsBuilder.PreprocessPerformanceValues(performancePoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value)));
+            dailyReturnsSeries = new Series<DateTime, double>(dailyDictionary);
+
+            if (benchmarkPoints.Count != 0)
+            {
+                var benchmarkReturnsDictionary = StatisticsBuilder.CreateBenchmarkDifferences(benchmarkPoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value)), benchmarkPoints.Keys.First(), benchmarkPoints.Keys.Last());
+                benchmarkReturns = new Series<DateTime, double>(benchmarkReturnsDictionary);
+            }
+            else
+            {
+                benchmarkReturns = new Series<DateTime, double>(benchmarkPoints);
+            }
+
+            var returns = Frame.CreateEmpty<DateTime, string>();
+            returns["strategy"] = dailyReturnsSeries;
+            return returns.Join("benchmark", benchmarkReturns)
+                .FillMissing(Direction.Forward)
+                .DropSparseRows();
+        }
+
+        /// <summary>
+        /// The Pearson correlation of the strategy and benchmark columns over windows of rows, like the Deedle
+        /// frame Window(windowSize), keyed by their last row
+        /// </summary>
+        private static Series<DateTime, double> Correlation(Frame<DateTime, string> returns, int windowSize)
+        {
+            var keys = returns.RowKeys.ToList();
+            if (keys.Count == 0)
+            {
+                return new Series<DateTime, double>(keys, new List<double>());
+            }
+
+            var strategy = returns.GetColumn<double>("strategy");
+            var benchmark = returns.GetColumn<double>("benchmark");
+            return Roll(keys, windowSize,
+                i => GetValueAt(strategy, i),
+                i => GetValueAt(benchmark, i),
+                window => window.Correlation);
+        }
+
+        /// <summary>
+        /// The sample standard deviation of the values over windows of keys, like the Deedle
+        /// series Window(windowSize), keyed by their last key
+        /// </summary>
+        private static Series<DateTime, double> StandardDeviation(Series<DateTime, double> series, int windowSize)
+        {
+            return Roll(series.Keys.ToList(), windowSize,
+                i => GetValueAt(series, i),
+                i => 0,
+                window => Math.Sqrt(window.VarianceX));
+        }
+
+        /// <summary>
+        /// Slides a window of <paramref name="windowSize"/> pairs over the keys and computes a statistic of each full window
+        /// </summary>
+        private static Series<DateTime, double> Roll(List<DateTime> keys, int windowSize, Func<int, double> getX, Func<int, double> getY,
+            Func<RollingMoments, double> statistic)
+        {
+            var windowKeys = new List<DateTime>();
+            var values = new List<double>();
+            var window = new RollingMoments();
+
+            for (var i = 0; i < keys.Count; i++)
+            {
+                window.Add(getX(i), getY(i));
+                if (i >= windowSize)
+                {
+                    window.Remove(getX(i - windowSize), getY(i - windowSize));
+                }
+                if (i >= windowSize - 1)
+                {
+                    windowKeys.Add(keys[i]);
+                    values.Add(statistic(window));
+                }
+            }
+
+            return new Series<DateTime, double>(windowKeys, values);
+        }
+
+        /// <summary>
+        /// The value at the given position, NaN if missing
+        /// </summary>
+        private static double GetValueAt(Series<DateTime, double> series, int index)
+        {
+            var value = series.TryGetAt(index);
+            return value.HasValue ? value.Value : double.NaN;
+        }
     }
 }
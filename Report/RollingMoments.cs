@@ -0,0 +1,189 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// The means, variances and covariance of the pairs of values of a sliding window, updated in constant time
+    /// when a pair enters or leaves the window. The missing values, NaN, are skipped like Deedle does and an
+    /// infinite value makes the statistics NaN while it is in the window
+    /// </summary>
+    public class RollingMoments
+    {
+        private int _presentCount;
+        private int _infiniteCount;
+        private double _meanX;
+        private double _meanY;
+        private double _sumSquaresX;
+        private double _sumSquaresY;
+        private double _coMoment;
+
+        // the trailing values that are all equal, the variance of a window of equal values is exactly zero
+        private int _equalXCount;
+        private int _equalYCount;
+        private double _lastX = double.NaN;
+        private double _lastY = double.NaN;
+
+        /// <summary>
+        /// The number of pairs in the window, including the missing ones
+        /// </summary>
+        public int Count { get; private set; }
+
+        /// <summary>
+        /// The number of pairs in the window without missing values
+        /// </summary>
+        public int PresentCount => _presentCount;
+
+        /// <summary>
+        /// True if a value of the window is infinite
+        /// </summary>
+        public bool HasInfiniteValues => _infiniteCount > 0;
+
+        /// <summary>
+        /// The mean of the first values
+        /// </summary>
+        public double MeanX => IsDefined(1) ? _meanX : double.NaN;
+
+        /// <summary>
+        /// The mean of the second values
+        /// </summary>
+        public double MeanY => IsDefined(1) ? _meanY : double.NaN;
+
+        /// <summary>
+        /// The sample variance of the first values, NaN with less than two values
+        /// </summary>
+        public double VarianceX => !IsDefined(2) ? double.NaN : IsConstantX ? 0 : Math.Max(0, _sumSquaresX) / (_presentCount - 1);
+
+        /// <summary>
+        /// The sample variance of the second values, NaN with less than two values
+        /// </summary>
+        public double VarianceY => !IsDefined(2) ? double.NaN : IsConstantY ? 0 : Math.Max(0, _sumSquaresY) / (_presentCount - 1);
+
+        /// <summary>
+        /// The sample covariance of the pairs, NaN with less than two pairs
+        /// </summary>
+        public double Covariance => !IsDefined(2) ? double.NaN : IsConstantX || IsConstantY ? 0 : _coMoment / (_presentCount - 1);
+
+        /// <summary>
+        /// The Pearson correlation of the pairs, NaN if the values of one side are all equal
+        /// </summary>
+        public double Correlation
+        {
+            get
+            {
+                var varianceX = VarianceX;
+                var varianceY = VarianceY;
+                if (double.IsNaN(varianceX) || double.IsNaN(varianceY) || varianceX == 0 || varianceY == 0)
+                {
+                    return double.NaN;
+                }
+                return Math.Max(-1, Math.Min(1, Covariance / Math.Sqrt(varianceX * varianceY)));
+            }
+        }
+
+        private bool IsConstantX => _equalXCount >= Count;
+
+        private bool IsConstantY => _equalYCount >= Count;
+
+        /// <summary>
+        /// Adds a value at the end of the window, when only the first values are of interest
+        /// </summary>
+        public void Add(double x)
+        {
+            Add(x, 0);
+        }
+
+        /// <summary>
+        /// Adds a pair at the end of the window
+        /// </summary>
+        public void Add(double x, double y)
+        {
+            Count++;
+            _equalXCount = x == _lastX ? _equalXCount + 1 : 1;
+            _equalYCount = y == _lastY ? _equalYCount + 1 : 1;
+            _lastX = x;
+            _lastY = y;
+
+            if (double.IsNaN(x) || double.IsNaN(y))
+            {
+                return;
+            }
+            if (double.IsInfinity(x) || double.IsInfinity(y))
+            {
+                _infiniteCount++;
+                return;
+            }
+
+            // Welford's update
+            _presentCount++;
+            var deltaX = x - _meanX;
+            var deltaY = y - _meanY;
+            _meanX += deltaX / _presentCount;
+            _meanY += deltaY / _presentCount;
+            _sumSquaresX += deltaX * (x - _meanX);
+            _sumSquaresY += deltaY * (y - _meanY);
+            _coMoment += deltaX * (y - _meanY);
+        }
+
+        /// <summary>
+        /// Removes a value from the start of the window, it must be the oldest value added
+        /// </summary>
+        public void Remove(double x)
+        {
+            Remove(x, 0);
+        }
+
+        /// <summary>
+        /// Removes a pair from the start of the window, it must be the oldest pair added
+        /// </summary>
+        public void Remove(double x, double y)
+        {
+            Count--;
+
+            if (double.IsNaN(x) || double.IsNaN(y))
+            {
+                return;
+            }
+            if (double.IsInfinity(x) || double.IsInfinity(y))
+            {
+                _infiniteCount--;
+                return;
+            }
+
+            if (--_presentCount == 0)
+            {
+                // starts over from exact values
+                _meanX = _meanY = _sumSquaresX = _sumSquaresY = _coMoment = 0;
+                return;
+            }
+
+            // Welford's update in reverse
+            var deltaX = x - _meanX;
+            var deltaY = y - _meanY;
+            _meanX -= deltaX / _presentCount;
+            _meanY -= deltaY / _presentCount;
+            _sumSquaresX -= deltaX * (x - _meanX);
+            _sumSquaresY -= deltaY * (y - _meanY);
+            _coMoment -= deltaX * (y - _meanY);
+        }
+
+        private bool IsDefined(int minimumCount)
+        {
+            return !HasInfiniteValues && _presentCount >= minimumCount;
+        }
+    }
+}
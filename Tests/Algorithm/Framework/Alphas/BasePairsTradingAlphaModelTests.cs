@@ -13,12 +13,17 @@
  * limitations under the License.
 */
 
+using System;
 using System.Collections.Generic;
+using System.Linq;
 using NUnit.Framework;
 using Python.Runtime;
 using QuantConnect.Algorithm;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Selection;
+using QuantConnect.Securities;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+using QuantConnect.Tests.Engine.DataFeeds;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Alphas
 {
@@ -62,5 +67,165 @@ namespace QuantConnect.Tests.Algorithm.Framework.Alphas
             Assert.Ignore("The CommonAlphaModelTests need to be refactored to support multiple securities with different prices for each security");
             return null;
         }
+
+        [Test]
+        public void PythonPairRatiosMatchTheRatioIndicators()
+        {
+            var algorithm = CreateAlgorithm();
+            var securities = new[] { "AIG", "BAC" }.Select(ticker => (Security)algorithm.AddEquity(ticker, _resolution)).ToArray();
+
+            using (Py.GIL())
+            {
+                var test = CreateTestModule().GetAttr("test_pair_ratios_match_the_ratio_indicators");
+                Assert.DoesNotThrow(() => test.Invoke(algorithm.ToPython(), SecurityChangesTests.AddedNonInternal(securities).ToPython()));
+            }
+        }
+
+        [Test]
+        public void PythonRemovedSecuritiesStopUpdatingTheirPairs()
+        {
+            var algorithm = CreateAlgorithm();
+            var securities = new[] { "AIG", "BAC", "IBM" }.Select(ticker => (Security)algorithm.AddEquity(ticker, _resolution)).ToArray();
+
+            using (Py.GIL())
+            {
+                var test = CreateTestModule().GetAttr("test_removed_securities_stop_updating_their_pairs");
+                Assert.DoesNotThrow(() => test.Invoke(algorithm.ToPython(),
+                    SecurityChangesTests.AddedNonInternal(securities).ToPython(),
+                    SecurityChangesTests.RemovedNonInternal(securities[0]).ToPython()));
+            }
+        }
+
+        private static QCAlgorithm CreateAlgorithm()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            algorithm.SetDateTime(new DateTime(2013, 10, 7, 14, 0, 0));
+            return algorithm;
+        }
+
+        private static PyModule CreateTestModule()
+        {
+            return PyModule.FromString("BasePairsTradingAlphaModelTests", @"
+from AlgorithmImports import *
+from BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
+
+class IndicatorPair:
+    '''The pair of the indicators implementation: the ratio of two identity indicators and its 500 periods EMA'''
+    def __init__(self, algorithm, asset1, asset2, prediction_interval, threshold):
+        self.state = 0
+        self.asset1 = asset1
+        self.asset2 = asset2
+        self.prediction_interval = prediction_interval
+
+        def create_identity_indicator(symbol):
+            resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
+            identity = Identity(algorithm.create_indicator_name(symbol, 'close', resolution))
+            algorithm.register_indicator(symbol, identity, algorithm.resolve_consolidator(symbol, resolution))
+            return identity
+
+        self.ratio = IndicatorExtensions.over(create_identity_indicator(asset1), create_identity_indicator(asset2))
+        self.mean = IndicatorExtensions.of(ExponentialMovingAverage(500), self.ratio)
+        self.upper_threshold = IndicatorExtensions.times(self.mean, ConstantIndicator[IndicatorDataPoint]('ct', 1 + threshold / 100))
+        self.lower_threshold = IndicatorExtensions.times(self.mean, ConstantIndicator[IndicatorDataPoint]('ct', 1 - threshold / 100))
+
+    def get_insight_group(self):
+        if not self.mean.is_ready:
+            return []
+        if self.state != 1 and self.ratio > self.upper_threshold:
+            self.state = 1
+            return Insight.group(Insight.price(self.asset1, self.prediction_interval, InsightDirection.DOWN),
+                                 Insight.price(self.asset2, self.prediction_interval, InsightDirection.UP))
+        if self.state != -1 and self.ratio < self.lower_threshold:
+            self.state = -1
+            return Insight.group(Insight.price(self.asset1, self.prediction_interval, InsightDirection.UP),
+                                 Insight.price(self.asset2, self.prediction_interval, InsightDirection.DOWN))
+        return []
+
+def get_price(symbol, step):
+    if symbol.value == 'AIG':
+        return 100 + 10 * math.sin(step / 20)
+    if symbol.value == 'BAC':
+        # a zero price leaves the ratio unchanged
+        return 0 if step == 600 else 50 + 5 * math.cos(step / 15)
+    return 75 + step / 100
+
+def feed(algorithm, symbols, step):
+    '''Sends the bar of each symbol to all its consolidators'''
+    time = algorithm.time + timedelta(minutes=step)
+    for symbol in symbols:
+        price = get_price(symbol, step)
+        bar = TradeBar(time, symbol, price, price, price, price, 100, timedelta(minutes=1))
+        for config in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol):
+            for consolidator in list(config.consolidators):
+                consolidator.update(bar)
+
+def count_consolidators(algorithm, symbol):
+    return sum(len(list(config.consolidators))
+        for config in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol))
+
+def get_directions(insights, step):
+    return [(step, str(insight.symbol), insight.direction) for insight in insights]
+
+def assert_close(name, step, expected, actual):
+    if not math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-12):
+        raise ValueError(f'{name} at step {step}: {expected} != {actual}')
+
+def test_pair_ratios_match_the_ratio_indicators(algorithm, changes):
+    model = BasePairsTradingAlphaModel(15, Resolution.MINUTE, 1)
+    model.on_securities_changed(algorithm, changes)
+    pair = next(iter(model.pairs.values()))
+    indicators = IndicatorPair(algorithm, pair.asset1, pair.asset2, model.prediction_interval, 1)
+
+    expected_insights = []
+    actual_insights = []
+    for step in range(1, 1200):
+        feed(algorithm, [pair.asset1, pair.asset2], step)
+        actual_insights.extend(get_directions(model.update(algorithm, None), step))
+        expected_insights.extend(get_directions(indicators.get_insight_group(), step))
+
+        if pair.is_ready != indicators.mean.is_ready:
+            raise ValueError(f'is_ready at step {step}: {indicators.mean.is_ready} != {pair.is_ready}')
+        assert_close('ratio', step, float(indicators.ratio.current.value), pair.ratio)
+        assert_close('mean', step, float(indicators.mean.current.value), pair.mean)
+        if indicators.mean.is_ready:
+            assert_close('upper threshold', step, float(indicators.upper_threshold.current.value), pair.upper_threshold)
+            assert_close('lower threshold', step, float(indicators.lower_threshold.current.value), pair.lower_threshold)
+
+    if not expected_insights:
+        raise ValueError('The prices must cross the thresholds')
+    if expected_insights != actual_insights:
+        raise ValueError(f'{expected_insights} != {actual_insights}')
+
+def test_removed_securities_stop_updating_their_pairs(algorithm, added, removed):
+    model = BasePairsTradingAlphaModel(15, Resolution.MINUTE, 1)
+    model.on_securities_changed(algorithm, added)
+    symbols = [security.symbol for security in added.added_securities]
+    removed_symbol = removed.removed_securities[0].symbol
+
+    # three pairs and a single consolidator per symbol
+    if len(model.pairs) != 3 or any(count_consolidators(algorithm, symbol) != 1 for symbol in symbols):
+        raise ValueError('Expected a price feed per symbol shared by its pairs')
+
+    model.on_securities_changed(algorithm, removed)
+
+    remaining = [symbol for symbol in symbols if symbol != removed_symbol]
+    if len(model.pairs) != 1 or any(removed_symbol in key for key in model.pairs):
+        raise ValueError(f'Unexpected pairs {list(model.pairs)}')
+    if count_consolidators(algorithm, removed_symbol) != 0 or any(count_consolidators(algorithm, symbol) != 1 for symbol in remaining):
+        raise ValueError('The consolidator of the removed symbol must be released')
+    if removed_symbol in model.price_feeds.slot_by_symbol or model.pair_ratios.ratio.size != 1:
+        raise ValueError('The removed symbol must not have a price feed')
+
+    # only the remaining pair is updated
+    for step in range(1, 10):
+        feed(algorithm, symbols, step)
+        model.update(algorithm, None)
+    pair = next(iter(model.pairs.values()))
+    assert_close('ratio', step, get_price(pair.asset1, step) / get_price(pair.asset2, step), pair.ratio)
+    if model.pair_ratios.samples.tolist() != [9]:
+        raise ValueError(f'Unexpected samples {model.pair_ratios.samples}')
+");
+        }
     }
 }
\ No newline at end of file
@@ -0,0 +1,72 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class IndicatorUpdateTrackerTests
+    {
+        [Test]
+        public void MarksTheSymbolsOfTheUpdatedIndicators()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Alphas.IndicatorUpdateTracker import IndicatorUpdateTracker
+
+def Test():
+    tracker = IndicatorUpdateTracker()
+    fast = ExponentialMovingAverage(2)
+    slow = ExponentialMovingAverage(4)
+    sma = SimpleMovingAverage(3)
+    tracker.track('B', fast, slow)
+    tracker.track('A', sma)
+
+    # newly tracked symbols are visited once
+    assert tracker.pop_updated() == ['B', 'A']
+    assert tracker.pop_updated() == []
+
+    time = datetime(2013, 10, 7)
+    sma.update(time, 1)
+    assert tracker.pop_updated() == ['A']
+
+    # the symbols are returned in the order they were tracked
+    sma.update(time, 2)
+    slow.update(time, 2)
+    assert tracker.pop_updated() == ['B', 'A']
+
+    # the reset does not fire the updated event
+    fast.reset()
+    assert len(tracker) == 0
+    tracker.mark('B')
+    tracker.mark('C')
+    assert tracker.pop_updated() == ['B']
+
+    tracker.untrack('B')
+    fast.update(time, 3)
+    assert 'B' not in tracker
+    tracker.mark_all()
+    assert tracker.pop_updated() == ['A']").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test());
+            }
+        }
+    }
+}
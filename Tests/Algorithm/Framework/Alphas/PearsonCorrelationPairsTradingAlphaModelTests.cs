@@ -0,0 +1,142 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class PearsonCorrelationPairsTradingAlphaModelTests
+    {
+        private PyModule _module;
+
+        [OneTimeSetUp]
+        public void SetUp()
+        {
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("PearsonCorrelationPairsTradingAlphaModelTests", @"
+from AlgorithmImports import *
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+from scipy.stats import pearsonr
+
+TICKERS = ['AIG', 'BAC', 'IBM', 'SPY', 'AAPL']
+START = datetime(2020, 1, 6, 9, 30)
+MINUTES = 400
+
+class TestSecurity:
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.exchange = type('Exchange', (), { 'time_zone': TimeZones.NEW_YORK })()
+
+class TestAlgorithm:
+    '''Serves the history of random walks, half of them sharing a common factor, up to the algorithm time'''
+    def __init__(self):
+        random = np.random.default_rng(1)
+        common = np.cumsum(random.normal(0, 1e-3, MINUTES))
+        self.symbols = { ticker: Symbol.create(ticker, SecurityType.EQUITY, Market.USA) for ticker in TICKERS }
+        self.closes = { ticker: 100 * np.exp(common * (i % 2) + np.cumsum(random.normal(0, 1e-3, MINUTES)))
+            for i, ticker in enumerate(TICKERS) }
+        self.time = START + timedelta(minutes=100)
+
+    def get_history(self, symbols, include):
+        rows = []
+        for symbol in symbols:
+            for minute in range(MINUTES):
+                time = START + timedelta(minutes=minute)
+                if include(time):
+                    rows.append((str(symbol.id), time, self.closes[symbol.value][minute]))
+        return pd.DataFrame(rows, columns=['symbol', 'time', 'close']).set_index(['symbol', 'time'])
+
+    def history(self, symbols, *args):
+        if len(args) == 2:
+            count, resolution = args
+            return self.get_history(symbols, lambda time: time <= self.time).groupby(level=0).tail(count)
+        start, end, resolution = args
+        return self.get_history(symbols, lambda time: start < time <= end)
+
+def set_universe(model, algorithm, tickers):
+    symbols = sorted([ algorithm.symbols[ticker] for ticker in tickers ])
+    model.securities = { TestSecurity(symbol) for symbol in symbols }
+    return symbols
+
+def get_pairwise_best_pair(model, algorithm, tickers):
+    '''The pair selected by the previous implementation, the pearson correlation of every pair of columns one by one'''
+    symbols = set_universe(model, algorithm, tickers)
+    history = algorithm.history(symbols, model.lookback, model.resolution).close.unstack(level=0)
+    df = model.get_price_dataframe(history)
+    corr = dict()
+    for i in range(0, len(df.columns)):
+        for j in range(i + 1, len(df.columns)):
+            corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
+    corr = sorted(corr.items(), key = lambda kv: kv[1])
+    return (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+
+def get_best_pair(model, algorithm, tickers):
+    symbols = set_universe(model, algorithm, tickers)
+    model.update_correlation_matrix(algorithm, symbols)
+    return model.get_pair_symbols(model.get_top_pairs(model.correlation, 1)[0][0], symbols)
+
+def test_vectorized_correlation_selects_the_pairwise_best_pair():
+    algorithm = TestAlgorithm()
+    for count in range(2, len(TICKERS) + 1):
+        model = PearsonCorrelationPairsTradingAlphaModel(lookback = 60)
+        expected = get_pairwise_best_pair(model, algorithm, TICKERS[:count])
+        actual = get_best_pair(model, algorithm, TICKERS[:count])
+        if expected != actual:
+            raise ValueError(f'{count} symbols: {expected} != {actual}')
+
+        # the top pairs are sorted by descending correlation
+        top_pairs = model.get_top_pairs(model.correlation, 10)
+        correlations = [ x[1] for x in top_pairs ]
+        if len(top_pairs) != count * (count - 1) // 2 or correlations != sorted(correlations, reverse = True):
+            raise ValueError(f'Unexpected top pairs {top_pairs}')
+
+def test_incremental_correlation_matches_the_full_computation():
+    algorithm = TestAlgorithm()
+    full = PearsonCorrelationPairsTradingAlphaModel(lookback = 60)
+    incremental = PearsonCorrelationPairsTradingAlphaModel(lookback = 60, incremental = True)
+    tickers = TICKERS[:3]
+    changes = [ None, ('add', 'SPY'), ('remove', 'BAC'), ('add', 'AAPL'), None ]
+    for step, change in enumerate(changes):
+        if change is not None:
+            (tickers.append if change[0] == 'add' else tickers.remove)(change[1])
+        # the window of the incremental model moves forward with the algorithm time
+        algorithm.time += timedelta(minutes = 17 * step)
+
+        expected = get_pairwise_best_pair(PearsonCorrelationPairsTradingAlphaModel(lookback = 60), algorithm, tickers)
+        actual = get_best_pair(incremental, algorithm, tickers)
+        if expected != actual or get_best_pair(full, algorithm, tickers) != actual:
+            raise ValueError(f'Step {step}: {expected} != {actual}')
+
+        correlation = incremental.correlation.loc[full.correlation.index, full.correlation.columns]
+        if not np.allclose(full.correlation.values, correlation.values) or not incremental.prices.index.equals(full.prices.index):
+            raise ValueError(f'Step {step}: the incremental correlation differs from the full one')
+");
+            }
+        }
+
+        [TestCase("test_vectorized_correlation_selects_the_pairwise_best_pair")]
+        [TestCase("test_incremental_correlation_matches_the_full_computation")]
+        public void PythonCorrelationMatchesThePairwiseImplementation(string test)
+        {
+            using (Py.GIL())
+            {
+                Assert.DoesNotThrow(() => _module.GetAttr(test).Invoke());
+            }
+        }
+    }
+}
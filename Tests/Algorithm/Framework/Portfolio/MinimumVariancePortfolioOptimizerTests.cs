@@ -14,9 +14,11 @@
 */
 
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Algorithm.Framework.Portfolio;
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
@@ -177,5 +179,66 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
 
             Assert.AreEqual(expectedResult, result);
         }
+
+        [TestCase(0)]
+        [TestCase(1)]
+        [TestCase(2)]
+        [TestCase(3)]
+        [TestCase(4)]
+        [TestCase(5)]
+        [TestCase(6)]
+        [TestCase(7)]
+        public void PythonClosedFormMatchesIterativeSolver(int testCaseNumber)
+        {
+            var targetReturn = _targetReturns.TryGetValue(testCaseNumber, out var value) ? value : 0.02;
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+
+def Test(target_return):
+    historical_returns = pd.DataFrame({ToPythonLiteral(HistoricalReturns[testCaseNumber])})
+    expected_returns = {ToPythonLiteral(ExpectedReturns[testCaseNumber])}
+    expected_returns = None if expected_returns is None else pd.Series(expected_returns)
+    covariance = {ToPythonLiteral(Covariances[testCaseNumber])}
+    covariance = None if covariance is None else pd.DataFrame(covariance)
+
+    fast = MinimumVariancePortfolioOptimizer(target_return = target_return, use_closed_form = True, warm_start = True)
+    iterative = MinimumVariancePortfolioOptimizer(target_return = target_return)
+    expected = iterative.optimize(historical_returns, expected_returns, covariance)
+    actual = fast.optimize(historical_returns, expected_returns, covariance)
+    if not np.allclose(expected, actual, atol = 1e-3):
+        raise ValueError(f'{{expected}} != {{actual}}')
+    if fast.last_method not in ['KKT', 'SLSQP'] or iterative.last_method != 'SLSQP' or iterative.last_iterations == 0:
+        raise ValueError('Unexpected solver statistics')
+
+    # warm started from its own solution, the optimizer must land on the same weights
+    again = fast.optimize(historical_returns, expected_returns, covariance)
+    if not np.allclose(actual, again, atol = 1e-3) or fast.optimization_count != 2:
+        raise ValueError(f'{{actual}} != {{again}}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(targetReturn));
+            }
+        }
+
+        private static string ToPythonLiteral(double[] values)
+        {
+            return values == null ? "None" : $"[{string.Join(", ", values.Select(x => x.ToString(CultureInfo.InvariantCulture)))}]";
+        }
+
+        private static string ToPythonLiteral(double[,] values)
+        {
+            if (values == null)
+            {
+                return "None";
+            }
+
+            var rows = Enumerable.Range(0, values.GetLength(0))
+                .Select(i => ToPythonLiteral(Enumerable.Range(0, values.GetLength(1)).Select(j => values[i, j]).ToArray()));
+            return $"[{string.Join(", ", rows)}]";
+        }
     }
 }
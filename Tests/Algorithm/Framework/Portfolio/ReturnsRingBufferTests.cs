@@ -0,0 +1,82 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class ReturnsRingBufferTests
+    {
+        [TestCase(1)]
+        [TestCase(4)]
+        [TestCase(63)]
+        public void KeepsTheLastReturnsInChronologicalOrder(int size)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.ReturnsRingBuffer import ReturnsRingBuffer
+
+def Test(size):
+    window = RollingWindow[IndicatorDataPoint](size)
+    buffer = ReturnsRingBuffer(size)
+    for i in range(3 * size + 1):
+        time = datetime(2020, 1, 1) + timedelta(i)
+        window.add(IndicatorDataPoint(Symbol.EMPTY, time, i / 100))
+        buffer.add(time, i / 100)
+
+        expected = pd.Series([x.value for x in window], index = [x.end_time for x in window]).sort_index()
+        actual = buffer.to_series()
+        if not np.allclose(expected.values, actual.values) or list(expected.index) != list(actual.index):
+            raise ValueError(f'Returns mismatch at {i}')
+        if window.is_ready != buffer.is_ready or window.samples != buffer.samples:
+            raise ValueError(f'State mismatch at {i}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(size));
+            }
+        }
+
+        [TestCase(true)]
+        [TestCase(false)]
+        public void StackMatchesDataFrameOfSeries(bool aligned)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.ReturnsRingBuffer import ReturnsRingBuffer
+
+def Test(aligned):
+    buffers = {}
+    for j in range(5):
+        buffer = buffers[f'S{j}'] = ReturnsRingBuffer(10)
+        for i in range(15 if aligned else 12 + j):
+            buffer.add(datetime(2020, 1, 1) + timedelta(i), (i + 1) * (j + 1) / 100)
+
+    expected = pd.DataFrame({ label: buffer.to_series() for label, buffer in buffers.items() })
+    actual = ReturnsRingBuffer.stack(buffers)
+    if not np.allclose(expected.values, actual.values, equal_nan = True) or not expected.columns.equals(actual.columns):
+        raise ValueError('Stack mismatch')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(aligned));
+            }
+        }
+    }
+}
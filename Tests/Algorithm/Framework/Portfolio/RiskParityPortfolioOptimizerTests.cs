@@ -15,9 +15,11 @@
 
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using Accord.Math;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Algorithm.Framework.Portfolio;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
@@ -136,6 +138,54 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(expected, result);
         }
 
+        [Test]
+        public void PythonWarmStartMatchesColdStart()
+        {
+            var cases = Enumerable.Range(1, 8).ToList();
+            var covariances = string.Join(", ", cases.Select(i => ToPythonLiteral(_covariances[i])));
+            var budgets = string.Join(", ", cases.Select(i => ToPythonLiteral(_riskBudgets[i])));
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def Test():
+    warm = RiskParityPortfolioOptimizer()
+    for covariance, budget in zip([{covariances}], [{budgets}]):
+        covariance = pd.DataFrame(covariance, index = ['A', 'B'], columns = ['A', 'B'])
+        expected = RiskParityPortfolioOptimizer(warm_start = False).optimize(None, budget, covariance)
+        actual = warm.optimize(None, budget, covariance)
+        if not np.allclose(expected, actual, atol = 1e-5):
+            raise ValueError(f'{{expected}} != {{actual}}')
+
+    # the same covariance and budget do not need to be solved again
+    again = warm.optimize(None, budget, covariance.copy())
+    if not warm.last_solve_skipped or not np.array_equal(actual, again):
+        raise ValueError('The optimization was not skipped')
+
+    # a new asset starts from the mean of the previous solution
+    covariance = pd.DataFrame(np.diag([0.04, 0.09, 0.01]), index = ['A', 'B', 'C'], columns = ['A', 'B', 'C'])
+    actual = warm.optimize(None, None, covariance)
+    if warm.last_solve_skipped or not np.allclose(actual, [0.3 / 1.1, 0.2 / 1.1, 0.6 / 1.1], atol = 1e-5):
+        raise ValueError(f'Unexpected weights {{actual}}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test());
+            }
+        }
+
+        private static string ToPythonLiteral(double[] values)
+        {
+            return $"[{string.Join(", ", values.Select(x => x.ToString(CultureInfo.InvariantCulture)))}]";
+        }
+
+        private static string ToPythonLiteral(double[][] values)
+        {
+            return $"[{string.Join(", ", values.Select(ToPythonLiteral))}]";
+        }
+
         private T[,] JaggedArrayTo2DArray<T>(T[][] source)
         {
             int FirstDim = source.Length;
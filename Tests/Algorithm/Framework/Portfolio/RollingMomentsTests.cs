@@ -0,0 +1,99 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class RollingMomentsTests
+    {
+        [TestCase(5, 2)]
+        [TestCase(63, 16)]
+        public void MomentsMatchPandasDataFrameOfAlignedWindows(int period, int capacity)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.RollingMoments import RollingMoments
+
+def Test(period, capacity):
+    rng = np.random.default_rng(7)
+    moments = RollingMoments(period, capacity)
+    windows = {}
+    for step in range(1000):
+        symbol = f'S{rng.integers(0, 8)}'
+        # symbols leave the universe from time to time
+        if rng.random() < 0.02 and symbol in windows:
+            moments.remove(symbol)
+            del windows[symbol]
+            continue
+        # most observations are aligned, some are late or repeated
+        time = datetime(2020, 1, 1) + timedelta(int(rng.integers(0, step // 3 + 1)) if rng.random() < 0.2 else step // 3)
+        value = float(rng.normal(0.001, 0.02))
+
+        window = windows.setdefault(symbol, [])
+        existing = [i for i, (t, _) in enumerate(window) if t == time]
+        if existing:
+            window.pop(existing[0])
+        elif len(window) == period:
+            window.pop(0)
+        window.append((time, value))
+        moments.add(symbol, time, value)
+
+    symbols = sorted(windows)
+    returns = pd.DataFrame({ s: pd.Series([x[1] for x in windows[s]], index = [x[0] for x in windows[s]]) for s in symbols })
+    if not np.allclose(returns.mean().values, moments.mean(symbols).values, equal_nan = True):
+        raise ValueError('Mean mismatch')
+    if not np.allclose(returns.cov().values, moments.covariance(symbols).values, equal_nan = True):
+        raise ValueError('Covariance mismatch')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(period, capacity));
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(16)]
+        public void SymbolsWithoutObservationsHaveNaNMoments(int capacity)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.RollingMoments import RollingMoments
+
+def Test(capacity):
+    moments = RollingMoments(5, capacity)
+    for i, (a, b) in enumerate([(0.1, 0.2), (0.3, 0.1), (-0.2, 0.05)]):
+        moments.add('A', datetime(2020, 1, 1 + i), a)
+        moments.add('B', datetime(2020, 1, 1 + i), b)
+    symbols = ['A', 'C', 'B']
+    returns = pd.DataFrame({ 'A': [0.1, 0.3, -0.2], 'C': [np.nan] * 3, 'B': [0.2, 0.1, 0.05] })
+    if not np.allclose(returns.mean().values, moments.mean(symbols).values, equal_nan = True):
+        raise ValueError('Mean mismatch')
+    if not np.allclose(returns.cov().values, moments.covariance(symbols).values, equal_nan = True):
+        raise ValueError('Covariance mismatch')
+    if not moments.covariance(['C']).isna().all().all():
+        raise ValueError('Expected NaN covariance')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(capacity));
+            }
+        }
+    }
+}
@@ -16,10 +16,14 @@
 using System;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading;
 using NUnit.Framework;
 using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework;
 using QuantConnect.Algorithm.Framework.Alphas;
+using QuantConnect.Algorithm.Framework.Execution;
 using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Algorithm.Framework.Risk;
 using QuantConnect.Algorithm.Framework.Selection;
 using QuantConnect.Data;
 using QuantConnect.Data.Market;
@@ -112,6 +116,67 @@ namespace QuantConnect.Tests.Algorithm.Framework
             Assert.AreEqual(expectedCount, actualInsights.Count);
         }
 
+        [TestCase(true)]
+        [TestCase(false)]
+        public void ProfilesFrameworkStages(bool enabled)
+        {
+            var algo = new QCAlgorithm();
+            algo.SubscriptionManager.SetDataManager(new DataManagerStub(algo));
+            algo.Transactions.SetOrderProcessor(new FakeOrderProcessor());
+            var security = algo.AddEquity("SPY");
+            algo.SetAlpha(new FakeAlpha { Name = "FakeAlpha" });
+            algo.SetPortfolioConstruction(new FakePortfolioConstruction());
+            algo.FrameworkProfiler.Enabled = enabled;
+
+            var tick = new Tick { Symbol = security.Symbol, Value = 1, Quantity = 2 };
+            security.SetMarketPrice(tick);
+            for (var i = 0; i < 3; i++)
+            {
+                algo.OnFrameworkData(new Slice(new DateTime(2000, 01, 01), algo.Securities.Select(s => tick), new DateTime(2000, 01, 01)));
+            }
+
+            var statistics = algo.FrameworkProfiler.GetStatistics();
+            if (!enabled)
+            {
+                Assert.IsEmpty(statistics);
+                return;
+            }
+
+            var stages = statistics.ToDictionary(x => x.Stage);
+            Assert.AreEqual("FakeAlpha", stages[FrameworkProfiler.AlphaUpdate].Model);
+            Assert.AreEqual(nameof(FakePortfolioConstruction), stages[FrameworkProfiler.CreateTargets].Model);
+            Assert.AreEqual(nameof(NullRiskManagementModel), stages[FrameworkProfiler.ManageRisk].Model);
+            Assert.AreEqual(nameof(ImmediateExecutionModel), stages[FrameworkProfiler.Execute].Model);
+            foreach (var stage in statistics)
+            {
+                Assert.AreEqual(3, stage.Count);
+                Assert.Greater(stage.TotalMilliseconds, 0);
+                Assert.LessOrEqual(stage.MedianMilliseconds, stage.P99Milliseconds);
+                Assert.LessOrEqual(stage.P99Milliseconds, stage.MaximumMilliseconds);
+            }
+            Assert.AreEqual(4, algo.FrameworkProfiler.GetRuntimeStatistics().Count);
+        }
+
+        [Test]
+        public void ProfilesTheTimeOfEachCompositeAlphaModel()
+        {
+            var algo = new QCAlgorithm();
+            algo.FrameworkProfiler.Enabled = true;
+            var eager = new SleepingAlpha { Name = "Eager", Milliseconds = 20 };
+            var lazy = new FakeAlpha { Name = "Lazy" };
+            var composite = new CompositeAlphaModel(eager, lazy);
+
+            var insights = composite.Update(algo, new Slice(new DateTime(2000, 01, 01), new List<BaseData>(), new DateTime(2000, 01, 01))).ToList();
+
+            Assert.AreEqual(2, insights.Count);
+            var models = algo.FrameworkProfiler.GetStatistics()
+                .Where(x => x.Stage == FrameworkProfiler.AlphaUpdate)
+                .ToDictionary(x => x.Model);
+            // the update of a model returning a list is recorded, not only the enumeration of the list
+            Assert.GreaterOrEqual(models["Eager"].TotalMilliseconds, 15);
+            Assert.AreEqual(1, models["Lazy"].Count);
+        }
+
         class FakeAlpha : AlphaModel
         {
             public override IEnumerable<Insight> Update(QCAlgorithm algorithm, Slice data)
@@ -120,6 +185,17 @@ namespace QuantConnect.Tests.Algorithm.Framework
             }
         }
 
+        class SleepingAlpha : AlphaModel
+        {
+            public int Milliseconds { get; set; }
+
+            public override IEnumerable<Insight> Update(QCAlgorithm algorithm, Slice data)
+            {
+                Thread.Sleep(Milliseconds);
+                return new List<Insight> { Insight.Price(Symbols.SPY, TimeSpan.FromDays(1), InsightDirection.Down) };
+            }
+        }
+
         class FakePortfolioConstruction : PortfolioConstructionModel
         {
             public IReadOnlyCollection<Insight> Insights { get; private set; }
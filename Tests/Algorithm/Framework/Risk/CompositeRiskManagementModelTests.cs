@@ -0,0 +1,101 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Algorithm.Framework.Risk;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Risk
+{
+    [TestFixture]
+    public class CompositeRiskManagementModelTests
+    {
+        private static readonly Symbol A = Symbol.Create("A", SecurityType.Equity, Market.USA);
+        private static readonly Symbol B = Symbol.Create("B", SecurityType.Equity, Market.USA);
+        private static readonly Symbol C = Symbol.Create("C", SecurityType.Equity, Market.USA);
+        private static readonly Symbol D = Symbol.Create("D", SecurityType.Equity, Market.USA);
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void MergesTheTargetsOfEachModelGivingPreferenceToNewerTargets(Language language)
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SetPandasConverter();
+
+            var first = new FixedTargetsRiskManagementModel(new PortfolioTarget(B, 5));
+            var second = new FixedTargetsRiskManagementModel();
+            // the first target of a symbol wins within the targets of a model
+            var third = new FixedTargetsRiskManagementModel(new PortfolioTarget(C, 0), new PortfolioTarget(D, 1), new PortfolioTarget(C, 7));
+
+            IRiskManagementModel model;
+            if (language == Language.Python)
+            {
+                using (Py.GIL())
+                {
+                    const string name = nameof(CompositeRiskManagementModel);
+                    var instance = Py.Import(name).GetAttr(name).Invoke(first.ToPython(), second.ToPython(), third.ToPython());
+                    model = new RiskManagementModelPythonWrapper(instance);
+                }
+            }
+            else
+            {
+                model = new CompositeRiskManagementModel(first, second, third);
+            }
+
+            var targets = new IPortfolioTarget[]
+            {
+                new PortfolioTarget(A, 10),
+                new PortfolioTarget(B, 20),
+                new PortfolioTarget(C, 30),
+                new PortfolioTarget(A, 40)
+            };
+            var riskAdjusted = model.ManageRisk(algorithm, targets).ToDictionary(target => target.Symbol, target => target.Quantity);
+
+            // each model receives the distinct targets adjusted by the previous ones
+            CollectionAssert.AreEquivalent(new[] { A, B, C }, first.Targets.Select(target => target.Symbol));
+            CollectionAssert.AreEquivalent(new decimal[] { 10, 5, 30 }, second.Targets.Select(target => target.Quantity));
+            CollectionAssert.AreEquivalent(new decimal[] { 10, 5, 30 }, third.Targets.Select(target => target.Quantity));
+
+            Assert.AreEqual(4, riskAdjusted.Count);
+            Assert.AreEqual(10, riskAdjusted[A]);
+            Assert.AreEqual(5, riskAdjusted[B]);
+            Assert.AreEqual(0, riskAdjusted[C]);
+            Assert.AreEqual(1, riskAdjusted[D]);
+        }
+
+        private class FixedTargetsRiskManagementModel : RiskManagementModel
+        {
+            private readonly IPortfolioTarget[] _riskAdjusted;
+
+            public IPortfolioTarget[] Targets { get; private set; }
+
+            public FixedTargetsRiskManagementModel(params IPortfolioTarget[] riskAdjusted)
+            {
+                _riskAdjusted = riskAdjusted;
+            }
+
+            public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
+            {
+                Targets = targets;
+                return _riskAdjusted.ToList();
+            }
+        }
+    }
+}
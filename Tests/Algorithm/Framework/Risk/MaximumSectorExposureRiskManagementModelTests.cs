@@ -0,0 +1,269 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using NodaTime;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Algorithm.Framework.Risk;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.Market;
+using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Interfaces;
+using QuantConnect.Logging;
+using QuantConnect.Securities;
+using QuantConnect.Securities.Equity;
+using QuantConnect.Tests.Common.Data.Fundamental;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Risk
+{
+    [TestFixture]
+    public class MaximumSectorExposureRiskManagementModelTests
+    {
+        private readonly Dictionary<SecurityIdentifier, string> _industryTemplateCodes = new();
+
+        [OneTimeSetUp]
+        public void SetUp()
+        {
+            FundamentalService.Initialize(TestGlobals.DataProvider, new TestFundamentalDataProvider(_industryTemplateCodes), false);
+        }
+
+        [OneTimeTearDown]
+        public void TearDown()
+        {
+            FundamentalService.Initialize(TestGlobals.DataProvider, new NullFundamentalDataProvider(), false);
+        }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ReducesTheSectorsAboveTheMaximumExposure(Language language)
+        {
+            var algorithm = CreateAlgorithm();
+            var a1 = AddSecurity(algorithm, "A01", "A", 150);
+            var a2 = AddSecurity(algorithm, "A02", "A", 100);
+            AddSecurity(algorithm, "A03", "A", 0);
+            var b1 = AddSecurity(algorithm, "B01", "B", 50);
+            var b2 = AddSecurity(algorithm, "B02", "B", 0);
+            AddSecurity(algorithm, "C01", "C", 100);
+            // without fundamental data, it is ignored
+            AddSecurity(algorithm, "XXX", null, 100);
+            // 50000 of holdings
+            algorithm.Portfolio.SetCash(50000);
+
+            var model = CreateModel(language, 0.2m);
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(algorithm.Securities.Values.ToArray()));
+
+            // sector A holds 25000 and sector B 5000 and a target of 30000, the maximum is 20000
+            var targets = model.ManageRisk(algorithm, new IPortfolioTarget[] { new PortfolioTarget(b2, 300) })
+                .ToDictionary(target => target.Symbol, target => (double)target.Quantity);
+
+            Assert.AreEqual(4, targets.Count);
+            Assert.AreEqual(120, targets[a1], 1e-6);
+            Assert.AreEqual(80, targets[a2], 1e-6);
+            Assert.AreEqual(50 / 1.75, targets[b1], 1e-6);
+            Assert.AreEqual(300 / 1.75, targets[b2], 1e-6);
+
+            // the target of B02 is cancelled, sector B is below the maximum
+            targets = model.ManageRisk(algorithm, new IPortfolioTarget[] { new PortfolioTarget(b2, 0) })
+                .ToDictionary(target => target.Symbol, target => (double)target.Quantity);
+
+            CollectionAssert.AreEquivalent(new[] { a1, a2 }, targets.Keys);
+
+            // sector A is removed from the universe
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(
+                algorithm.Securities.Values.Where(security => security.Symbol.Value.StartsWith("A")).ToArray()));
+
+            Assert.IsEmpty(model.ManageRisk(algorithm, Array.Empty<IPortfolioTarget>()));
+        }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void EmitsTheTargetsBySectorAndSymbol(Language language)
+        {
+            var algorithm = CreateAlgorithm();
+            // the securities are added out of order, every sector is above the maximum
+            var b2 = AddSecurity(algorithm, "B02", "B", 100);
+            var a2 = AddSecurity(algorithm, "A02", "A", 100);
+            var c1 = AddSecurity(algorithm, "C01", "C", 100);
+            var b1 = AddSecurity(algorithm, "B01", "B", 100);
+            var a1 = AddSecurity(algorithm, "A01", "A", 100);
+            algorithm.Portfolio.SetCash(50000);
+
+            var model = CreateModel(language, 0.01m);
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(algorithm.Securities.Values.ToArray()));
+
+            var targets = model.ManageRisk(algorithm, Array.Empty<IPortfolioTarget>()).Select(target => target.Symbol);
+
+            CollectionAssert.AreEqual(new[] { a1, a2, b1, b2, c1 }, targets);
+        }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ForgetsTheTargetsOfTheRemovedSecurities(Language language)
+        {
+            var algorithm = CreateAlgorithm();
+            AddSecurity(algorithm, "A01", "A", 0);
+            var b1 = AddSecurity(algorithm, "B01", "B", 0);
+            algorithm.Portfolio.SetCash(50000);
+
+            var model = CreateModel(language, 0.2m);
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(algorithm.Securities.Values.ToArray()));
+
+            // a target of 30000 for sector B, the maximum is 10000
+            var targets = model.ManageRisk(algorithm, new IPortfolioTarget[] { new PortfolioTarget(b1, 300) }).ToList();
+            Assert.AreEqual(1, targets.Count);
+
+            // the security leaves the universe and comes back without a new target or holdings
+            var security = algorithm.Securities[b1];
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(security));
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(security));
+
+            Assert.IsEmpty(model.ManageRisk(algorithm, Array.Empty<IPortfolioTarget>()));
+        }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ThrowsWithoutFundamentalData(Language language)
+        {
+            var algorithm = CreateAlgorithm();
+            AddSecurity(algorithm, "XXX", null, 0);
+
+            var model = CreateModel(language, 0.2m);
+            var changes = SecurityChangesTests.AddedNonInternal(algorithm.Securities.Values.ToArray());
+
+            Assert.That(() => model.OnSecuritiesChanged(algorithm, changes), Throws.Exception);
+        }
+
+        [Explicit("Benchmark, reports the time of a call over a 1000 securities universe")]
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ManageRiskBenchmark(Language language)
+        {
+            const int sectorCount = 10;
+            const int securityCount = 1000;
+            const int investedCount = 50;
+            const int iterations = 1000;
+
+            var algorithm = CreateAlgorithm();
+            for (var i = 0; i < securityCount; i++)
+            {
+                AddSecurity(algorithm, $"S{i:D4}", $"{i % sectorCount}", i < investedCount ? 100 : 0);
+            }
+            algorithm.Portfolio.SetCash(1000000);
+
+            var model = CreateModel(language, 0.05m);
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(algorithm.Securities.Values.ToArray()));
+
+            // the portfolio construction model only emits the targets of a few securities at each time step
+            var symbols = algorithm.Securities.Keys.ToList();
+            var targets = Enumerable.Range(0, iterations)
+                .Select(i => new IPortfolioTarget[] { new PortfolioTarget(symbols[i % securityCount], 100) })
+                .ToList();
+
+            var stopwatch = Stopwatch.StartNew();
+            var riskTargets = 0;
+            foreach (var target in targets)
+            {
+                riskTargets += model.ManageRisk(algorithm, target).Count();
+            }
+            stopwatch.Stop();
+
+            Log.Trace($"{language} MaximumSectorExposureRiskManagementModel.ManageRisk(): {securityCount} securities, " +
+                $"{stopwatch.Elapsed.TotalMilliseconds * 1000 / iterations:F1}us per call, {riskTargets} risk targets");
+        }
+
+        private static QCAlgorithm CreateAlgorithm()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SetPandasConverter();
+            algorithm.SetDateTime(new DateTime(2020, 1, 6, 15, 0, 0));
+            return algorithm;
+        }
+
+        private Symbol AddSecurity(QCAlgorithm algorithm, string ticker, string industryTemplateCode, decimal quantity)
+        {
+            const decimal price = 100m;
+            var symbol = Symbol.Create(ticker, SecurityType.Equity, Market.USA);
+            var security = new Equity(
+                symbol,
+                SecurityExchangeHours.AlwaysOpen(DateTimeZone.Utc),
+                new Cash(Currencies.USD, 0, 1),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache()
+            );
+            if (industryTemplateCode != null)
+            {
+                _industryTemplateCodes[symbol.ID] = industryTemplateCode;
+            }
+
+            algorithm.Securities.Add(symbol, security);
+            security.SetMarketPrice(new Tick(algorithm.Time, symbol, price, price));
+            security.Holdings.SetHoldings(price, quantity);
+            return symbol;
+        }
+
+        private static IRiskManagementModel CreateModel(Language language, decimal maximumSectorExposure)
+        {
+            if (language == Language.Python)
+            {
+                using (Py.GIL())
+                {
+                    const string name = nameof(MaximumSectorExposureRiskManagementModel);
+                    var instance = Py.Import(name).GetAttr(name).Invoke(maximumSectorExposure.ToPython());
+                    return new RiskManagementModelPythonWrapper(instance);
+                }
+            }
+            return new MaximumSectorExposureRiskManagementModel(maximumSectorExposure);
+        }
+
+        private class TestFundamentalDataProvider : IFundamentalDataProvider
+        {
+            private readonly Dictionary<SecurityIdentifier, string> _industryTemplateCodes;
+
+            public TestFundamentalDataProvider(Dictionary<SecurityIdentifier, string> industryTemplateCodes)
+            {
+                _industryTemplateCodes = industryTemplateCodes;
+            }
+
+            public T Get<T>(DateTime time, SecurityIdentifier securityIdentifier, FundamentalProperty name)
+            {
+                if (_industryTemplateCodes.TryGetValue(securityIdentifier, out var industryTemplateCode))
+                {
+                    switch (name)
+                    {
+                        case FundamentalProperty.HasFundamentalData:
+                            return (T)(object)true;
+                        case FundamentalProperty.CompanyReference_IndustryTemplateCode:
+                            return (T)(object)industryTemplateCode;
+                    }
+                }
+                return default;
+            }
+
+            public void Initialize(IDataProvider dataProvider, bool liveMode)
+            {
+            }
+        }
+    }
+}
@@ -0,0 +1,145 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Selection
+{
+    [TestFixture]
+    public class IndicatorBankTests
+    {
+        [Test]
+        public void MatchesTheLeanIndicators()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Selection.IndicatorBank import *
+
+def Test():
+    rng = np.random.default_rng(11)
+    bank = IndicatorBank(capacity = 4)
+    bank.add('sma', SimpleMovingAverages(4))
+    bank.add('ema', ExponentialMovingAverages(5))
+    bank.add('rsi', RelativeStrengthIndexes(3))
+    bank.add('macd', MovingAverageConvergenceDivergences(3, 6, 4))
+
+    symbols = [ f'S{i}' for i in range(20) ]
+    indicators = {}
+    time = datetime(2013, 10, 7)
+    for step in range(100):
+        time += timedelta(1)
+        updated = [ symbol for symbol in symbols if rng.random() < 0.7 ]
+        values = 100 + rng.normal(0, 1, len(updated)).cumsum()
+        if step == 50:
+            bank.remove('S1')
+            indicators.pop('S1', None)
+
+        slots = bank.update(updated, values)
+        for symbol, slot, value in zip(updated, slots, values):
+            if symbol not in indicators:
+                indicators[symbol] = [ SimpleMovingAverage(4), ExponentialMovingAverage(5),
+                    RelativeStrengthIndex(3, MovingAverageType.WILDERS), MovingAverageConvergenceDivergence(3, 6, 4) ]
+            sma, ema, rsi, macd = indicators[symbol]
+            for indicator in indicators[symbol]:
+                indicator.update(time, value)
+
+            for name, indicator in [('sma', sma), ('ema', ema), ('rsi', rsi), ('macd', macd)]:
+                if not np.isclose(bank[name].current[slot], float(indicator.current.value)):
+                    raise ValueError(f'{name} {symbol}: {bank[name].current[slot]} != {indicator.current.value}')
+                if bank[name].is_ready[slot] != indicator.is_ready:
+                    raise ValueError(f'{name} {symbol}: readiness {bank[name].is_ready[slot]} != {indicator.is_ready}')
+            if not np.isclose(bank['macd'].histogram[slot], float(macd.histogram.current.value)):
+                raise ValueError(f'histogram {symbol}: {bank[""macd""].histogram[slot]} != {macd.histogram.current.value}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test());
+            }
+        }
+
+        [Test]
+        public void EmaCrossSelectionMatchesThePerSymbolIndicators()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Selection.EmaCrossUniverseSelectionModel import EmaCrossUniverseSelectionModel
+
+class TestFundamental:
+    def __init__(self, symbol, end_time, adjusted_price):
+        self.symbol = symbol
+        self.end_time = end_time
+        self.adjusted_price = adjusted_price
+
+def Test():
+    rng = np.random.default_rng(5)
+    indicators = EmaCrossUniverseSelectionModel(5, 15, 10)
+    bank = EmaCrossUniverseSelectionModel(5, 15, 10, useIndicatorBank = True)
+    symbols = [ f'S{i}' for i in range(40) ]
+    prices = dict.fromkeys(symbols, 100.0)
+    time = datetime(2013, 10, 7)
+    selections = 0
+    for step in range(60):
+        time += timedelta(1)
+        fundamental = []
+        for symbol in symbols:
+            # some symbols miss a day, like the ones without a trade
+            if rng.random() < 0.9:
+                prices[symbol] *= float(np.exp(rng.normal(0.002, 0.02)))
+                fundamental.append(TestFundamental(symbol, time, prices[symbol]))
+
+        expected = indicators.select_coarse(None, fundamental)
+        actual = bank.select_coarse(None, fundamental)
+        if actual != expected:
+            raise ValueError(f'Step {step}: {actual} != {expected}')
+        selections += len(expected) > 0
+    if selections == 0:
+        raise ValueError('Expected selected symbols')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test());
+            }
+        }
+
+        [Test]
+        public void TopKeepsTheOrderOfEqualScores()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Selection.IndicatorBank import IndicatorBank
+
+def Test():
+    bank = IndicatorBank()
+    symbols = [ f'S{i}' for i in range(30) ]
+    slots = bank.get_slots(symbols)
+    rng = np.random.default_rng(3)
+    for count in range(1, 35):
+        scores = rng.integers(0, 5, len(symbols)).astype(float)
+        expected = [ symbols[i] for i in sorted(range(len(symbols)), key = lambda i: scores[i], reverse = True)[:count] ]
+        actual = bank.top(slots, scores, count)
+        if actual != expected:
+            raise ValueError(f'{actual} != {expected}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test());
+            }
+        }
+    }
+}
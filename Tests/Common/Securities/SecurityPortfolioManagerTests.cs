@@ -680,6 +680,97 @@ namespace QuantConnect.Tests.Common.Securities
             Assert.AreEqual(0, securities[Symbols.Fut_SPY_Feb19_2016].Holdings.Quantity);
         }
 
+        [Test]
+        public void TracksTheInvestedSecuritiesAsTheFillsChangeTheHoldings()
+        {
+            var securities = new SecurityManager(TimeKeeper);
+            var transactions = new SecurityTransactionManager(null, securities);
+            var portfolio = new SecurityPortfolioManager(securities, transactions, new AlgorithmSettings());
+            portfolio.SetCash(100000);
+
+            foreach (var symbol in new[] { Symbols.AAPL, Symbols.SPY, Symbols.IBM })
+            {
+                securities.Add(
+                    symbol,
+                    new Security(
+                        SecurityExchangeHours,
+                        CreateTradeBarDataConfig(SecurityType.Equity, symbol),
+                        new Cash(Currencies.USD, 0, 1m),
+                        SymbolProperties.GetDefault(Currencies.USD),
+                        ErrorCurrencyConverter.Instance,
+                        RegisteredSecurityDataTypesProvider.Null,
+                        new SecurityCache()
+                    )
+                );
+                securities[symbol].SetMarketPrice(new TradeBar { Time = DateTime.Now, Symbol = symbol, Value = 100 });
+            }
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+
+            portfolio.ProcessFills(new List<OrderEvent>
+            {
+                new OrderEvent(1, Symbols.AAPL, DateTime.MinValue, OrderStatus.Filled, OrderDirection.Buy, 100, 10, OrderFee.Zero),
+                new OrderEvent(2, Symbols.SPY, DateTime.MinValue, OrderStatus.Filled, OrderDirection.Sell, 100, -10, OrderFee.Zero)
+            });
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL, Symbols.SPY }, portfolio.InvestedSecurities.Select(security => security.Symbol));
+
+            // AAPL loses 10% and SPY, short, gains 20%
+            securities[Symbols.AAPL].SetMarketPrice(new TradeBar { Time = DateTime.Now, Symbol = Symbols.AAPL, Value = 90 });
+            securities[Symbols.SPY].SetMarketPrice(new TradeBar { Time = DateTime.Now, Symbol = Symbols.SPY, Value = 80 });
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL },
+                portfolio.GetInvestedSecuritiesWithUnrealizedProfitPercentBelow(-0.05m).Select(security => security.Symbol));
+            CollectionAssert.AreEquivalent(new[] { Symbols.SPY },
+                portfolio.GetInvestedSecuritiesWithUnrealizedProfitPercentAbove(0.05m).Select(security => security.Symbol));
+
+            portfolio.ProcessFills(new List<OrderEvent>
+            {
+                new OrderEvent(3, Symbols.AAPL, DateTime.MinValue, OrderStatus.Filled, OrderDirection.Sell, 90, -10, OrderFee.Zero)
+            });
+            CollectionAssert.AreEquivalent(new[] { Symbols.SPY }, portfolio.InvestedSecurities.Select(security => security.Symbol));
+            CollectionAssert.IsEmpty(portfolio.GetInvestedSecuritiesWithUnrealizedProfitPercentBelow(-0.05m));
+
+            securities.Remove(Symbols.SPY);
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+        }
+
+        [Test]
+        public void InvestedSecuritiesAreInTheOrderTheSecuritiesWereAdded()
+        {
+            var securities = new SecurityManager(TimeKeeper);
+            var transactions = new SecurityTransactionManager(null, securities);
+            var portfolio = new SecurityPortfolioManager(securities, transactions, new AlgorithmSettings());
+            portfolio.SetCash(100000);
+
+            var symbols = new[] { Symbols.SPY, Symbols.AAPL, Symbols.IBM, Symbols.MSFT, Symbols.GOOG };
+            foreach (var symbol in symbols)
+            {
+                securities.Add(
+                    symbol,
+                    new Security(
+                        SecurityExchangeHours,
+                        CreateTradeBarDataConfig(SecurityType.Equity, symbol),
+                        new Cash(Currencies.USD, 0, 1m),
+                        SymbolProperties.GetDefault(Currencies.USD),
+                        ErrorCurrencyConverter.Instance,
+                        RegisteredSecurityDataTypesProvider.Null,
+                        new SecurityCache()
+                    )
+                );
+                securities[symbol].SetMarketPrice(new TradeBar { Time = DateTime.Now, Symbol = symbol, Value = 100 });
+            }
+
+            // the fills come in the reverse order, all the positions lose 10%
+            portfolio.ProcessFills(symbols.Reverse().Select((symbol, i) =>
+                new OrderEvent(i + 1, symbol, DateTime.MinValue, OrderStatus.Filled, OrderDirection.Buy, 100, 10, OrderFee.Zero)).ToList());
+            foreach (var symbol in symbols)
+            {
+                securities[symbol].SetMarketPrice(new TradeBar { Time = DateTime.Now, Symbol = symbol, Value = 90 });
+            }
+
+            CollectionAssert.AreEqual(symbols, portfolio.InvestedSecurities.Select(security => security.Symbol));
+            CollectionAssert.AreEqual(symbols,
+                portfolio.GetInvestedSecuritiesWithUnrealizedProfitPercentBelow(-0.05m).Select(security => security.Symbol));
+        }
+
         [Test]
         public void BuyingSellingFuturesAddsToCashOnClose()
         {
@@ -0,0 +1,96 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.IO;
+using System.Text;
+using NUnit.Framework;
+using QuantConnect.Util;
+
+namespace QuantConnect.Tests.Common.Util
+{
+    [TestFixture]
+    public class SharedDataCacheTests
+    {
+        private string _folder;
+        private string _zipFile;
+
+        [SetUp]
+        public void SetUp()
+        {
+            _folder = Path.Combine(Path.GetTempPath(), $"shared-data-cache-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_folder);
+            _zipFile = Path.Combine(_folder, "20131007_trade.zip");
+            File.WriteAllText(_zipFile, "zip");
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Directory.Delete(_folder, true);
+        }
+
+        [Test]
+        public void SharesTheEntriesBetweenInstances()
+        {
+            var writer = new SharedDataCache(Path.Combine(_folder, "cache"), 1024 * 1024);
+            var reader = new SharedDataCache(Path.Combine(_folder, "cache"), 1024 * 1024);
+
+            Assert.IsNull(reader.Fetch(_zipFile, "20131007_spy_minute_trade.csv"));
+            writer.Store(_zipFile, "20131007_spy_minute_trade.csv", new MemoryStream(Encoding.UTF8.GetBytes("14400000,1,2,3,4,5")));
+
+            using (var stream = reader.Fetch(_zipFile, "20131007_spy_minute_trade.csv"))
+            using (var streamReader = new StreamReader(stream))
+            {
+                Assert.AreEqual("14400000,1,2,3,4,5", streamReader.ReadToEnd());
+            }
+            Assert.IsNull(reader.Fetch(_zipFile, "20131007_aapl_minute_trade.csv"));
+
+            reader.WriteStatistics();
+            writer.WriteStatistics();
+            var statistics = SharedDataCache.ReadStatistics(Path.Combine(_folder, "cache"));
+            Assert.AreEqual(1, statistics.Hits);
+            Assert.AreEqual(2, statistics.Misses);
+            Assert.AreEqual(18, statistics.Size);
+        }
+
+        [Test]
+        public void ChangedZipFilesAreNotReadFromTheCache()
+        {
+            var cache = new SharedDataCache(Path.Combine(_folder, "cache"), 1024 * 1024);
+            cache.Store(_zipFile, null, new MemoryStream(Encoding.UTF8.GetBytes("old")));
+            using (var stream = cache.Fetch(_zipFile, null))
+            {
+                Assert.IsNotNull(stream);
+            }
+
+            File.WriteAllText(_zipFile, "new zip");
+            Assert.IsNull(cache.Fetch(_zipFile, null));
+        }
+
+        [Test]
+        public void EvictsTheLeastRecentlyUsedEntries()
+        {
+            var cache = new SharedDataCache(Path.Combine(_folder, "cache"), 250);
+            for (var i = 0; i < 5; i++)
+            {
+                cache.Store(_zipFile, $"{i}.csv", new MemoryStream(new byte[100]));
+            }
+
+            Assert.LessOrEqual(SharedDataCache.ReadStatistics(Path.Combine(_folder, "cache")).Size, 250);
+            Assert.Greater(cache.Evictions, 0);
+        }
+    }
+}
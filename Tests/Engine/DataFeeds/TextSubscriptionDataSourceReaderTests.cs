@@ -22,6 +22,7 @@ using System.Threading;
 using System.Threading.Tasks;
 using Accord.Math.Comparers;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Data.Market;
 using QuantConnect.Interfaces;
@@ -69,6 +70,42 @@ namespace QuantConnect.Tests.Engine.DataFeeds
             Assert.AreNotEqual(dataBars.Price, dataBars2.Price);
         }
 
+        [Test]
+        public void ChunkReaderErrorsOnlyDropTheInvalidLines()
+        {
+            Type type;
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString("ChunkReaderErrorsTest", @"
+from AlgorithmImports import *
+
+class ChunkedData(PythonData):
+    def reader(self, config, line, date, is_live_mode):
+        time, value = line.split(',')
+        data = ChunkedData()
+        data.symbol = config.symbol
+        data.time = datetime.strptime(time, '%Y%m%d')
+        data.value = float(value)
+        return data
+
+    def read_chunk(self, config, lines, date, is_live_mode):
+        return [ self.reader(config, line, date, is_live_mode) for line in lines ]");
+                type = Extensions.CreateType(module.GetAttr("ChunkedData"));
+            }
+            var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, TimeZones.NewYork, TimeZones.NewYork,
+                false, false, false, isCustom: true);
+            var dataCacheProvider = new CustomEphemeralDataCacheProvider { IsDataEphemeral = true, Data = "20000101,1\ninvalid\n20000102,2" };
+            var reader = new TextSubscriptionDataSourceReader(dataCacheProvider, config, _initialDate, false, null);
+            var errors = new List<string>();
+            reader.ReaderError += (sender, args) => errors.Add(args.Line);
+
+            var data = reader.Read(new SubscriptionDataSource("ChunkedData.csv", SubscriptionTransportMedium.LocalFile)).ToList();
+
+            // the chunk fails, its lines are read one by one like without the bulk reader
+            CollectionAssert.AreEqual(new[] { 1m, 2m }, data.Select(x => x.Value));
+            CollectionAssert.AreEqual(new[] { "invalid" }, errors);
+        }
+
         [Test]
         public void DataIsNotCachedForEphemeralDataCacheProvider()
         {
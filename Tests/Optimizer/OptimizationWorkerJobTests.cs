@@ -0,0 +1,50 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System.Collections.Generic;
+using Newtonsoft.Json;
+using NUnit.Framework;
+using QuantConnect.Optimizer;
+using QuantConnect.Optimizer.Parameters;
+
+namespace QuantConnect.Tests.Optimizer
+{
+    [TestFixture, Parallelizable(ParallelScope.All)]
+    public class OptimizationWorkerJobTests
+    {
+        [Test]
+        public void RoundTripIsASingleLine()
+        {
+            var parameterSet = new ParameterSet(1, new Dictionary<string, string> { { "ema-fast", "10" }, { "ema-slow", "50.5" } });
+            var job = new OptimizationWorkerJob
+            {
+                BacktestId = "1f2e",
+                BacktestName = "OptimizationBacktest",
+                ResultsDestinationFolder = "opt/1f2e",
+                Parameters = parameterSet.Value
+            };
+
+            var serialized = JsonConvert.SerializeObject(job, Formatting.None);
+            var deserialized = JsonConvert.DeserializeObject<OptimizationWorkerJob>(serialized);
+
+            // the worker reads one job per line
+            Assert.IsFalse(serialized.Contains('\n'));
+            Assert.AreEqual(job.BacktestId, deserialized.BacktestId);
+            Assert.AreEqual(job.BacktestName, deserialized.BacktestName);
+            Assert.AreEqual(job.ResultsDestinationFolder, deserialized.ResultsDestinationFolder);
+            CollectionAssert.AreEquivalent(parameterSet.Value, deserialized.Parameters);
+        }
+    }
+}
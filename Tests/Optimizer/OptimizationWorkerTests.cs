@@ -0,0 +1,140 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.IO.Pipes;
+using System.Linq;
+using Newtonsoft.Json;
+using NUnit.Framework;
+using QuantConnect.Optimizer;
+using QuantConnect.Optimizer.Parameters;
+using QuantConnect.Packets;
+
+namespace QuantConnect.Tests.Optimizer
+{
+    [TestFixture, Category("TravisExclude")]
+    public class OptimizationWorkerTests
+    {
+        private static readonly string Launcher = Path.Combine(AppDomain.CurrentDomain.BaseDirectory, "QuantConnect.Lean.Launcher.dll");
+
+        private static readonly string AlgorithmArguments = $"--algorithm-type-name ParameterizedAlgorithm --algorithm-language CSharp " +
+            $"--algorithm-location QuantConnect.Algorithm.CSharp.dll --data-folder \"{Path.GetFullPath(Globals.DataFolder)}\" --close-automatically true";
+
+        private static readonly Dictionary<string, string>[] ParameterSets =
+        {
+            new() { { "ema-fast", "10" }, { "ema-slow", "50" } },
+            new() { { "ema-fast", "20" }, { "ema-slow", "100" } },
+            new() { { "ema-fast", "10" }, { "ema-slow", "50" } },
+            new() { { "ema-fast", "5" }, { "ema-slow", "200" } }
+        };
+
+        private string _folder;
+
+        [SetUp]
+        public void SetUp()
+        {
+            _folder = Path.Combine(Path.GetTempPath(), $"OptimizationWorkerTests-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_folder);
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Directory.Delete(_folder, true);
+        }
+
+        [Test]
+        public void WorkerPoolResultsMatchAProcessPerBacktest()
+        {
+            var expected = ParameterSets.Select((parameters, i) => RunProcess($"process-{i}", parameters)).ToList();
+            var actual = RunWorker(ParameterSets.Select((parameters, i) => ($"worker-{i}", parameters)).ToList());
+
+            for (var i = 0; i < ParameterSets.Length; i++)
+            {
+                Assert.IsNotEmpty(expected[i].Statistics);
+                CollectionAssert.AreEquivalent(expected[i].Statistics, actual[i].Statistics, $"Parameter set {i}");
+            }
+            // the repeated parameter set isn't affected by the backtests the worker ran before it
+            CollectionAssert.AreEquivalent(actual[0].Statistics, actual[2].Statistics);
+        }
+
+        private BacktestResult RunProcess(string backtestId, Dictionary<string, string> parameters)
+        {
+            var resultsFolder = Path.Combine(_folder, backtestId);
+            Directory.CreateDirectory(resultsFolder);
+            using var process = Process.Start(CreateStartInfo($"{AlgorithmArguments} --algorithm-id {backtestId} " +
+                $"--results-destination-folder \"{resultsFolder}\" --parameters {new ParameterSet(0, parameters)}"));
+            process.StandardOutput.ReadToEnd();
+            Assert.IsTrue(process.WaitForExit(300000));
+            return ReadResult(resultsFolder, backtestId);
+        }
+
+        private List<BacktestResult> RunWorker(List<(string BacktestId, Dictionary<string, string> Parameters)> backtests)
+        {
+            using var completions = new AnonymousPipeServerStream(PipeDirection.In, HandleInheritability.Inheritable);
+            using var process = Process.Start(CreateStartInfo($"{AlgorithmArguments} --optimization-worker true " +
+                $"--results-destination-folder \"{Path.Combine(_folder, "worker")}\" --optimization-worker-pipe {completions.GetClientHandleAsString()}"));
+            completions.DisposeLocalCopyOfClientHandle();
+            // the standard output is the log of the backtests, the completions can't be mixed with it
+            process.BeginOutputReadLine();
+
+            using var reader = new StreamReader(completions);
+            var results = new List<BacktestResult>();
+            foreach (var (backtestId, parameters) in backtests)
+            {
+                var job = new OptimizationWorkerJob
+                {
+                    BacktestId = backtestId,
+                    BacktestName = backtestId,
+                    ResultsDestinationFolder = Path.Combine(_folder, backtestId),
+                    Parameters = parameters
+                };
+                process.StandardInput.WriteLine(JsonConvert.SerializeObject(job, Formatting.None));
+                process.StandardInput.Flush();
+
+                var line = reader.ReadLine();
+                StringAssert.StartsWith($"{OptimizationWorkerJob.CompletedPrefix}{backtestId} ", line);
+                results.Add(ReadResult(job.ResultsDestinationFolder, backtestId));
+            }
+
+            process.StandardInput.Close();
+            Assert.IsTrue(process.WaitForExit(60000));
+            return results;
+        }
+
+        private static ProcessStartInfo CreateStartInfo(string arguments)
+        {
+            return new ProcessStartInfo
+            {
+                FileName = "dotnet",
+                Arguments = $"\"{Launcher}\" {arguments}",
+                WorkingDirectory = AppDomain.CurrentDomain.BaseDirectory,
+                UseShellExecute = false,
+                RedirectStandardInput = true,
+                RedirectStandardOutput = true
+            };
+        }
+
+        private static BacktestResult ReadResult(string resultsFolder, string backtestId)
+        {
+            var resultJson = Path.Combine(resultsFolder, $"{backtestId}.json");
+            Assert.IsTrue(File.Exists(resultJson), $"Missing {resultJson}");
+            return JsonConvert.DeserializeObject<BacktestResult>(File.ReadAllText(resultJson));
+        }
+    }
+}
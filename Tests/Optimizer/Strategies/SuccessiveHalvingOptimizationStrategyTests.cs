@@ -0,0 +1,227 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json.Linq;
+using NUnit.Framework;
+using QuantConnect.Optimizer;
+using QuantConnect.Optimizer.Objectives;
+using QuantConnect.Optimizer.Parameters;
+using QuantConnect.Optimizer.Strategies;
+
+namespace QuantConnect.Tests.Optimizer.Strategies
+{
+    [TestFixture, Parallelizable(ParallelScope.Fixtures)]
+    public class SuccessiveHalvingOptimizationStrategyTests : OptimizationStrategyTests
+    {
+        [TestFixture]
+        public class SuccessiveHalvingTests
+        {
+            private static readonly DateTime StartDate = new DateTime(2020, 1, 1);
+            private const int PeriodDays = 90;
+
+            private SuccessiveHalvingOptimizationStrategy _strategy;
+            private Queue<OptimizationResult> _pendingResults;
+            private List<ParameterSet> _parameterSets;
+
+            [SetUp]
+            public void Init()
+            {
+                _strategy = new SuccessiveHalvingOptimizationStrategy();
+                _pendingResults = new Queue<OptimizationResult>();
+                _parameterSets = new List<ParameterSet>();
+                _strategy.NewParameterSet += (s, parameterSet) =>
+                {
+                    _parameterSets.Add(parameterSet);
+                    _pendingResults.Enqueue(new OptimizationResult(CreateResult(parameterSet), parameterSet, ""));
+                };
+            }
+
+            [Test]
+            public void PromotesTheBestParameterSetsToLongerPeriods()
+            {
+                Run(new SuccessiveHalvingOptimizationStrategySettings());
+
+                CollectionAssert.AreEqual(new decimal?[] { 0.111111m, 0.333333m, null }, _parameterSets.Select(parameterSet => parameterSet.PeriodFraction).Distinct());
+                Assert.AreEqual(27, _parameterSets.Count(parameterSet => parameterSet.PeriodFraction == 0.111111m));
+                CollectionAssert.AreEquivalent(new[] { "10", "9", "9", "9", "8", "8", "8", "8", "8" },
+                    _parameterSets.Where(parameterSet => parameterSet.PeriodFraction == 0.333333m).Select(parameterSet => Profit(parameterSet).ToStringInvariant()));
+                CollectionAssert.AreEquivalent(new[] { "10", "9", "9" },
+                    _parameterSets.Where(parameterSet => parameterSet.PeriodFraction == null).Select(parameterSet => Profit(parameterSet).ToStringInvariant()));
+                Assert.AreEqual(27 + 9 + 3, _strategy.GetTotalBacktestEstimate());
+
+                Assert.AreEqual(10, Profit(_strategy.Solution.ParameterSet));
+                Assert.IsNull(_strategy.Solution.ParameterSet.PeriodFraction);
+            }
+
+            [Test]
+            public void CountsTheBacktestDays()
+            {
+                Run(new SuccessiveHalvingOptimizationStrategySettings());
+
+                Assert.AreEqual(27 * 10 + 9 * 30 + 3 * PeriodDays, _strategy.BacktestDays);
+                Assert.AreEqual(27 * PeriodDays, _strategy.GridSearchBacktestDays);
+            }
+
+            [Test]
+            public void AddsTheBacktestDaysToTheRuntimeStatistics()
+            {
+                Run(new SuccessiveHalvingOptimizationStrategySettings());
+
+                var statistics = new Dictionary<string, string>();
+                _strategy.AddRuntimeStatistics(statistics);
+
+                Assert.AreEqual($"{_strategy.BacktestDays}", statistics["Backtest Days"]);
+                Assert.AreEqual($"{_strategy.GridSearchBacktestDays}", statistics["Grid Search Backtest Days"]);
+            }
+
+            [Test]
+            public void FailedBacktestsAreNotPromoted()
+            {
+                _strategy.Initialize(new Target("Profit", new Maximization(), null), null, Parameters, new SuccessiveHalvingOptimizationStrategySettings());
+                _strategy.PushNewResults(OptimizationResult.Initial);
+
+                while (_pendingResults.TryDequeue(out var result))
+                {
+                    // the best parameter set fails on the shortest period
+                    var failed = result.ParameterSet.PeriodFraction == 0.111111m && Profit(result.ParameterSet) == 10;
+                    _strategy.PushNewResults(failed ? new OptimizationResult(null, result.ParameterSet, "") : result);
+                }
+
+                Assert.AreEqual(9, Profit(_strategy.Solution.ParameterSet));
+            }
+
+            [TestCase(0)]
+            [TestCase(1.5)]
+            public void ThrowsOnInvalidMinimumPeriodFraction(decimal fraction)
+            {
+                Assert.Throws<ArgumentException>(() => _strategy.Initialize(new Target("Profit", new Maximization(), null), null, Parameters,
+                    new SuccessiveHalvingOptimizationStrategySettings { MinimumPeriodFraction = fraction }));
+            }
+
+            private void Run(OptimizationStrategySettings settings)
+            {
+                _strategy.Initialize(new Target("Profit", new Maximization(), null), null, Parameters, settings);
+                _strategy.PushNewResults(OptimizationResult.Initial);
+
+                while (_pendingResults.TryDequeue(out var result))
+                {
+                    _strategy.PushNewResults(result);
+                }
+            }
+
+            private static HashSet<OptimizationParameter> Parameters => new HashSet<OptimizationParameter>
+            {
+                new OptimizationStepParameter("ema-slow", 1, 3, 1),
+                new OptimizationStepParameter("ema-fast", 1, 3, 1),
+                new OptimizationStepParameter("ema-custom", 2, 4, 1)
+            };
+
+            private static decimal Profit(ParameterSet parameterSet) => parameterSet.Value.Sum(arg => arg.Value.ToDecimal());
+
+            private static string CreateResult(ParameterSet parameterSet)
+            {
+                var days = Math.Max(1, (int)Math.Ceiling(PeriodDays * (parameterSet.PeriodFraction ?? 1m)));
+                return new JObject
+                {
+                    ["Statistics"] = new JObject { ["Profit"] = Profit(parameterSet) },
+                    ["AlgorithmConfiguration"] = new JObject
+                    {
+                        ["StartDate"] = StartDate.ToStringInvariant(DateFormat.UI),
+                        ["EndDate"] = StartDate.AddDays(days - 1).ToStringInvariant(DateFormat.UI)
+                    }
+                }.ToString();
+            }
+        }
+
+        protected override IOptimizationStrategy CreateStrategy()
+        {
+            return new SuccessiveHalvingOptimizationStrategy();
+        }
+
+        protected override OptimizationStrategySettings CreateSettings()
+        {
+            return new SuccessiveHalvingOptimizationStrategySettings { DefaultSegmentAmount = 10 };
+        }
+
+        private static TestCaseData[] StrategySettings => new[]
+        {
+            new TestCaseData(new Maximization(), OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"} })),
+            new TestCaseData(new Minimization(), OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "1"}, { "ema-fast" , "3"} })),
+            new TestCaseData(new Maximization(), OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"}, { "skipFromResultSum", "SPY" } })),
+            new TestCaseData(new Minimization(), OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "1"}, { "ema-fast" , "3"}, { "skipFromResultSum", "SPY" } }))
+        };
+
+        [Test, TestCaseSource(nameof(StrategySettings))]
+        public override void StepInsideNoTargetNoConstraints(Extremum extremum, HashSet<OptimizationParameter> optimizationParameters, ParameterSet solution)
+        {
+            base.StepInsideNoTargetNoConstraints(extremum, optimizationParameters, solution);
+        }
+
+        private static TestCaseData[] OptimizeWithConstraint => new[]
+        {
+            new TestCaseData(0.05m, OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "1"}, { "ema-fast" , "3"} })),
+            new TestCaseData(0.06m, OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "2"}, { "ema-fast" , "3"} })),
+            new TestCaseData(0.05m, OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "1"}, { "ema-fast" , "3"}, { "skipFromResultSum", "SPY" } })),
+            new TestCaseData(0.06m, OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "2"}, { "ema-fast" , "3"}, { "skipFromResultSum", "SPY" } }))
+        };
+
+        [Test, TestCaseSource(nameof(OptimizeWithConstraint))]
+        public override void StepInsideWithConstraints(decimal drawdown, HashSet<OptimizationParameter> optimizationParameters, ParameterSet solution)
+        {
+            base.StepInsideWithConstraints(drawdown, optimizationParameters, solution);
+        }
+
+        // the target is only checked against the full period backtests
+        private static TestCaseData[] OptimizeWithTarget => new[]
+        {
+            new TestCaseData(8m, OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"} })),
+            new TestCaseData(8m, OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"}, { "skipFromResultSum", "SPY" } }))
+        };
+
+        [Test, TestCaseSource(nameof(OptimizeWithTarget))]
+        public override void StepInsideWithTarget(decimal targetValue, HashSet<OptimizationParameter> optimizationParameters, ParameterSet solution)
+        {
+            base.StepInsideWithTarget(targetValue, optimizationParameters, solution);
+        }
+
+        private static TestCaseData[] OptimizeWithTargetNotReached => new[]
+        {
+            new TestCaseData(15m, OptimizationStepParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"} })),
+            new TestCaseData(155m, OptimizationMixedParameters, new ParameterSet(-1, new Dictionary<string, string>{{"ema-slow", "5"}, { "ema-fast" , "5"}, { "skipFromResultSum", "SPY" } }))
+        };
+
+        [Test, TestCaseSource(nameof(OptimizeWithTargetNotReached))]
+        public override void TargetNotReached(decimal targetValue, HashSet<OptimizationParameter> optimizationParameters, ParameterSet solution)
+        {
+            base.TargetNotReached(targetValue, optimizationParameters, solution);
+        }
+
+        // 10 parameter sets on a ninth of the period, 3 on a third and the best on the full period
+        private static TestCaseData[] HalvingEstimations => new[]
+        {
+            new TestCaseData(OptimizationStepParameters, 14),
+            new TestCaseData(OptimizationMixedParameters, 14)
+        };
+
+        [Test, TestCaseSource(nameof(HalvingEstimations))]
+        public override void Estimate(HashSet<OptimizationParameter> optimizationParameters, int expected)
+        {
+            base.Estimate(optimizationParameters, expected);
+        }
+    }
+}
@@ -0,0 +1,137 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Data;
+using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Tests.Common.Data.Fundamental;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class FundamentalFrameUniverseTests
+    {
+        private static readonly DateTime Time = new DateTime(2014, 4, 1);
+        private static readonly Symbol AIG = Symbol.Create("AIG", SecurityType.Equity, Market.USA);
+
+        private PyModule _module;
+
+        [OneTimeSetUp]
+        public void SetUp()
+        {
+            FundamentalService.Initialize(TestGlobals.DataProvider, new TestFundamentalDataProvider(), false);
+
+            using (Py.GIL())
+            {
+                _module = PyModule.FromString("FundamentalFrameUniverseTests", @"
+from AlgorithmImports import *
+
+def select_mask(frame):
+    assert frame.index.name == 'symbol'
+    assert frame['has_fundamental_data'].dtype == 'bool'
+    assert frame['valuation_ratios.pe_ratio'].dtype == 'float64'
+    assert frame['company_reference.industry_template_code'].tolist() == ['N', 'N', 'I']
+    return frame['valuation_ratios.pe_ratio'] > 10
+
+def select_shuffled_mask(frame):
+    # the mask is aligned on the frame index, not on its positions
+    return (frame['valuation_ratios.pe_ratio'] > 10).sample(frac = 1, random_state = 2).sort_values()
+
+def select_misaligned_mask(frame):
+    return pd.Series([True, False, True], index = ['A', 'B', 'C'])
+
+def select_index(frame):
+    return frame.nlargest(1, 'market_cap').index
+
+def select_symbols(frame):
+    return [Symbol.create('AIG', SecurityType.EQUITY, Market.USA)]
+
+def select_unchanged(frame):
+    return Universe.UNCHANGED
+");
+            }
+        }
+
+        [OneTimeTearDown]
+        public void TearDown()
+        {
+            FundamentalService.Initialize(TestGlobals.DataProvider, new NullFundamentalDataProvider(), false);
+        }
+
+        [TestCase("select_mask", "AAPL", "IBM")]
+        [TestCase("select_shuffled_mask", "AAPL", "IBM")]
+        [TestCase("select_index", "AAPL")]
+        [TestCase("select_symbols", "AIG")]
+        public void SelectsTheSymbolsFromTheDataFrame(string selector, params string[] expected)
+        {
+            var universe = CreateUniverse(selector);
+
+            var selected = universe.SelectSymbols(Time, GetFundamentals());
+
+            CollectionAssert.AreEqual(expected, selected.Select(symbol => symbol.Value));
+        }
+
+        [Test]
+        public void SelectionCanReturnUnchanged()
+        {
+            var universe = CreateUniverse("select_unchanged");
+
+            var selected = universe.SelectSymbols(Time, GetFundamentals());
+
+            Assert.AreSame(Universe.Unchanged, selected);
+        }
+
+        [Test]
+        public void ThrowsForAMaskWithADifferentIndex()
+        {
+            var universe = CreateUniverse("select_misaligned_mask");
+
+            Assert.Throws<ArgumentException>(() => universe.SelectSymbols(Time, GetFundamentals()).ToList());
+        }
+
+        [Test]
+        public void ThrowsForUnknownFields()
+        {
+            using (Py.GIL())
+            {
+                using var fields = new PyList(new PyObject[] { new PyString("unknown_field") });
+                Assert.Throws<ArgumentException>(() => new FundamentalFrameUniverse(Market.USA, new QCAlgorithm().UniverseSettings,
+                    fields, _module.GetAttr("select_mask")));
+            }
+        }
+
+        private FundamentalFrameUniverse CreateUniverse(string selector)
+        {
+            using (Py.GIL())
+            {
+                var fields = new[] { "has_fundamental_data", "market_cap", "valuation_ratios.pe_ratio", "company_reference.industry_template_code" };
+                using var pyFields = new PyList(fields.Select(field => (PyObject)new PyString(field)).ToArray());
+                return new FundamentalFrameUniverse(Market.USA, new QCAlgorithm().UniverseSettings,
+                    pyFields, _module.GetAttr(selector));
+            }
+        }
+
+        private static BaseDataCollection GetFundamentals()
+        {
+            var fundamentals = new[] { Symbols.AAPL, Symbols.IBM, AIG }
+                .Select(symbol => (BaseData)new QuantConnect.Data.Fundamental.Fundamental(Time, symbol));
+            return new BaseDataCollection(Time, Symbols.AAPL, fundamentals);
+        }
+    }
+}
@@ -183,6 +183,43 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [TestCase(typeof(TradeBar))]
+        [TestCase(typeof(QuoteBar))]
+        [TestCase(typeof(Tick))]
+        public void ColumnarConversionMatchesPerValueConversion(Type dataType)
+        {
+            var converter = new PandasConverter();
+            var symbol = dataType == typeof(QuoteBar) ? Symbols.EURUSD : Symbols.SPY;
+            var time = new DateTime(2013, 10, 7, 9, 31, 0);
+
+            var rawData = Enumerable
+                .Range(0, 10)
+                .Select(i => dataType == typeof(TradeBar)
+                    ? new TradeBar(time.AddMinutes(i), symbol, i + 101m, i + 102m, i + 100m, i + 101m, i * 10m)
+                    : dataType == typeof(QuoteBar)
+                        ? new QuoteBar(time.AddMinutes(i), symbol, new Bar(i + 1.01m, i + 1.02m, i + 1.00m, i + 1.01m), 0m, null, 0m)
+                        : (BaseData)new Tick(time.AddMinutes(i / 2), symbol, string.Empty, "P", i * 10m, i + 101m))
+                .ToArray();
+
+            try
+            {
+                PandasData.ColumnarConversion = false;
+                var expected = converter.GetDataFrame(rawData);
+                PandasData.ColumnarConversion = true;
+                var actual = converter.GetDataFrame(rawData);
+
+                using (Py.GIL())
+                {
+                    using var testing = Py.Import("pandas.testing");
+                    Assert.DoesNotThrow(() => testing.InvokeMethod("assert_frame_equal", expected, actual));
+                }
+            }
+            finally
+            {
+                PandasData.ColumnarConversion = true;
+            }
+        }
+
         [Test]
         public void HandlesQuoteBars()
         {
@@ -17,6 +17,7 @@
 using System;
 using NUnit.Framework;
 using Python.Runtime;
+using QuantConnect.Logging;
 using static QLNet.NumericHaganPricer;
 
 namespace QuantConnect.Tests.Python
@@ -85,5 +86,36 @@ namespace QuantConnect.Tests.Python
                 Assert.IsTrue(exception.Contains("No key found for either mapped or original key. Mapped Key: ['AAPL R735QTJ8XC9X']; Original Key: ['aapl']", StringComparison.InvariantCulture));
             }
         }
+
+        [Test]
+        public void DoesNotRemapNonLeanDataFrames()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_non_lean_data_frame_is_not_remapped();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void RemappingCanBeDisabled()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_remapping_disabled();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test, Explicit("Benchmark, reports the PandasMapper overhead")]
+        public void PandasMapperOverheadBenchmark()
+        {
+            using (Py.GIL())
+            {
+                var benchmark = Py.Import("PandasMapperBenchmark");
+                var report = benchmark.GetAttr("report").Invoke().As<string>();
+                Log.Trace(report);
+            }
+        }
     }
 }
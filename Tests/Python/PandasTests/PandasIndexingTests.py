@@ -68,3 +68,19 @@ class PandasDataFrameTests():
             return True
         except:
             return False
+
+    def test_non_lean_data_frame_is_not_remapped(self):
+        # 'SPY' is in the SymbolCache but this frame was not created by Lean, the key must be used as is
+        df = pd.DataFrame({'SPY': [2, 5, 8, 10], str(self.spy.ID): [1, 2, 3, 4]})
+        return df['SPY'].iloc[0] == 2 and 'SPY' in df.columns
+
+    def test_remapping_disabled(self):
+        import PandasMapper
+        with PandasMapper.symbol_remapping_disabled():
+            try:
+                self.spydf.loc['SPY']
+                return False
+            except KeyError:
+                pass
+        # remapping is restored when leaving the context
+        return not self.spydf.loc['SPY'].empty
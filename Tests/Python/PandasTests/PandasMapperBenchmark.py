@@ -0,0 +1,94 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+Micro-benchmark of the overhead PandasMapper adds to pandas indexing.
+Each scenario is timed with the original pandas functions, with the PandasMapper patches
+and with the patches but the remapping turned off through PandasMapper.symbol_remapping_disabled
+'''
+
+from clr import AddReference
+AddReference("QuantConnect.Common")
+AddReference("QuantConnect.Tests")
+
+from QuantConnect import *
+from QuantConnect.Python import PandasConverter
+from QuantConnect.Tests import Symbols
+from QuantConnect.Tests.Python import PythonTestingUtils
+
+import PandasMapper
+import pandas as pd
+from timeit import timeit
+
+_patched_functions = [
+    (pd.core.indexing._LocationIndexer, '__getitem__'),
+    (pd.core.indexing._ScalarAccessIndexer, '__getitem__'),
+    (pd.core.indexes.base.Index, 'get_loc'),
+    (pd.core.indexes.base.Index, '__contains__'),
+    (pd.core.frame.DataFrame, '__getitem__'),
+]
+
+def _set_original_functions(original):
+    for cls, name in _patched_functions:
+        function = getattr(cls, name)
+        if original:
+            setattr(cls, name, getattr(function, '__wrapped__', function))
+        else:
+            setattr(cls, name, PandasMapper.wrap_bool_function(function) if name == '__contains__' else PandasMapper.wrap_keyerror_function(function))
+
+def _get_scenarios():
+    spy = Symbols.SPY
+    SymbolCache.Set("SPY", spy)
+    sid = str(spy.ID)
+
+    lean_df = PandasConverter().GetDataFrame(PythonTestingUtils.GetSlices(spy))
+    unstacked = lean_df['lastprice'].unstack(level=0)
+    user_df = pd.DataFrame({'a': range(100), 'b': range(100)})
+
+    return {
+        'lean_loc_ticker': lambda: lean_df.loc['SPY'],
+        'lean_loc_symbol': lambda: lean_df.loc[spy],
+        'lean_loc_sid': lambda: lean_df.loc[sid],
+        'lean_getitem_ticker': lambda: unstacked['SPY'],
+        'lean_contains_ticker': lambda: 'SPY' in unstacked,
+        'user_getitem': lambda: user_df['a'],
+        'user_loc': lambda: user_df.loc[10, 'b'],
+        'user_at': lambda: user_df.at[10, 'b'],
+        'user_contains': lambda: 'b' in user_df,
+    }
+
+def run(iterations = 10000):
+    '''Returns the seconds per call of each scenario keyed by mode (original, patched, disabled)'''
+    scenarios = _get_scenarios()
+    results = {}
+    try:
+        _set_original_functions(True)
+        results['original'] = { name: timeit(scenario, number=iterations) / iterations for name, scenario in scenarios.items() if not name.endswith('_ticker') and not name.endswith('_symbol') }
+    finally:
+        _set_original_functions(False)
+
+    results['patched'] = { name: timeit(scenario, number=iterations) / iterations for name, scenario in scenarios.items() }
+
+    with PandasMapper.symbol_remapping_disabled():
+        results['disabled'] = { name: timeit(scenario, number=iterations) / iterations for name, scenario in scenarios.items() if not name.endswith('_ticker') and not name.endswith('_symbol') }
+
+    return results
+
+def report(iterations = 10000):
+    '''Formats the benchmark results as a table of microseconds per call'''
+    results = run(iterations)
+    lines = [f"{'scenario':<24}{'original':>12}{'patched':>12}{'disabled':>12}"]
+    for name in results['patched']:
+        columns = [results[mode].get(name) for mode in ['original', 'patched', 'disabled']]
+        lines.append(f"{name:<24}" + ''.join(f"{'-' if x is None else f'{x * 1e6:.2f}':>12}" for x in columns))
+    return '\n'.join(lines)
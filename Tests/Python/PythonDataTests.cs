@@ -136,6 +136,52 @@ class CustomDataTest(PythonData):
             }
         }
 
+        [TestCase(false)]
+        [TestCase(true)]
+        public void ReadChunkParsesManyLines(bool returnsDataFrame)
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def read_chunk(self, config, lines, date, is_live_mode):
+        rows = [ line.split(',') for line in lines if line[0].isdigit() ]
+        if {(returnsDataFrame ? "True" : "False")}:
+            frame = pd.DataFrame(rows, columns = ['time', 'value', 'name'])
+            frame['time'] = pd.to_datetime(frame['time'])
+            frame['value'] = frame['value'].astype(float)
+            return frame
+        result = []
+        for row in rows:
+            data = CustomDataTest()
+            data.symbol = config.symbol
+            data.time = datetime.strptime(row[0], ""%Y-%m-%d"")
+            data.value = float(row[1])
+            data['name'] = row[2]
+            result.append(data)
+        return result");
+
+                var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+                var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, DateTimeZone.Utc,
+                    DateTimeZone.Utc, false, false, false, isCustom: true);
+
+                Assert.IsTrue(customDataTest.ImplementsChunkReader);
+                var data = customDataTest.ReadChunk(config, new[] { "time,value,name", "2022-05-05,10.5,a", "2022-05-06,11,b" },
+                    DateTime.UtcNow, false);
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(Symbols.SPY, data[1].Symbol);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[1].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[1].EndTime);
+                Assert.AreEqual(10.5m, data[0].Value);
+                Assert.AreEqual("b", ((PythonData)data[1]).GetProperty("name"));
+            }
+        }
+
         public class TestPythonData : PythonData
         {
             private static void Throw()
@@ -0,0 +1,80 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.IO;
+using System.Linq;
+using Python.Runtime;
+using NUnit.Framework;
+using QuantConnect.Python;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class PythonSamplingProfilerTests
+    {
+        [Test]
+        public void WritesCollapsedStacksOfThePythonThreads()
+        {
+            // the frames of the files of the algorithm folder are the user code the profiler records
+            var folder = Path.Combine(Path.GetTempPath(), $"SamplingProfilerTest-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(folder);
+            var algorithmLocation = Path.Combine(folder, "SamplingProfilerTest.py");
+            File.WriteAllText(algorithmLocation, @"
+import time
+
+def busy_function():
+    end = time.time() + 0.5
+    total = 0
+    while time.time() < end:
+        total += sum(range(1000))
+    return total
+");
+
+            PyObject busyFunction;
+            using (Py.GIL())
+            {
+                using var sys = Py.Import("sys");
+                using var sysPath = sys.GetAttr("path");
+                sysPath.InvokeMethod("insert", 0.ToPython(), folder.ToPython()).Dispose();
+                using var module = Py.Import("SamplingProfilerTest");
+                busyFunction = module.GetAttr("busy_function");
+                sysPath.InvokeMethod("remove", folder.ToPython()).Dispose();
+            }
+
+            var profiler = PythonSamplingProfiler.Start(algorithmLocation, 1);
+            Assert.IsNotNull(profiler);
+
+            using (Py.GIL())
+            {
+                busyFunction.Invoke().Dispose();
+            }
+
+            var path = Path.GetTempFileName();
+            profiler.Stop(path);
+            // stopping twice does nothing
+            profiler.Stop(path);
+
+            var lines = File.ReadAllLines(path);
+            File.Delete(path);
+            Directory.Delete(folder, true);
+
+            Assert.IsNotEmpty(lines);
+            // 'frame;frame count' lines
+            Assert.IsTrue(lines.All(line => int.TryParse(line.Split(' ').Last(), out var count) && count > 0));
+            Assert.IsTrue(lines.Any(line => line.Contains("[user] SamplingProfilerTest:busy_function")));
+        }
+    }
+}
@@ -14,8 +14,11 @@
 */
 
 using Deedle;
+using MathNet.Numerics.Statistics;
 using NUnit.Framework;
+using QuantConnect.Data;
 using QuantConnect.Report;
+using QuantConnect.Statistics;
 using System;
 using System.Linq;
 using System.Collections.Generic;
@@ -64,6 +67,95 @@ namespace QuantConnect.Tests.Report
             }
         }
 
+        [TestCase(2)]
+        [TestCase(22)]
+        [TestCase(132)]
+        public void RollingBetaMatchesTheWindowedCalculation(int windowSize)
+        {
+            var performancePoints = CreateRandomWalk(500, 1);
+            var benchmarkPoints = CreateRandomWalk(500, 2);
+            // a flat equity curve while not invested
+            for (var i = 200; i < 300; i++)
+            {
+                performancePoints[performancePoints.Keys[i]] = performancePoints.Values[199];
+            }
+
+            var dailyReturns = new Series<DateTime, double>(StatisticsBuilder.PreprocessPerformanceValues(
+                performancePoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value))));
+            var benchmarkReturns = new Series<DateTime, double>(StatisticsBuilder.CreateBenchmarkDifferences(
+                benchmarkPoints.Select(x => new KeyValuePair<DateTime, decimal>(x.Key, (decimal)x.Value)), benchmarkPoints.Keys.First(), benchmarkPoints.Keys.Last()));
+            var returns = Frame.CreateEmpty<DateTime, string>();
+            returns["strategy"] = dailyReturns;
+            returns = returns.Join("benchmark", benchmarkReturns).FillMissing(Direction.Forward).DropSparseRows();
+            var correlation = returns.Window(windowSize).SelectValues(x => Correlation.Pearson(x["strategy"].Values, x["benchmark"].Values));
+            var expected = (correlation * (dailyReturns.Window(windowSize).SelectValues(s => s.StdDev()) / benchmarkReturns.Window(windowSize).SelectValues(s => s.StdDev())))
+                .FillMissing(Direction.Forward)
+                .DropMissing();
+
+            var beta = Rolling.Beta(performancePoints, benchmarkPoints, windowSize);
+
+            Assert.AreEqual(expected.Keys.ToList(), beta.Keys.ToList());
+            foreach (var (expectedValue, value) in expected.Values.Zip(beta.Values))
+            {
+                Assert.AreEqual(expectedValue, value, 1e-9);
+            }
+            Assert.AreEqual(correlation.DropMissing().Keys.ToList(), Rolling.Correlation(performancePoints, benchmarkPoints, windowSize).DropMissing().Keys.ToList());
+        }
+
+        [TestCase(22)]
+        [TestCase(252)]
+        public void RollingVolatilityMatchesTheWindowedCalculation(int windowSize)
+        {
+            var returns = new Series<DateTime, double>(CreateRandomWalk(500, 3)).PercentChange();
+
+            var expected = returns.Window(windowSize).SelectValues(s => s.StdDev() * Math.Sqrt(252));
+            var volatility = Rolling.Volatility(returns, windowSize, 252);
+
+            Assert.AreEqual(expected.Keys.ToList(), volatility.Keys.ToList());
+            foreach (var (expectedValue, value) in expected.Values.Zip(volatility.Values))
+            {
+                Assert.AreEqual(expectedValue, value, 1e-9);
+            }
+        }
+
+        [TestCase(1)]
+        [TestCase(6)]
+        [TestCase(12)]
+        public void RollingSharpeMatchesTheSlicedCalculation(int months)
+        {
+            // two points per day, like an intraday sampled equity curve
+            var equityCurve = new Series<DateTime, double>(CreateRandomWalk(1000, 4)
+                .ToDictionary(kvp => new DateTime(2000, 1, 1).AddHours(12 * (kvp.Key - new DateTime(2000, 1, 1)).TotalDays), kvp => kvp.Value));
+
+            var riskFreeRate = (double)new InterestRateProvider().GetAverageRiskFreeRate(equityCurve.Keys);
+            var dailyReturns = equityCurve.ResampleEquivalence(date => date.Date, s => s.LastValue()).PercentChange();
+            var expected = equityCurve.Keys
+                .Where(date => date.AddMonths(-months) >= equityCurve.FirstKey())
+                .ToDictionary(date => date, date => Statistics.Statistics.SharpeRatio(
+                    dailyReturns.Between(date.AddMonths(-months), date).Values.ToList(), riskFreeRate, 252));
+
+            var sharpe = Rolling.Sharpe(equityCurve, months, 252);
+
+            Assert.AreEqual(expected.Keys.ToList(), sharpe.Keys.ToList());
+            foreach (var (expectedValue, value) in expected.Values.Zip(sharpe.Values))
+            {
+                Assert.AreEqual(expectedValue, value, Math.Abs(expectedValue) * 1e-9 + 1e-9);
+            }
+        }
+
+        private static SortedList<DateTime, double> CreateRandomWalk(int count, int seed)
+        {
+            var random = new Random(seed);
+            var value = 100d;
+            var points = new SortedList<DateTime, double>();
+            for (var i = 0; i < count; i++)
+            {
+                points[new DateTime(2000, 1, 1).AddDays(i)] = value;
+                value *= 1 + (random.NextDouble() - 0.5) / 50;
+            }
+            return points;
+        }
+
         private Dictionary<DateTime, double> CreateFakeSeries(double[] inputs)
         {
             var i = 0;
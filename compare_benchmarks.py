@@ -1,28 +1,241 @@
 import sys
 import json
+import math
+import argparse
+import statistics
+from datetime import datetime, timezone
 
-print(f'Will compare benchmark results {sys.argv[2]} against reference {sys.argv[1]}')
+# the compared metrics: True if higher values are better, and the default relative change considered a regression
+METRICS = {
+	"dps": (True, 0.03),
+	"length": (False, 0.03),
+	"wall-time": (False, 0.05),
+	"time-to-first-bar": (False, 0.10),
+	"peak-rss-mb": (False, 0.05)
+}
+LANGUAGES = ["CSharp", "Python"]
+# the relative change allowed when there are too few samples for a significance test
+SINGLE_SAMPLE_TOLERANCE = 0.10
 
-referenceBenchmark = json.load(open(sys.argv[1]))
-newBenchmark = json.load(open(sys.argv[2]))
+parser = argparse.ArgumentParser(description='Compares benchmark results written by run_benchmarks.py against reference ones')
+parser.add_argument('reference', help='the reference results, usually master')
+parser.add_argument('new', help='the new results')
+parser.add_argument('--alpha', type=float, default=0.05, help='the significance level of the Mann-Whitney U test')
+parser.add_argument('--tolerances', default=None,
+	help='json file of relative tolerances: {"defaults": {"dps": 0.03}, "Python": {"SomeBenchmark": {"dps": 0.08}}}')
+parser.add_argument('--gate', default='dps,peak-rss-mb', help='the metrics whose regressions fail the comparison, the others are only reported')
+parser.add_argument('--history', default=None, help='json lines file of past results, used to detect trends and step changes')
+parser.add_argument('--record', action='store_true', help='append the new results to the history file')
+parser.add_argument('--window', type=int, default=5, help='the number of recent history entries compared against the older ones')
+parser.add_argument('--fail-on-trend', action='store_true', help='trend and step change regressions also fail the comparison')
+parser.add_argument('--report', default=None, help='the machine readable comparison report to write')
+args = parser.parse_args()
+
+print(f'Will compare benchmark results {args.new} against reference {args.reference}')
+
+def getSamples(benchmark, metric):
+	"""The measured values of a metric, the first schema version only has the dps samples and the average length"""
+	if "runs" in benchmark:
+		return [run[metric] for run in benchmark["runs"] if run.get(metric) is not None]
+	if metric == "dps":
+		return benchmark.get("samples") or [benchmark["average-dps"]]
+	if metric == "length" and benchmark.get("average-length") is not None:
+		return [benchmark["average-length"]]
+	return []
+
+def exactUDistribution(m, n):
+	"""Number of orderings of m + n distinct values giving each U statistic value"""
+	counts = {(0, 0): [1]}
+	def get(i, j):
+		if (i, j) not in counts:
+			if i == 0 or j == 0:
+				counts[(i, j)] = [1] + [0] * (i * j)
+			else:
+				# the largest value is from the first sample, adding j to U, or from the second one
+				withFirst, withSecond = get(i - 1, j), get(i, j - 1)
+				counts[(i, j)] = [(withFirst[u - j] if u >= j else 0) + (withSecond[u] if u < len(withSecond) else 0) for u in range(i * j + 1)]
+		return counts[(i, j)]
+	return get(m, n)
+
+def mannWhitneyGreater(first, second):
+	"""One sided Mann-Whitney U test p-value of the first sample being stochastically greater than the second one"""
+	m, n = len(first), len(second)
+	values = sorted([(x, 0) for x in first] + [(x, 1) for x in second])
+	ranks = [0.0] * len(values)
+	tieGroups = []
+	i = 0
+	while i < len(values):
+		j = i
+		while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+			j += 1
+		for k in range(i, j + 1):
+			ranks[k] = (i + j) / 2 + 1
+		tieGroups.append(j - i + 1)
+		i = j + 1
+	u = sum(rank for rank, (x, sample) in zip(ranks, values) if sample == 0) - m * (m + 1) / 2
+
+	if all(size == 1 for size in tieGroups) and m + n <= 40:
+		distribution = exactUDistribution(m, n)
+		return sum(distribution[math.ceil(u):]) / math.comb(m + n, m)
+
+	# normal approximation with tie and continuity corrections
+	total = m + n
+	variance = m * n / 12 * (total + 1 - sum(t ** 3 - t for t in tieGroups) / (total * (total - 1)))
+	if variance <= 0:
+		return 1.0
+	z = (u - m * n / 2 - 0.5) / math.sqrt(variance)
+	return 0.5 * math.erfc(z / math.sqrt(2))
+
+def cliffsDelta(first, second):
+	"""Effect size in [-1, 1], the probability of a first sample value being greater minus the one of it being lower"""
+	greater = sum(1 for x in first for y in second if x > y)
+	lower = sum(1 for x in first for y in second if x < y)
+	return (greater - lower) / (len(first) * len(second))
+
+def getTolerance(tolerances, language, name, metric):
+	benchmarkTolerances = tolerances.get(language, {}).get(name, {})
+	if metric in benchmarkTolerances:
+		return benchmarkTolerances[metric]
+	return tolerances.get("defaults", {}).get(metric, METRICS[metric][1])
+
+def compareMetric(referenceSamples, newSamples, higherIsBetter, tolerance):
+	referenceMedian = statistics.median(referenceSamples)
+	newMedian = statistics.median(newSamples)
+	change = (newMedian - referenceMedian) / referenceMedian if referenceMedian else 0.0
+	# positive when the new results are worse
+	degradation = -change if higherIsBetter else change
+
+	result = { "reference": referenceMedian, "new": newMedian, "change": change, "tolerance": tolerance,
+		"reference-samples": len(referenceSamples), "new-samples": len(newSamples) }
+	if min(len(referenceSamples), len(newSamples)) < 3:
+		# too few samples for a test, only the tolerance applies, at least the one used before the test
+		tolerance = max(tolerance, SINGLE_SAMPLE_TOLERANCE)
+		result.update({ "p-value": None, "effect-size": None, "tolerance": tolerance })
+		significant = True
+	else:
+		worse, better = (referenceSamples, newSamples) if higherIsBetter else (newSamples, referenceSamples)
+		result["p-value"] = mannWhitneyGreater(worse, better) if degradation > 0 else mannWhitneyGreater(better, worse)
+		result["effect-size"] = cliffsDelta(newSamples, referenceSamples)
+		significant = result["p-value"] < args.alpha
+
+	if significant and degradation > tolerance:
+		result["status"] = "regressed"
+	elif significant and degradation < -tolerance:
+		result["status"] = "improved"
+	else:
+		result["status"] = "unchanged"
+	return result
+
+def linearSlope(values):
+	count = len(values)
+	meanX = (count - 1) / 2
+	meanY = statistics.mean(values)
+	denominator = sum((x - meanX) ** 2 for x in range(count))
+	return sum((x - meanX) * (y - meanY) for x, y in enumerate(values)) / denominator if denominator else 0.0
+
+def analyzeHistory(series, higherIsBetter, tolerance):
+	"""Trend of the recent entries and step change between the recent and the older ones, as relative changes"""
+	recent = series[-args.window:]
+	older = series[-3 * args.window:-args.window]
+	result = { "points": len(series) }
+	sign = -1 if higherIsBetter else 1
+
+	if len(recent) >= 3 and statistics.mean(recent):
+		trend = linearSlope(recent) * (len(recent) - 1) / statistics.mean(recent)
+		result["trend"] = trend
+		result["trend-regressed"] = sign * trend > tolerance
+	if len(older) >= 3 and statistics.median(older):
+		step = statistics.median(recent) / statistics.median(older) - 1
+		result["step-change"] = step
+		result["step-regressed"] = sign * step > tolerance
+	return result
+
+def loadHistory(path):
+	history = []
+	try:
+		with open(path) as file:
+			for line in file:
+				if line.strip():
+					history.append(json.loads(line))
+	except FileNotFoundError:
+		pass
+	return history
+
+referenceBenchmark = json.load(open(args.reference))
+newBenchmark = json.load(open(args.new))
+tolerances = json.load(open(args.tolerances)) if args.tolerances else {}
+gatedMetrics = set(metric for metric in args.gate.split(',') if metric)
+history = loadHistory(args.history) if args.history else []
 
 failed = False
-for language in ["CSharp", "Python"]:
+report = { "reference": args.reference, "new": args.new, "alpha": args.alpha, "created": datetime.now(timezone.utc).isoformat(),
+	"new-metadata": newBenchmark.get("metadata"), "reference-metadata": referenceBenchmark.get("metadata"), "benchmarks": [] }
+
+for language in LANGUAGES:
+
+	for key, value in referenceBenchmark.get(language, {}).items():
+		entry = { "language": language, "name": key, "metrics": {} }
+		report["benchmarks"].append(entry)
 
-	for key, value in referenceBenchmark[language].items():
-		if key not in newBenchmark[language]:
+		if key not in newBenchmark.get(language, {}):
 			failed = True
+			entry["status"] = "missing"
 			print(f'Performance benchmark {key} language {language} was not found in new results')
 			continue
 		newResult = newBenchmark[language][key]
 
-		# allow 5% noise
-		expectedValue = value["average-dps"] * 0.90
-		if expectedValue > newResult["average-dps"]:
-			failed = True
-			print(f'Performance benchmark Failed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
-		else:
-			print(f'Performance benchmark Passed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+		for metric, (higherIsBetter, _) in METRICS.items():
+			referenceSamples = getSamples(value, metric)
+			newSamples = getSamples(newResult, metric)
+			if not referenceSamples or not newSamples:
+				continue
+
+			tolerance = getTolerance(tolerances, language, key, metric)
+			comparison = compareMetric(referenceSamples, newSamples, higherIsBetter, tolerance)
+			comparison["gated"] = metric in gatedMetrics
+
+			series = [past["benchmarks"][language][key][metric] for past in history
+				if metric in past.get("benchmarks", {}).get(language, {}).get(key, {})] + [comparison["new"]]
+			comparison["history"] = analyzeHistory(series, higherIsBetter, tolerance)
+			entry["metrics"][metric] = comparison
+
+			pValue = "n/a" if comparison["p-value"] is None else f'{comparison["p-value"]:.4f}'
+			details = (f'{metric} was {comparison["new"]:.6g} reference {comparison["reference"]:.6g} change {comparison["change"]:+.2%} '
+				f'p-value {pValue} tolerance {tolerance:.0%}')
+			trendRegressed = comparison["history"].get("trend-regressed") or comparison["history"].get("step-regressed")
+
+			if comparison["status"] == "regressed" and comparison["gated"]:
+				failed = True
+				print(f'Performance benchmark Failed for algorithm {key} language {language}. {details}')
+			elif comparison["status"] == "regressed":
+				print(f'Performance benchmark Warning for algorithm {key} language {language}. {details}')
+			elif metric == "dps":
+				print(f'Performance benchmark Passed for algorithm {key} language {language}. {details}')
+
+			if trendRegressed:
+				failed = failed or (args.fail_on_trend and comparison["gated"])
+				print(f'Performance benchmark Trend for algorithm {key} language {language}. {metric} trend '
+					f'{comparison["history"].get("trend", 0):+.2%} step change {comparison["history"].get("step-change", 0):+.2%} '
+					f'over {comparison["history"]["points"]} results')
+
+		statuses = [comparison["status"] for comparison in entry["metrics"].values() if comparison["gated"]]
+		entry["status"] = "regressed" if "regressed" in statuses else "improved" if "improved" in statuses else "unchanged"
+
+report["failed"] = failed
+
+if args.report:
+	with open(args.report, "w") as outfile:
+		json.dump(report, outfile, indent=1)
+
+if args.history and args.record:
+	metadata = newBenchmark.get("metadata") or {}
+	historyEntry = { "created": metadata.get("created"), "commit": metadata.get("commit"), "benchmarks": {} }
+	for language in LANGUAGES:
+		historyEntry["benchmarks"][language] = {
+			key: { metric: statistics.median(getSamples(value, metric)) for metric in METRICS if getSamples(value, metric) }
+			for key, value in newBenchmark.get(language, {}).items() }
+	with open(args.history, "a") as outfile:
+		outfile.write(json.dumps(historyEntry) + "\n")
 
 if failed:
 	exit(1)
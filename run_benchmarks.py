@@ -2,20 +2,209 @@ import os
 import re
 import sys
 import json
+import time
+import queue
+import shutil
+import argparse
+import platform
+import tempfile
+import itertools
 import subprocess
 import statistics
 from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
-dataPath = '../../../Data'
-if len(sys.argv) > 1:
-	dataPath = sys.argv[1]
+# version of the json written to the output file, see the bottom of this script
+SCHEMA_VERSION = 2
+
+parser = argparse.ArgumentParser(description='Runs the Lean benchmark algorithms and stores their performance')
+parser.add_argument('dataPath', nargs='?', default='../../../Data', help='the data folder, relative to the launcher folder')
+parser.add_argument('--repetitions', type=int, default=5, help='the measured runs of each benchmark')
+parser.add_argument('--warmup', type=int, default=1, help='the runs of each benchmark discarded before the measured ones')
+parser.add_argument('--concurrency', type=int, default=1, help='the benchmarks run at the same time, each on its own cores')
+parser.add_argument('--filter', default=None, help='only run the benchmarks whose name matches this regular expression')
+parser.add_argument('--output', default='benchmark_results.json', help='the results file')
+parser.add_argument('--suite', default=None,
+	help='json file of a parameterized benchmark suite, like Algorithm.Python/Benchmarks/Framework/framework_benchmarks.json, run instead of the benchmark folders')
+parser.add_argument('--generate-data', action='store_true', help='generates the random data of the suite in the data folder if it has none')
+args = parser.parse_args()
+
+dataPath = args.dataPath
 print(f'Using data path {dataPath}')
 
-results = {}
-for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]:
+launcherPath = "./Launcher/bin/Release"
+toolBoxPath = "./ToolBox/bin/Release"
+
+def getCoreSets(concurrency):
+	"""Splits the cores this process can use between the benchmarks running at the same time"""
+	if concurrency <= 1 or not hasattr(os, "sched_getaffinity"):
+		return [None] * max(1, concurrency)
+	cores = sorted(os.sched_getaffinity(0))
+	if len(cores) < concurrency:
+		print(f'Only {len(cores)} cores for {concurrency} concurrent benchmarks, they will share cores')
+		return [None] * concurrency
+	size = len(cores) // concurrency
+	return [set(cores[i * size:(i + 1) * size]) for i in range(concurrency)]
+
+def runLean(language, algorithmName, algorithmLocation, parameters, cores):
+	"""Runs a single backtest and returns its metrics, None for the ones that could not be measured"""
+	resultsFolder = tempfile.mkdtemp(prefix=f'benchmark-{algorithmName}-')
+	try:
+		run = { "dps": None, "length": None, "wall-time": None, "time-to-first-bar": None,
+			"peak-rss-mb": None, "user-cpu": None, "system-cpu": None, "exit-code": None }
+
+		start = time.perf_counter()
+		process = subprocess.Popen(["dotnet", "./QuantConnect.Lean.Launcher.dll",
+			"--data-folder", dataPath,
+			"--algorithm-language", language,
+			"--algorithm-type-name", algorithmName,
+			"--algorithm-location", algorithmLocation,
+			"--results-destination-folder", resultsFolder,
+			"--log-handler", "ConsoleLogHandler",
+			"--close-automatically", "true"] +
+			(["--parameters", ",".join(f'{key}:{value}' for key, value in parameters.items())] if parameters else []),
+			cwd=launcherPath,
+			stdout=subprocess.PIPE,
+			stderr=subprocess.DEVNULL,
+			text=True,
+			errors='replace')
+		if cores:
+			# set after the start, a preexec_fn is not safe with the threads of the concurrent benchmarks
+			try:
+				os.sched_setaffinity(process.pid, cores)
+			except ProcessLookupError:
+				pass
+
+		# the algorithm manager logs this line right before the first time slice is requested
+		for line in process.stdout:
+			if run["time-to-first-bar"] is None and "Begin DataStream" in line:
+				run["time-to-first-bar"] = time.perf_counter() - start
+		process.stdout.close()
+
+		if hasattr(os, "wait4"):
+			_, status, usage = os.wait4(process.pid, 0)
+			process.returncode = os.waitstatus_to_exitcode(status)
+			# kilobytes on linux, bytes on mac
+			run["peak-rss-mb"] = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+			run["user-cpu"] = usage.ru_utime
+			run["system-cpu"] = usage.ru_stime
+		else:
+			process.wait()
+		run["wall-time"] = time.perf_counter() - start
+		run["exit-code"] = process.returncode
+
+		algorithmLogs = os.path.join(resultsFolder, algorithmName + "-log.txt")
+		if os.path.exists(algorithmLogs):
+			with open(algorithmLogs, 'r') as file:
+				for line in file.readlines():
+					for match in re.findall(r"(\d+)k data points per second", line):
+						run["dps"] = int(match)
+					for match in re.findall(r" completed in ([\d.]+)", line):
+						run["length"] = float(match)
+		return run
+	finally:
+		shutil.rmtree(resultsFolder, ignore_errors=True)
+
+def summarize(values):
+	"""Median, interquartile range and extremes of the measured values"""
+	values = [x for x in values if x is not None]
+	if not values:
+		return None
+	quartiles = statistics.quantiles(values, n=4, method='inclusive') if len(values) > 1 else [values[0]] * 3
+	return { "median": statistics.median(values), "iqr": quartiles[2] - quartiles[0], "min": min(values), "max": max(values), "count": len(values) }
+
+def runBenchmark(language, benchmarkName, algorithmName, algorithmLocation, parameters, coreSets):
+	cores = coreSets.get()
+	try:
+		print(f'Start running algorithm {benchmarkName} language {language}...')
+		for x in range(args.warmup):
+			runLean(language, algorithmName, algorithmLocation, parameters, cores)
+
+		runs = []
+		for x in range(args.repetitions):
+			run = runLean(language, algorithmName, algorithmLocation, parameters, cores)
+			if run["dps"] is None:
+				print(f'Algorithm {benchmarkName} language {language} run {x} failed with exit code {run["exit-code"]}')
+				continue
+			runs.append(run)
+	finally:
+		coreSets.put(cores)
+
+	if not runs:
+		return None
+
+	dataPointsPerSecond = [run["dps"] for run in runs]
+	benchmarkLengths = [run["length"] for run in runs if run["length"] is not None]
+	metrics = { key: summarize([run[key] for run in runs]) for key in ["dps", "length", "wall-time", "time-to-first-bar", "peak-rss-mb", "user-cpu", "system-cpu"] }
+	result = {
+		# kept from the first schema version
+		"average-dps": statistics.mean(dataPointsPerSecond),
+		"samples": dataPointsPerSecond,
+		"average-length": statistics.mean(benchmarkLengths) if benchmarkLengths else None,
+		"median-dps": metrics["dps"]["median"],
+		"iqr-dps": metrics["dps"]["iqr"],
+		"metrics": metrics,
+		"runs": runs
+	}
+	rss = metrics["peak-rss-mb"]["median"] if metrics["peak-rss-mb"] else None
+	print(f'Performance for {benchmarkName} language {language} median dps: {result["median-dps"]}k iqr: {result["iqr-dps"]}k '
+		f'samples: [{",".join(str(x) for x in dataPointsPerSecond)}] median length {metrics["length"]["median"] if metrics["length"] else None} sec '
+		f'peak rss {rss} MB')
+	return result
+
+def getCommit():
+	try:
+		return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def loadSuite(path):
+	"""Reads a suite json file, the lines starting with // are comments"""
+	with open(path) as file:
+		return json.loads("\n".join(line for line in file.readlines() if not line.strip().startswith("//")))
+
+def generateData(settings):
+	"""Runs the ToolBox random data generator, it writes to the data folder of the config.json of its working directory"""
+	dataFolder = os.path.abspath(os.path.join(launcherPath, dataPath))
+	if os.path.isdir(os.path.join(dataFolder, settings["security-type"].lower(), settings["market"], settings["resolution"].lower())):
+		print(f'Using the generated data of {dataFolder}')
+		return
+
+	# the generator needs the market hours and symbol properties databases
+	for database in ["market-hours", "symbol-properties"]:
+		shutil.copytree(os.path.join("Data", database), os.path.join(dataFolder, database), dirs_exist_ok=True)
+
+	print(f'Generating random data in {dataFolder}...')
+	workingDirectory = tempfile.mkdtemp(prefix='benchmark-data-')
+	try:
+		with open(os.path.join(workingDirectory, "config.json"), "w") as file:
+			json.dump({ "data-folder": dataFolder, "log-handler": "ConsoleLogHandler" }, file)
+		subprocess.run(["dotnet", os.path.abspath(os.path.join(toolBoxPath, "QuantConnect.ToolBox.dll")), "--app", "RandomDataGenerator"] +
+			[argument for key, value in settings.items() for argument in (f'--{key}', value)],
+			cwd=workingDirectory, stdout=subprocess.DEVNULL, check=True)
+	finally:
+		shutil.rmtree(workingDirectory, ignore_errors=True)
+
+benchmarks = []
+if args.suite:
+	suite = loadSuite(args.suite)
+	if args.generate_data:
+		generateData(suite["data"])
+
+	algorithmName = Path(suite["algorithm"]).stem
+	algorithmLocation = os.path.join("../../../", os.path.dirname(args.suite), suite["algorithm"])
+	keys = list(suite["parameters"])
+	for values in itertools.product(*[suite["parameters"][key] for key in keys]):
+		parameters = dict(zip(keys, values))
+		benchmarkName = f'{algorithmName}[{",".join(f"{key}={value}" for key, value in parameters.items())}]'
+		if args.filter and not re.search(args.filter, benchmarkName):
+			continue
+		benchmarks.append((suite["language"], benchmarkName, algorithmName, algorithmLocation, parameters))
+
+for baseDirectory in ([] if args.suite else ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]):
 
 	language = baseDirectory[len("Algorithm") + 1:baseDirectory.index("/")]
-	resultsPerLanguage = {}
 
 	for algorithmFile in sorted(os.listdir(baseDirectory)):
 		if algorithmFile.endswith(("py", "cs")):
@@ -25,38 +214,36 @@ for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmark
 			if "Fine" in algorithmName:
 				# we skip fundamental benchmarks for now
 				continue
+			if args.filter and not re.search(args.filter, algorithmName):
+				continue
 			algorithmLocation = "QuantConnect.Algorithm.CSharp.dll" if language == "CSharp" else os.path.join("../../../", baseDirectory, algorithmFile)
-			print(f'Start running algorithm {algorithmName} language {language}...')
-
-			dataPointsPerSecond = []
-			benchmarkLengths = []
-			for x in range(1, 2):
-
-				subprocess.run(["dotnet", "./QuantConnect.Lean.Launcher.dll",
-					"--data-folder " + dataPath,
-					"--algorithm-language " + language,
-					"--algorithm-type-name " + algorithmName,
-					"--algorithm-location " + algorithmLocation,
-					"--log-handler ConsoleErrorLogHandler",
-					"--close-automatically true"],
-					cwd="./Launcher/bin/Release",
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL)
-
-				algorithmLogs = os.path.join("./Launcher/bin/Release", algorithmName + "-log.txt")
-				file = open(algorithmLogs, 'r')
-				for line in file.readlines():
-					for match in re.findall(r"(\d+)k data points per second", line):
-						dataPointsPerSecond.append(int(match))
-					for match in re.findall(r" completed in (\d+)", line):
-						benchmarkLengths.append(int(match))
+			benchmarks.append((language, algorithmName, algorithmName, algorithmLocation, None))
+
+coreSets = queue.Queue()
+for cores in getCoreSets(args.concurrency):
+	coreSets.put(cores)
 
-			averageDps = statistics.mean(dataPointsPerSecond)
-			averageLength = statistics.mean(benchmarkLengths)
-			resultsPerLanguage[algorithmName] = { "average-dps": averageDps, "samples": dataPointsPerSecond, "average-length": averageLength }
-			print(f'Performance for {algorithmName} language {language} avg dps: {averageDps}k samples: [{",".join(str(x) for x in dataPointsPerSecond)}] avg length {averageLength} sec')
+results = { "CSharp": {}, "Python": {} }
+with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+	futures = [(language, benchmarkName, executor.submit(runBenchmark, language, benchmarkName, algorithmName, algorithmLocation, parameters, coreSets))
+		for language, benchmarkName, algorithmName, algorithmLocation, parameters in benchmarks]
+	for language, benchmarkName, future in futures:
+		result = future.result()
+		if result is not None:
+			results[language][benchmarkName] = result
 
-	results[language] = resultsPerLanguage
+results["schema-version"] = SCHEMA_VERSION
+results["metadata"] = {
+	"created": datetime.now(timezone.utc).isoformat(),
+	"commit": getCommit(),
+	"repetitions": args.repetitions,
+	"warmup": args.warmup,
+	"concurrency": args.concurrency,
+	"suite": args.suite,
+	"platform": platform.platform(),
+	"processor": platform.processor(),
+	"cpu-count": os.cpu_count()
+}
 
-with open("benchmark_results.json", "w") as outfile:
-	json.dump(results, outfile)
+with open(args.output, "w") as outfile:
+	json.dump(results, outfile, indent=1)